@@ -0,0 +1,30 @@
+"""Add runtime_profile to problems
+
+Revision ID: 9c1d2e3f4a5b
+Revises: 8b6c4d9e1f2a
+Create Date: 2026-10-17
+
+Changes:
+- Add runtime_profile JSONB column to problems table
+  (Golden 실행 시간 표본과 문제별 judge 타임아웃)
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '9c1d2e3f4a5b'
+down_revision = '8b6c4d9e1f2a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('problems',
+        sa.Column('runtime_profile', postgresql.JSONB(), nullable=True)
+    )
+
+
+def downgrade():
+    op.drop_column('problems', 'runtime_profile')
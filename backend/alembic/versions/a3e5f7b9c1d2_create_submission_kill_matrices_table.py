@@ -0,0 +1,41 @@
+"""Create submission kill matrices table
+
+Revision ID: a3e5f7b9c1d2
+Revises: 9c1d2e3f4a5b
+Create Date: 2026-10-17
+
+Changes:
+- Create submission_kill_matrices table (per-submission test x mutant bitsets)
+- Add index on problem_id for per-problem analytics
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3e5f7b9c1d2'
+down_revision = '9c1d2e3f4a5b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'submission_kill_matrices',
+        sa.Column('submission_id', postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey('submissions.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('problem_id', sa.Integer(),
+                  sa.ForeignKey('problems.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('test_names', postgresql.JSONB(), nullable=False),
+        sa.Column('mutant_ids', postgresql.JSONB(), nullable=False),
+        sa.Column('killed', sa.LargeBinary(), nullable=False),
+        sa.Column('executed', sa.LargeBinary(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
+    )
+    op.create_index('ix_submission_kill_matrices_problem_id', 'submission_kill_matrices', ['problem_id'])
+
+
+def downgrade():
+    op.drop_index('ix_submission_kill_matrices_problem_id', 'submission_kill_matrices')
+    op.drop_table('submission_kill_matrices')
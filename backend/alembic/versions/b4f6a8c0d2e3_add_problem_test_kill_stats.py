@@ -0,0 +1,30 @@
+"""Add test_kill_stats to problems
+
+Revision ID: b4f6a8c0d2e3
+Revises: a3e5f7b9c1d2
+Create Date: 2026-10-17
+
+Changes:
+- Add test_kill_stats JSONB column to problems table
+  (Mutant별 테스트 특징 kill 통계, 테스트 실행 순서 결정에 사용)
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'b4f6a8c0d2e3'
+down_revision = 'a3e5f7b9c1d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('problems',
+        sa.Column('test_kill_stats', postgresql.JSONB(), nullable=True)
+    )
+
+
+def downgrade():
+    op.drop_column('problems', 'test_kill_stats')
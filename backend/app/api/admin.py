@@ -1,7 +1,10 @@
 """Admin API endpoints."""
 
 import logging
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from uuid import UUID
+
+import redis
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
@@ -11,12 +14,18 @@ from app.models.problem import Problem
 from app.models.buggy_implementation import BuggyImplementation
 from app.repositories.problem_repository import ProblemRepository
 from app.repositories.buggy_implementation_repository import BuggyImplementationRepository
+from app.repositories.kill_matrix_repository import KillMatrixRepository
 from app.schemas.problem import (
     ProblemGenerateRequest,
     ProblemCreateWithBuggy,
     ProblemResponse,
 )
+from app.schemas.grading_queue import GradingLaneDepth, GradingQueueDepthResponse
+from app.schemas.kill_matrix import KillMatrixResponse, ProblemKillStatsResponse
 from app.services.ai_problem_designer import generate_problem
+from app.services.fair_share import get_fair_share_scheduler
+from app.services.kill_matrix import decode_kill_matrix, summarize_kill_matrices
+from app.services.problem_bundle import build_problem_bundles
 
 logger = logging.getLogger(__name__)
 
@@ -129,5 +138,125 @@ async def create_problem(
         buggy_repo.create(buggy_impl)
 
     db.refresh(problem)
+    # Golden/Mutant 채점 대상 번들 준비 (JUDGE_BUNDLE_ENABLED)
+    build_problem_bundles(
+        problem.golden_code, [b.buggy_code for b in problem.buggy_implementations]
+    )
     return problem
 
+
+@router.get("/submissions/{submission_id}/kill-matrix", response_model=KillMatrixResponse)
+@limiter.limit(settings.RATE_LIMIT_DEFAULT)
+async def get_submission_kill_matrix(
+    request: Request,
+    submission_id: UUID,
+    db: Session = Depends(get_db),
+):
+    """
+    Get the test-by-mutant kill matrix of a submission.
+
+    Args:
+        submission_id: Submission ID
+        db: Database session
+
+    Returns:
+        Kill matrix ({test name: {mutant id: killed | survived | not_run}})
+
+    Raises:
+        404: If the submission has no kill matrix
+    """
+    matrix = KillMatrixRepository(db).get_by_submission_id(submission_id)
+    if not matrix:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Kill matrix for submission {submission_id} not found",
+        )
+
+    return KillMatrixResponse(
+        submission_id=matrix.submission_id,
+        problem_id=matrix.problem_id,
+        test_names=matrix.test_names,
+        mutant_ids=matrix.mutant_ids,
+        cells=decode_kill_matrix(
+            matrix.test_names, matrix.mutant_ids, matrix.killed, matrix.executed
+        ),
+    )
+
+
+@router.get("/problems/{problem_id}/kill-stats", response_model=ProblemKillStatsResponse)
+@limiter.limit(settings.RATE_LIMIT_DEFAULT)
+async def get_problem_kill_stats(
+    request: Request,
+    problem_id: int,
+    limit: int = Query(1000, ge=1, le=10000),
+    top_tests: int = Query(20, ge=1, le=200),
+    db: Session = Depends(get_db),
+):
+    """
+    Get per-mutant and per-test kill statistics of a problem.
+
+    Args:
+        problem_id: Problem ID
+        limit: Number of most recent submissions to aggregate
+        top_tests: Number of test names to return (by kill count)
+        db: Database session
+
+    Returns:
+        Aggregated kill statistics
+
+    Raises:
+        404: If problem not found
+    """
+    if not ProblemRepository(db).get_by_id(problem_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Problem with id {problem_id} not found",
+        )
+
+    matrices = KillMatrixRepository(db).get_recent_by_problem_id(problem_id, limit=limit)
+    summary = summarize_kill_matrices(matrices, top_tests=top_tests)
+    return ProblemKillStatsResponse(problem_id=problem_id, **summary)
+
+
+@router.get("/grading-queue", response_model=GradingQueueDepthResponse)
+@limiter.limit(settings.RATE_LIMIT_DEFAULT)
+async def get_grading_queue_depth(
+    request: Request,
+    top: int = Query(50, ge=1, le=1000),
+):
+    """
+    Get per-submitter queue depth of the fair-share grading queues.
+
+    Args:
+        top: Number of submitters to return per queue (by queue depth)
+
+    Returns:
+        Queue depth per grading queue and submitter
+
+    Raises:
+        503: If the queue depth cannot be read from Redis
+    """
+    if not settings.FAIR_SHARE_ENABLED:
+        return GradingQueueDepthResponse(enabled=False, lanes=[])
+
+    scheduler = get_fair_share_scheduler()
+    lanes = []
+    try:
+        for queue in (settings.CELERY_QUEUE_MEMBER_GRADING, settings.CELERY_QUEUE_GUEST_GRADING):
+            depths = scheduler.depths(queue)
+            ranked = sorted(depths.items(), key=lambda item: item[1], reverse=True)[:top]
+            lanes.append(
+                GradingLaneDepth(
+                    queue=queue,
+                    total=sum(depths.values()),
+                    active_submitters=len(depths),
+                    submitters=dict(ranked),
+                )
+            )
+    except redis.RedisError as e:
+        logger.error(f"Failed to read grading queue depth: {type(e).__name__}: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Grading queue depth is unavailable",
+        )
+    return GradingQueueDepthResponse(enabled=True, lanes=lanes)
@@ -8,6 +8,8 @@ from sqlalchemy import text
 import redis
 
 from app.services.worker_monitor import WorkerMonitor, WorkerStatus
+from app.services import judge_cache
+from app.services.judge_admission import get_admission_controller
 from app.core.config import settings
 from app.models.db import SessionLocal
 
@@ -109,6 +111,40 @@ async def worker_detail(worker_name: str) -> Dict[str, Any]:
         )
 
 
+@router.get("/judge")
+async def judge_metrics() -> Dict[str, Any]:
+    """
+    Judge 실행 관련 지표 조회.
+
+    Returns:
+        Judge 결과 캐시 hit/miss 통계, 호스트 슬롯 대기 시간 통계
+    """
+    result: Dict[str, Any] = {}
+
+    if settings.JUDGE_CACHE_ENABLED:
+        try:
+            result["cache"] = {"enabled": True, **judge_cache.get_shared_stats()}
+        except Exception as e:
+            logger.error(f"Failed to read judge cache stats: {e}")
+            result["cache"] = {"enabled": True, "status": "unknown", "error": str(e)}
+    else:
+        result["cache"] = {"enabled": False}
+
+    if settings.JUDGE_ADMISSION_ENABLED:
+        try:
+            result["admission"] = {
+                "enabled": True,
+                **get_admission_controller().shared_stats(),
+            }
+        except Exception as e:
+            logger.error(f"Failed to read judge admission stats: {e}")
+            result["admission"] = {"enabled": True, "status": "unknown", "error": str(e)}
+    else:
+        result["admission"] = {"enabled": False}
+
+    return result
+
+
 @router.get("")
 async def system_health() -> Dict[str, Any]:
     """
@@ -1,25 +1,34 @@
 """Submissions API endpoints."""
 
+import json
 import logging
-from typing import Optional
+import time
+from typing import AsyncIterator, List, Optional, Tuple
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
+from app.core.celery_app import grading_queue
 from app.core.config import settings
 from app.core.rate_limiter import limiter
 from app.core.dependencies import get_current_user_optional
-from app.models.db import get_db
+from app.models.db import SessionLocal, get_db
 from app.models.submission import Submission
 from app.models.user import User
 from app.repositories.submission_repository import SubmissionRepository
 from app.repositories.problem_repository import ProblemRepository
 from app.schemas.submission import SubmissionCreate, SubmissionResponse
+from app.services.fair_share import get_fair_share_scheduler, submitter_key
+from app.services.progress_channel import get_progress_channel, subscribe_submission_events
 from app.workers.tasks import process_submission_task
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# 채점이 끝난 상태 (SSE 스트림 종료)
+FINAL_STATUSES = ("SUCCESS", "FAILURE", "ERROR")
+
 
 @router.post("", response_model=SubmissionResponse, status_code=status.HTTP_201_CREATED)
 @limiter.limit(settings.RATE_LIMIT_GUEST_SUBMISSIONS)  # 게스트 기준 (더 엄격한 제한)
@@ -105,11 +114,30 @@ async def create_submission(
             f"anonymous_id={anonymous_id} problem_id={submission_data.problem_id} status=PENDING"
         )
     
+    # 제출자별 공정 분배 대기열에 추가 (채점 태스크가 DRR 순서로 가져감)
+    lane = grading_queue(user_id is not None)
+    fair_share_item = None
+    if settings.FAIR_SHARE_ENABLED:
+        fair_share_item = (
+            lane,
+            submitter_key(user_id, anonymous_id),
+            str(submission.id),
+            submission.problem_id,
+            1 + len(problem.buggy_implementations),
+        )
+        if not get_fair_share_scheduler().enqueue(*fair_share_item):
+            fair_share_item = None
+
     # Celery Task 발행
     try:
-        process_submission_task.delay(str(submission.id))
-        logger.info(f"[SUBMISSION_QUEUED] submission_id={submission.id}")
+        process_submission_task.apply_async(
+            args=[str(submission.id), submission.problem_id],
+            kwargs={"is_member": user_id is not None, "fair_share": fair_share_item is not None},
+        )
+        logger.info(f"[SUBMISSION_QUEUED] submission_id={submission.id} queue={lane}")
     except Exception as e:
+        if fair_share_item is not None:
+            get_fair_share_scheduler().cancel(*fair_share_item)
         # Task 발행 실패 시 에러 상태로 업데이트
         logger.error(
             f"[SUBMISSION_QUEUE_ERROR] submission_id={submission.id} "
@@ -158,5 +186,162 @@ async def get_submission(
         )
     
     logger.info(f"Submission {submission_id} retrieved - status: {submission.status}")
-    return submission
+    response = SubmissionResponse.model_validate(submission)
+    if settings.SUBMISSION_PROGRESS_REDIS_ENABLED and submission.status in ("PENDING", "RUNNING"):
+        # 채점 중 진행률은 Redis에만 기록됨 (없으면 DB에 저장된 마지막 진행률)
+        live_progress = get_progress_channel().get(submission.id)
+        if live_progress is not None:
+            response.progress = live_progress
+    return response
+
+
+
+def _sse_event(event: str, data: str) -> str:
+    """SSE 메시지 형식 (data는 한 줄 JSON)."""
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+def _load_submission_response(submission_id: UUID) -> Optional[SubmissionResponse]:
+    """짧은 DB 세션으로 제출을 읽습니다 (SSE 스트림이 DB 연결을 점유하지 않도록)."""
+    db = SessionLocal()
+    try:
+        submission = SubmissionRepository(db).get_by_id(submission_id)
+        return SubmissionResponse.model_validate(submission) if submission else None
+    finally:
+        db.close()
+
+
+def _load_submission_status(submission_id: UUID) -> Optional[Tuple[str, Optional[str]]]:
+    """짧은 DB 세션으로 제출 상태와 진행 단계만 읽습니다 (heartbeat마다 전체 행을 읽지 않도록)."""
+    db = SessionLocal()
+    try:
+        return SubmissionRepository(db).get_status(submission_id)
+    finally:
+        db.close()
+
+
+def _feedback_pending(status: str, step: Optional[str]) -> bool:
+    """점수가 확정되고 AI 피드백 생성을 기다리는 제출인지 여부."""
+    return status == "SUCCESS" and step == "generating_feedback"
+
+
+async def _submission_event_stream(request: Request, submission_id: UUID) -> AsyncIterator[str]:
+    """
+    제출 진행률(progress 이벤트), 최종 결과(result 이벤트, 한 번),
+    AI 피드백 저장 결과(feedback 이벤트, 피드백을 기다리는 회원 제출만)를 SSE로 전달합니다.
+
+    워커가 발행한 Redis pub/sub 이벤트를 전달하며, 이벤트가 없는 동안에는
+    heartbeat 간격마다 연결 유지 주석을 보내고 DB 상태를 확인합니다 (final/feedback 이벤트 유실 대비).
+    """
+    deadline = time.monotonic() + settings.SUBMISSION_EVENTS_MAX_SECONDS
+    result_sent = False
+
+    def final_events() -> Tuple[List[str], bool]:
+        """
+        DB 상태로 보낼 result/feedback 이벤트와 스트림 종료 여부를 반환합니다.
+
+        상태/진행 단계만 먼저 확인하고, 보낼 이벤트가 있을 때만 전체 제출을 읽습니다.
+        """
+        nonlocal result_sent
+        state = _load_submission_status(submission_id)
+        if state is None:
+            return [], True
+        if state[0] not in FINAL_STATUSES or (result_sent and _feedback_pending(*state)):
+            return [], False
+        submission = _load_submission_response(submission_id)
+        if submission is None:
+            return [], True
+        pending = _feedback_pending(submission.status, (submission.progress or {}).get("step"))
+        if not result_sent:
+            result_sent = True
+            return [_sse_event("result", submission.model_dump_json())], not pending
+        if pending:
+            return [], False
+        return [_sse_event("feedback", submission.model_dump_json())], True
+
+    async with subscribe_submission_events(submission_id) as pubsub:
+        # 구독 후 현재 상태 확인 (구독 전에 끝난 채점의 final 이벤트를 놓치지 않도록)
+        events, done = final_events()
+        for event in events:
+            yield event
+        if done:
+            return
+        if not result_sent:
+            progress = get_progress_channel().get(submission_id)
+            if progress:
+                yield _sse_event("progress", json.dumps(progress, ensure_ascii=False))
+
+        while time.monotonic() < deadline:
+            if await request.is_disconnected():
+                return
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True,
+                timeout=settings.SUBMISSION_EVENTS_HEARTBEAT_SECONDS,
+            )
+            if message is None:
+                events, done = final_events()
+                for event in events:
+                    yield event
+                if done:
+                    return
+                yield ": keepalive\n\n"
+                continue
 
+            try:
+                event = json.loads(message["data"])
+            except (TypeError, ValueError):
+                continue
+            if event.get("type") == "progress":
+                yield _sse_event("progress", json.dumps(event.get("progress"), ensure_ascii=False))
+            elif event.get("type") in ("final", "feedback"):
+                events, done = final_events()
+                for event in events:
+                    yield event
+                if done:
+                    return
+
+
+@router.get("/{submission_id}/events")
+async def stream_submission_events(
+    request: Request,
+    submission_id: UUID,
+):
+    """
+    Stream submission progress and the final result as server-sent events.
+
+    Events:
+        progress: 채점 진행률 ({"step", "message", "percent", ...})
+        result: 최종 제출 결과 (GET /submissions/{id}와 같은 형식, 한 번)
+        feedback: AI 피드백이 저장된 제출 (result 시점에 피드백 생성 중이던 회원 제출만)
+        result(피드백 대기가 없으면) 또는 feedback 전송 후 스트림을 종료합니다.
+
+    Args:
+        submission_id: Submission ID
+
+    Returns:
+        text/event-stream 응답
+
+    Raises:
+        404: If submission not found or submission events are not enabled
+    """
+    if not settings.SUBMISSION_PROGRESS_REDIS_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Submission events are not enabled",
+        )
+    if _load_submission_status(submission_id) is None:
+        logger.warning(f"Submission {submission_id} not found")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Submission with id {submission_id} not found",
+        )
+
+    logger.info(f"Streaming events for submission {submission_id}")
+    return StreamingResponse(
+        _submission_event_stream(request, submission_id),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # nginx 응답 버퍼링 비활성화
+        },
+    )
@@ -3,6 +3,7 @@
 from datetime import timedelta
 
 from celery import Celery
+from kombu import Queue
 
 from app.core.config import settings
 
@@ -21,12 +22,35 @@ else:
         # DB 번호가 없는 경우
         redis_backend = redis_broker + "/1"
 
+# 메시지 우선순위 (Redis 브로커: 0이 가장 높음, 지정하지 않으면 0)
+# 재시도는 낮은 우선순위로 보내 같은 큐의 새 제출보다 뒤에 처리
+PRIORITY_RETRY = 9
+
+PROCESS_SUBMISSION_TASK = "app.workers.tasks.process_submission_task"
+
+
+def grading_queue(is_member: bool) -> str:
+    """제출 채점 태스크 큐 (회원/게스트 분리)."""
+    return settings.CELERY_QUEUE_MEMBER_GRADING if is_member else settings.CELERY_QUEUE_GUEST_GRADING
+
+
+def route_submission_task(name, args, kwargs, options, task=None, **kw):
+    """
+    채점 태스크를 회원/게스트 큐로 라우팅합니다.
+
+    큐를 태스크 인자(is_member)로 결정하므로 재시도 메시지도 같은 큐로 갑니다.
+    """
+    if name != PROCESS_SUBMISSION_TASK:
+        return None
+    return {"queue": grading_queue((kwargs or {}).get("is_member", True))}
+
+
 # Celery 앱 초기화
 celery_app = Celery(
     "qa_arena",
     broker=redis_broker,
     backend=redis_backend,
-    include=["app.workers.tasks", "app.workers.monitoring_tasks"],
+    include=["app.workers.tasks", "app.workers.monitoring_tasks", "app.workers.maintenance_tasks"],
 )
 
 # Celery 설정
@@ -39,6 +63,29 @@ celery_app.conf.update(
     task_track_started=True,
     task_time_limit=300,  # 5분 타임아웃
     task_soft_time_limit=240,  # 4분 소프트 타임아웃
+    # 큐 라우팅: 회원 채점 / 게스트 채점 / AI 피드백 / 유지보수 (워커 풀은 app.workers.worker_pools)
+    task_queues=(
+        Queue(settings.CELERY_QUEUE_MEMBER_GRADING),
+        Queue(settings.CELERY_QUEUE_GUEST_GRADING),
+        Queue(settings.AI_FEEDBACK_QUEUE),
+        Queue(settings.CELERY_QUEUE_MAINTENANCE),
+    ),
+    task_default_queue=settings.CELERY_QUEUE_MAINTENANCE,
+    task_routes=(
+        route_submission_task,
+        {
+            "app.workers.tasks.generate_feedback_task": {"queue": settings.AI_FEEDBACK_QUEUE},
+            "app.workers.monitoring_tasks.*": {"queue": settings.CELERY_QUEUE_MAINTENANCE},
+            "app.workers.maintenance_tasks.*": {"queue": settings.CELERY_QUEUE_MAINTENANCE},
+        },
+    ),
+    broker_transport_options={
+        # 큐별 우선순위 리스트 (<queue>:<priority>)
+        "priority_steps": list(range(10)),
+        "sep": ":",
+        # 워커가 -Q에 나열한 순서대로 큐를 소비 (앞쪽 큐가 비었을 때만 뒤쪽 큐 처리)
+        "queue_order_strategy": "priority",
+    },
     worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=50,
     # Worker 이벤트 활성화 (모니터링용)
@@ -50,6 +97,18 @@ celery_app.conf.update(
             "task": "app.workers.monitoring_tasks.check_worker_health",
             "schedule": timedelta(seconds=settings.WORKER_MONITOR_INTERVAL_SECONDS),
         },
+        "flush-problem-stats": {
+            "task": "app.workers.maintenance_tasks.flush_problem_stats",
+            "schedule": timedelta(seconds=settings.PROBLEM_STATS_FLUSH_INTERVAL_SECONDS),
+        },
+        "expire-stale-feedback": {
+            "task": "app.workers.maintenance_tasks.expire_stale_feedback",
+            "schedule": timedelta(seconds=settings.AI_FEEDBACK_SWEEP_INTERVAL_SECONDS),
+        },
+        "collect-judge-bundle-garbage": {
+            "task": "app.workers.maintenance_tasks.collect_judge_bundle_garbage",
+            "schedule": timedelta(seconds=settings.JUDGE_BUNDLE_GC_INTERVAL_SECONDS),
+        },
     },
 )
 
@@ -49,12 +49,96 @@ class Settings(BaseSettings):
     OPENAI_DEFAULT_VERBOSITY: str = "medium"  # GPT-5.2 verbosity: low, medium, high
     OPENAI_COMPACTION_ENABLED: bool = True  # GPT-5.2 컨텍스트 압축 기능
 
+    # Celery Queues (태스크 큐 라우팅, app.core.celery_app / app.workers.worker_pools)
+    CELERY_QUEUE_MEMBER_GRADING: str = "grading_member"  # 회원 제출 채점
+    CELERY_QUEUE_GUEST_GRADING: str = "grading_guest"  # 게스트 제출 채점
+    AI_FEEDBACK_QUEUE: str = "feedback"  # 제출 AI 피드백 (LLM 호출)
+    AI_FEEDBACK_STALE_SECONDS: int = 900  # 제출 후 이 시간이 지나도 피드백 대기 중이면 피드백 없이 완료 처리 (태스크 유실 대비)
+    AI_FEEDBACK_SWEEP_INTERVAL_SECONDS: int = 300  # 피드백 대기 제출 정리 주기 (초, 유지보수 태스크)
+    CELERY_QUEUE_MAINTENANCE: str = "maintenance"  # 모니터링/유지보수 (Beat 태스크)
+    CELERY_MEMBER_GRADING_CONCURRENCY: int = 4  # 회원 채점 워커 풀 동시 실행 수
+    CELERY_GUEST_GRADING_CONCURRENCY: int = 2  # 게스트 채점 워커 풀 동시 실행 수
+    CELERY_FEEDBACK_CONCURRENCY: int = 8  # 피드백 워커 풀 동시 실행 수 (스레드, 네트워크 대기 위주)
+    CELERY_MAINTENANCE_CONCURRENCY: int = 1  # 유지보수 워커 풀 동시 실행 수
+    CELERY_BEAT_SCHEDULE_FILE: str = "/tmp/celerybeat-schedule"  # 유지보수 워커에 포함된 Celery Beat의 스케줄 상태 파일
+
     # Worker Monitoring
     WORKER_MONITOR_ENABLED: bool = True
     WORKER_MONITOR_INTERVAL_SECONDS: int = 30
     WORKER_DOWN_THRESHOLD: int = 3  # 연속 N회 미응답시 Down 판정
     WORKER_HEARTBEAT_TIMEOUT: int = 10  # Inspect 타임아웃 (초)
 
+    # Judge Backend
+    JUDGE_BACKEND: str = "docker"  # docker: 컨테이너 실행, sandbox: nsjail 로컬 프로세스 실행 (root 필요)
+    JUDGE_SANDBOX_PYTHON: Optional[str] = None  # sandbox 인터프리터 (None이면 워커의 python)
+    JUDGE_SANDBOX_WORKDIR: str = "/tmp/qa_arena_sandbox"  # sandbox 작업 디렉토리 루트
+    JUDGE_SANDBOX_NSJAIL: str = "nsjail"  # nsjail 실행 파일 (경로 또는 PATH의 이름)
+    JUDGE_SANDBOX_HOST_UID_BASE: int = 200000  # jail 내부 root/대상 실행 uid를 매핑할 호스트 비특권 uid 시작 번호
+
+    # bind: 호스트 임시 디렉토리 마운트 (DinD 시 /tmp/qa_arena_judge 공유 필요)
+    # archive: 메모리 내 tar를 put_archive로 전달 (호스트 임시 디렉토리 불필요)
+    JUDGE_FILE_DELIVERY: str = "bind"
+    JUDGE_LOG_MAX_BYTES: int = 65536  # 실행당 보관할 최대 출력 크기 (초과 시 앞/뒤만 유지)
+    JUDGE_RUN_UID_BASE: int = 62000  # 다중 대상 러너가 대상마다 권한을 낮출 uid 시작 번호 (러너가 root일 때, 0이면 사용 안 함)
+    JUDGE_ASYNC_CLEANUP: bool = False  # 컨테이너/임시 디렉토리 정리를 백그라운드 reaper 스레드에서 수행
+    JUDGE_REAPER_STALE_SECONDS: int = 600  # 워커 시작 시 이보다 오래된 judge 컨테이너/임시 디렉토리 정리
+    JUDGE_TEST_TIMEOUT: float = 0.0  # 테스트 하나의 최대 실행 시간 (초, 실행 타임아웃의 60% 이하로 제한, 0이면 사용 안 함). 느린 정상 테스트가 Timeout 실패로 바뀌지 않도록 문제들의 Golden 실행 시간보다 충분히 크게 설정
+    JUDGE_BUNDLE_ENABLED: bool = False  # 대상 코드별 번들(target.py + pyc + conftest)을 마운트하고 실행마다 test_user.py만 전달 (bind 방식, cold 컨테이너)
+    JUDGE_BUNDLE_DIR: str = "/tmp/qa_arena_bundles"  # 내용 주소 번들 저장소 (Docker-in-Docker 시 호스트와 같은 경로로 공유 필요)
+    JUDGE_BUNDLE_GC_INTERVAL_SECONDS: int = 3600  # 사용되지 않는 번들/중단된 .build-* 디렉토리 정리 주기 (초, 유지보수 태스크)
+    JUDGE_BUNDLE_GC_GRACE_SECONDS: int = 3600  # 이 시간보다 오래된 디렉토리만 정리 (실행 중인 컨테이너가 마운트한 번들 보호)
+
+    # Judge Container Pool
+    JUDGE_POOL_ENABLED: bool = False  # warm 컨테이너 풀 사용 여부
+    JUDGE_POOL_SIZE: int = 2  # 유휴 상태로 유지할 warm 컨테이너 수 (워커 프로세스당)
+    JUDGE_POOL_MAX_JOBS: int = 20  # 컨테이너당 최대 작업 수 (초과 시 재생성)
+    JUDGE_POOL_FORKSERVER: bool = False  # pool 컨테이너에서 forkserver로 작업 실행 (judge 이미지 재빌드 필요)
+    JUDGE_MULTI_TARGET_ENABLED: bool = False  # Golden + 모든 Mutant를 한 컨테이너에서 채점
+    JUDGE_MUTANT_SCHEMA_ENABLED: bool = False  # 다중 대상 채점 시 Mutant schema 모듈로 한 번만 임포트/수집 (judge 이미지 재빌드 필요)
+    JUDGE_MUTANT_CONCURRENCY: int = 1  # 워커당 동시에 실행할 Mutant 수 (1이면 순차 실행)
+    JUDGE_SPECULATIVE_MUTANTS: bool = False  # Golden과 Mutant를 동시에 시작 (Golden 실패 시 취소)
+    JUDGE_COVERAGE_SKIP_ENABLED: bool = False  # Golden 커버리지가 변경된 줄에 도달하지 않은 Mutant는 실행 없이 survived 처리
+    JUDGE_PRESCREEN_ENABLED: bool = True  # 문법 오류/테스트 없음/차단 임포트는 컨테이너 실행 없이 실패 처리
+    JUDGE_KILL_MATRIX_ENABLED: bool = True  # 제출별 테스트 × Mutant kill 행렬 저장 (분석 API용)
+    JUDGE_TEST_KILL_STATS_ENABLED: bool = False  # 테스트 특징별 kill 통계를 Redis에 누적 후 Problem.test_kill_stats에 주기 반영 (테스트 순서 최적화용)
+    JUDGE_TEST_KILL_STATS_MAX_FEATURES: int = 500  # Mutant당 유지할 최대 특징 수 (실행 수가 적은 특징부터 제거)
+    JUDGE_TEST_ORDERING_ENABLED: bool = False  # Mutant별로 kill 확률이 높은 테스트부터 실행 (다중 대상 채점 제외)
+    JUDGE_BATCH_ENABLED: bool = False  # 같은 문제의 동시 제출을 모아 공유 컨테이너에서 채점 (judge 이미지 재빌드 필요)
+    JUDGE_BATCH_WINDOW_MS: int = 200  # 배치 리더가 같은 문제의 제출을 모으는 시간 (밀리초)
+    JUDGE_BATCH_MAX_SIZE: int = 8  # 한 배치의 최대 제출 수
+
+    # Judge Adaptive Timeout (문제별 Golden 실행 시간 프로파일 기반)
+    JUDGE_RUNTIME_PROFILE_ENABLED: bool = False  # 통과한 Golden 실행 시간을 Redis에 누적 후 Problem.runtime_profile에 주기 반영 (adaptive 타임아웃용)
+    JUDGE_ADAPTIVE_TIMEOUT_ENABLED: bool = False  # Mutant 실행에 문제별 타임아웃 적용 (기본 타임아웃 이하로만 단축)
+    JUDGE_ADAPTIVE_TIMEOUT_MULTIPLIER: float = 3.0  # Golden 실행 시간 p99 (및 이번 Golden 실행 시간)에 곱하는 배수
+    JUDGE_ADAPTIVE_TIMEOUT_FLOOR: float = 1.0  # 문제별 타임아웃 하한 (초)
+    JUDGE_ADAPTIVE_TIMEOUT_MIN_SAMPLES: int = 20  # 문제별 타임아웃을 계산하기 위한 최소 표본 수
+    JUDGE_ADAPTIVE_TIMEOUT_WINDOW: int = 200  # 문제당 유지할 최근 Golden 실행 시간 표본 수
+    PROBLEM_STATS_FLUSH_INTERVAL_SECONDS: int = 60  # 누적된 문제별 통계(runtime_profile, test_kill_stats)를 DB에 반영하는 주기 (초)
+    PROBLEM_STATS_FLUSH_BATCH_SIZE: int = 100  # 한 번의 반영에서 처리할 최대 문제 수
+
+    # Judge Admission Control (호스트 단위 동시 실행 제한)
+    JUDGE_ADMISSION_ENABLED: bool = False  # 호스트당 동시 judge 실행 수 제한 (Redis 세마포어)
+    JUDGE_ADMISSION_HOST_ID: Optional[str] = None  # 같은 Docker 호스트를 쓰는 워커가 공유할 키 (None이면 hostname)
+    JUDGE_ADMISSION_SLOTS: int = 0  # 호스트당 동시 실행 수 (0이면 CPU 코어/메모리로 자동 계산)
+    JUDGE_ADMISSION_WAIT_TIMEOUT: int = 60  # 슬롯 대기 최대 시간 (초, 초과 시 경고 후 실행)
+
+    # Judge Result Cache
+    JUDGE_CACHE_ENABLED: bool = False  # 동일 입력의 채점 결과 재사용
+    JUDGE_CACHE_REDIS_DB: int = 3  # Celery 0-1, Rate limiting 2, Judge 캐시/admission 3 (maxmemory-policy volatile-lru 권장)
+    JUDGE_CACHE_TTL_SECONDS: int = 86400  # Redis 캐시 항목 TTL (1일)
+    JUDGE_CACHE_LOCAL_MAX_ENTRIES: int = 256  # 프로세스 내 LRU 캐시 최대 항목 수
+
+    # Submission Progress (Redis 진행률 채널)
+    SUBMISSION_PROGRESS_REDIS_ENABLED: bool = False  # 채점 중 진행률을 Redis에만 기록 (RUNNING 전환/최종 상태만 DB 커밋)
+    SUBMISSION_PROGRESS_TTL_SECONDS: int = 3600  # 진행률 키 TTL (워커 비정상 종료 시 정리)
+    SUBMISSION_EVENTS_HEARTBEAT_SECONDS: int = 15  # SSE 연결 유지용 주석 전송 및 DB 상태 확인 간격 (초)
+    SUBMISSION_EVENTS_MAX_SECONDS: int = 600  # SSE 연결 최대 유지 시간 (초, 이후 클라이언트가 재연결)
+
+    # Fair-share Scheduling (제출자별 채점 순서 공정 분배, deficit round-robin)
+    FAIR_SHARE_ENABLED: bool = False  # 채점 태스크가 제출자별 대기열에서 DRR 순서로 제출을 가져와 채점
+    FAIR_SHARE_QUANTUM: int = 8  # 차례마다 제출자에게 주는 deficit (채점 대상 수 단위: Golden 1 + Mutant 수)
+
     # Slack Alert
     SLACK_WEBHOOK_URL: Optional[str] = None
     SLACK_ALERT_ENABLED: bool = False
@@ -0,0 +1,45 @@
+"""Submission kill matrix model."""
+
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, LargeBinary
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+
+from app.models.db import Base
+
+
+class SubmissionKillMatrix(Base):
+    """
+    제출별 테스트 × Mutant kill 행렬.
+
+    행(테스트)은 test_names 순서, 열(Mutant)은 mutant_ids 순서이며
+    killed/executed는 행 우선 순서의 비트셋입니다 (app/services/kill_matrix.py).
+    """
+
+    __tablename__ = "submission_kill_matrices"
+
+    submission_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("submissions.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    problem_id = Column(
+        Integer,
+        ForeignKey("problems.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    test_names = Column(JSONB, nullable=False)  # ["test_x", "TestY::test_z", ...]
+    mutant_ids = Column(JSONB, nullable=False)  # [3, 4, 7, ...]
+    killed = Column(LargeBinary, nullable=False)  # 테스트가 Mutant를 kill (실패)
+    executed = Column(LargeBinary, nullable=False)  # 테스트가 Mutant에 대해 실행됨 (--maxfail=1로 일부만 실행)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Relationships
+    submission = relationship("Submission")
+
+    def __repr__(self):
+        return (
+            f"<SubmissionKillMatrix(submission_id={self.submission_id}, "
+            f"tests={len(self.test_names or [])}, mutants={len(self.mutant_ids or [])})>"
+        )
@@ -25,6 +25,8 @@ class Problem(Base):
         nullable=False,
     )
     skills = Column(JSONB)
+    runtime_profile = Column(JSONB)  # Golden 실행 시간 표본과 문제별 타임아웃 (runtime_profile.py)
+    test_kill_stats = Column(JSONB)  # Mutant별 테스트 특징 kill 통계 (mutant_test_order.py)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
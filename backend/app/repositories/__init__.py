@@ -3,10 +3,12 @@
 from app.repositories.problem_repository import ProblemRepository
 from app.repositories.submission_repository import SubmissionRepository
 from app.repositories.buggy_implementation_repository import BuggyImplementationRepository
+from app.repositories.kill_matrix_repository import KillMatrixRepository
 
 __all__ = [
     "ProblemRepository",
     "SubmissionRepository",
     "BuggyImplementationRepository",
+    "KillMatrixRepository",
 ]
 
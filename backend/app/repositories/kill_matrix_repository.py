@@ -0,0 +1,62 @@
+"""Submission kill matrix repository."""
+
+from typing import List, Optional
+from uuid import UUID
+from sqlalchemy.orm import Session
+
+from app.models.kill_matrix import SubmissionKillMatrix
+
+
+class KillMatrixRepository:
+    """Repository for SubmissionKillMatrix model."""
+
+    def __init__(self, db: Session):
+        """Initialize repository with database session."""
+        self.db = db
+
+    def save(self, matrix: SubmissionKillMatrix) -> SubmissionKillMatrix:
+        """
+        Create or replace the kill matrix of a submission.
+
+        같은 제출이 다시 채점되면(재시도 등) 기존 행렬을 덮어씁니다.
+
+        Args:
+            matrix: SubmissionKillMatrix instance to save
+
+        Returns:
+            Saved kill matrix
+        """
+        matrix = self.db.merge(matrix)
+        self.db.commit()
+        return matrix
+
+    def get_by_submission_id(self, submission_id: UUID) -> Optional[SubmissionKillMatrix]:
+        """
+        Get kill matrix by submission ID.
+
+        Args:
+            submission_id: Submission ID
+
+        Returns:
+            SubmissionKillMatrix if found, None otherwise
+        """
+        return self.db.get(SubmissionKillMatrix, submission_id)
+
+    def get_recent_by_problem_id(self, problem_id: int, limit: int = 1000) -> List[SubmissionKillMatrix]:
+        """
+        Get the most recent kill matrices of a problem.
+
+        Args:
+            problem_id: Problem ID
+            limit: Maximum number of matrices to return
+
+        Returns:
+            List of kill matrices (newest first)
+        """
+        return (
+            self.db.query(SubmissionKillMatrix)
+            .filter(SubmissionKillMatrix.problem_id == problem_id)
+            .order_by(SubmissionKillMatrix.created_at.desc())
+            .limit(limit)
+            .all()
+        )
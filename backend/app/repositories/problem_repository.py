@@ -4,6 +4,7 @@ from typing import Optional, List, Tuple, Union
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
+from app.models.buggy_implementation import BuggyImplementation
 from app.models.problem import Problem
 from app.schemas.problem import ProblemCreate
 
@@ -49,6 +50,23 @@ class ProblemRepository:
         """
         return self.db.query(Problem).filter(Problem.id == problem_id).first()
 
+    def get_by_id_for_update(self, problem_id: int) -> Optional[Problem]:
+        """
+        Get problem by ID, locking the row until the transaction ends.
+
+        Args:
+            problem_id: Problem ID
+
+        Returns:
+            Problem if found, None otherwise
+        """
+        return (
+            self.db.query(Problem)
+            .filter(Problem.id == problem_id)
+            .with_for_update()
+            .first()
+        )
+
     def get_by_slug(self, slug: str) -> Optional[Problem]:
         """
         Get problem by slug.
@@ -92,3 +110,28 @@ class ProblemRepository:
         self.db.commit()
         self.db.refresh(problem)
         return problem
+
+    def get_target_codes(self) -> List[str]:
+        """
+        Get every golden and buggy implementation code (judge targets).
+
+        Returns:
+            List of target code strings
+        """
+        golden = [code for (code,) in self.db.query(Problem.golden_code)]
+        buggy = [code for (code,) in self.db.query(BuggyImplementation.buggy_code)]
+        return golden + buggy
+
+    def update(self, problem: Problem) -> Problem:
+        """
+        Update an existing problem.
+
+        Args:
+            problem: Problem instance to update
+
+        Returns:
+            Updated problem
+        """
+        self.db.commit()
+        self.db.refresh(problem)
+        return problem
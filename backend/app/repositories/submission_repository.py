@@ -44,6 +44,44 @@ class SubmissionRepository:
         """
         return self.db.query(Submission).filter(Submission.id == submission_id).first()
 
+    def get_status(self, submission_id: UUID) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Get only the status and progress step of a submission.
+
+        Args:
+            submission_id: Submission ID
+
+        Returns:
+            (status, progress step) if found, None otherwise
+        """
+        row = (
+            self.db.query(Submission.status, Submission.progress["step"].astext)
+            .filter(Submission.id == submission_id)
+            .first()
+        )
+        return (row[0], row[1]) if row else None
+
+    def get_feedback_pending_before(self, step: str, cutoff: datetime) -> List[Submission]:
+        """
+        Get successful submissions still at the given progress step, created before cutoff.
+
+        Args:
+            step: Progress step (e.g. "generating_feedback")
+            cutoff: Only submissions created before this time
+
+        Returns:
+            List of submissions
+        """
+        return (
+            self.db.query(Submission)
+            .filter(
+                Submission.status == "SUCCESS",
+                Submission.progress["step"].astext == step,
+                Submission.created_at < cutoff,
+            )
+            .all()
+        )
+
     def update(self, submission: Submission) -> Submission:
         """
         Update an existing submission.
@@ -0,0 +1,21 @@
+"""Grading queue schemas."""
+
+from pydantic import BaseModel
+from typing import Dict, List
+
+
+class GradingLaneDepth(BaseModel):
+    """Schema for per-submitter queue depth of a grading queue."""
+
+    queue: str
+    total: int
+    active_submitters: int
+    # {제출자 키(user:<id> / anon:<id>): 대기 제출 수}, 대기 수가 많은 순
+    submitters: Dict[str, int]
+
+
+class GradingQueueDepthResponse(BaseModel):
+    """Schema for fair-share grading queue depth."""
+
+    enabled: bool
+    lanes: List[GradingLaneDepth]
@@ -0,0 +1,43 @@
+"""Kill matrix schemas."""
+
+from pydantic import BaseModel
+from uuid import UUID
+from typing import Dict, List
+
+
+class KillMatrixResponse(BaseModel):
+    """Schema for a submission's test-by-mutant kill matrix."""
+
+    submission_id: UUID
+    problem_id: int
+    test_names: List[str]
+    mutant_ids: List[int]
+    # {테스트 이름: {mutant_id: "killed" | "survived" | "not_run"}}
+    cells: Dict[str, Dict[int, str]]
+
+
+class MutantKillStats(BaseModel):
+    """Schema for per-mutant kill statistics."""
+
+    mutant_id: int
+    submissions: int
+    killed: int
+    kill_ratio: float
+
+
+class PerTestKillStats(BaseModel):
+    """Schema for per-test-name kill statistics."""
+
+    name: str
+    executed: int
+    kills: int
+    killed_mutants: Dict[int, int]
+
+
+class ProblemKillStatsResponse(BaseModel):
+    """Schema for a problem's aggregated kill statistics."""
+
+    problem_id: int
+    submissions: int
+    mutants: List[MutantKillStats]
+    tests: List[PerTestKillStats]
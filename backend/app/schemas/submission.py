@@ -27,6 +27,7 @@ class SubmissionResponse(BaseModel):
     total_mutants: Optional[int] = None
     execution_log: Optional[Dict[str, Any]] = None
     feedback_json: Optional[Dict[str, Any]] = None
+    progress: Optional[Dict[str, Any]] = None  # 채점 중 진행률 (Redis 진행률 채널 우선)
     created_at: datetime
 
     model_config = {"from_attributes": True}
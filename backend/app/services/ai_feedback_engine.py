@@ -76,13 +76,15 @@ def build_user_prompt(
     if execution_log:
         golden_log = execution_log.get("golden", {})
         if golden_log:
-            pytest_output += f"Golden Code 테스트 결과:\n{golden_log.get('stdout', '')}\n\n"
+            pytest_output += f"Golden Code 테스트 결과:\n{golden_log.get('logs') or golden_log.get('stdout') or ''}\n\n"
         
         mutants_log = execution_log.get("mutants", [])
         if mutants_log:
             pytest_output += "결함 코드 테스트 결과:\n"
             for i, mutant_log in enumerate(mutants_log[:3], 1):  # 처음 3개만 표시
-                pytest_output += f"결함 {i}: {mutant_log.get('stdout', '')[:200]}...\n"
+                mutant_result = mutant_log.get("result", mutant_log)
+                mutant_output = mutant_result.get("logs") or mutant_result.get("stdout") or ""
+                pytest_output += f"결함 {i}: {mutant_output[:200]}...\n"
 
     return f"""[문제 정보]
 제목: {problem_title}
@@ -0,0 +1,444 @@
+"""Warm judge container pool.
+
+미리 시작해 둔 judge 컨테이너를 재사용하여 채점마다 발생하는
+create → start → wait → stop → remove 비용을 제거합니다.
+각 작업은 컨테이너 내부의 별도 디렉토리에 tar로 전달되고 exec로 실행됩니다.
+작업이 끝나면 PID 1을 제외한 남은 프로세스를 종료하며, 남은 프로세스가 있었거나
+타임아웃/메모리 한도 초과가 발생한 컨테이너는 재사용하지 않습니다.
+"""
+
+import atexit
+import logging
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import docker
+
+from app.core.config import settings
+from app.services.container_reaper import get_container_reaper, judge_labels
+from app.services.docker_service import (
+    CONTAINER_LIMITS,
+    JUDGE_IMAGE,
+    build_files_archive,
+)
+from app.services.judge_backend import (
+    BoundedOutput,
+    MultiTargetRun,
+    cancellable,
+    run_cancelled,
+)
+
+logger = logging.getLogger(__name__)
+
+# 풀 컨테이너를 식별하기 위한 라벨
+POOL_LABEL = "qa_arena.judge.pool"
+# 작업 디렉토리 루트 (컨테이너 내부)
+JOB_ROOT = "/tmp/qa_arena_jobs"
+# coreutils timeout (및 forkserver)이 타임아웃으로 종료했을 때의 종료 코드
+TIMEOUT_EXIT_CODE = 124
+# SIGKILL로 종료된 경우의 종료 코드 (timeout의 --kill-after 강제 종료 또는 OOM 종료)
+KILLED_EXIT_CODE = 137
+# timeout이 SIGTERM 후 SIGKILL을 보내기까지 기다리는 시간 (초)
+TIMEOUT_KILL_AFTER = 1
+# 작업 후 컨테이너에 남은 프로세스를 정리하는 스크립트
+# (PID 1(sleep 또는 forkserver)과 자신을 제외한 모든 프로세스를 SIGKILL 하고,
+#  종료한 프로세스 수와 cgroup의 누적 OOM 종료 횟수를 출력)
+SWEEP_SCRIPT = """
+import os, signal
+me = os.getpid()
+killed = 0
+for name in os.listdir("/proc"):
+    if name.isdigit() and int(name) not in (1, me):
+        try:
+            os.kill(int(name), signal.SIGKILL)
+            killed += 1
+        except ProcessLookupError:
+            pass
+oom_kills = 0
+for path in ("/sys/fs/cgroup/memory.events", "/sys/fs/cgroup/memory/memory.oom_control"):
+    try:
+        with open(path) as f:
+            for line in f:
+                key, _, value = line.partition(" ")
+                if key == "oom_kill":
+                    oom_kills = int(value)
+        break
+    except OSError:
+        pass
+print(killed, oom_kills)
+"""
+# judge 이미지에 포함된 forkserver 런타임 (judge/Dockerfile 참고)
+FORKSERVER_COMMAND = ["python", "/opt/qa_arena/forkserver.py"]
+FORKSERVER_CLIENT_COMMAND = ["python", "-I", "-S", "/opt/qa_arena/forkserver_client.py"]
+# forkserver 연결 실패 또는 forkserver가 신뢰할 수 없는 작업을 알렸을 때의 종료 코드
+# (judge/forkserver_client.py의 CONNECT_FAILED_EXIT_CODE와 동일)
+FORKSERVER_FAILED_EXIT_CODE = 97
+
+
+@dataclass
+class PooledContainer:
+    """풀에서 관리되는 warm 컨테이너."""
+
+    container: Any
+    jobs_run: int = 0
+    # 마지막으로 확인한 cgroup 누적 OOM 종료 횟수
+    oom_kills: int = 0
+    created_at: float = field(default_factory=time.time)
+
+
+class JudgeContainerPool:
+    """미리 시작된 judge 컨테이너 풀."""
+
+    def __init__(
+        self,
+        client: docker.DockerClient,
+        size: int = 2,
+        max_jobs_per_container: int = 20,
+        use_forkserver: bool = False,
+    ):
+        """
+        JudgeContainerPool 초기화.
+
+        Args:
+            client: Docker 클라이언트
+            size: 유휴 상태로 유지할 warm 컨테이너 수
+            max_jobs_per_container: 컨테이너당 최대 작업 수 (초과 시 재생성)
+            use_forkserver: 컨테이너 내부 forkserver로 작업 실행 (pytest 사전 임포트)
+        """
+        self.client = client
+        self.size = size
+        self.max_jobs_per_container = max_jobs_per_container
+        self.use_forkserver = use_forkserver
+        self._idle: Deque[PooledContainer] = deque()
+        self._in_use = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "recycled": 0,
+            "created": 0,
+            "jobs": 0,
+        }
+
+    def _start_container(self) -> PooledContainer:
+        """유휴 상태로 대기하는 새 warm 컨테이너를 시작합니다."""
+        container = self.client.containers.run(
+            image=JUDGE_IMAGE,
+            command=FORKSERVER_COMMAND if self.use_forkserver else ["sleep", "infinity"],
+            labels={POOL_LABEL: "true", **judge_labels("pool")},
+            environment={"PYTHONDONTWRITEBYTECODE": "1"},
+            detach=True,
+            **CONTAINER_LIMITS,
+        )
+        with self._lock:
+            self._stats["created"] += 1
+        logger.info(f"Warm judge 컨테이너 시작: {container.id[:12]}")
+        return PooledContainer(container=container)
+
+    def _destroy(self, pooled: PooledContainer) -> None:
+        """컨테이너를 강제 제거합니다."""
+        try:
+            pooled.container.remove(force=True)
+        except Exception as e:
+            logger.warning(
+                f"Warm 컨테이너 제거 실패: 컨테이너 ID={pooled.container.id[:12]}, "
+                f"에러 타입={type(e).__name__}, 에러 메시지={str(e)}"
+            )
+
+    def warm_up(self) -> None:
+        """유휴 컨테이너 수가 size가 될 때까지 컨테이너를 시작합니다."""
+        while True:
+            with self._lock:
+                if self._closed or len(self._idle) >= self.size:
+                    return
+            try:
+                pooled = self._start_container()
+            except Exception as e:
+                logger.error(f"Warm 컨테이너 시작 실패: {type(e).__name__}: {str(e)}")
+                return
+            with self._lock:
+                if self._closed or len(self._idle) >= self.size:
+                    surplus = pooled
+                else:
+                    self._idle.append(pooled)
+                    surplus = None
+            if surplus is not None:
+                self._destroy(surplus)
+                return
+
+    def _replenish_async(self) -> None:
+        """백그라운드에서 풀을 다시 채웁니다."""
+        threading.Thread(target=self.warm_up, name="judge-pool-warmup", daemon=True).start()
+
+    def acquire(self) -> PooledContainer:
+        """
+        유휴 컨테이너를 가져옵니다. 없으면 새로 시작합니다 (miss).
+
+        Returns:
+            작업을 실행할 PooledContainer
+        """
+        with self._lock:
+            pooled = self._idle.popleft() if self._idle else None
+            self._stats["hits" if pooled else "misses"] += 1
+            self._in_use += 1
+        if pooled is None:
+            try:
+                pooled = self._start_container()
+            except Exception:
+                with self._lock:
+                    self._in_use -= 1
+                raise
+        return pooled
+
+    def release(self, pooled: PooledContainer, contaminated: bool = False) -> None:
+        """
+        작업이 끝난 컨테이너를 반환합니다.
+
+        Args:
+            pooled: 반환할 컨테이너
+            contaminated: 타임아웃/exec 실패 등으로 상태를 신뢰할 수 없는 경우 True
+        """
+        pooled.jobs_run += 1
+        recycle = contaminated or pooled.jobs_run >= self.max_jobs_per_container
+        with self._lock:
+            self._in_use -= 1
+            if recycle:
+                self._stats["recycled"] += 1
+            keep = not recycle and not self._closed and len(self._idle) < self.size
+            if keep:
+                self._idle.append(pooled)
+            needs_refill = not self._closed and len(self._idle) < self.size
+        if not keep:
+            if recycle:
+                logger.info(
+                    f"Warm 컨테이너 재생성: 컨테이너 ID={pooled.container.id[:12]}, "
+                    f"작업 수={pooled.jobs_run}, 오염={contaminated}"
+                )
+            if settings.JUDGE_ASYNC_CLEANUP:
+                get_container_reaper().submit(container=pooled.container)
+            else:
+                self._destroy(pooled)
+        if needs_refill:
+            self._replenish_async()
+
+    def run_pytest(self, run: MultiTargetRun) -> Dict[str, Any]:
+        """
+        warm 컨테이너에서 multi_runner.py로 단일 대상 pytest를 실행합니다.
+
+        Args:
+            run: 단일 대상 실행 구성
+
+        Returns:
+            JudgeBackend.run_pytest와 같은 형식의 실행 결과 딕셔너리
+        """
+        pooled = self.acquire()
+        container = pooled.container
+        job_dir = f"{JOB_ROOT}/{uuid.uuid4().hex}"
+        contaminated = False
+        start_time = time.time()
+
+        try:
+            if run.uid_base:
+                # 같은 컨테이너의 이전 작업과 uid가 겹치지 않도록 작업마다 다른 uid 범위 사용
+                run.uid_base = settings.JUDGE_RUN_UID_BASE + pooled.jobs_run * len(run.targets)
+            archive = build_files_archive(run.files())
+            mkdir = container.exec_run(["mkdir", "-p", "-m", "700", job_dir])
+            if mkdir.exit_code != 0 or not container.put_archive(job_dir, archive):
+                contaminated = True
+                raise RuntimeError(f"작업 디렉토리 준비 실패: {job_dir}")
+
+            timeout = run.run_timeout()
+            if self.use_forkserver:
+                # forkserver가 타임아웃을 처리하며, 바깥 timeout은 안전장치
+                command = [
+                    "timeout", f"--kill-after={TIMEOUT_KILL_AFTER}", "-s", "TERM", str(timeout + 2),
+                    *FORKSERVER_CLIENT_COMMAND, job_dir, str(timeout), run.spec_argument(),
+                ]
+            else:
+                command = [
+                    "timeout", f"--kill-after={TIMEOUT_KILL_AFTER}", "-s", "TERM", str(timeout),
+                    *run.command("python"),
+                ]
+
+            start_time = time.time()
+            with cancellable(container.kill):
+                exit_code, output = self._exec_streaming(container, command, job_dir)
+            execution_time = time.time() - start_time
+            if run_cancelled():
+                # 취소로 종료된 컨테이너는 재사용하지 않음 (cold 컨테이너로 폴백하지 않도록 결과 반환)
+                contaminated = True
+                return {
+                    "success": False,
+                    "exit_code": -1,
+                    "stdout": "",
+                    "stderr": "취소된 judge 실행",
+                    "execution_time": execution_time,
+                    "logs": "",
+                }
+            logs = output.getvalue()
+
+            if self.use_forkserver and exit_code == FORKSERVER_FAILED_EXIT_CODE:
+                # forkserver가 없거나 작업 중 시그널을 받음 - 컨테이너를 버리고 cold로 폴백
+                contaminated = True
+                raise RuntimeError(
+                    f"forkserver 실행 실패: 컨테이너 ID={container.id[:12]}"
+                )
+
+            clean, oom_seen = self._sweep(pooled)
+            if not clean:
+                contaminated = True
+
+            stderr = ""
+            if oom_seen or self._oom_flagged(pooled, exit_code):
+                logger.warning(
+                    f"Warm 컨테이너 메모리 한도 초과: 컨테이너 ID={container.id[:12]}, "
+                    f"메모리 제한={CONTAINER_LIMITS['mem_limit']}"
+                )
+                contaminated = True
+                stderr = "메모리 한도 초과로 종료됨"
+            elif exit_code == TIMEOUT_EXIT_CODE or (
+                exit_code == KILLED_EXIT_CODE and execution_time >= timeout
+            ):
+                logger.warning(
+                    f"Warm 컨테이너 실행 타임아웃: 컨테이너 ID={container.id[:12]}, "
+                    f"타임아웃={timeout}초"
+                )
+                contaminated = True
+                stderr = f"타임아웃 ({timeout}초)"
+            elif exit_code == KILLED_EXIT_CODE:
+                contaminated = True
+                stderr = "러너가 강제 종료됨"
+
+            cleanup = container.exec_run(["rm", "-rf", job_dir])
+            if cleanup.exit_code != 0:
+                contaminated = True
+
+            with self._lock:
+                self._stats["jobs"] += 1
+
+            result = run.parse_single(
+                {"logs": logs, "stderr": stderr, "execution_time": execution_time}
+            )
+            logger.info(
+                f"Warm 컨테이너 실행 완료: {container.id[:12]}, 러너 종료 코드: {exit_code}, "
+                f"성공: {result['success']}, 시간: {execution_time:.2f}초"
+            )
+            return result
+
+        except Exception:
+            contaminated = True
+            raise
+
+        finally:
+            self.release(pooled, contaminated=contaminated)
+
+    def _sweep(self, pooled: PooledContainer) -> Tuple[bool, bool]:
+        """
+        작업이 끝난 컨테이너에서 PID 1을 제외한 남은 프로세스를 모두 종료합니다.
+
+        Returns:
+            (남은 프로세스가 없었는지 여부 (재사용 가능), 직전 작업 중 OOM 종료 발생 여부) 튜플
+        """
+        container = pooled.container
+        result = container.exec_run(["python", "-I", "-S", "-c", SWEEP_SCRIPT])
+        try:
+            killed, oom_kills = (int(value) for value in result.output.decode().split())
+        except ValueError:
+            return False, False
+        oom_seen = oom_kills > pooled.oom_kills
+        pooled.oom_kills = oom_kills
+        if killed:
+            logger.warning(
+                f"Warm 컨테이너에 남은 프로세스 종료: 컨테이너 ID={container.id[:12]}, 프로세스 수={killed}"
+            )
+        return result.exit_code == 0 and killed == 0, oom_seen
+
+    def _oom_flagged(self, pooled: PooledContainer, exit_code: int) -> bool:
+        """SIGKILL로 끝난 작업이 Docker에 OOM 종료로 기록되었는지 확인합니다."""
+        if exit_code != KILLED_EXIT_CODE:
+            return False
+        container = pooled.container
+        container.reload()
+        return bool(container.attrs.get("State", {}).get("OOMKilled"))
+
+    def _exec_streaming(
+        self,
+        container: Any,
+        command: List[str],
+        workdir: str,
+    ) -> Tuple[int, BoundedOutput]:
+        """
+        exec 출력을 스트리밍으로 읽어 상한까지만 보관합니다.
+
+        Returns:
+            (종료 코드, 출력 버퍼) 튜플
+        """
+        api = self.client.api
+        exec_id = api.exec_create(container.id, command, workdir=workdir)["Id"]
+        output = BoundedOutput()
+        for chunk in api.exec_start(exec_id, stream=True):
+            output.feed(chunk)
+        if output.truncated:
+            logger.warning(
+                f"Warm 컨테이너 출력 상한 초과: {container.id[:12]}, "
+                f"전체={output.total_bytes}바이트, 상한={output.max_bytes}바이트"
+            )
+        return api.exec_inspect(exec_id)["ExitCode"], output
+
+    def stats(self) -> Dict[str, int]:
+        """풀 크기 및 hit/miss/recycle 카운터를 반환합니다."""
+        with self._lock:
+            return {
+                "size": self.size,
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                **self._stats,
+            }
+
+    def shutdown(self) -> None:
+        """모든 유휴 컨테이너를 제거하고 풀을 닫습니다."""
+        with self._lock:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+        for pooled in idle:
+            self._destroy(pooled)
+        logger.info(f"Judge 컨테이너 풀 종료: 제거된 컨테이너={len(idle)}")
+
+
+_pool: Optional[JudgeContainerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_container_pool(client: docker.DockerClient) -> JudgeContainerPool:
+    """
+    프로세스 전역 judge 컨테이너 풀을 반환합니다 (최초 호출 시 생성).
+
+    Args:
+        client: 풀 생성 시 사용할 Docker 클라이언트
+
+    Returns:
+        JudgeContainerPool 인스턴스
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = JudgeContainerPool(
+                client,
+                size=settings.JUDGE_POOL_SIZE,
+                max_jobs_per_container=settings.JUDGE_POOL_MAX_JOBS,
+                use_forkserver=settings.JUDGE_POOL_FORKSERVER,
+            )
+            atexit.register(_pool.shutdown)
+            _pool._replenish_async()
+        return _pool
+
+
+def get_pool_stats() -> Optional[Dict[str, int]]:
+    """현재 프로세스의 풀 통계를 반환합니다. 풀이 없으면 None."""
+    return _pool.stats() if _pool is not None else None
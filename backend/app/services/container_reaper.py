@@ -0,0 +1,234 @@
+"""Background cleanup of judge containers and temp directories.
+
+채점 스레드가 컨테이너 stop/remove와 임시 디렉토리 삭제를 기다리지 않도록
+정리 작업을 백그라운드 reaper 스레드에 넘깁니다.
+워커 시작 시에는 이전 프로세스가 비정상 종료하며 남긴 judge 컨테이너와
+임시 디렉토리를 라벨과 생성 시각 기준으로 정리합니다.
+"""
+
+import logging
+import queue
+import shutil
+import socket
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import docker
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 모든 judge 컨테이너에 붙는 라벨 (값: "cold" 또는 "pool")
+JUDGE_LABEL = "qa_arena.judge"
+# 컨테이너를 만든 워커 호스트 (pool 컨테이너 정리 시 사용)
+OWNER_LABEL = "qa_arena.judge.owner"
+# judge 임시 디렉토리 이름 접두어
+TEMP_DIR_PREFIX = "qa_arena_judge_"
+# reaper 큐 최대 길이 (가득 차면 호출 스레드에서 직접 정리)
+MAX_PENDING = 1000
+
+
+def judge_labels(kind: str) -> Dict[str, str]:
+    """
+    judge 컨테이너 라벨을 반환합니다.
+
+    Args:
+        kind: "cold" 또는 "pool"
+
+    Returns:
+        컨테이너 생성 시 사용할 라벨 딕셔너리
+    """
+    return {JUDGE_LABEL: kind, OWNER_LABEL: socket.gethostname()}
+
+
+def _remove_container(container: Any) -> None:
+    """컨테이너를 강제 제거합니다 (실행 중이면 kill 포함, API 호출 1회)."""
+    try:
+        container.remove(force=True)
+    except docker.errors.NotFound:
+        pass
+
+
+class ContainerReaper:
+    """컨테이너/임시 디렉토리 정리를 처리하는 백그라운드 스레드."""
+
+    def __init__(self):
+        """ContainerReaper 초기화 및 스레드 시작."""
+        self._queue: "queue.Queue[tuple]" = queue.Queue(maxsize=MAX_PENDING)
+        self._lock = threading.Lock()
+        self._stats = {"containers": 0, "temp_dirs": 0, "failures": 0, "inline": 0}
+        self._thread = threading.Thread(target=self._run, name="judge-reaper", daemon=True)
+        self._thread.start()
+
+    def submit(self, container: Any = None, temp_path: Optional[Path] = None) -> None:
+        """
+        정리할 컨테이너와 임시 디렉토리를 등록합니다.
+
+        Args:
+            container: 제거할 컨테이너 (없으면 None)
+            temp_path: 삭제할 임시 디렉토리 (없으면 None)
+        """
+        if container is None and temp_path is None:
+            return
+        try:
+            self._queue.put_nowait((container, temp_path))
+        except queue.Full:
+            # 정리가 밀린 경우 컨테이너/디스크 사용량이 계속 늘지 않도록 직접 정리
+            with self._lock:
+                self._stats["inline"] += 1
+            self._reap(container, temp_path)
+
+    def _reap(self, container: Any, temp_path: Optional[Path]) -> None:
+        """컨테이너와 임시 디렉토리를 정리합니다."""
+        if container is not None:
+            try:
+                _remove_container(container)
+                with self._lock:
+                    self._stats["containers"] += 1
+            except Exception as e:
+                with self._lock:
+                    self._stats["failures"] += 1
+                logger.warning(
+                    f"컨테이너 비동기 정리 실패: 컨테이너 ID={container.id[:12]}, "
+                    f"에러 타입={type(e).__name__}, 에러 메시지={str(e)}"
+                )
+        if temp_path is not None:
+            shutil.rmtree(temp_path, ignore_errors=True)
+            with self._lock:
+                self._stats["temp_dirs"] += 1
+
+    def _run(self) -> None:
+        """큐에 등록된 정리 작업을 순서대로 처리합니다."""
+        while True:
+            container, temp_path = self._queue.get()
+            try:
+                self._reap(container, temp_path)
+            finally:
+                self._queue.task_done()
+
+    def stats(self) -> Dict[str, int]:
+        """정리 처리 건수와 대기 중인 작업 수를 반환합니다."""
+        with self._lock:
+            return {"pending": self._queue.qsize(), **self._stats}
+
+
+_reaper: Optional[ContainerReaper] = None
+_reaper_lock = threading.Lock()
+
+
+def get_container_reaper() -> ContainerReaper:
+    """프로세스 전역 reaper를 반환합니다 (최초 호출 시 스레드 시작)."""
+    global _reaper
+    with _reaper_lock:
+        if _reaper is None:
+            _reaper = ContainerReaper()
+        return _reaper
+
+
+def _container_age_seconds(container: Any, now: float) -> float:
+    """컨테이너 생성 후 경과 시간 (초)."""
+    created = container.attrs.get("Created", "")
+    try:
+        # 예: 2024-01-01T00:00:00.123456789Z (소수점 이하 초는 무시)
+        base = created.rstrip("Z").split(".")[0]
+        created_at = datetime.strptime(base, "%Y-%m-%dT%H:%M:%S").replace(tzinfo=timezone.utc)
+        return now - created_at.timestamp()
+    except ValueError:
+        return 0.0
+
+
+def sweep_stale_containers(client: docker.DockerClient, max_age_seconds: int) -> int:
+    """
+    남겨진 judge 컨테이너를 제거합니다.
+
+    - cold 컨테이너: 생성 후 max_age_seconds가 지난 것
+    - pool 컨테이너: 종료된 것, 또는 이 호스트의 이전 워커 프로세스가 만든 것
+
+    Args:
+        client: Docker 클라이언트
+        max_age_seconds: cold 컨테이너를 stale로 판단하는 경과 시간 (초)
+
+    Returns:
+        제거한 컨테이너 수
+    """
+    now = time.time()
+    hostname = socket.gethostname()
+    removed = 0
+    for container in client.containers.list(all=True, filters={"label": JUDGE_LABEL}):
+        labels = container.labels or {}
+        if labels.get(JUDGE_LABEL) == "pool":
+            stale = container.status != "running" or labels.get(OWNER_LABEL) == hostname
+        else:
+            stale = _container_age_seconds(container, now) >= max_age_seconds
+        if not stale:
+            continue
+        try:
+            _remove_container(container)
+            removed += 1
+        except Exception as e:
+            logger.warning(
+                f"Stale 컨테이너 제거 실패: 컨테이너 ID={container.id[:12]}, "
+                f"에러 타입={type(e).__name__}, 에러 메시지={str(e)}"
+            )
+    return removed
+
+
+def sweep_stale_temp_dirs(root: Path, max_age_seconds: int) -> int:
+    """
+    수정 후 max_age_seconds가 지난 judge 임시 디렉토리를 삭제합니다.
+
+    Args:
+        root: 임시 디렉토리 루트
+        max_age_seconds: stale로 판단하는 경과 시간 (초)
+
+    Returns:
+        삭제한 디렉토리 수
+    """
+    if not root.is_dir():
+        return 0
+    cutoff = time.time() - max_age_seconds
+    removed = 0
+    for path in root.glob(f"{TEMP_DIR_PREFIX}*"):
+        try:
+            if path.is_dir() and path.stat().st_mtime < cutoff:
+                shutil.rmtree(path, ignore_errors=True)
+                removed += 1
+        except OSError:
+            continue
+    return removed
+
+
+def sweep_stale_judge_resources() -> Dict[str, int]:
+    """
+    워커 시작 시 이전 프로세스가 남긴 judge 컨테이너와 임시 디렉토리를 정리합니다.
+
+    Returns:
+        {"containers": 제거한 컨테이너 수, "temp_dirs": 삭제한 디렉토리 수}
+    """
+    from app.services.docker_service import TEMP_ROOT
+
+    max_age = settings.JUDGE_REAPER_STALE_SECONDS
+    result = {"containers": 0, "temp_dirs": 0}
+
+    for root in (Path(TEMP_ROOT), Path(settings.JUDGE_SANDBOX_WORKDIR)):
+        result["temp_dirs"] += sweep_stale_temp_dirs(root, max_age)
+
+    if settings.JUDGE_BACKEND == "docker":
+        try:
+            client = docker.from_env()
+            try:
+                result["containers"] = sweep_stale_containers(client, max_age)
+            finally:
+                client.close()
+        except Exception as e:
+            logger.warning(f"Stale 컨테이너 정리 실패: {type(e).__name__}: {str(e)}")
+
+    logger.info(
+        f"Stale judge 리소스 정리 완료: 컨테이너={result['containers']}, "
+        f"임시 디렉토리={result['temp_dirs']}"
+    )
+    return result
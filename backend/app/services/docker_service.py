@@ -1,25 +1,82 @@
 """Docker service for managing judge containers."""
 
 import docker
+import io
+import tarfile
 import tempfile
 import os
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import logging
 
+from app.core.config import settings
+from app.services.container_reaper import TEMP_DIR_PREFIX, get_container_reaper, judge_labels
+from app.services.judge_backend import (
+    SINGLE_TARGET_NAME,
+    BoundedOutput,
+    JudgeBackend,
+    MultiTargetRun,
+    cancellable,
+    with_conftest,
+    write_workdir,
+)
+from app.services.mutant_schema import MutantSchema
+from app.services.problem_bundle import RUN_DIR_NAME, get_target_bundle
+
 logger = logging.getLogger(__name__)
 
 # Judge Docker 이미지 이름
 JUDGE_IMAGE = "qa-arena-judge:latest"
 # 작업 디렉토리 (컨테이너 내부)
 WORKDIR = "/workdir"
+# bind 방식 임시 디렉토리 루트 (Docker-in-Docker 환경에서 호스트와 공유)
+TEMP_ROOT = "/tmp/qa_arena_judge"
 # 타임아웃 (초)
 DEFAULT_TIMEOUT = 5
-
-
-class DockerService:
+# judge 이미지에 포함된 다중 대상 러너 (작업 디렉토리에 러너를 전달하지 않는 실행에서 사용)
+IMAGE_RUNNER_PATH = "/opt/qa_arena/multi_runner.py"
+# 컨테이너 리소스 제한 (cold 컨테이너와 pool 컨테이너 공통)
+CONTAINER_LIMITS = {
+    "network_disabled": True,  # 네트워크 비활성화 (보안)
+    "mem_limit": "128m",  # 메모리 제한
+    "cpu_period": 100000,
+    "cpu_quota": 50000,  # CPU 제한 (50%)
+}
+# 프로세스당 한 번 조회한 judge 이미지 ID
+_image_digest: Optional[str] = None
+
+
+def build_files_archive(files: Dict[str, str], include_conftest: bool = True) -> bytes:
+    """
+    작업 디렉토리 파일 구성을 메모리 내 tar 아카이브로 만듭니다.
+
+    Args:
+        files: {작업 디렉토리 기준 상대 경로: 내용}
+        include_conftest: test_user.py 옆에 conftest.py 포함 여부
+
+    Returns:
+        put_archive에 전달할 수 있는 tar 바이트
+    """
+    if include_conftest:
+        files = with_conftest(files)
+
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        for name, content in files.items():
+            data = content.encode("utf-8")
+            info = tarfile.TarInfo(name=name)
+            info.size = len(data)
+            # 소유자 전용: 권한을 낮춘 대상 실행 프로세스가 다른 대상의 파일을 읽지 못하도록 함
+            info.mode = 0o600
+            tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+class DockerService(JudgeBackend):
     """Docker 컨테이너 관리를 위한 서비스 클래스."""
 
+    name = "docker"
+
     def __init__(self):
         """Docker 클라이언트 초기화."""
         try:
@@ -86,43 +143,140 @@ class DockerService:
             logger.error(error_msg)
             raise RuntimeError(f"Docker 클라이언트를 초기화할 수 없습니다: {str(e)}") from e
 
+    def get_runtime_digest(self) -> str:
+        """
+        Judge 이미지 ID(digest)를 반환합니다. 프로세스당 한 번만 조회합니다.
+
+        Returns:
+            이미지 ID (조회 실패 시 이미지 이름)
+        """
+        global _image_digest
+        if _image_digest is None:
+            try:
+                _image_digest = self.client.images.get(JUDGE_IMAGE).id
+            except Exception as e:
+                logger.warning(f"Judge 이미지 digest 조회 실패: {type(e).__name__}: {str(e)}")
+                return JUDGE_IMAGE
+        return _image_digest
+
     def create_container(
         self,
-        target_code: str,
-        test_code: str,
-        timeout: int = DEFAULT_TIMEOUT,
-    ) -> tuple[docker.models.containers.Container, Path]:
+        run: MultiTargetRun,
+    ) -> tuple[docker.models.containers.Container, Optional[Path]]:
         """
-        Docker 컨테이너를 생성하고 파일을 마운트합니다.
+        단일 대상 실행용 Docker 컨테이너를 생성하고 파일을 전달합니다.
+
+        bind 방식에서 대상 번들을 사용할 수 있으면 번들을 마운트하고, 아니면 작업 디렉토리 파일을 전달합니다.
 
         Args:
-            target_code: 테스트 대상 코드 (target.py)
-            test_code: 사용자가 작성한 테스트 코드 (test_user.py)
-            timeout: 실행 타임아웃 (초)
+            run: 단일 대상 실행 구성
 
         Returns:
             (생성된 Docker 컨테이너 객체, 임시 디렉토리 경로) 튜플
         """
+        if settings.JUDGE_FILE_DELIVERY == "bind":
+            bundle = get_target_bundle(run.targets[SINGLE_TARGET_NAME])
+            if bundle is not None:
+                return self._create_container_with_bundle(bundle, run)
+        return self._create_container_with_files(run.files(), run.command("python"), run.timeout)
+
+    def _create_container_with_bundle(
+        self,
+        bundle: Path,
+        run: MultiTargetRun,
+    ) -> tuple[docker.models.containers.Container, Optional[Path]]:
+        """
+        대상 번들을 대상 디렉토리에 읽기 전용으로 마운트한 컨테이너를 생성합니다.
+
+        실행마다 test_user.py만 임시 디렉토리에 작성하여 번들의 run/ 디렉토리에 마운트하고,
+        judge 이미지의 multi_runner.py가 번들 레이아웃의 대상을 실행합니다.
+
+        Args:
+            bundle: 대상 번들 디렉토리 (problem_bundle.build_target_bundle)
+            run: 단일 대상 실행 구성
+
+        Returns:
+            (생성된 Docker 컨테이너 객체, 임시 디렉토리 경로) 튜플
+        """
+        temp_path = Path(tempfile.mkdtemp(prefix=TEMP_DIR_PREFIX, dir=TEMP_ROOT))
+        target_dir = f"{WORKDIR}/{run.target_dir(SINGLE_TARGET_NAME)}"
+
+        try:
+            write_workdir(temp_path, {"test_user.py": run.test_code}, include_conftest=False)
+
+            container = self.client.containers.create(
+                image=JUDGE_IMAGE,
+                command=run.command("python", runner=IMAGE_RUNNER_PATH),
+                volumes={
+                    str(bundle): {"bind": target_dir, "mode": "ro"},
+                    str(temp_path): {"bind": f"{target_dir}/{RUN_DIR_NAME}", "mode": "ro"},
+                },
+                working_dir=WORKDIR,
+                labels=judge_labels("cold"),
+                detach=True,
+                **CONTAINER_LIMITS,
+            )
+
+            logger.info(f"컨테이너 생성 완료 (bundle {bundle.name[:12]}): {container.id}")
+            return container, temp_path
+
+        except Exception as e:
+            self._cleanup_temp_dir(temp_path)
+            raise self._creation_error(e, run.timeout) from e
+
+    def create_multi_target_container(
+        self,
+        run: MultiTargetRun,
+    ) -> tuple[docker.models.containers.Container, Optional[Path]]:
+        """
+        Golden Code와 모든 Mutant를 하나의 컨테이너에 마운트합니다.
+
+        각 대상은 targets/<별칭>/ 디렉토리에 target.py, test_user.py, conftest.py로 배치되고,
+        컨테이너 내부의 multi_runner.py가 대상마다 fork한 프로세스에서 pytest를 실행합니다.
+        schema를 사용하면 모든 대상이 targets/__schema__/에서 한 번에 실행됩니다.
+
+        Args:
+            run: 다중 대상 실행 구성
+
+        Returns:
+            (생성된 Docker 컨테이너 객체, 임시 디렉토리 경로) 튜플
+        """
+        return self._create_container_with_files(run.files(), run.command("python"), run.timeout)
+
+    def _create_container_with_files(
+        self,
+        files: Dict[str, str],
+        command: list[str],
+        timeout: float,
+    ) -> tuple[docker.models.containers.Container, Optional[Path]]:
+        """
+        작업 디렉토리 파일을 전달한 컨테이너를 생성합니다.
+
+        conftest.py는 test_user.py가 위치한 각 디렉토리에 함께 배치됩니다.
+        JUDGE_FILE_DELIVERY 설정에 따라 전달 방식이 달라집니다:
+        - "bind": 호스트 임시 디렉토리에 파일을 작성하고 읽기 전용으로 마운트
+        - "archive": 메모리 내 tar를 put_archive로 컨테이너 작업 디렉토리에 복사 (임시 디렉토리 없음)
+
+        Args:
+            files: {작업 디렉토리 기준 상대 경로: 내용}
+            command: 컨테이너 실행 명령
+            timeout: 실행 타임아웃 (초, 로그용)
+
+        Returns:
+            (생성된 Docker 컨테이너 객체, 임시 디렉토리 경로) 튜플.
+            archive 방식에서는 임시 디렉토리 경로가 None입니다.
+        """
+        if settings.JUDGE_FILE_DELIVERY == "archive":
+            return self._create_container_with_archive(files, command, timeout), None
+
         # 임시 디렉토리 생성
         # Docker-in-Docker 환경을 위해 호스트와 공유되는 경로 사용
-        temp_dir = tempfile.mkdtemp(prefix="qa_arena_judge_", dir="/tmp/qa_arena_judge")
+        temp_dir = tempfile.mkdtemp(prefix=TEMP_DIR_PREFIX, dir=TEMP_ROOT)
         temp_path = Path(temp_dir)
 
         try:
-            # 파일 작성
-            (temp_path / "target.py").write_text(target_code, encoding="utf-8")
-            (temp_path / "test_user.py").write_text(test_code, encoding="utf-8")
-
-            # conftest.py 복사 (judge 디렉토리에서)
-            # backend/app/services/docker_service.py -> backend -> qa_labs -> judge
-            backend_dir = Path(__file__).parent.parent.parent
-            project_root = backend_dir.parent
-            judge_dir = project_root / "judge"
-            conftest_path = judge_dir / "conftest.py"
-            if conftest_path.exists():
-                (temp_path / "conftest.py").write_text(
-                    conftest_path.read_text(encoding="utf-8"), encoding="utf-8"
-                )
+            # 파일 작성 (conftest.py 포함)
+            write_workdir(temp_path, files)
 
             # 볼륨 마운트 설정
             volumes = {
@@ -132,14 +286,12 @@ class DockerService:
             # 컨테이너 생성
             container = self.client.containers.create(
                 image=JUDGE_IMAGE,
-                command=["pytest", "-q", "--disable-warnings", "--maxfail=1", "--ignore=target.py", "test_user.py"],
+                command=command,
                 volumes=volumes,
-                network_disabled=True,  # 네트워크 비활성화 (보안)
-                mem_limit="128m",  # 메모리 제한
-                cpu_period=100000,
-                cpu_quota=50000,  # CPU 제한 (50%)
                 working_dir=WORKDIR,
+                labels=judge_labels("cold"),
                 detach=True,
+                **CONTAINER_LIMITS,
             )
 
             logger.info(f"컨테이너 생성 완료: {container.id}")
@@ -148,20 +300,63 @@ class DockerService:
         except Exception as e:
             # 에러 발생 시 임시 디렉토리 정리
             self._cleanup_temp_dir(temp_path)
-            error_msg = (
-                f"Judge 컨테이너 생성 실패: {type(e).__name__}: {str(e)}. "
-                f"이미지: {JUDGE_IMAGE}, 타임아웃: {timeout}초"
+            raise self._creation_error(e, timeout) from e
+
+    def _create_container_with_archive(
+        self,
+        files: Dict[str, str],
+        command: list[str],
+        timeout: float,
+    ) -> docker.models.containers.Container:
+        """
+        컨테이너를 생성한 뒤 메모리 내 tar 아카이브로 작업 디렉토리 파일을 복사합니다.
+
+        Args:
+            files: {작업 디렉토리 기준 상대 경로: 내용}
+            command: 컨테이너 실행 명령
+            timeout: 실행 타임아웃 (초, 로그용)
+
+        Returns:
+            파일이 복사된 (시작 전) Docker 컨테이너 객체
+        """
+        container = None
+        try:
+            container = self.client.containers.create(
+                image=JUDGE_IMAGE,
+                command=command,
+                working_dir=WORKDIR,
+                labels=judge_labels("cold"),
+                detach=True,
+                **CONTAINER_LIMITS,
             )
-            logger.error(error_msg)
-            raise RuntimeError(
-                f"Judge 컨테이너를 생성할 수 없습니다. "
-                f"이미지 '{JUDGE_IMAGE}'가 존재하는지 확인하세요: {str(e)}"
-            ) from e
+            if not container.put_archive(WORKDIR, build_files_archive(files)):
+                raise RuntimeError(f"작업 디렉토리 파일 복사 실패: {WORKDIR}")
+
+            logger.info(f"컨테이너 생성 완료 (archive): {container.id}")
+            return container
+
+        except Exception as e:
+            if container is not None:
+                self.cleanup_container(container)
+            raise self._creation_error(e, timeout) from e
+
+    def _creation_error(self, error: Exception, timeout: float) -> RuntimeError:
+        """컨테이너 생성 실패를 로깅하고 호출자에게 전달할 예외를 만듭니다."""
+        error_msg = (
+            f"Judge 컨테이너 생성 실패: {type(error).__name__}: {str(error)}. "
+            f"이미지: {JUDGE_IMAGE}, 타임아웃: {timeout}초"
+        )
+        logger.error(error_msg)
+        return RuntimeError(
+            f"Judge 컨테이너를 생성할 수 없습니다. "
+            f"이미지 '{JUDGE_IMAGE}'가 존재하는지 확인하세요: {str(error)}"
+        )
 
     def run_container(
         self,
         container: docker.models.containers.Container,
-        timeout: int = DEFAULT_TIMEOUT,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_log_bytes: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         컨테이너를 실행하고 결과를 수집합니다.
@@ -169,6 +364,7 @@ class DockerService:
         Args:
             container: 실행할 컨테이너 객체
             timeout: 실행 타임아웃 (초)
+            max_log_bytes: 보관할 최대 출력 크기. None이면 JUDGE_LOG_MAX_BYTES 설정 사용
 
         Returns:
             실행 결과 딕셔너리:
@@ -191,7 +387,8 @@ class DockerService:
 
             # 타임아웃까지 대기
             try:
-                result = container.wait(timeout=timeout)
+                with cancellable(container.kill):
+                    result = container.wait(timeout=timeout)
                 exit_code = result.get("StatusCode", -1)
             except Exception as e:
                 # 타임아웃 발생
@@ -200,17 +397,27 @@ class DockerService:
                     f"타임아웃={timeout}초, 에러={type(e).__name__}: {str(e)}"
                 )
                 logger.warning(timeout_msg)
-                try:
-                    container.kill()
-                    logger.info(f"타임아웃으로 인해 컨테이너 강제 종료: {container.id[:12]}")
-                except Exception as kill_error:
-                    logger.error(f"컨테이너 강제 종료 실패: {container.id[:12]}, 에러: {kill_error}")
+                # 비동기 정리 모드에서는 reaper의 강제 제거가 kill을 겸함
+                if not settings.JUDGE_ASYNC_CLEANUP:
+                    try:
+                        container.kill()
+                        logger.info(f"타임아웃으로 인해 컨테이너 강제 종료: {container.id[:12]}")
+                    except Exception as kill_error:
+                        logger.error(f"컨테이너 강제 종료 실패: {container.id[:12]}, 에러: {kill_error}")
                 exit_code = -1
 
             execution_time = time.time() - start_time
 
-            # 로그 수집
-            logs = container.logs(stdout=True, stderr=True).decode("utf-8", errors="replace")
+            # 로그 수집 (스트리밍, 상한 초과 시 앞/뒤만 유지)
+            output = BoundedOutput(max_log_bytes)
+            for chunk in container.logs(stdout=True, stderr=True, stream=True, follow=False):
+                output.feed(chunk)
+            logs = output.getvalue()
+            if output.truncated:
+                logger.warning(
+                    f"컨테이너 출력 상한 초과: {container.id[:12]}, "
+                    f"전체={output.total_bytes}바이트, 상한={output.max_bytes}바이트"
+                )
 
             # stdout/stderr 분리 (pytest는 stdout에 출력)
             stdout = logs
@@ -260,9 +467,15 @@ class DockerService:
         """
         컨테이너를 정리합니다.
 
+        JUDGE_ASYNC_CLEANUP이 활성화되면 reaper 스레드에 넘기고 바로 반환합니다.
+
         Args:
             container: 정리할 컨테이너 객체
         """
+        if container and settings.JUDGE_ASYNC_CLEANUP:
+            get_container_reaper().submit(container=container)
+            return
+
         try:
             if container:
                 # 컨테이너 중지 (실행 중인 경우)
@@ -286,7 +499,11 @@ class DockerService:
             )
 
     def _cleanup_temp_dir(self, temp_path: Path):
-        """임시 디렉토리를 정리합니다."""
+        """임시 디렉토리를 정리합니다 (비동기 정리 모드에서는 reaper에 넘김)."""
+        if settings.JUDGE_ASYNC_CLEANUP:
+            get_container_reaper().submit(temp_path=temp_path)
+            return
+
         try:
             import shutil
 
@@ -303,7 +520,9 @@ class DockerService:
         self,
         target_code: str,
         test_code: str,
-        timeout: int = DEFAULT_TIMEOUT,
+        timeout: float = DEFAULT_TIMEOUT,
+        test_order: Optional[List[str]] = None,
+        coverage: bool = False,
     ) -> Dict[str, Any]:
         """
         pytest를 Docker 컨테이너에서 실행하는 통합 함수.
@@ -312,21 +531,42 @@ class DockerService:
             target_code: 테스트 대상 코드
             test_code: 사용자가 작성한 테스트 코드
             timeout: 실행 타임아웃 (초)
+            test_order: 먼저 실행할 테스트 이름 순서
+            coverage: target.py 줄 커버리지 수집 여부 (Golden 실행에서만 사용)
 
         Returns:
             실행 결과 딕셔너리
         """
+        run = MultiTargetRun(
+            {SINGLE_TARGET_NAME: target_code}, test_code, timeout,
+            test_order=test_order, coverage=coverage,
+        )
+
+        # Warm 컨테이너 풀이 활성화된 경우 풀에서 실행
+        if settings.JUDGE_POOL_ENABLED:
+            try:
+                from app.services.container_pool import get_container_pool
+
+                return get_container_pool(self.client).run_pytest(run)
+            except Exception as e:
+                # 풀 자체의 장애는 cold 컨테이너 경로로 폴백
+                logger.warning(
+                    f"Judge 컨테이너 풀 실행 실패, cold 컨테이너로 폴백: "
+                    f"{type(e).__name__}: {str(e)}"
+                )
+
         container = None
         temp_path = None
 
         try:
             # 컨테이너 생성 (임시 디렉토리도 함께 생성됨)
-            container, temp_path = self.create_container(target_code, test_code, timeout)
+            container, temp_path = self.create_container(run)
 
             # 컨테이너 실행
-            result = self.run_container(container, timeout)
-
-            return result
+            run_result = self.run_container(
+                container, run.run_timeout(), max_log_bytes=run.output_limit()
+            )
+            return run.parse_single(run_result)
 
         except Exception as e:
             error_msg = (
@@ -348,3 +588,56 @@ class DockerService:
             if temp_path and temp_path.exists():
                 self._cleanup_temp_dir(temp_path)
 
+    def run_pytest_multi(
+        self,
+        targets: Dict[str, str],
+        test_code: str,
+        timeout: float = DEFAULT_TIMEOUT,
+        schema: Optional[MutantSchema] = None,
+        test_codes: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        하나의 컨테이너에서 여러 대상(Golden Code + Mutant)에 대해 pytest를 실행합니다.
+
+        Args:
+            targets: {대상 이름: 대상 코드}
+            test_code: 사용자가 작성한 테스트 코드
+            timeout: 대상별 실행 타임아웃 (초)
+            schema: mutant schema 모듈 (모든 대상을 포함하면 한 번의 수집으로 실행)
+            test_codes: {대상 이름: 테스트 코드} (배치 채점)
+
+        Returns:
+            {대상 이름: 실행 결과 딕셔너리}. 결과가 없는 대상은 시스템 오류(exit_code=-1)로 채워집니다.
+        """
+        container = None
+        temp_path = None
+
+        try:
+            run = MultiTargetRun(targets, test_code, timeout, schema, test_codes)
+            container, temp_path = self.create_multi_target_container(run)
+            run_result = self.run_container(
+                container, run.run_timeout(), max_log_bytes=run.output_limit()
+            )
+            return run.parse(run_result)
+
+        except Exception as e:
+            error_msg = (
+                f"다중 대상 pytest 실행 실패: {type(e).__name__}: {str(e)}. "
+                f"대상 수: {len(targets)}, 타임아웃: {timeout}초"
+            )
+            logger.error(error_msg, exc_info=True)
+            return {
+                name: {
+                    "success": False,
+                    "exit_code": -1,
+                    "stdout": "",
+                    "stderr": f"pytest 실행 중 오류 발생: {type(e).__name__}: {str(e)}",
+                    "execution_time": 0.0,
+                    "logs": "",
+                }
+                for name in targets
+            }
+
+        finally:
+            if temp_path and temp_path.exists():
+                self._cleanup_temp_dir(temp_path)
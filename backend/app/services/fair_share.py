@@ -0,0 +1,249 @@
+"""Per-submitter fair-share scheduling of grading jobs.
+
+Celery 큐는 FIFO이므로 한 사용자(또는 스크립트)가 제출 한도까지 연속으로 제출하면
+그 뒤에 들어온 다른 사용자의 제출이 모두 밀립니다. 이 모듈은 채점 큐(회원/게스트)마다
+제출자 키(user:<id> / anon:<id>)별 Redis 대기열을 두고, 채점 태스크가 시작될 때
+자신의 제출 대신 deficit round-robin(DRR) 순서로 다음 제출을 가져가게 합니다.
+
+동작:
+    1. API는 제출을 제출자 대기열에 넣고(enqueue) 평소처럼 채점 태스크를 하나 발행합니다.
+       태스크 수와 대기 항목 수가 같으므로 태스크는 "채점 슬롯" 역할을 합니다.
+    2. 태스크는 시작 시 dispatch()로 활성 제출자 순환 목록 앞에서부터 제출을 하나 꺼냅니다.
+       제출자는 차례가 올 때마다 quantum만큼 deficit을 받고, 맨 앞 제출의 비용
+       (채점 대상 수 = Golden 1 + Mutant 수)이 deficit 이하이면 그 제출이 채점됩니다.
+       대기열이 빈 제출자는 순환 목록에서 빠지고 deficit이 초기화됩니다.
+    3. 따라서 활성 제출자마다 judge 실행량을 균등하게 나눠 가지며, 제출을 몰아서 보낸
+       제출자는 자신의 대기열만 길어집니다.
+
+키 형식 (<lane> = 채점 큐 이름):
+    fair_share:<lane>:active        list  활성 제출자 순환 목록
+    fair_share:<lane>:deficit       hash  제출자별 deficit
+    fair_share:<lane>:queue:<key>   list  제출자별 대기 항목 (JSON: submission_id, problem_id, cost)
+
+Redis 오류 시에는 태스크가 자신의 제출을 채점합니다 (FIFO).
+이때 대기열에 남은 항목은 나중에 다른 태스크가 꺼내므로, 태스크는 PENDING이 아닌 제출을
+건너뛰고 다음 항목을 다시 꺼냅니다 (app.workers.tasks). 대기열 키에는 TTL을 두지 않습니다.
+슬롯 태스크가 이미 소비된 항목이 만료되면 그 제출은 채점되지 않고 PENDING에 남기 때문입니다.
+"""
+
+import json
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+import redis
+
+from app.core.config import settings
+from app.services.judge_cache import get_judge_cache_redis_url
+
+logger = logging.getLogger(__name__)
+
+# dispatch 한 번에 순환 목록을 도는 최대 횟수 (비용이 quantum보다 큰 제출도 몇 차례 안에 채점됨)
+MAX_DISPATCH_ROTATIONS = 10000
+
+# 제출자 대기열에 항목을 추가하고, 제출자가 순환 목록에 없으면 끝에 추가
+# (deficit hash에 키가 있는 제출자만 순환 목록에 있음)
+# KEYS[1]=제출자 대기열, KEYS[2]=순환 목록, KEYS[3]=deficit hash
+# ARGV=[항목 JSON, 제출자 키]
+ENQUEUE_SCRIPT = """
+redis.call('RPUSH', KEYS[1], ARGV[1])
+if redis.call('HEXISTS', KEYS[3], ARGV[2]) == 0 then
+    redis.call('RPUSH', KEYS[2], ARGV[2])
+    redis.call('HSET', KEYS[3], ARGV[2], 0)
+end
+return 1
+"""
+
+# 제출자 대기열에서 항목을 제거하고, 대기열이 비면 순환 목록과 deficit에서도 제출자를 제거
+# KEYS[1]=제출자 대기열, KEYS[2]=순환 목록, KEYS[3]=deficit hash
+# ARGV=[항목 JSON, 제출자 키]
+CANCEL_SCRIPT = """
+local removed = redis.call('LREM', KEYS[1], 1, ARGV[1])
+if redis.call('LLEN', KEYS[1]) == 0 then
+    redis.call('LREM', KEYS[2], 0, ARGV[2])
+    redis.call('HDEL', KEYS[3], ARGV[2])
+end
+return removed
+"""
+
+# DRR로 다음 항목을 꺼냄 (없으면 false)
+# KEYS[1]=순환 목록, KEYS[2]=deficit hash
+# ARGV=[제출자 대기열 키 접두사, quantum, 최대 순환 횟수]
+DISPATCH_SCRIPT = """
+for _ = 1, tonumber(ARGV[3]) do
+    local key = redis.call('LINDEX', KEYS[1], 0)
+    if not key then
+        return false
+    end
+    local queue = ARGV[1] .. key
+    local head = redis.call('LINDEX', queue, 0)
+    if not head then
+        redis.call('LPOP', KEYS[1])
+        redis.call('HDEL', KEYS[2], key)
+    else
+        local cost = tonumber(cjson.decode(head)['cost']) or 1
+        local deficit = tonumber(redis.call('HGET', KEYS[2], key) or '0')
+        if deficit >= cost then
+            redis.call('LPOP', queue)
+            if redis.call('LLEN', queue) == 0 then
+                redis.call('LPOP', KEYS[1])
+                redis.call('HDEL', KEYS[2], key)
+            else
+                redis.call('HSET', KEYS[2], key, deficit - cost)
+            end
+            return head
+        end
+        redis.call('HSET', KEYS[2], key, deficit + tonumber(ARGV[2]))
+        redis.call('RPUSH', KEYS[1], redis.call('LPOP', KEYS[1]))
+    end
+end
+return false
+"""
+
+
+def submitter_key(user_id: Optional[UUID], anonymous_id: Optional[str]) -> str:
+    """제출자 키 (회원: user:<id>, 게스트: anon:<anonymous id>)."""
+    return f"user:{user_id}" if user_id is not None else f"anon:{anonymous_id}"
+
+
+class FairShareScheduler:
+    """Redis 기반 제출자별 DRR 채점 스케줄러."""
+
+    REDIS_KEY_PREFIX = "fair_share:"
+
+    def __init__(self, redis_url: str, quantum: int):
+        """
+        FairShareScheduler 초기화.
+
+        Args:
+            redis_url: 대기열을 저장할 Redis URL
+            quantum: 차례마다 제출자에게 주는 deficit (채점 대상 수 단위)
+        """
+        self.redis_client = redis.from_url(redis_url)
+        self.quantum = max(1, quantum)
+        self._enqueue = self.redis_client.register_script(ENQUEUE_SCRIPT)
+        self._cancel = self.redis_client.register_script(CANCEL_SCRIPT)
+        self._dispatch = self.redis_client.register_script(DISPATCH_SCRIPT)
+
+    def _active_key(self, lane: str) -> str:
+        return f"{self.REDIS_KEY_PREFIX}{lane}:active"
+
+    def _deficit_key(self, lane: str) -> str:
+        return f"{self.REDIS_KEY_PREFIX}{lane}:deficit"
+
+    def _queue_prefix(self, lane: str) -> str:
+        return f"{self.REDIS_KEY_PREFIX}{lane}:queue:"
+
+    @staticmethod
+    def _item(submission_id: str, problem_id: int, cost: int) -> str:
+        return json.dumps(
+            {"submission_id": submission_id, "problem_id": problem_id, "cost": max(1, cost)},
+            sort_keys=True,
+        )
+
+    def enqueue(self, lane: str, key: str, submission_id: str, problem_id: int, cost: int = 1) -> bool:
+        """
+        제출을 제출자 대기열에 추가합니다. 채점 태스크 발행 전에 호출합니다.
+
+        Args:
+            lane: 채점 큐 이름
+            key: 제출자 키 (submitter_key)
+            submission_id: 제출 ID
+            problem_id: 제출의 문제 ID
+            cost: 채점 비용 (채점 대상 수)
+
+        Returns:
+            추가 성공 여부 (실패 시 태스크가 자신의 제출을 채점하도록 발행)
+        """
+        try:
+            self._enqueue(
+                keys=[self._queue_prefix(lane) + key, self._active_key(lane), self._deficit_key(lane)],
+                args=[self._item(submission_id, problem_id, cost), key],
+            )
+            return True
+        except redis.RedisError as e:
+            logger.warning(
+                f"공정 분배 대기열 추가 실패 (FIFO 채점): submission_id={submission_id}, "
+                f"{type(e).__name__}: {str(e)}"
+            )
+            return False
+
+    def cancel(self, lane: str, key: str, submission_id: str, problem_id: int, cost: int = 1) -> None:
+        """
+        태스크 발행에 실패한 제출을 대기열에서 제거합니다.
+
+        대기열이 비면 제출자를 순환 목록에서도 제거합니다. 빈 제출자가 남아 있으면
+        다음 제출 때 순환 목록에 한 번 더 추가되어 두 배의 몫을 받습니다.
+        """
+        try:
+            self._cancel(
+                keys=[self._queue_prefix(lane) + key, self._active_key(lane), self._deficit_key(lane)],
+                args=[self._item(submission_id, problem_id, cost), key],
+            )
+        except redis.RedisError as e:
+            logger.warning(
+                f"공정 분배 대기열 제거 실패: submission_id={submission_id}, "
+                f"{type(e).__name__}: {str(e)}"
+            )
+
+    def dispatch(self, lane: str, submission_id: str, problem_id: Optional[int]) -> Optional[Tuple[str, Optional[int]]]:
+        """
+        채점 태스크가 채점할 다음 제출을 DRR 순서로 꺼냅니다.
+
+        Args:
+            lane: 채점 큐 이름
+            submission_id: 태스크를 발행한 제출 ID (Redis 오류 시 채점)
+            problem_id: 태스크를 발행한 제출의 문제 ID
+
+        Returns:
+            (제출 ID, 문제 ID). 대기열이 비었으면 None (태스크의 제출은 이미 다른 태스크가 채점).
+            Redis 오류 시 (submission_id, problem_id)
+        """
+        try:
+            raw = self._dispatch(
+                keys=[self._active_key(lane), self._deficit_key(lane)],
+                args=[self._queue_prefix(lane), self.quantum, MAX_DISPATCH_ROTATIONS],
+            )
+        except redis.RedisError as e:
+            logger.warning(
+                f"공정 분배 dispatch 실패 (자신의 제출 채점): submission_id={submission_id}, "
+                f"{type(e).__name__}: {str(e)}"
+            )
+            return submission_id, problem_id
+        if not raw:
+            return None
+        item = json.loads(raw)
+        return item["submission_id"], item.get("problem_id")
+
+    def depths(self, lane: str) -> Dict[str, int]:
+        """
+        활성 제출자별 대기 제출 수.
+
+        Raises:
+            redis.RedisError: Redis 조회 실패
+        """
+        keys = [
+            k.decode() if isinstance(k, bytes) else k
+            for k in self.redis_client.lrange(self._active_key(lane), 0, -1)
+        ]
+        pipe = self.redis_client.pipeline()
+        for key in keys:
+            pipe.llen(self._queue_prefix(lane) + key)
+        return {key: depth for key, depth in zip(keys, pipe.execute()) if depth}
+
+
+_scheduler: Optional[FairShareScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_fair_share_scheduler() -> FairShareScheduler:
+    """프로세스 전역 공정 분배 스케줄러를 반환합니다 (최초 호출 시 생성)."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = FairShareScheduler(
+                redis_url=get_judge_cache_redis_url(),
+                quantum=settings.FAIR_SHARE_QUANTUM,
+            )
+        return _scheduler
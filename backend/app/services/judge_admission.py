@@ -0,0 +1,259 @@
+"""Host-level admission control for judge runs.
+
+같은 Docker 호스트를 공유하는 모든 Celery 워커가 Redis 세마포어 하나를 통해
+동시에 실행되는 judge 컨테이너(또는 sandbox 프로세스) 수를 제한합니다.
+용량을 초과한 실행은 슬롯이 빌 때까지 대기하므로, 워커를 늘려도 CPU/메모리 과할당으로
+인한 타임아웃(거짓 ERROR) 대신 대기 시간이 늘어납니다.
+
+세마포어는 sorted set(멤버=토큰, 점수=임대 만료 시각)으로 구현되어,
+워커가 비정상 종료되어도 임대 만료 후 슬롯이 자동으로 회수됩니다.
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+import redis
+
+from app.core.config import settings
+from app.services.judge_cache import get_judge_cache_redis_url
+
+logger = logging.getLogger(__name__)
+
+# judge 컨테이너 하나의 리소스 (docker_service.CONTAINER_LIMITS 기준)
+CONTAINER_MEMORY_BYTES = 128 * 1024 * 1024
+CONTAINER_CPU_SHARE = 0.5
+# 호스트 메모리 중 judge 실행에 사용할 비율 (나머지는 워커/OS 몫)
+HOST_MEMORY_FRACTION = 0.75
+# 슬롯 재시도 간격 (초)
+POLL_INTERVAL_MIN = 0.02
+POLL_INTERVAL_MAX = 0.5
+
+# 만료된 임대를 정리한 뒤 빈 슬롯이 있으면 토큰을 추가하는 원자적 스크립트
+# KEYS[1]=세마포어 키, ARGV=[현재 시각, 만료 시각, 용량, 토큰]
+ACQUIRE_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[3]) then
+    redis.call('ZADD', KEYS[1], ARGV[2], ARGV[4])
+    return 1
+end
+return 0
+"""
+
+
+def detect_host_capacity() -> int:
+    """
+    CPU 코어 수와 물리 메모리로 호스트의 동시 judge 실행 수를 계산합니다.
+
+    Returns:
+        동시에 실행할 수 있는 judge 수 (최소 1)
+    """
+    cpu_slots = int((os.cpu_count() or 1) / CONTAINER_CPU_SHARE)
+    try:
+        memory_bytes = os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+        memory_slots = int(memory_bytes * HOST_MEMORY_FRACTION // CONTAINER_MEMORY_BYTES)
+    except (ValueError, OSError, AttributeError):
+        memory_slots = cpu_slots
+    return max(1, min(cpu_slots, memory_slots))
+
+
+class JudgeAdmissionController:
+    """Redis 기반 호스트 단위 judge 실행 세마포어."""
+
+    REDIS_KEY_PREFIX = "judge_admission:"
+
+    def __init__(
+        self,
+        redis_url: str,
+        host_id: str,
+        capacity: int,
+        wait_timeout: float = 60.0,
+    ):
+        """
+        JudgeAdmissionController 초기화.
+
+        Args:
+            redis_url: 세마포어를 저장할 Redis URL
+            host_id: 슬롯을 공유할 호스트 식별자 (같은 Docker 데몬을 쓰는 워커는 같은 값)
+            capacity: 호스트당 동시 실행 수
+            wait_timeout: 슬롯 대기 최대 시간 (초). 초과 시 경고 후 실행
+        """
+        self.redis_client = redis.from_url(redis_url)
+        self.host_id = host_id
+        self.capacity = capacity
+        self.wait_timeout = wait_timeout
+        self._acquire = self.redis_client.register_script(ACQUIRE_SCRIPT)
+        self._lock = threading.Lock()
+        self._stats = {
+            "acquired": 0,
+            "waited": 0,
+            "wait_timeouts": 0,
+            "bypassed": 0,
+            "total_wait_ms": 0,
+            "max_wait_ms": 0,
+        }
+
+    @property
+    def semaphore_key(self) -> str:
+        """호스트 세마포어 Redis 키."""
+        return f"{self.REDIS_KEY_PREFIX}{self.host_id}:slots"
+
+    @property
+    def stats_key(self) -> str:
+        """호스트 대기 시간 통계 Redis 키."""
+        return f"{self.REDIS_KEY_PREFIX}{self.host_id}:stats"
+
+    def _record(self, wait_ms: int, outcome: str) -> None:
+        """대기 시간 통계를 기록합니다 (프로세스 + Redis 공유 카운터)."""
+        with self._lock:
+            self._stats[outcome] += 1
+            self._stats["total_wait_ms"] += wait_ms
+            self._stats["max_wait_ms"] = max(self._stats["max_wait_ms"], wait_ms)
+            if wait_ms > 0:
+                self._stats["waited"] += 1
+        try:
+            pipe = self.redis_client.pipeline()
+            pipe.hincrby(self.stats_key, outcome, 1)
+            pipe.hincrby(self.stats_key, "total_wait_ms", wait_ms)
+            if wait_ms > 0:
+                pipe.hincrby(self.stats_key, "waited", 1)
+            pipe.execute()
+            # 최대 대기 시간은 비교 후 갱신 (경합 시 근사치)
+            current_max = int(self.redis_client.hget(self.stats_key, "max_wait_ms") or 0)
+            if wait_ms > current_max:
+                self.redis_client.hset(self.stats_key, "max_wait_ms", wait_ms)
+        except redis.RedisError:
+            pass
+
+    @contextmanager
+    def slot(self, lease_seconds: float) -> Iterator[None]:
+        """
+        judge 실행 슬롯을 확보하고, 블록이 끝나면 반환합니다.
+
+        용량을 초과하면 슬롯이 빌 때까지 대기합니다. Redis 오류나 대기 시간 초과 시에는
+        채점이 멈추지 않도록 슬롯 없이 실행합니다.
+
+        Args:
+            lease_seconds: 슬롯 임대 시간 (초). 워커가 비정상 종료해도 이 시간 후 회수
+        """
+        token = uuid.uuid4().hex
+        start_time = time.monotonic()
+        deadline = start_time + self.wait_timeout
+        interval = POLL_INTERVAL_MIN
+        acquired = False
+
+        try:
+            while True:
+                now = time.time()
+                if self._acquire(
+                    keys=[self.semaphore_key],
+                    args=[now, now + lease_seconds, self.capacity, token],
+                ):
+                    acquired = True
+                    break
+                if time.monotonic() >= deadline:
+                    break
+                time.sleep(interval)
+                interval = min(interval * 2, POLL_INTERVAL_MAX)
+        except redis.RedisError as e:
+            logger.warning(
+                f"Judge 슬롯 확보 실패 (제한 없이 실행): {type(e).__name__}: {str(e)}"
+            )
+            self._record(0, "bypassed")
+            yield
+            return
+
+        wait_ms = int((time.monotonic() - start_time) * 1000)
+        if acquired:
+            self._record(wait_ms, "acquired")
+            if wait_ms >= 1000:
+                logger.info(
+                    f"Judge 슬롯 대기: host={self.host_id}, 대기={wait_ms}ms, "
+                    f"용량={self.capacity}"
+                )
+        else:
+            self._record(wait_ms, "wait_timeouts")
+            logger.warning(
+                f"Judge 슬롯 대기 시간 초과 (제한 없이 실행): host={self.host_id}, "
+                f"대기={wait_ms}ms, 용량={self.capacity}"
+            )
+
+        try:
+            yield
+        finally:
+            if acquired:
+                try:
+                    self.redis_client.zrem(self.semaphore_key, token)
+                except redis.RedisError as e:
+                    logger.warning(
+                        f"Judge 슬롯 반환 실패 (임대 만료 시 회수): "
+                        f"{type(e).__name__}: {str(e)}"
+                    )
+
+    def stats(self) -> Dict[str, Any]:
+        """현재 프로세스 기준 대기 시간 통계를 반환합니다."""
+        with self._lock:
+            stats = dict(self._stats)
+        admitted = stats["acquired"] + stats["wait_timeouts"] + stats["bypassed"]
+        stats["avg_wait_ms"] = stats["total_wait_ms"] / admitted if admitted else 0.0
+        return stats
+
+    def shared_stats(self) -> Dict[str, Any]:
+        """
+        호스트의 모든 워커가 Redis에 누적한 대기 시간 통계와 현재 사용 중인 슬롯 수를 반환합니다.
+        """
+        raw = self.redis_client.hgetall(self.stats_key)
+        stats: Dict[str, Any] = {
+            "acquired": 0,
+            "waited": 0,
+            "wait_timeouts": 0,
+            "bypassed": 0,
+            "total_wait_ms": 0,
+            "max_wait_ms": 0,
+        }
+        for k, v in raw.items():
+            stats[k.decode() if isinstance(k, bytes) else k] = int(v)
+        admitted = stats["acquired"] + stats["wait_timeouts"] + stats["bypassed"]
+        stats["avg_wait_ms"] = stats["total_wait_ms"] / admitted if admitted else 0.0
+        stats["in_use"] = self.redis_client.zcount(self.semaphore_key, time.time(), "+inf")
+        stats["capacity"] = self.capacity
+        stats["host_id"] = self.host_id
+        return stats
+
+
+def get_judge_host_id() -> str:
+    """슬롯을 공유할 호스트 식별자 (설정이 없으면 hostname)."""
+    return settings.JUDGE_ADMISSION_HOST_ID or socket.gethostname()
+
+
+_controller: Optional[JudgeAdmissionController] = None
+_controller_lock = threading.Lock()
+
+
+def get_admission_controller() -> JudgeAdmissionController:
+    """
+    프로세스 전역 admission controller를 반환합니다 (최초 호출 시 생성).
+
+    Returns:
+        JudgeAdmissionController 인스턴스
+    """
+    global _controller
+    with _controller_lock:
+        if _controller is None:
+            capacity = settings.JUDGE_ADMISSION_SLOTS or detect_host_capacity()
+            _controller = JudgeAdmissionController(
+                redis_url=get_judge_cache_redis_url(),
+                host_id=get_judge_host_id(),
+                capacity=capacity,
+                wait_timeout=settings.JUDGE_ADMISSION_WAIT_TIMEOUT,
+            )
+            logger.info(
+                f"Judge admission control 활성화: host={_controller.host_id}, "
+                f"용량={capacity}"
+            )
+        return _controller
@@ -0,0 +1,532 @@
+"""Judge execution backend interface.
+
+JudgeService는 이 인터페이스를 통해 pytest를 실행하며,
+실제 실행 환경(Docker 컨테이너, 로컬 sandbox 프로세스)은 설정으로 선택합니다.
+"""
+
+import json
+import logging
+import os
+import random
+import secrets
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from app.core.config import settings
+from app.services.mutant_schema import MutantSchema
+
+logger = logging.getLogger(__name__)
+
+# judge 디렉토리 경로
+# backend/app/services/judge_backend.py -> backend -> qa_labs -> judge
+JUDGE_DIR = Path(__file__).parent.parent.parent.parent / "judge"
+CONFTEST_PATH = JUDGE_DIR / "conftest.py"
+# 단일 실행 다중 대상 채점 러너 (judge/multi_runner.py)
+MULTI_RUNNER_PATH = JUDGE_DIR / "multi_runner.py"
+# multi_runner.py 결과 JSON 앞에 붙는 마커
+MULTI_RESULT_MARKER = "QA_ARENA_RESULTS="
+# mutant schema 모듈 디렉토리 (targets/__schema__/, judge/multi_runner.py와 동일)
+SCHEMA_DIR_NAME = "__schema__"
+# 단일 대상 실행의 대상 이름 (run_pytest)
+SINGLE_TARGET_NAME = "target"
+# 러너 기동(fork, 대상 파일 복사)과 결과 보고에 더하는 전체 실행 여유 시간 (초)
+RUNNER_GRACE_SECONDS = 5
+# 테스트별 결과 리포터 플러그인 (judge/qa_arena_reporter.py, conftest.py에서 로드)
+REPORTER_PATH = JUDGE_DIR / "qa_arena_reporter.py"
+# 테스트별 타임아웃 ini 옵션 (judge/conftest.py와 동일)
+TEST_TIMEOUT_INI = "qa_arena_test_timeout"
+# 실행 타임아웃 중 테스트 하나에 허용하는 최대 비율 (나머지는 인터프리터/pytest 기동과 결과 보고 몫)
+TEST_TIMEOUT_SHARE = 0.6
+# 테스트 실행 순서 ini 옵션 (judge/conftest.py와 동일)
+TEST_ORDER_INI = "qa_arena_test_order"
+# target.py 줄 커버리지 수집을 요청하는 ini 옵션 (judge/qa_arena_reporter.py와 동일)
+COVERAGE_INI = "qa_arena_coverage"
+# 테스트별 타임아웃으로 실패한 테스트의 error_type (judge/qa_arena_reporter.py와 동일)
+TEST_TIMEOUT_ERROR_TYPE = "Timeout"
+# 출력 상한 초과 시 앞부분과 뒷부분 사이에 들어가는 표시
+TRUNCATION_MARKER = "\n[... truncated {omitted} bytes of output ...]\n"
+
+
+class RunCancelScope:
+    """
+    실행 중인 judge 실행(컨테이너, sandbox 프로세스)을 함께 중단하기 위한 범위.
+
+    투기적 Mutant 실행에서 Golden이 실패하면 executor는 시작하지 않은 실행만 취소하므로,
+    이미 시작된 실행은 백엔드가 cancellable()로 등록한 종료 함수를 cancel()에서 호출하여 중단합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._kills: Dict[int, Callable[[], None]] = {}
+        self._next_token = 0
+        self.cancelled = False
+
+    @staticmethod
+    def _kill(kill: Callable[[], None]) -> None:
+        try:
+            kill()
+        except Exception as e:
+            logger.warning(f"취소된 judge 실행 종료 실패: {type(e).__name__}: {str(e)}")
+
+    def register(self, kill: Callable[[], None]) -> Optional[int]:
+        """실행 종료 함수를 등록합니다. 이미 취소되었으면 바로 종료하고 None을 반환합니다."""
+        with self._lock:
+            if not self.cancelled:
+                token = self._next_token
+                self._next_token += 1
+                self._kills[token] = kill
+                return token
+        self._kill(kill)
+        return None
+
+    def unregister(self, token: Optional[int]) -> None:
+        with self._lock:
+            self._kills.pop(token, None)
+
+    def cancel(self) -> int:
+        """
+        범위를 취소하고 실행 중인 실행을 모두 종료합니다.
+
+        Returns:
+            종료한 실행 수
+        """
+        with self._lock:
+            self.cancelled = True
+            kills = list(self._kills.values())
+            self._kills.clear()
+        for kill in kills:
+            self._kill(kill)
+        return len(kills)
+
+
+_run_scope: ContextVar[Optional[RunCancelScope]] = ContextVar("judge_run_scope", default=None)
+
+
+def run_in_scope(scope: Optional[RunCancelScope], fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """scope 안에서 fn을 실행합니다 (executor 스레드에서 사용)."""
+    token = _run_scope.set(scope)
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        _run_scope.reset(token)
+
+
+@contextmanager
+def cancellable(kill: Callable[[], None]) -> Iterator[None]:
+    """실행 중인 동안 현재 cancel scope에 종료 함수를 등록하는 컨텍스트 (scope가 없으면 no-op)."""
+    scope = _run_scope.get()
+    if scope is None:
+        yield
+        return
+    token = scope.register(kill)
+    try:
+        yield
+    finally:
+        scope.unregister(token)
+
+
+def run_cancelled() -> bool:
+    """현재 cancel scope가 취소되었는지 여부 (취소로 중단된 결과는 캐시하지 않음)."""
+    scope = _run_scope.get()
+    return scope is not None and scope.cancelled
+
+
+@lru_cache(maxsize=1)
+def read_support_files() -> Dict[str, str]:
+    """
+    test_user.py 옆에 배치되는 채점 런타임 파일을 반환합니다 (프로세스당 한 번 읽음).
+
+    Returns:
+        {파일 이름: 내용} (conftest.py, qa_arena_reporter.py 중 존재하는 파일)
+    """
+    files = {}
+    for path in (CONFTEST_PATH, REPORTER_PATH):
+        if path.exists():
+            files[path.name] = path.read_text(encoding="utf-8")
+    return files
+
+
+@lru_cache(maxsize=1)
+def read_multi_runner() -> str:
+    """judge/multi_runner.py 내용을 반환합니다 (프로세스당 한 번 읽음)."""
+    return MULTI_RUNNER_PATH.read_text(encoding="utf-8")
+
+
+def with_conftest(files: Dict[str, str]) -> Dict[str, str]:
+    """
+    test_user.py가 위치한 각 디렉토리에 conftest.py와 리포터 플러그인을 추가한 파일 구성을 반환합니다.
+
+    Args:
+        files: {작업 디렉토리 기준 상대 경로: 내용}
+
+    Returns:
+        conftest.py가 포함된 새 파일 구성
+    """
+    support_files = read_support_files()
+    expanded = dict(files)
+    for relative_path in files:
+        path = PurePosixPath(relative_path)
+        if path.name == "test_user.py":
+            for name, content in support_files.items():
+                expanded[str(path.parent / name)] = content
+    return expanded
+
+
+def per_test_timeout(timeout: float) -> float:
+    """
+    실행 타임아웃에 대응하는 테스트별 타임아웃을 반환합니다.
+
+    Args:
+        timeout: 전체(대상별) 실행 타임아웃 (초)
+
+    Returns:
+        테스트별 타임아웃 (초). JUDGE_TEST_TIMEOUT이 0 이하이면 0 (사용 안 함)
+    """
+    if settings.JUDGE_TEST_TIMEOUT <= 0:
+        return 0.0
+    return round(min(settings.JUDGE_TEST_TIMEOUT, timeout * TEST_TIMEOUT_SHARE), 3)
+
+
+def pytest_timeout_args(timeout: float) -> List[str]:
+    """테스트별 타임아웃을 conftest.py에 전달하는 pytest 인자."""
+    budget = per_test_timeout(timeout)
+    return ["-o", f"{TEST_TIMEOUT_INI}={budget}"] if budget else []
+
+
+def pytest_order_args(test_order: Optional[List[str]]) -> List[str]:
+    """테스트 실행 순서를 conftest.py에 전달하는 pytest 인자."""
+    if not test_order:
+        return []
+    return ["-o", f"{TEST_ORDER_INI}={json.dumps(test_order, separators=(',', ':'))}"]
+
+
+def pytest_coverage_args(coverage: bool) -> List[str]:
+    """target.py 줄 커버리지 수집을 리포터에 요청하는 pytest 인자."""
+    return ["-o", f"{COVERAGE_INI}=true"] if coverage else []
+
+
+class MultiTargetRun:
+    """
+    multi_runner.py 한 번의 실행 구성 (작업 디렉토리 파일, 실행 명령, 결과 파싱).
+
+    단일 대상 실행(run_pytest)도 같은 러너를 거치므로, 리포터 결과는 항상 pytest 출력과
+    분리된 결과 채널로 전달됩니다.
+    대상 디렉토리 이름은 실행마다 새로 만든 임의의 별칭이고 실행 순서도 섞으므로,
+    사용자 테스트는 디렉토리 이름이나 실행 순서로 Golden Code를 구분할 수 없습니다.
+    schema는 모든 대상을 포함할 때만 사용합니다 (일부 대상만 다르게 실행하면 구분 가능).
+    """
+
+    _shuffler = random.SystemRandom()
+
+    def __init__(
+        self,
+        targets: Dict[str, str],
+        test_code: str,
+        timeout: float,
+        schema: Optional[MutantSchema] = None,
+        test_codes: Optional[Dict[str, str]] = None,
+        test_order: Optional[List[str]] = None,
+        coverage: bool = False,
+    ):
+        """
+        Args:
+            targets: {대상 이름: 대상 코드}
+            test_code: 사용자가 작성한 테스트 코드
+            timeout: 대상별 실행 타임아웃 (초)
+            schema: mutant schema 모듈. 모든 대상을 포함하면 한 번의 임포트/수집으로 실행
+            test_codes: {대상 이름: 테스트 코드}. 대상마다 다른 제출의 테스트를 실행할 때 사용
+                (배치 채점, schema와 함께 사용할 수 없음)
+            test_order: 먼저 실행할 테스트 이름 순서
+            coverage: 리포터의 target.py 줄 커버리지 수집 여부
+        """
+        self.targets = targets
+        self.test_code = test_code
+        self.timeout = timeout
+        self.test_codes = test_codes
+        # 대상별 전용 uid 시작 번호 (warm 컨테이너는 작업마다 다른 범위를 지정)
+        self.uid_base = settings.JUDGE_RUN_UID_BASE
+        self.pytest_args = [
+            *pytest_timeout_args(timeout), *pytest_order_args(test_order), *pytest_coverage_args(coverage),
+        ]
+        if schema is not None and (test_codes is not None or not all(schema.covers(name) for name in targets)):
+            schema = None
+        self.schema = schema
+
+        names = list(targets)
+        self._shuffler.shuffle(names)
+        if schema is not None:
+            # schema 변형은 이름으로 선택되므로 별칭을 쓰지 않음 (schema 디렉토리 하나만 존재)
+            self.aliases = {name: name for name in names}
+        else:
+            self.aliases = {name: secrets.token_hex(8) for name in names}
+
+    def target_dir(self, name: str) -> str:
+        """대상의 작업 디렉토리 기준 디렉토리 경로."""
+        return f"targets/{self.aliases[name]}"
+
+    def files(self) -> Dict[str, str]:
+        """작업 디렉토리 파일 구성 ({작업 디렉토리 기준 상대 경로: 내용}, conftest.py 제외)."""
+        files = {"multi_runner.py": read_multi_runner()}
+        if self.schema is not None:
+            files[f"targets/{SCHEMA_DIR_NAME}/target.py"] = self.schema.source
+            files[f"targets/{SCHEMA_DIR_NAME}/test_user.py"] = self.test_code
+            return files
+        for name in self.aliases:
+            files[f"{self.target_dir(name)}/target.py"] = self.targets[name]
+            files[f"{self.target_dir(name)}/test_user.py"] = (self.test_codes or {}).get(name, self.test_code)
+        return files
+
+    def spec(self) -> Dict[str, Any]:
+        """multi_runner.py 실행 명세."""
+        in_schema = self.schema is not None
+        return {
+            "timeout": self.timeout,
+            "targets": [] if in_schema else list(self.aliases.values()),
+            "schema_variants": list(self.aliases) if in_schema else [],
+            "max_log_chars": settings.JUDGE_LOG_MAX_BYTES,
+            "pytest_args": self.pytest_args,
+            "uid_base": self.uid_base,
+        }
+
+    def spec_argument(self) -> str:
+        """러너에 전달하는 실행 명세 JSON 인자."""
+        return json.dumps(self.spec(), separators=(",", ":"))
+
+    def command(self, python: str, runner: str = "multi_runner.py") -> List[str]:
+        """작업 디렉토리 기준 실행 명령 (python <러너> <실행 명세 JSON>)."""
+        return [python, runner, self.spec_argument()]
+
+    def run_timeout(self) -> float:
+        """러너 전체 실행 타임아웃 (대상별 타임아웃 합 + 기동 여유 시간)."""
+        return self.timeout * len(self.targets) + RUNNER_GRACE_SECONDS
+
+    def output_limit(self) -> int:
+        """
+        multi_runner.py 전체 출력의 상한 (바이트)을 반환합니다.
+
+        대상별 로그는 러너가 JUDGE_LOG_MAX_BYTES 문자로 자르므로,
+        결과 JSON 줄이 잘리지 않도록 UTF-8 인코딩과 JSON 이스케이프 여유를 포함한 크기를 사용합니다.
+        """
+        return settings.JUDGE_LOG_MAX_BYTES * 4 * (len(self.targets) + 1)
+
+    def parse(self, run_result: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        러너 출력에서 대상별 결과를 추출합니다.
+
+        결과 줄은 러너만 출력하므로 정확히 한 줄이어야 하며,
+        없거나 여러 줄이면 모든 대상을 시스템 오류(exit_code=-1)로 처리합니다.
+        """
+        logs = run_result.get("logs") or ""
+        lines = [line for line in logs.splitlines() if line.startswith(MULTI_RESULT_MARKER)]
+        payload = []
+        if len(lines) == 1:
+            try:
+                payload = json.loads(lines[0][len(MULTI_RESULT_MARKER):])
+            except ValueError:
+                logger.warning("다중 대상 러너 결과 파싱 실패 (출력 상한 초과 가능)")
+        elif lines:
+            logger.warning("다중 대상 러너 결과 줄이 %d개 출력되어 결과를 사용하지 않음", len(lines))
+
+        names = {alias: name for name, alias in self.aliases.items()}
+        results: Dict[str, Dict[str, Any]] = {}
+        for entry in payload if isinstance(payload, list) else []:
+            name = names.get(entry.get("target")) if isinstance(entry, dict) else None
+            if name is None or name in results:
+                continue
+            exit_code = entry.get("exit_code", -1)
+            entry_logs = entry.get("logs", "")
+            results[name] = {
+                "success": exit_code == 0,
+                "exit_code": exit_code,
+                "stdout": entry_logs,
+                "stderr": "",
+                "execution_time": entry.get("execution_time", 0.0),
+                "logs": entry_logs,
+                "report": entry.get("report"),
+            }
+
+        # 러너가 중단되어 결과가 누락된 대상은 전체 실행 결과로 채움
+        for name in self.targets:
+            if name not in results:
+                results[name] = {
+                    "success": False,
+                    "exit_code": -1,
+                    "stdout": "",
+                    "stderr": run_result.get("stderr") or "다중 대상 러너 결과 누락",
+                    "execution_time": run_result.get("execution_time", 0.0),
+                    "logs": logs[-settings.JUDGE_LOG_MAX_BYTES:],
+                    "report": None,
+                }
+        return results
+
+    def parse_single(self, run_result: Dict[str, Any]) -> Dict[str, Any]:
+        """단일 대상 실행의 결과를 추출합니다."""
+        return self.parse(run_result)[next(iter(self.targets))]
+
+
+class BoundedOutput:
+    """
+    실행 출력을 최대 바이트 수까지만 보관하는 버퍼.
+
+    상한을 넘으면 앞부분과 뒷부분(pytest 요약과 리포터 결과가 있는 부분)만 유지하고
+    중간은 버립니다. 출력 전체를 메모리에 올리지 않고 청크 단위로 받습니다.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        """
+        BoundedOutput 초기화.
+
+        Args:
+            max_bytes: 보관할 최대 바이트 수. None이면 JUDGE_LOG_MAX_BYTES 설정 사용
+        """
+        self.max_bytes = max_bytes if max_bytes is not None else settings.JUDGE_LOG_MAX_BYTES
+        self.head_limit = self.max_bytes // 2
+        self.tail_limit = self.max_bytes - self.head_limit
+        self.total_bytes = 0
+        self._head = bytearray()
+        self._tail = bytearray()
+
+    def feed(self, chunk: bytes) -> None:
+        """출력 청크를 추가합니다."""
+        if not chunk:
+            return
+        self.total_bytes += len(chunk)
+        room = self.head_limit - len(self._head)
+        if room > 0:
+            self._head += chunk[:room]
+            chunk = chunk[room:]
+        if chunk:
+            self._tail += chunk
+            # 상한의 두 배를 넘을 때만 잘라 복사 비용을 청크 수에 비례하지 않게 유지
+            if len(self._tail) > 2 * self.tail_limit:
+                del self._tail[:-self.tail_limit or None]
+
+    @property
+    def truncated(self) -> bool:
+        """상한 초과로 출력 일부가 버려졌는지 여부."""
+        return self.total_bytes > self.max_bytes
+
+    def getvalue(self) -> str:
+        """보관된 출력을 문자열로 반환합니다 (잘린 경우 표시 포함)."""
+        head = self._head.decode("utf-8", errors="replace")
+        if not self.truncated:
+            return head + self._tail.decode("utf-8", errors="replace")
+        tail = bytes(self._tail[-self.tail_limit:]) if self.tail_limit else b""
+        omitted = self.total_bytes - len(self._head) - len(tail)
+        return (
+            head
+            + TRUNCATION_MARKER.format(omitted=omitted)
+            + tail.decode("utf-8", errors="replace")
+        )
+
+
+def write_workdir(root: Path, files: Dict[str, str], include_conftest: bool = True) -> None:
+    """
+    작업 디렉토리에 파일을 작성합니다.
+
+    파일은 소유자 전용(0600, 디렉토리 0700)으로 작성되어, 권한을 낮춘 대상 실행 프로세스는
+    다른 대상(다른 제출)의 파일을 읽을 수 없습니다.
+
+    Args:
+        root: 작업 디렉토리 경로
+        files: {작업 디렉토리 기준 상대 경로: 내용}
+        include_conftest: test_user.py 옆에 conftest.py 포함 여부
+    """
+    if include_conftest:
+        files = with_conftest(files)
+    for relative_path, content in files.items():
+        file_path = root / relative_path
+        file_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            file.write(content)
+
+
+class JudgeBackend(ABC):
+    """pytest 실행 백엔드 인터페이스."""
+
+    name = "base"
+
+    @abstractmethod
+    def run_pytest(
+        self,
+        target_code: str,
+        test_code: str,
+        timeout: float,
+        test_order: Optional[List[str]] = None,
+        coverage: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        하나의 대상에 대해 pytest를 실행합니다.
+
+        test_order가 주어지면 나열된 테스트를 그 순서대로 먼저 실행합니다.
+        coverage가 참이면 리포터가 target.py 줄 커버리지를 수집합니다 (실행이 느려짐).
+
+        Returns:
+            실행 결과 딕셔너리:
+            {
+                "success": bool,
+                "exit_code": int,  # 타임아웃/시스템 오류는 -1
+                "stdout": str,
+                "stderr": str,
+                "execution_time": float,
+                "logs": str,
+                "report": dict | None  # 리포터 결과 (테스트별 결과, 커버리지)
+            }
+        """
+
+    @abstractmethod
+    def run_pytest_multi(
+        self,
+        targets: Dict[str, str],
+        test_code: str,
+        timeout: float,
+        schema: Optional[MutantSchema] = None,
+        test_codes: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        한 번의 실행으로 여러 대상에 대해 pytest를 실행합니다.
+
+        모든 대상은 러너가 fork한 별도 프로세스에서 실행됩니다.
+        schema가 모든 대상을 포함하면 한 번의 임포트/수집으로 실행합니다.
+        test_codes가 주어지면 대상마다 해당 테스트 코드를 사용합니다.
+
+        Returns:
+            {대상 이름: run_pytest와 같은 형식의 결과 딕셔너리}
+        """
+
+    @abstractmethod
+    def get_runtime_digest(self) -> str:
+        """실행 환경 식별자를 반환합니다 (결과 캐시 키에 사용)."""
+
+
+def create_judge_backend(name: Optional[str] = None) -> JudgeBackend:
+    """
+    설정에 따라 judge 백엔드를 생성합니다.
+
+    Args:
+        name: 백엔드 이름 ("docker" 또는 "sandbox"). None이면 JUDGE_BACKEND 설정 사용
+
+    Returns:
+        JudgeBackend 인스턴스
+
+    Raises:
+        ValueError: 알 수 없는 백엔드 이름인 경우
+    """
+    name = (name or settings.JUDGE_BACKEND).lower()
+
+    if name == "docker":
+        from app.services.docker_service import DockerService
+
+        return DockerService()
+    if name == "sandbox":
+        from app.services.sandbox_service import SandboxService
+
+        return SandboxService()
+
+    raise ValueError(f"알 수 없는 judge 백엔드: {name} (docker, sandbox 중 선택)")
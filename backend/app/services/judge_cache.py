@@ -0,0 +1,214 @@
+"""Content-addressed cache for judge results.
+
+같은 (대상 코드, 테스트 코드, 채점 런타임 파일, judge 이미지, 타임아웃) 조합은
+항상 같은 채점 결과를 내므로, 결과를 해시 키로 캐시하여 컨테이너 실행을 건너뜁니다.
+프로세스 내 LRU 캐시를 앞단에 두고, Redis를 워커 간 공유 캐시로 사용합니다.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import redis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class JudgeResultCache:
+    """judge 실행 결과 캐시 (in-process LRU + Redis)."""
+
+    REDIS_KEY_PREFIX = "judge_cache:"
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        ttl_seconds: int = 86400,
+        local_max_entries: int = 256,
+    ):
+        """
+        JudgeResultCache 초기화.
+
+        Args:
+            redis_url: 공유 캐시용 Redis URL. None이면 in-process 캐시만 사용
+            ttl_seconds: Redis 항목 TTL (초)
+            local_max_entries: in-process LRU 캐시 최대 항목 수
+        """
+        self.ttl_seconds = ttl_seconds
+        self.local_max_entries = local_max_entries
+        self._local: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"local_hits": 0, "redis_hits": 0, "misses": 0, "stores": 0}
+        self.redis_client = redis.from_url(redis_url) if redis_url else None
+
+    @staticmethod
+    def make_key(
+        target_code: str,
+        test_code: str,
+        runtime_files: Optional[str],
+        image_digest: str,
+        timeout: float,
+    ) -> str:
+        """
+        캐시 키를 생성합니다.
+
+        Args:
+            target_code: 테스트 대상 코드
+            test_code: 사용자가 작성한 테스트 코드
+            runtime_files: 채점 런타임 파일(conftest.py, 리포터 플러그인) 내용
+            image_digest: judge 이미지 ID (digest)
+            timeout: 실행 타임아웃 (초)
+
+        Returns:
+            sha256 hex digest
+        """
+        digest = hashlib.sha256()
+        for part in (target_code, test_code, runtime_files or "", image_digest, str(timeout)):
+            encoded = part.encode("utf-8")
+            # 길이 접두어로 필드 경계를 명확히 하여 충돌 방지
+            digest.update(len(encoded).to_bytes(8, "big"))
+            digest.update(encoded)
+        return digest.hexdigest()
+
+    def _redis_key(self, key: str) -> str:
+        """결과 저장 Redis 키 생성."""
+        return f"{self.REDIS_KEY_PREFIX}result:{key}"
+
+    def _remember_local(self, key: str, result: Dict[str, Any]) -> None:
+        """in-process LRU 캐시에 저장합니다."""
+        with self._lock:
+            self._local[key] = result
+            self._local.move_to_end(key)
+            while len(self._local) > self.local_max_entries:
+                self._local.popitem(last=False)
+
+    def _count(self, stat: str) -> None:
+        """캐시 통계를 증가시킵니다 (프로세스 + Redis 공유 카운터)."""
+        with self._lock:
+            self._stats[stat] += 1
+        if self.redis_client is not None:
+            try:
+                self.redis_client.hincrby(f"{self.REDIS_KEY_PREFIX}stats", stat, 1)
+            except redis.RedisError:
+                pass
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 결과를 조회합니다.
+
+        Args:
+            key: make_key로 생성한 캐시 키
+
+        Returns:
+            캐시된 결과의 복사본 (없으면 None)
+        """
+        with self._lock:
+            result = self._local.get(key)
+            if result is not None:
+                self._local.move_to_end(key)
+        if result is not None:
+            self._count("local_hits")
+            return copy.deepcopy(result)
+
+        if self.redis_client is not None:
+            try:
+                raw = self.redis_client.get(self._redis_key(key))
+            except redis.RedisError as e:
+                logger.warning(f"Judge 캐시 조회 실패 (miss로 처리): {type(e).__name__}: {str(e)}")
+                raw = None
+            if raw is not None:
+                result = json.loads(raw)
+                self._remember_local(key, result)
+                self._count("redis_hits")
+                return copy.deepcopy(result)
+
+        self._count("misses")
+        return None
+
+    def set(self, key: str, result: Dict[str, Any]) -> None:
+        """
+        결과를 캐시에 저장합니다.
+
+        Args:
+            key: make_key로 생성한 캐시 키
+            result: judge 실행 결과
+        """
+        stored = copy.deepcopy(result)
+        self._remember_local(key, stored)
+        if self.redis_client is not None:
+            try:
+                self.redis_client.set(
+                    self._redis_key(key), json.dumps(stored), ex=self.ttl_seconds
+                )
+            except (redis.RedisError, TypeError, ValueError) as e:
+                logger.warning(f"Judge 캐시 저장 실패: {type(e).__name__}: {str(e)}")
+        self._count("stores")
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 hit/miss 통계와 hit rate를 반환합니다 (현재 프로세스 기준)."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["local_entries"] = len(self._local)
+        lookups = stats["local_hits"] + stats["redis_hits"] + stats["misses"]
+        stats["hit_rate"] = (
+            (stats["local_hits"] + stats["redis_hits"]) / lookups if lookups else 0.0
+        )
+        return stats
+
+
+def get_shared_stats() -> Dict[str, Any]:
+    """
+    모든 워커가 Redis에 누적한 캐시 통계를 조회합니다.
+
+    Returns:
+        hit/miss/store 카운터와 hit rate
+    """
+    client = redis.from_url(get_judge_cache_redis_url())
+    try:
+        raw = client.hgetall(f"{JudgeResultCache.REDIS_KEY_PREFIX}stats")
+    finally:
+        client.close()
+    stats = {"local_hits": 0, "redis_hits": 0, "misses": 0, "stores": 0}
+    for k, v in raw.items():
+        stats[k.decode() if isinstance(k, bytes) else k] = int(v)
+    hits = stats["local_hits"] + stats["redis_hits"]
+    lookups = hits + stats["misses"]
+    stats["hit_rate"] = hits / lookups if lookups else 0.0
+    return stats
+
+
+def is_cacheable(result: Dict[str, Any]) -> bool:
+    """
+    캐시 가능한 결과인지 판단합니다.
+
+    타임아웃이나 Docker/시스템 오류(exit_code == -1)는 일시적일 수 있으므로 캐시하지 않습니다.
+    """
+    return result.get("exit_code", -1) >= 0
+
+
+def get_judge_cache_redis_url() -> str:
+    """Judge 캐시용 Redis URL (Celery/Rate limit과 별도 DB)."""
+    base_url = settings.REDIS_URL.rsplit("/", 1)[0]
+    return f"{base_url}/{settings.JUDGE_CACHE_REDIS_DB}"
+
+
+_cache: Optional[JudgeResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_judge_cache() -> JudgeResultCache:
+    """프로세스 전역 judge 결과 캐시를 반환합니다 (최초 호출 시 생성)."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = JudgeResultCache(
+                redis_url=get_judge_cache_redis_url(),
+                ttl_seconds=settings.JUDGE_CACHE_TTL_SECONDS,
+                local_max_entries=settings.JUDGE_CACHE_LOCAL_MAX_ENTRIES,
+            )
+        return _cache
@@ -1,31 +1,82 @@
-"""Judge service for running pytest tests in Docker containers."""
+"""Judge service for running pytest tests through a judge backend."""
 
-from typing import Dict, Any, Optional
+from contextlib import nullcontext
+from typing import ContextManager, Dict, Any, List, Optional, Tuple
 import logging
 
-from app.services.docker_service import DockerService, DEFAULT_TIMEOUT
+from app.core.config import settings
+from app.services.docker_service import DEFAULT_TIMEOUT
+from app.services.judge_backend import (
+    JudgeBackend,
+    create_judge_backend,
+    per_test_timeout,
+    read_multi_runner,
+    read_support_files,
+    run_cancelled,
+)
+from app.services.judge_admission import get_admission_controller
+from app.services.judge_cache import get_judge_cache, is_cacheable
+from app.services.mutant_schema import MutantSchema
 
 logger = logging.getLogger(__name__)
 
+# 슬롯 임대 시간 = 실행 타임아웃 + 컨테이너 생성/정리 여유 시간 (초)
+ADMISSION_LEASE_MARGIN = 30
+
+# 실행 시간이 적용된 타임아웃의 이 비율 이상이면 exit_code -1을 타임아웃으로 판단
+TIMEOUT_DETECTION_RATIO = 0.9
+
 
 class JudgeService:
     """채점을 위한 Judge 서비스 클래스."""
 
-    def __init__(self, timeout: int = DEFAULT_TIMEOUT):
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, backend: Optional[JudgeBackend] = None):
         """
         JudgeService 초기화.
 
         Args:
             timeout: pytest 실행 타임아웃 (초)
+            backend: pytest 실행 백엔드. None이면 JUDGE_BACKEND 설정으로 생성
         """
-        self.docker_service = DockerService()
+        self.backend = backend or create_judge_backend()
         self.timeout = timeout
+        self.cache = get_judge_cache() if settings.JUDGE_CACHE_ENABLED else None
+        self.admission = (
+            get_admission_controller() if settings.JUDGE_ADMISSION_ENABLED else None
+        )
+
+    def _admitted(self, run_timeout: float) -> ContextManager[None]:
+        """호스트 실행 슬롯을 확보하는 컨텍스트 (admission control 비활성 시 no-op)."""
+        if self.admission is None:
+            return nullcontext()
+        return self.admission.slot(lease_seconds=run_timeout + ADMISSION_LEASE_MARGIN)
+
+    def _cache_key(
+        self, target_code: str, user_test_code: str, timeout: float, coverage: bool = False
+    ) -> str:
+        """실행 결과 캐시 키를 생성합니다 (러너와 커버리지 수집 여부에 따라 결과 형식이 다름)."""
+        return self.cache.make_key(
+            target_code=target_code,
+            test_code=user_test_code,
+            runtime_files="\0".join(
+                [
+                    *(f"{name}:{content}" for name, content in sorted(read_support_files().items())),
+                    f"multi_runner.py:{read_multi_runner()}",
+                    f"per_test_timeout:{per_test_timeout(timeout)}",
+                    *(["coverage:1"] if coverage else []),
+                ]
+            ),
+            image_digest=f"{self.backend.name}:{self.backend.get_runtime_digest()}",
+            timeout=timeout,
+        )
 
     def run_pytest(
         self,
         target_code: str,
         user_test_code: str,
-        timeout: Optional[int] = None,
+        timeout: Optional[float] = None,
+        test_order: Optional[List[str]] = None,
+        coverage: bool = False,
     ) -> Dict[str, Any]:
         """
         pytest를 실행하고 결과를 반환합니다.
@@ -34,41 +85,64 @@ class JudgeService:
             target_code: 테스트 대상 코드 (golden_code 또는 buggy_code)
             user_test_code: 사용자가 작성한 테스트 코드
             timeout: 실행 타임아웃 (초). None이면 기본값 사용
+            test_order: 먼저 실행할 테스트 이름 순서.
+                실행 순서는 kill 여부를 바꾸지 않으므로 캐시 키에 포함하지 않습니다.
+            coverage: target.py 줄 커버리지 수집 여부. 줄 단위 추적은 실행을 크게 느리게 하므로
+                커버리지 기반 Mutant 생략에 쓰는 Golden 실행에서만 켭니다.
 
         Returns:
             실행 결과 딕셔너리:
             {
                 "success": bool,  # 모든 테스트 통과 여부
                 "exit_code": int,
-                "stdout": str,
+                "stdout": str | None,  # logs와 같으면 None (중복 저장 방지)
                 "stderr": str,
                 "execution_time": float,
-                "logs": str,
+                "logs": str,  # 상한(JUDGE_LOG_MAX_BYTES) 초과 시 앞/뒤만 유지
                 "all_tests_passed": bool,  # pytest 결과 기반
                 "any_test_failed": bool,  # pytest 결과 기반
+                "tests": list | None,  # 테스트별 결과 (리포터 플러그인)
+                "collection_errors": list | None,  # 수집 오류 (리포터 플러그인)
+                "test_summary": dict | None,  # outcome별 테스트 수
+                "first_failure": dict | None,  # 첫 번째 수집 오류 또는 실패 테스트
+                "target_coverage": list | None,  # 실행된 target.py 줄 번호 (coverage 요청 시)
+                "timeout": float,  # 적용된 실행 타임아웃 (초)
             }
+
+            리포터 결과가 없으면(이전 judge 이미지, 러너 중단 등) tests 등은 None입니다.
         """
         if timeout is None:
             timeout = self.timeout
 
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self._cache_key(target_code, user_test_code, timeout, coverage)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                cached["cached"] = True
+                cached["timeout"] = timeout
+                logger.info("pytest 결과 캐시 hit: 컨테이너 실행 생략")
+                return cached
+
         try:
-            # Docker 컨테이너에서 pytest 실행
-            result = self.docker_service.run_pytest(
-                target_code=target_code,
-                test_code=user_test_code,
-                timeout=timeout,
-            )
+            # 백엔드(Docker 컨테이너 또는 sandbox)에서 pytest 실행
+            with self._admitted(timeout):
+                result = self.backend.run_pytest(
+                    target_code=target_code,
+                    test_code=user_test_code,
+                    timeout=timeout,
+                    test_order=test_order,
+                    coverage=coverage,
+                )
 
             # pytest 결과 파싱
-            all_tests_passed = result["success"] and result["exit_code"] == 0
-            any_test_failed = not all_tests_passed and result["exit_code"] != -1
-
-            # 결과에 추가 정보 포함
-            result["all_tests_passed"] = all_tests_passed
-            result["any_test_failed"] = any_test_failed
+            self._annotate_result(result)
+            result["timeout"] = timeout
+            if cache_key is not None and is_cacheable(result) and not run_cancelled():
+                self.cache.set(cache_key, result)
 
             logger.info(
-                f"pytest 실행 완료: 성공={all_tests_passed}, "
+                f"pytest 실행 완료: 성공={result['all_tests_passed']}, "
                 f"시간={result['execution_time']:.2f}초"
             )
 
@@ -85,8 +159,159 @@ class JudgeService:
                 "logs": "",
                 "all_tests_passed": False,
                 "any_test_failed": False,
+                "tests": None,
+                "collection_errors": None,
+                "test_summary": None,
+                "first_failure": None,
+                "target_coverage": None,
+                "timeout": timeout,
             }
 
+    def _annotate_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        실행 결과에 all_tests_passed / any_test_failed 필드와
+        리포터 플러그인의 테스트별 결과 필드를 추가합니다.
+        """
+        all_tests_passed = result["success"] and result["exit_code"] == 0
+        result["all_tests_passed"] = all_tests_passed
+        result["any_test_failed"] = not all_tests_passed and result["exit_code"] != -1
+
+        stdout_is_logs = result.get("stdout") == result.get("logs")
+        # 리포터 결과는 러너가 pytest 출력과 분리된 채널로 전달 (출력의 마커 줄은 해석하지 않음)
+        report = result.pop("report", None)
+        if not isinstance(report, dict):
+            report = None
+        if stdout_is_logs:
+            # 백엔드는 stdout과 logs에 같은 출력을 담으므로 한 번만 저장
+            result["stdout"] = None
+
+        tests = report.get("tests", []) if report is not None else None
+        collection_errors = report.get("collection_errors", []) if report is not None else None
+        result["tests"] = tests
+        result["collection_errors"] = collection_errors
+        result["test_summary"] = report.get("summary") if report is not None else None
+        result["target_coverage"] = report.get("coverage") if report is not None else None
+
+        first_failure = None
+        if collection_errors:
+            first_failure = collection_errors[0]
+        elif tests:
+            first_failure = next(
+                (t for t in tests if t.get("outcome") in ("failed", "error")), None
+            )
+        result["first_failure"] = first_failure
+        return result
+
+    def run_pytest_multi(
+        self,
+        targets: Dict[str, str],
+        user_test_code: str,
+        timeout: Optional[float] = None,
+        schema: Optional[MutantSchema] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        하나의 컨테이너에서 여러 대상에 대해 pytest를 실행합니다.
+
+        Args:
+            targets: {대상 이름: 대상 코드} (예: {"golden": ..., "mutant_3": ...})
+            user_test_code: 사용자가 작성한 테스트 코드
+            timeout: 대상별 실행 타임아웃 (초). None이면 기본값 사용
+            schema: mutant schema 모듈. 모든 대상을 포함하면 한 번의 임포트/수집으로 실행
+
+        Returns:
+            {대상 이름: run_pytest와 같은 형식의 결과 딕셔너리}
+        """
+        if timeout is None:
+            timeout = self.timeout
+
+        results: Dict[str, Dict[str, Any]] = {}
+        cache_keys: Dict[str, str] = {}
+        if self.cache is not None:
+            for name, target_code in targets.items():
+                cache_keys[name] = self._cache_key(target_code, user_test_code, timeout)
+                cached = self.cache.get(cache_keys[name])
+                if cached is not None:
+                    cached["cached"] = True
+                    cached["timeout"] = timeout
+                    results[name] = cached
+
+        # 캐시에 없는 대상만 실행
+        pending = {name: code for name, code in targets.items() if name not in results}
+        if pending:
+            logger.info(
+                f"다중 대상 pytest 실행 시작: 대상 수={len(pending)}, "
+                f"캐시 hit={len(results)}"
+            )
+            # 다중 대상 실행은 컨테이너 하나이므로 슬롯 하나를 사용
+            with self._admitted(timeout * len(pending)):
+                executed = self.backend.run_pytest_multi(
+                    targets=pending,
+                    test_code=user_test_code,
+                    timeout=timeout,
+                    schema=schema,
+                )
+            for name, result in executed.items():
+                self._annotate_result(result)
+                result["timeout"] = timeout
+                if name in cache_keys and is_cacheable(result):
+                    self.cache.set(cache_keys[name], result)
+                results[name] = result
+
+        return {name: results[name] for name in targets}
+
+    def run_pytest_batch(
+        self,
+        runs: Dict[str, Tuple[str, str]],
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 제출의 (대상 코드, 테스트 코드) 실행을 하나의 컨테이너에서 수행합니다 (배치 채점).
+
+        대상마다 격리된 프로세스에서 실행되므로 제출 간에 상태가 공유되지 않으며,
+        캐시 키는 run_pytest와 같아 단건 채점과 결과를 공유합니다.
+
+        Args:
+            runs: {실행 이름: (대상 코드, 테스트 코드)}
+            timeout: 실행별 타임아웃 (초). None이면 기본값 사용
+
+        Returns:
+            {실행 이름: run_pytest와 같은 형식의 결과 딕셔너리}
+        """
+        if timeout is None:
+            timeout = self.timeout
+
+        results: Dict[str, Dict[str, Any]] = {}
+        cache_keys: Dict[str, str] = {}
+        if self.cache is not None:
+            for name, (target_code, test_code) in runs.items():
+                cache_keys[name] = self._cache_key(target_code, test_code, timeout)
+                cached = self.cache.get(cache_keys[name])
+                if cached is not None:
+                    cached["cached"] = True
+                    cached["timeout"] = timeout
+                    results[name] = cached
+
+        pending = {name: run for name, run in runs.items() if name not in results}
+        if pending:
+            logger.info(
+                f"배치 pytest 실행 시작: 실행 수={len(pending)}, 캐시 hit={len(results)}"
+            )
+            with self._admitted(timeout * len(pending)):
+                executed = self.backend.run_pytest_multi(
+                    targets={name: target_code for name, (target_code, _) in pending.items()},
+                    test_code="",
+                    timeout=timeout,
+                    test_codes={name: test_code for name, (_, test_code) in pending.items()},
+                )
+            for name, result in executed.items():
+                self._annotate_result(result)
+                result["timeout"] = timeout
+                if name in cache_keys and is_cacheable(result):
+                    self.cache.set(cache_keys[name], result)
+                results[name] = result
+
+        return {name: results[name] for name in runs}
+
     def test_golden_code(
         self,
         golden_code: str,
@@ -95,6 +320,9 @@ class JudgeService:
         """
         Golden Code에 대해 테스트를 실행합니다.
 
+        커버리지 기반 Mutant 생략(JUDGE_COVERAGE_SKIP_ENABLED)이 켜져 있으면
+        target.py 줄 커버리지를 함께 수집합니다.
+
         Args:
             golden_code: 정답 구현 코드
             user_test_code: 사용자가 작성한 테스트 코드
@@ -106,12 +334,15 @@ class JudgeService:
         return self.run_pytest(
             target_code=golden_code,
             user_test_code=user_test_code,
+            coverage=settings.JUDGE_COVERAGE_SKIP_ENABLED,
         )
 
     def test_buggy_code(
         self,
         buggy_code: str,
         user_test_code: str,
+        timeout: Optional[float] = None,
+        test_order: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         Buggy Code에 대해 테스트를 실행합니다.
@@ -119,6 +350,8 @@ class JudgeService:
         Args:
             buggy_code: 버그가 있는 구현 코드
             user_test_code: 사용자가 작성한 테스트 코드
+            timeout: 실행 타임아웃 (초). None이면 기본값 사용 (문제별 adaptive 타임아웃 등)
+            test_order: 먼저 실행할 테스트 이름 순서 (kill 확률이 높은 테스트부터)
 
         Returns:
             실행 결과 딕셔너리
@@ -127,5 +360,7 @@ class JudgeService:
         return self.run_pytest(
             target_code=buggy_code,
             user_test_code=user_test_code,
+            timeout=timeout,
+            test_order=test_order,
         )
 
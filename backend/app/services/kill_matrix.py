@@ -0,0 +1,179 @@
+"""Test-by-mutant kill matrix.
+
+채점 결과(Golden/Mutant별 테스트 결과)로 제출별 테스트 × Mutant kill 행렬을 만들고,
+비트셋으로 압축하여 저장하거나 분석용으로 다시 풀어냅니다.
+
+Mutant 실행은 --maxfail=1이므로 첫 실패 이후의 테스트는 실행되지 않습니다.
+따라서 셀은 killed / survived / not_run 세 가지 상태를 가지며,
+killed와 executed 두 비트셋(행 우선: test_index * Mutant 수 + mutant_index)으로 표현합니다.
+"""
+
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+
+# 셀 상태
+KILLED = "killed"
+SURVIVED = "survived"
+NOT_RUN = "not_run"
+
+# kill로 보는 테스트 결과 (setup/teardown 오류 포함)
+_KILLING_OUTCOMES = frozenset({"failed", "error"})
+
+
+def short_test_name(nodeid: str) -> str:
+    """pytest nodeid에서 파일 이름을 제외한 테스트 이름 (예: "TestX::test_y[1]")."""
+    return nodeid.split("::", 1)[1] if "::" in nodeid else nodeid
+
+
+def _set_bit(bits: bytearray, index: int) -> None:
+    bits[index >> 3] |= 1 << (index & 7)
+
+
+def _get_bit(bits: bytes, index: int) -> bool:
+    return bool(bits[index >> 3] & (1 << (index & 7)))
+
+
+def build_kill_matrix(
+    golden_result: Dict[str, Any],
+    mutant_logs: List[Dict[str, Any]],
+) -> Optional[Dict[str, Any]]:
+    """
+    채점 결과로 kill 행렬을 만듭니다.
+
+    행은 Golden 실행의 테스트 목록(모든 테스트가 통과했으므로 전체 목록)입니다.
+    실행하지 않고 survived 처리된 Mutant(not_reached)는 모든 테스트가 통과한 것으로,
+    테스트별 결과가 없는 Mutant(타임아웃, 수집 오류 등)는 모두 not_run으로 기록합니다.
+
+    Args:
+        golden_result: Golden 실행 결과
+        mutant_logs: SubmissionService._run_mutants의 Mutant별 실행 로그
+
+    Returns:
+        {"test_names", "mutant_ids", "killed": bytes, "executed": bytes}.
+        Golden 테스트별 결과가 없으면 None
+    """
+    golden_tests = golden_result.get("tests")
+    if not golden_tests:
+        return None
+
+    test_names: List[str] = []
+    for test in golden_tests:
+        name = short_test_name(test["nodeid"])
+        if name not in test_names:
+            test_names.append(name)
+    row_of = {name: index for index, name in enumerate(test_names)}
+    mutant_ids = [log["mutant_id"] for log in mutant_logs]
+
+    size = (len(test_names) * len(mutant_ids) + 7) // 8
+    killed = bytearray(size)
+    executed = bytearray(size)
+    for column, log in enumerate(mutant_logs):
+        result = log["result"]
+        if result.get("not_reached"):
+            for row in range(len(test_names)):
+                _set_bit(executed, row * len(mutant_ids) + column)
+            continue
+        for test in result.get("tests") or []:
+            row = row_of.get(short_test_name(test["nodeid"]))
+            if row is None:
+                continue
+            index = row * len(mutant_ids) + column
+            _set_bit(executed, index)
+            if test.get("outcome") in _KILLING_OUTCOMES:
+                _set_bit(killed, index)
+
+    return {
+        "test_names": test_names,
+        "mutant_ids": mutant_ids,
+        "killed": bytes(killed),
+        "executed": bytes(executed),
+    }
+
+
+def cell_state(killed: bytes, executed: bytes, index: int) -> str:
+    """비트셋 위치의 셀 상태."""
+    if _get_bit(killed, index):
+        return KILLED
+    return SURVIVED if _get_bit(executed, index) else NOT_RUN
+
+
+def decode_kill_matrix(
+    test_names: List[str],
+    mutant_ids: List[int],
+    killed: bytes,
+    executed: bytes,
+) -> Dict[str, Dict[int, str]]:
+    """
+    비트셋 kill 행렬을 {테스트 이름: {mutant_id: 셀 상태}}로 풉니다.
+    """
+    width = len(mutant_ids)
+    return {
+        name: {
+            mutant_id: cell_state(killed, executed, row * width + column)
+            for column, mutant_id in enumerate(mutant_ids)
+        }
+        for row, name in enumerate(test_names)
+    }
+
+
+def summarize_kill_matrices(matrices: Iterable[Any], top_tests: int = 20) -> Dict[str, Any]:
+    """
+    문제의 kill 행렬들을 Mutant별/테스트 이름별 통계로 집계합니다.
+
+    Args:
+        matrices: SubmissionKillMatrix 목록 (같은 문제)
+        top_tests: kill 수 기준으로 반환할 테스트 이름 수
+
+    Returns:
+        {
+            "submissions": int,
+            "mutants": [{"mutant_id", "submissions", "killed", "kill_ratio"}],
+            "tests": [{"name", "executed", "kills", "killed_mutants": {mutant_id: kills}}],
+        }
+    """
+    submissions = 0
+    mutant_runs: Counter = Counter()
+    mutant_kills: Counter = Counter()
+    test_executed: Counter = Counter()
+    test_kills: Counter = Counter()
+    test_killed_mutants: Dict[str, Counter] = {}
+
+    for matrix in matrices:
+        submissions += 1
+        width = len(matrix.mutant_ids)
+        for column, mutant_id in enumerate(matrix.mutant_ids):
+            states = [
+                cell_state(matrix.killed, matrix.executed, row * width + column)
+                for row in range(len(matrix.test_names))
+            ]
+            if any(state != NOT_RUN for state in states):
+                mutant_runs[mutant_id] += 1
+            if KILLED in states:
+                mutant_kills[mutant_id] += 1
+            for name, state in zip(matrix.test_names, states):
+                if state == NOT_RUN:
+                    continue
+                test_executed[name] += 1
+                if state == KILLED:
+                    test_kills[name] += 1
+                    test_killed_mutants.setdefault(name, Counter())[mutant_id] += 1
+
+    mutants = [
+        {
+            "mutant_id": mutant_id,
+            "submissions": runs,
+            "killed": mutant_kills[mutant_id],
+            "kill_ratio": mutant_kills[mutant_id] / runs if runs else 0.0,
+        }
+        for mutant_id, runs in sorted(mutant_runs.items())
+    ]
+    tests = [
+        {
+            "name": name,
+            "executed": test_executed[name],
+            "kills": kills,
+            "killed_mutants": dict(test_killed_mutants.get(name, {})),
+        }
+        for name, kills in test_kills.most_common(top_tests)
+    ]
+    return {"submissions": submissions, "mutants": mutants, "tests": tests}
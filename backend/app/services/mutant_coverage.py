@@ -0,0 +1,191 @@
+"""Coverage-guided mutant skipping.
+
+Mutant가 Golden Code에서 바꾼 줄을 미리 계산해 두고, Golden 실행의 target.py 줄 커버리지와
+비교하여 사용자 테스트가 변경된 코드에 도달하지 않는 Mutant를 찾습니다.
+Golden과 Mutant는 변경된 코드에 도달하기 전까지 똑같이 실행되므로,
+도달하지 않는 Mutant는 실행하지 않아도 살아남는다(survived)는 것을 알 수 있습니다.
+"""
+
+import ast
+import difflib
+import logging
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from app.services.mutant_schema import changed_definitions
+logger = logging.getLogger(__name__)
+
+
+def _statements(tree: ast.Module) -> List[ast.stmt]:
+    """모든 문장 노드 (중첩 포함)."""
+    return [node for node in ast.walk(tree) if isinstance(node, ast.stmt)]
+
+
+def _enclosing_function(
+    functions: List[ast.AST],
+    first_line: int,
+    last_line: int,
+) -> Optional[ast.AST]:
+    """줄 범위를 본문으로 포함하는 가장 안쪽 함수 정의를 반환합니다."""
+    best = None
+    for function in functions:
+        body_start = function.body[0].lineno
+        if body_start <= first_line and last_line <= function.end_lineno:
+            if best is None or function.lineno >= best.lineno:
+                best = function
+    return best
+
+
+def _innermost_statement(statements: List[ast.stmt], line: int) -> Optional[ast.stmt]:
+    """줄을 포함하는 가장 안쪽 문장을 반환합니다."""
+    best = None
+    for statement in statements:
+        if statement.lineno <= line <= statement.end_lineno:
+            if best is None or (statement.end_lineno - statement.lineno) <= (best.end_lineno - best.lineno):
+                best = statement
+    return best
+
+
+def _is_blank(line: str) -> bool:
+    """빈 줄 또는 주석만 있는 줄인지 확인합니다."""
+    stripped = line.strip()
+    return not stripped or stripped.startswith("#")
+
+
+def _definition_lines(node: ast.AST) -> Tuple[int, int]:
+    """데코레이터를 포함한 정의의 (첫 줄, 마지막 줄)."""
+    first_line = min([node.lineno, *(d.lineno for d in node.decorator_list)])
+    return first_line, node.end_lineno
+
+
+def _find_definition(tree: ast.Module, path: Tuple[str, ...]) -> Optional[ast.AST]:
+    """(함수 이름,) 또는 (클래스 이름, 메서드 이름) 경로의 정의를 찾습니다."""
+    scope = tree.body
+    node = None
+    for name in path:
+        node = next((n for n in scope if getattr(n, "name", None) == name), None)
+        if node is None:
+            return None
+        scope = getattr(node, "body", [])
+    return node
+
+
+def _region_probes(
+    golden_lines: List[str],
+    buggy_lines: List[str],
+    line_offset: int,
+    functions: List[ast.AST],
+    statements: List[ast.stmt],
+    total_lines: int,
+) -> Optional[Set[int]]:
+    """
+    Golden/Mutant 코드 구간의 줄 단위 차이를 탐침 줄 번호로 변환합니다.
+
+    Returns:
+        탐침 줄 번호 집합. 함수 본문 밖의 변경이 있으면 None
+    """
+    probes: Set[int] = set()
+    matcher = difflib.SequenceMatcher(a=golden_lines, b=buggy_lines, autojunk=False)
+    for tag, g_start, g_end, b_start, b_end in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        # 빈 줄/주석 변경은 실행에 영향이 없으므로 무시
+        changed_lines = [
+            line_offset + index + 1
+            for index in range(g_start, g_end)
+            if not _is_blank(golden_lines[index])
+        ]
+        if not changed_lines:
+            if all(_is_blank(line) for line in buggy_lines[b_start:b_end]):
+                continue
+            # 삽입 위치 앞뒤 줄을 모두 포함하는 가장 안쪽 함수 본문 전체를 탐침으로 사용
+            first_line = max(line_offset + g_start, 1)
+            last_line = min(line_offset + g_end + 1, total_lines)
+            function = _enclosing_function(functions, first_line, last_line)
+            if function is None:
+                return None
+            probes.update(range(function.lineno, function.end_lineno + 1))
+            continue
+
+        # 교체/삭제된 줄: 그 줄을 포함하는 가장 안쪽 문장 범위를 탐침으로 사용
+        for line in changed_lines:
+            if _enclosing_function(functions, line, line) is None:
+                return None
+            statement = _innermost_statement(statements, line)
+            if statement is None:
+                return None
+            probes.update(range(statement.lineno, statement.end_lineno + 1))
+    return probes
+
+
+@lru_cache(maxsize=512)
+def mutant_probe_lines(golden_code: str, buggy_code: str) -> Optional[FrozenSet[int]]:
+    """
+    Mutant의 변경된 코드가 실행되었는지 판단할 Golden Code 줄 번호 집합을 계산합니다.
+
+    Golden 실행에서 이 줄 중 하나라도 실행되었으면 변경된 코드에 도달했을 수 있습니다.
+    변경이 함수 본문 밖(모듈/클래스 수준, 함수 시그니처, 데코레이터)에 있으면
+    임포트 시점에 실행되므로 항상 도달한 것으로 봅니다.
+
+    Args:
+        golden_code: 정답 구현 코드
+        buggy_code: Mutant 코드
+
+    Returns:
+        Golden Code 줄 번호 집합 (docstring만 다르면 빈 집합).
+        항상 도달하는 변경이거나 판단할 수 없으면 None
+    """
+    try:
+        golden = ast.parse(golden_code)
+        mutant = ast.parse(buggy_code)
+    except SyntaxError:
+        return None
+
+    statements = _statements(golden)
+    functions = [
+        node for node in ast.walk(golden) if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    ]
+    golden_lines = golden_code.splitlines()
+    buggy_lines = buggy_code.splitlines()
+
+    # 변경된 함수/메서드별로 비교 (docstring 차이 무시), 표현할 수 없으면 파일 전체 비교
+    regions = []
+    changed = changed_definitions(golden, mutant)
+    if changed is None:
+        regions.append((golden_lines, buggy_lines, 0))
+    else:
+        for path, m_def in changed.items():
+            g_def = _find_definition(golden, path)
+            if g_def is None:
+                return None
+            g_first, g_last = _definition_lines(g_def)
+            m_first, m_last = _definition_lines(m_def)
+            regions.append(
+                (golden_lines[g_first - 1:g_last], buggy_lines[m_first - 1:m_last], g_first - 1)
+            )
+
+    probes: Set[int] = set()
+    for g_region, m_region, offset in regions:
+        region_probes = _region_probes(
+            g_region, m_region, offset, functions, statements, len(golden_lines)
+        )
+        if region_probes is None:
+            return None
+        probes |= region_probes
+    return frozenset(probes)
+
+
+def is_reached(probe_lines: Optional[FrozenSet[int]], covered_lines: Iterable[int]) -> bool:
+    """
+    Golden 실행 커버리지로 Mutant의 변경된 코드에 도달했는지 판단합니다.
+
+    Args:
+        probe_lines: mutant_probe_lines 결과 (None이면 항상 도달)
+        covered_lines: Golden 실행에서 실행된 target.py 줄 번호
+
+    Returns:
+        도달했을 수 있으면 True, 확실히 도달하지 않았으면 False
+    """
+    if probe_lines is None:
+        return True
+    return not probe_lines.isdisjoint(covered_lines)
@@ -0,0 +1,550 @@
+"""Mutant schema compiler.
+
+Golden Code와 각 Mutant(buggy_code)를 AST 수준에서 비교하여,
+모든 변형을 담은 하나의 "schema" 모듈(target.py)을 생성합니다.
+변경된 함수/메서드는 변형별로 정의되고, 호출 시점에 환경 변수
+QA_ARENA_VARIANT로 선택된 변형으로 분기합니다.
+
+judge/multi_runner.py는 schema 모듈과 사용자 테스트를 한 번만 임포트/수집한 뒤
+같은 프로세스에서 변형마다 테스트를 다시 실행합니다.
+"""
+
+import ast
+import copy
+import hashlib
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 활성 변형을 선택하는 환경 변수 (judge/multi_runner.py와 동일)
+VARIANT_ENV = "QA_ARENA_VARIANT"
+GOLDEN_VARIANT = "golden"
+
+# schema 모듈 앞에 추가되는 분기 헬퍼
+SCHEMA_PRELUDE = f'''\
+import functools as _qa_functools
+import os as _qa_os
+
+
+def _qa_dispatch(variants, default):
+    """활성 변형의 구현으로 호출을 전달하는 함수를 만듭니다."""
+
+    @_qa_functools.wraps(default)
+    def _qa_dispatcher(*args, **kwargs):
+        active = _qa_os.environ.get("{VARIANT_ENV}", "{GOLDEN_VARIANT}")
+        return variants.get(active, default)(*args, **kwargs)
+
+    return _qa_dispatcher
+'''
+
+_FUNCTION_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+@dataclass(frozen=True)
+class MutantSchema:
+    """컴파일된 schema 모듈."""
+
+    source: str  # target.py로 배치되는 schema 모듈 코드
+    variants: Tuple[str, ...]  # schema로 실행할 수 있는 대상 이름 (golden 포함)
+    digest: str  # 입력(golden + mutant 코드) 해시
+
+    def covers(self, name: str) -> bool:
+        """대상이 schema에 포함되어 있는지 여부."""
+        return name in self.variants
+
+
+def _is_immutable_literal(node: ast.AST) -> bool:
+    """불변 리터럴 값인지 확인합니다 (변형 사이에 공유해도 안전한 값)."""
+    try:
+        value = ast.literal_eval(node)
+    except (ValueError, SyntaxError, TypeError):
+        return False
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _is_docstring(node: ast.AST) -> bool:
+    return isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant)
+
+
+def _is_safe_assignment(node: ast.AST) -> bool:
+    if isinstance(node, ast.Assign):
+        return _is_immutable_literal(node.value)
+    if isinstance(node, ast.AnnAssign):
+        return node.value is None or _is_immutable_literal(node.value)
+    return False
+
+
+def _is_schema_safe(tree: ast.Module) -> bool:
+    """
+    변형들이 한 번의 임포트를 공유해도 결과가 같은 모듈인지 확인합니다.
+
+    모듈/클래스 수준 가변 상태나 global/nonlocal 사용이 있으면
+    이전 변형의 실행이 다음 변형에 영향을 줄 수 있으므로 제외합니다.
+    """
+    if any(isinstance(node, (ast.Global, ast.Nonlocal)) for node in ast.walk(tree)):
+        return False
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom, *_FUNCTION_TYPES)):
+            continue
+        if _is_docstring(node) or _is_safe_assignment(node):
+            continue
+        if isinstance(node, ast.ClassDef):
+            if all(
+                isinstance(item, (*_FUNCTION_TYPES, ast.Pass))
+                or _is_docstring(item)
+                or _is_safe_assignment(item)
+                for item in node.body
+            ):
+                continue
+        return False
+    return True
+
+
+def _without_docstrings(node: ast.AST) -> ast.AST:
+    """docstring을 제거한 복사본을 반환합니다 (Mutant는 docstring이 생략된 경우가 많음)."""
+    node = copy.deepcopy(node)
+    for child in ast.walk(node):
+        body = getattr(child, "body", None)
+        if isinstance(child, (ast.Module, ast.ClassDef, *_FUNCTION_TYPES)) and body and _is_docstring(body[0]):
+            child.body = body[1:] or [ast.Pass()]
+    return node
+
+
+def _same(a: ast.AST, b: ast.AST) -> bool:
+    """docstring을 제외하고 같은 코드인지 비교합니다."""
+    return ast.dump(_without_docstrings(a)) == ast.dump(_without_docstrings(b))
+
+
+def _class_header(node: ast.ClassDef) -> Tuple:
+    """클래스 본문을 제외한 정의 (이름, 기반 클래스, 키워드, 데코레이터)."""
+    return (
+        node.name,
+        [ast.dump(base) for base in node.bases],
+        [ast.dump(keyword) for keyword in node.keywords],
+        [ast.dump(decorator) for decorator in node.decorator_list],
+    )
+
+
+def changed_definitions(golden: ast.Module, mutant: ast.Module) -> Optional[Dict[Tuple[str, ...], ast.AST]]:
+    """
+    Mutant에서 변경된 함수/메서드를 찾습니다 (docstring 차이는 무시).
+
+    Returns:
+        {(함수 이름,) 또는 (클래스 이름, 메서드 이름): 변경된 정의}.
+        함수/메서드 본문 외의 변경이 있으면 None (schema로 표현 불가)
+    """
+    if len(golden.body) != len(mutant.body):
+        return None
+
+    changed: Dict[Tuple[str, ...], ast.AST] = {}
+    for g_node, m_node in zip(golden.body, mutant.body):
+        if _same(g_node, m_node) or (_is_docstring(g_node) and _is_docstring(m_node)):
+            continue
+        if isinstance(g_node, _FUNCTION_TYPES) and type(g_node) is type(m_node):
+            if g_node.name != m_node.name:
+                return None
+            changed[(g_node.name,)] = m_node
+            continue
+        if not (isinstance(g_node, ast.ClassDef) and isinstance(m_node, ast.ClassDef)):
+            return None
+        if _class_header(g_node) != _class_header(m_node):
+            return None
+        if len(g_node.body) != len(m_node.body):
+            return None
+        for g_item, m_item in zip(g_node.body, m_node.body):
+            if _same(g_item, m_item) or (_is_docstring(g_item) and _is_docstring(m_item)):
+                continue
+            if not (
+                isinstance(g_item, _FUNCTION_TYPES)
+                and type(g_item) is type(m_item)
+                and g_item.name == m_item.name
+                # property/staticmethod 등 디스크립터는 호출 분기로 감쌀 수 없음
+                and not g_item.decorator_list
+                and not m_item.decorator_list
+            ):
+                return None
+            changed[(g_node.name, g_item.name)] = m_item
+    return changed
+
+
+def _variant_definitions(
+    name: str,
+    golden_def: ast.AST,
+    overrides: Dict[str, ast.AST],
+) -> List[ast.stmt]:
+    """
+    함수 하나의 변형별 정의와 분기 함수를 생성합니다.
+
+    각 변형은 원래 이름으로 정의한 뒤 별칭에 저장하므로
+    traceback에는 원래 함수 이름이 그대로 표시됩니다.
+    """
+    statements: List[ast.stmt] = []
+    implementations: List[ast.AST] = [golden_def]
+    variant_index: Dict[str, int] = {}
+    for variant, definition in overrides.items():
+        for index, existing in enumerate(implementations):
+            if _same(existing, definition):
+                break
+        else:
+            implementations.append(definition)
+            index = len(implementations) - 1
+        if index:
+            variant_index[variant] = index
+
+    for index, definition in enumerate(implementations):
+        statements.append(definition)
+        statements.extend(ast.parse(f"_qa_{name}__{index} = {name}").body)
+
+    table = ", ".join(f"{variant!r}: _qa_{name}__{index}" for variant, index in variant_index.items())
+    statements.extend(ast.parse(f"{name} = _qa_dispatch({{{table}}}, _qa_{name}__0)").body)
+    return statements
+
+
+def compile_mutant_schema(golden_code: str, mutants: Dict[str, str]) -> Optional[MutantSchema]:
+    """
+    Golden Code와 Mutant 코드로 schema 모듈을 생성합니다.
+
+    Args:
+        golden_code: 정답 구현 코드
+        mutants: {대상 이름: buggy_code} (예: {"mutant_3": ...})
+
+    Returns:
+        MutantSchema. Golden Code가 schema로 실행하기에 안전하지 않거나
+        표현 가능한 Mutant가 하나도 없으면 None.
+        표현할 수 없는 Mutant는 variants에서 제외되며 기존 방식으로 실행해야 합니다.
+    """
+    try:
+        golden = ast.parse(golden_code)
+    except SyntaxError:
+        return None
+    if not _is_schema_safe(golden):
+        return None
+
+    changes: Dict[str, Dict[Tuple[str, ...], ast.AST]] = {}
+    for name, buggy_code in mutants.items():
+        try:
+            changed = changed_definitions(golden, ast.parse(buggy_code))
+        except SyntaxError:
+            changed = None
+        if changed is None or any(
+            isinstance(node, (ast.Global, ast.Nonlocal))
+            for definition in changed.values()
+            for node in ast.walk(definition)
+        ):
+            logger.debug(f"schema로 표현할 수 없는 Mutant 제외: {name}")
+            continue
+        changes[name] = changed
+    if not changes:
+        return None
+
+    # 변형별로 바뀐 정의를 함수 경로 기준으로 모음
+    overrides: Dict[Tuple[str, ...], Dict[str, ast.AST]] = {}
+    for variant, changed in changes.items():
+        for path, definition in changed.items():
+            overrides.setdefault(path, {})[variant] = definition
+
+    # 모듈 docstring과 __future__ 임포트는 schema 모듈 맨 앞에 있어야 함
+    header_size = 0
+    for node in golden.body:
+        if (header_size == 0 and _is_docstring(node)) or (
+            isinstance(node, ast.ImportFrom) and node.module == "__future__"
+        ):
+            header_size += 1
+        else:
+            break
+
+    body: List[ast.stmt] = [*golden.body[:header_size], *ast.parse(SCHEMA_PRELUDE).body]
+    for node in golden.body[header_size:]:
+        if isinstance(node, _FUNCTION_TYPES) and (node.name,) in overrides:
+            body.extend(_variant_definitions(node.name, node, overrides[(node.name,)]))
+        elif isinstance(node, ast.ClassDef) and any(
+            path[0] == node.name and len(path) == 2 for path in overrides
+        ):
+            class_body: List[ast.stmt] = []
+            for item in node.body:
+                path = (node.name, getattr(item, "name", None))
+                if isinstance(item, _FUNCTION_TYPES) and path in overrides:
+                    class_body.extend(_variant_definitions(item.name, item, overrides[path]))
+                else:
+                    class_body.append(item)
+            body.append(
+                ast.ClassDef(
+                    name=node.name,
+                    bases=node.bases,
+                    keywords=node.keywords,
+                    body=class_body,
+                    decorator_list=node.decorator_list,
+                )
+            )
+        else:
+            body.append(node)
+
+    module = ast.fix_missing_locations(ast.Module(body=body, type_ignores=[]))
+    digest = hashlib.sha256(
+        "\0".join([golden_code, *(f"{n}:{c}" for n, c in sorted(mutants.items()))]).encode("utf-8")
+    ).hexdigest()
+    return MutantSchema(
+        source=ast.unparse(module) + "\n",
+        variants=(GOLDEN_VARIANT, *changes),
+        digest=digest,
+    )
+
+
+@lru_cache(maxsize=128)
+def _cached_schema(golden_code: str, mutants: Tuple[Tuple[str, str], ...]) -> Optional[MutantSchema]:
+    return compile_mutant_schema(golden_code, dict(mutants))
+
+
+def get_mutant_schema(golden_code: str, mutants: Dict[str, str]) -> Optional[MutantSchema]:
+    """
+    문제의 schema 모듈을 반환합니다 (같은 입력은 프로세스당 한 번만 컴파일).
+
+    Args:
+        golden_code: 정답 구현 코드
+        mutants: {대상 이름: buggy_code}
+
+    Returns:
+        MutantSchema 또는 None
+    """
+    try:
+        return _cached_schema(golden_code, tuple(mutants.items()))
+    except Exception as e:
+        logger.warning(f"Mutant schema 컴파일 실패, 대상별 실행으로 진행: {type(e).__name__}: {e}")
+        return None
+
+
+# 임포트 시점에 실행되는 하위 블록을 가진 복합문 필드
+_COMPOUND_BODY_FIELDS = ("body", "orelse", "finalbody")
+# 실행 환경(변형 선택, schema 모듈 내부, 러너 상태)을 들여다볼 수 있는 모듈
+_INTROSPECTION_MODULES = frozenset({"os", "sys", "importlib", "gc", "inspect", "builtins", "ctypes"})
+# 실행 환경을 들여다보거나 동적으로 코드를 실행할 수 있는 내장 함수
+_INTROSPECTION_NAMES = frozenset({
+    "open", "getattr", "setattr", "delattr", "vars", "globals", "locals",
+    "eval", "exec", "compile", "__import__", "dir",
+})
+# 변형 사이에 target 결과를 보관할 수 있는 캐시 데코레이터 (functools, pytest의 config.cache)
+_CACHE_NAMES = frozenset({"lru_cache", "cache", "cached_property"})
+# 가변 객체를 만드는 생성자
+_MUTABLE_FACTORIES = frozenset({
+    "dict", "list", "set", "bytearray", "defaultdict", "OrderedDict", "Counter", "deque",
+})
+# 가변 객체를 바꾸는 메서드
+_MUTATING_METHODS = frozenset({
+    "append", "appendleft", "extend", "extendleft", "insert", "add", "update", "setdefault",
+    "pop", "popleft", "popitem", "remove", "discard", "clear", "sort", "reverse",
+})
+
+
+def _import_time_nodes(body: List[ast.stmt]):
+    """
+    테스트 모듈을 임포트/수집할 때 실행되는 노드를 순회합니다.
+
+    함수 본문은 테스트 실행 시점에 평가되므로 제외하고,
+    데코레이터/기본값/주석과 클래스 본문, 복합문의 조건식은 포함합니다.
+    """
+    for stmt in body:
+        if isinstance(stmt, _FUNCTION_TYPES):
+            args = stmt.args
+            yield from stmt.decorator_list
+            yield from args.defaults
+            yield from (d for d in args.kw_defaults if d is not None)
+            yield from (
+                a.annotation
+                for a in (*args.posonlyargs, *args.args, *args.kwonlyargs, args.vararg, args.kwarg)
+                if a is not None and a.annotation is not None
+            )
+            if stmt.returns is not None:
+                yield stmt.returns
+        elif isinstance(stmt, ast.ClassDef):
+            yield from stmt.decorator_list
+            yield from stmt.bases
+            yield from stmt.keywords
+            yield from _import_time_nodes(stmt.body)
+        elif isinstance(stmt, (ast.If, ast.While, ast.For, ast.AsyncFor, ast.With, ast.AsyncWith, ast.Try)):
+            for field, value in ast.iter_fields(stmt):
+                if field in _COMPOUND_BODY_FIELDS:
+                    yield from _import_time_nodes(value)
+                elif field == "handlers":
+                    for handler in value:
+                        if handler.type is not None:
+                            yield handler.type
+                        yield from _import_time_nodes(handler.body)
+                elif isinstance(value, ast.AST):
+                    yield value
+                elif isinstance(value, list):
+                    yield from (v for v in value if isinstance(v, ast.AST))
+        else:
+            yield stmt
+
+
+def _is_mutable_value(node: Optional[ast.AST]) -> bool:
+    """가변 객체(리스트/딕셔너리/집합 리터럴, 컴프리헨션, 가변 생성자 호출)를 만드는 식인지 확인합니다."""
+    if isinstance(node, (ast.List, ast.Dict, ast.Set, ast.ListComp, ast.DictComp, ast.SetComp)):
+        return True
+    if isinstance(node, ast.Call):
+        func = node.func
+        name = func.id if isinstance(func, ast.Name) else getattr(func, "attr", None)
+        return name in _MUTABLE_FACTORIES
+    return False
+
+
+def _is_runner_name(name: str) -> bool:
+    """러너/schema 내부 이름(_qa_ 접두사, QA_ARENA 환경 변수/마커)을 포함하는지 확인합니다."""
+    lowered = name.lower()
+    return "_qa_" in lowered or "qa_arena" in lowered
+
+
+def _is_hidden_name(name: str) -> bool:
+    """러너/schema 내부 이름이거나 dunder 이름인지 확인합니다 (__name__ 제외)."""
+    if _is_runner_name(name):
+        return True
+    return name.startswith("__") and name.endswith("__") and name != "__name__"
+
+
+def _has_introspection(tree: ast.AST) -> bool:
+    """실행 환경을 들여다보거나 변형 사이에 값을 캐시할 수 있는 코드가 있는지 확인합니다."""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            if any(alias.name.split(".")[0] in _INTROSPECTION_MODULES for alias in node.names):
+                return True
+        elif isinstance(node, ast.ImportFrom):
+            if (node.module or "").split(".")[0] in _INTROSPECTION_MODULES:
+                return True
+            if any(alias.name in _CACHE_NAMES for alias in node.names):
+                return True
+        elif isinstance(node, ast.Name):
+            if node.id in _INTROSPECTION_NAMES or node.id in _CACHE_NAMES or _is_hidden_name(node.id):
+                return True
+        elif isinstance(node, ast.Attribute):
+            if node.attr in _CACHE_NAMES or _is_hidden_name(node.attr):
+                return True
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+            if _is_runner_name(node.value):
+                return True
+    return False
+
+
+def _mutable_base(node: ast.AST, shared: set) -> bool:
+    """식이 공유 가변 객체(모듈/클래스 수준 이름 또는 self.<클래스 속성>)를 가리키는지 확인합니다."""
+    while isinstance(node, ast.Subscript):
+        node = node.value
+    if isinstance(node, ast.Name):
+        return node.id in shared
+    if isinstance(node, ast.Attribute):
+        return node.attr in shared
+    return False
+
+
+def _has_shared_mutable_state(tree: ast.Module) -> bool:
+    """
+    테스트 사이에 값을 전달할 수 있는 공유 가변 상태가 있는지 확인합니다.
+
+    schema 모드에서는 모듈이 한 번만 임포트되므로, 모듈/클래스 수준의 가변 객체나
+    가변 기본 인자에 저장한 target 결과는 다음 변형의 실행에서도 남아 있습니다.
+    """
+    # 모듈/클래스 수준 가변 객체 이름과 모듈 수준 객체(클래스, 임포트한 모듈 등) 이름
+    shared = set()
+    module_names = {"cls"}
+    scopes = [tree.body]
+    while scopes:
+        for stmt in scopes.pop():
+            if isinstance(stmt, ast.ClassDef):
+                module_names.add(stmt.name)
+                scopes.append(stmt.body)
+            elif isinstance(stmt, _FUNCTION_TYPES):
+                module_names.add(stmt.name)
+            elif isinstance(stmt, (ast.Import, ast.ImportFrom)):
+                module_names.update((a.asname or a.name).split(".")[0] for a in stmt.names)
+            elif isinstance(stmt, (ast.Assign, ast.AnnAssign)):
+                targets = stmt.targets if isinstance(stmt, ast.Assign) else [stmt.target]
+                names = {t.id for t in targets if isinstance(t, ast.Name)}
+                module_names.update(names)
+                if _is_mutable_value(stmt.value):
+                    shared.update(names)
+
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Global, ast.Nonlocal)):
+            return True
+        if isinstance(node, _FUNCTION_TYPES):
+            defaults = [*node.args.defaults, *node.args.kw_defaults]
+            if any(_is_mutable_value(default) for default in defaults):
+                return True
+        elif isinstance(node, (ast.Subscript, ast.Attribute)) and isinstance(node.ctx, (ast.Store, ast.Del)):
+            if _mutable_base(node.value, shared) or (
+                isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name)
+                and node.value.id in module_names
+            ):
+                # 공유 객체의 항목 변경 또는 모듈/클래스 속성 대입 (target.X = ... 포함)
+                return True
+        elif isinstance(node, ast.AugAssign) and _mutable_base(node.target, shared):
+            return True
+        elif (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr in _MUTATING_METHODS
+            and _mutable_base(node.func.value, shared)
+        ):
+            return True
+    return False
+
+
+def is_schema_safe_test_code(test_code: str) -> bool:
+    """
+    사용자 테스트를 schema 모드(한 번 임포트 후 변형별 재실행)로 돌려도 되는지 확인합니다.
+
+    schema 모드는 테스트 모듈을 golden 변형에서 한 번만 임포트하므로,
+    모듈 상수·parametrize 인자·데코레이터처럼 임포트 시점에 target을 호출한 결과는
+    모든 변형에서 golden 값으로 고정됩니다 (예: EXPECTED = add(2, 2)).
+    이런 코드가 있으면 False를 반환해 대상별 실행으로 돌아가게 합니다.
+    판단이 어려운 경우(와일드카드/동적 임포트, 수집 훅, 로컬 함수 호출)도 False입니다.
+
+    테스트 실행 중 target 결과를 변형 사이에 남길 수 있는 코드(lru_cache/cache 데코레이터,
+    모듈/클래스 수준 가변 객체의 변경, 가변 기본 인자)와 변형 선택이나 schema 모듈 내부를
+    들여다볼 수 있는 코드(os/sys/inspect 등의 임포트, getattr/globals/open 등의 내장 함수,
+    dunder 속성, 러너 내부 이름)도 False입니다.
+    """
+    try:
+        tree = ast.parse(test_code)
+    except SyntaxError:
+        return False
+    if _has_introspection(tree) or _has_shared_mutable_state(tree):
+        return False
+
+    target_names = set()
+    local_defs = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and (node.module or "").split(".")[0] == "target":
+            for alias in node.names:
+                if alias.name == "*":
+                    return False
+                target_names.add(alias.asname or alias.name)
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                root = alias.name.split(".")[0]
+                if root == "target":
+                    target_names.add(alias.asname or root)
+        elif isinstance(node, (*_FUNCTION_TYPES, ast.ClassDef)):
+            if node.name.startswith("pytest_"):
+                # 수집 훅은 변형과 무관하게 한 번만 실행됩니다
+                return False
+            local_defs.add(node.name)
+
+    for root in _import_time_nodes(tree.body):
+        for node in ast.walk(root):
+            if isinstance(node, ast.Name) and node.id in target_names:
+                return False
+            if (
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Name)
+                and node.func.id in local_defs
+            ):
+                # 로컬 헬퍼가 내부에서 target을 부를 수 있으므로 보수적으로 제외
+                return False
+    return True
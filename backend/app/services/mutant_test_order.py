@@ -0,0 +1,274 @@
+"""Historical kill-probability test ordering.
+
+문제별로 "어떤 특징을 가진 테스트가 어떤 Mutant를 kill했는지" 통계를 누적하고
+(Problem.test_kill_stats), Mutant 실행 시 그 Mutant를 kill할 가능성이 높은 테스트부터
+실행되도록 순서를 정합니다. Mutant 실행은 --maxfail=1이므로 첫 kill까지의 시간이 줄어듭니다.
+
+테스트 특징:
+    name:<토큰>       테스트 이름의 단어 (test_empty_list -> name:empty, name:list)
+    assert:<형태>     assert 문의 형태 (비교 연산자, not, 함수 호출 등)
+    raises:<예외>     pytest.raises로 기대하는 예외
+    call:<함수>       테스트에서 호출하는 함수 이름
+    literal:<종류>    assert/호출 인자에 쓰인 리터럴 종류 (zero, negative, empty_list, none 등)
+
+test_kill_stats 형식:
+    {"<mutant_id>": {"<특징>": [kill 수, 실행 수], ...}, ...}
+"""
+
+import ast
+import re
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional
+
+from app.core.config import settings
+from app.services.kill_matrix import KILLED, NOT_RUN, cell_state
+from app.services.test_prescreen import collected_test_functions
+
+# 특징별 kill 확률의 사전 분포 (Laplace smoothing: (kills + 1) / (runs + 2))
+PRIOR_KILLS = 1
+PRIOR_RUNS = 2
+
+_NAME_TOKEN = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+")
+_PARAM_SUFFIX = re.compile(r"\[.*\]$")
+
+
+def base_test_name(name: str) -> str:
+    """parametrize 접미사를 제외한 테스트 이름 (예: "test_x[1-2]" -> "test_x")."""
+    return _PARAM_SUFFIX.sub("", name)
+
+
+def _literal_kind(node: ast.AST) -> Optional[str]:
+    """리터럴 노드의 종류."""
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        if isinstance(node.operand, ast.Constant) and isinstance(node.operand.value, (int, float)):
+            return "negative"
+    if isinstance(node, ast.Constant):
+        value = node.value
+        if value is None or isinstance(value, bool):
+            return str(value).lower()
+        if isinstance(value, (int, float)):
+            return "zero" if value == 0 else "number"
+        if isinstance(value, str):
+            return "empty_str" if not value else "str"
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set, ast.Dict)):
+        size = len(node.keys) if isinstance(node, ast.Dict) else len(node.elts)
+        kind = type(node).__name__.lower()
+        return f"empty_{kind}" if not size else kind
+    return None
+
+
+def _call_name(node: ast.Call) -> Optional[str]:
+    """호출되는 함수/메서드 이름."""
+    func = node.func
+    if isinstance(func, ast.Name):
+        return func.id
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    return None
+
+
+def _assert_shape(test: ast.AST) -> str:
+    """assert 조건식의 형태."""
+    if isinstance(test, ast.Compare):
+        return "_".join(type(op).__name__.lower() for op in test.ops)
+    if isinstance(test, ast.UnaryOp) and isinstance(test.op, ast.Not):
+        return "not"
+    if isinstance(test, ast.Call):
+        return "call"
+    return type(test).__name__.lower()
+
+
+def _function_features(name: str, function: ast.AST) -> FrozenSet[str]:
+    """테스트 함수 하나의 특징 집합."""
+    features = set()
+    function_name = name.rsplit("::", 1)[-1]
+    for token in _NAME_TOKEN.findall(function_name):
+        token = token.lower()
+        if token != "test":
+            features.add(f"name:{token}")
+
+    # 데코레이터(parametrize 등)는 제외하고 본문만 검사
+    body_nodes = (node for statement in function.body for node in ast.walk(statement))
+    for node in body_nodes:
+        if isinstance(node, ast.Assert):
+            features.add(f"assert:{_assert_shape(node.test)}")
+            for child in ast.walk(node.test):
+                kind = _literal_kind(child)
+                if kind:
+                    features.add(f"literal:{kind}")
+        elif isinstance(node, ast.Call):
+            called = _call_name(node)
+            if called == "raises" and node.args:
+                expected = node.args[0]
+                expected_name = expected.attr if isinstance(expected, ast.Attribute) else getattr(expected, "id", None)
+                if expected_name:
+                    features.add(f"raises:{expected_name}")
+            elif called and not called.startswith("assert"):
+                features.add(f"call:{called}")
+            for argument in node.args:
+                kind = _literal_kind(argument)
+                if kind:
+                    features.add(f"literal:{kind}")
+    return frozenset(features)
+
+
+@lru_cache(maxsize=256)
+def extract_test_features(test_code: str) -> Dict[str, FrozenSet[str]]:
+    """
+    사용자 테스트 코드의 테스트별 특징을 추출합니다.
+
+    Args:
+        test_code: 사용자가 작성한 테스트 코드
+
+    Returns:
+        {테스트 이름 ("test_x" 또는 "TestX::test_x"): 특징 집합}. 문법 오류이면 빈 딕셔너리
+    """
+    try:
+        tree = ast.parse(test_code)
+    except SyntaxError:
+        return {}
+    return {
+        name: _function_features(name, function)
+        for name, function in collected_test_functions(tree).items()
+    }
+
+
+def kill_probability(features: FrozenSet[str], mutant_stats: Dict[str, List[int]]) -> float:
+    """
+    특징 집합을 가진 테스트가 Mutant를 kill할 확률 추정치.
+
+    특징별 (kills + 1) / (runs + 2) 중 가장 큰 값을 사용하고,
+    기록이 있는 특징이 없으면 사전 확률(0.5)을 반환합니다.
+    """
+    best = PRIOR_KILLS / PRIOR_RUNS
+    seen = False
+    for feature in features:
+        counts = mutant_stats.get(feature)
+        if not counts:
+            continue
+        probability = (counts[0] + PRIOR_KILLS) / (counts[1] + PRIOR_RUNS)
+        best = probability if not seen else max(best, probability)
+        seen = True
+    return best
+
+
+def mutant_test_orders(
+    test_code: str,
+    stats: Optional[Dict[str, Any]],
+    mutant_ids: List[int],
+) -> Dict[int, List[str]]:
+    """
+    Mutant별 테스트 실행 순서를 계산합니다.
+
+    Args:
+        test_code: 사용자가 작성한 테스트 코드
+        stats: Problem.test_kill_stats
+        mutant_ids: Mutant ID 목록
+
+    Returns:
+        {mutant_id: kill 확률이 높은 순서의 테스트 이름 목록}.
+        통계가 없거나 순서가 원래와 같은 Mutant는 포함하지 않습니다.
+    """
+    if not settings.JUDGE_TEST_ORDERING_ENABLED or not stats:
+        return {}
+    features = extract_test_features(test_code)
+    if len(features) < 2:
+        return {}
+
+    names = list(features)
+    orders: Dict[int, List[str]] = {}
+    for mutant_id in mutant_ids:
+        mutant_stats = stats.get(str(mutant_id))
+        if not mutant_stats:
+            continue
+        # 정렬은 안정적이므로 확률이 같으면 원래 순서 유지
+        ordered = sorted(names, key=lambda name: -kill_probability(features[name], mutant_stats))
+        if ordered != names:
+            orders[mutant_id] = ordered
+    return orders
+
+
+def _prune(mutant_stats: Dict[str, List[int]], max_features: int) -> Dict[str, List[int]]:
+    """실행 수가 적은 특징부터 버려 Mutant당 특징 수를 제한합니다."""
+    if len(mutant_stats) <= max_features:
+        return mutant_stats
+    kept = sorted(mutant_stats.items(), key=lambda item: item[1][1], reverse=True)[:max_features]
+    return dict(kept)
+
+
+def count_test_kills(test_code: str, kill_matrix: Dict[str, Any]) -> Dict[str, Dict[str, List[int]]]:
+    """
+    제출 하나의 kill 행렬을 특징별 (kill 수, 실행 수)로 집계합니다.
+
+    Args:
+        test_code: 사용자가 작성한 테스트 코드
+        kill_matrix: build_kill_matrix 결과
+
+    Returns:
+        {str(mutant_id): {특징: [kill 수, 실행 수]}}
+    """
+    counts: Dict[str, Dict[str, List[int]]] = {}
+    features = extract_test_features(test_code)
+    test_names = kill_matrix["test_names"]
+    mutant_ids = kill_matrix["mutant_ids"]
+    width = len(mutant_ids)
+
+    for row, name in enumerate(test_names):
+        test_feature_set = features.get(base_test_name(name))
+        if not test_feature_set:
+            continue
+        for column, mutant_id in enumerate(mutant_ids):
+            state = cell_state(kill_matrix["killed"], kill_matrix["executed"], row * width + column)
+            if state == NOT_RUN:
+                continue
+            mutant_counts = counts.setdefault(str(mutant_id), {})
+            for feature in test_feature_set:
+                kills, runs = mutant_counts.get(feature, (0, 0))
+                mutant_counts[feature] = [kills + (state == KILLED), runs + 1]
+    return counts
+
+
+def merge_test_kills(
+    stats: Optional[Dict[str, Any]],
+    counts: Dict[str, Dict[str, List[int]]],
+) -> Dict[str, Any]:
+    """
+    집계된 kill 수를 문제의 특징별 kill 통계에 더합니다.
+
+    JSONB 컬럼 변경이 감지되도록 항상 새 딕셔너리를 반환합니다.
+
+    Args:
+        stats: 기존 Problem.test_kill_stats (없으면 None)
+        counts: count_test_kills 결과 (여러 제출을 합친 것도 가능)
+
+    Returns:
+        갱신된 test_kill_stats
+    """
+    updated: Dict[str, Any] = {key: dict(value) for key, value in (stats or {}).items()}
+    for mutant_key, mutant_counts in counts.items():
+        mutant_stats = updated.setdefault(mutant_key, {})
+        for feature, (kills, runs) in mutant_counts.items():
+            total_kills, total_runs = mutant_stats.get(feature, (0, 0))
+            mutant_stats[feature] = [total_kills + kills, total_runs + runs]
+
+    max_features = settings.JUDGE_TEST_KILL_STATS_MAX_FEATURES
+    return {key: _prune(value, max_features) for key, value in updated.items()}
+
+
+def record_test_kills(
+    stats: Optional[Dict[str, Any]],
+    test_code: str,
+    kill_matrix: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    제출의 kill 행렬을 문제의 특징별 kill 통계에 더합니다.
+
+    Args:
+        stats: 기존 Problem.test_kill_stats (없으면 None)
+        test_code: 사용자가 작성한 테스트 코드
+        kill_matrix: build_kill_matrix 결과
+
+    Returns:
+        갱신된 test_kill_stats
+    """
+    return merge_test_kills(stats, count_test_kills(test_code, kill_matrix))
@@ -0,0 +1,190 @@
+"""Content-addressed judge target bundles.
+
+채점 대상 코드(Golden Code, Mutant)마다 target.py, 미리 컴파일한 target.pyc,
+conftest.py, qa_arena_reporter.py를 담은 디렉토리를 내용 해시 경로에 저장합니다.
+judge 컨테이너는 번들을 대상 디렉토리(targets/<별칭>/)에 읽기 전용으로 마운트하고 실행마다
+test_user.py만 전달받으므로, 실행마다 대상 파일을 쓰고 다시 컴파일하지 않습니다.
+
+번들 레이아웃 (<JUDGE_BUNDLE_DIR>/<digest>/):
+    target.py
+    __pycache__/target.<cache tag>.pyc   # unchecked-hash pyc (내용 주소이므로 검증 불필요)
+    conftest.py, qa_arena_reporter.py
+    run/                                 # 실행별 test_user.py 디렉토리 마운트 위치
+
+digest는 대상 코드, 채점 런타임 파일, 컴파일한 인터프리터의 cache tag로 계산하므로
+conftest.py가 바뀌면 새 번들이 만들어집니다. pyc는 judge 이미지와 같은 Python 버전에서
+만들어야 사용되며, 버전이 다르면 인터프리터가 무시하고 소스를 컴파일합니다.
+
+conftest.py와 리포터는 pytest가 assertion rewrite로 다시 컴파일하므로 pyc를 만들지 않습니다.
+
+digest가 내용 주소이므로 문제/Mutant가 수정·삭제되거나 런타임 파일이 바뀌면 이전 번들은
+더 이상 사용되지 않습니다. collect_bundle_garbage가 유지보수 태스크에서 이런 번들과
+중단된 작성의 임시 디렉토리를 정리합니다.
+"""
+
+import hashlib
+import importlib.util
+import logging
+import py_compile
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+
+from app.core.config import settings
+from app.services.judge_backend import read_support_files
+
+logger = logging.getLogger(__name__)
+
+# 번들 레이아웃 버전 (레이아웃이 바뀌면 증가)
+BUNDLE_FORMAT = 1
+# 실행별 test_user.py 디렉토리를 마운트하는 번들 내 디렉토리
+RUN_DIR_NAME = "run"
+# 작성 중인 번들 임시 디렉토리 접두사
+BUILD_DIR_PREFIX = ".build-"
+# 번들 디렉토리 이름 길이 (sha256 hex digest)
+DIGEST_LENGTH = 64
+
+
+def bundle_digest(target_code: str) -> str:
+    """대상 코드의 번들 digest (내용 주소)."""
+    hasher = hashlib.sha256()
+    hasher.update(f"format:{BUNDLE_FORMAT}\0tag:{sys.implementation.cache_tag}\0".encode())
+    for name, content in sorted(read_support_files().items()):
+        hasher.update(f"{name}\0{content}\0".encode("utf-8"))
+    hasher.update(target_code.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def bundle_path(target_code: str) -> Path:
+    """대상 코드의 번들 디렉토리 경로 (존재 여부와 무관)."""
+    return Path(settings.JUDGE_BUNDLE_DIR) / bundle_digest(target_code)
+
+
+def build_target_bundle(target_code: str) -> Path:
+    """
+    대상 코드의 번들을 만듭니다. 이미 있으면 그대로 반환합니다.
+
+    임시 디렉토리에 작성한 뒤 rename으로 교체하므로, 동시에 여러 프로세스가 만들어도
+    완성되지 않은 번들이 마운트되지 않습니다.
+
+    Args:
+        target_code: 대상 코드 (Golden Code 또는 Mutant 코드)
+
+    Returns:
+        번들 디렉토리 경로
+
+    Raises:
+        OSError: 번들 디렉토리를 작성할 수 없는 경우
+    """
+    path = bundle_path(target_code)
+    if path.is_dir():
+        return path
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    build_dir = Path(tempfile.mkdtemp(prefix=BUILD_DIR_PREFIX, dir=path.parent))
+    try:
+        source = build_dir / "target.py"
+        source.write_text(target_code, encoding="utf-8")
+        try:
+            py_compile.compile(
+                str(source),
+                cfile=importlib.util.cache_from_source(str(source)),
+                doraise=True,
+                invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+            )
+        except py_compile.PyCompileError:
+            # 문법 오류가 있는 대상은 실행 시 원래와 같은 오류가 나도록 소스만 둠
+            pass
+        for name, content in read_support_files().items():
+            (build_dir / name).write_text(content, encoding="utf-8")
+        (build_dir / RUN_DIR_NAME).mkdir()
+        try:
+            build_dir.rename(path)
+        except OSError:
+            # 다른 프로세스가 먼저 만든 경우
+            if not path.is_dir():
+                raise
+    finally:
+        if build_dir.exists():
+            shutil.rmtree(build_dir, ignore_errors=True)
+    return path
+
+
+def get_target_bundle(target_code: str) -> Optional[Path]:
+    """
+    채점에 사용할 대상 코드의 번들을 반환합니다 (없으면 만듦).
+
+    Returns:
+        번들 디렉토리 경로. 비활성화되었거나 만들 수 없으면 None (실행마다 파일 전달)
+    """
+    if not settings.JUDGE_BUNDLE_ENABLED:
+        return None
+    try:
+        return build_target_bundle(target_code)
+    except OSError as e:
+        logger.warning(f"대상 번들 생성 실패 (파일 전달로 실행): {type(e).__name__}: {str(e)}")
+        return None
+
+
+def build_problem_bundles(golden_code: str, mutant_codes: Iterable[str] = ()) -> int:
+    """
+    문제의 Golden Code와 Mutant 번들을 미리 만듭니다 (문제 생성/수정 시).
+
+    실패해도 채점 시 필요한 번들을 다시 만들므로 예외를 전달하지 않습니다.
+
+    Args:
+        golden_code: 정답 구현 코드
+        mutant_codes: Mutant 코드 목록
+
+    Returns:
+        준비된 번들 수
+    """
+    if not settings.JUDGE_BUNDLE_ENABLED:
+        return 0
+    built = 0
+    for target_code in (golden_code, *mutant_codes):
+        try:
+            build_target_bundle(target_code)
+            built += 1
+        except OSError as e:
+            logger.warning(f"문제 번들 생성 실패: {type(e).__name__}: {str(e)}")
+    return built
+
+
+def collect_bundle_garbage(live_target_codes: Iterable[str], grace_seconds: float) -> int:
+    """
+    사용되지 않는 번들과 중단된 작성의 임시 디렉토리를 삭제합니다.
+
+    현재 대상 코드의 digest가 아닌 번들과 .build-* 디렉토리 중
+    grace_seconds보다 오래된 것만 지우므로, 방금 만들어졌거나 실행 중인 컨테이너가
+    마운트하고 있을 수 있는 번들은 남겨둡니다.
+
+    Args:
+        live_target_codes: 현재 채점에 쓰이는 대상 코드 (모든 Golden Code와 Mutant 코드)
+        grace_seconds: 삭제 대상이 되기 위한 최소 경과 시간 (초, 디렉토리 mtime 기준)
+
+    Returns:
+        삭제한 디렉토리 수
+    """
+    root = Path(settings.JUDGE_BUNDLE_DIR)
+    if not root.is_dir():
+        return 0
+    live = {bundle_digest(target_code) for target_code in live_target_codes}
+    cutoff = time.time() - grace_seconds
+    removed = 0
+    for entry in root.iterdir():
+        name = entry.name
+        is_bundle = len(name) == DIGEST_LENGTH and name not in live
+        if not (is_bundle or name.startswith(BUILD_DIR_PREFIX)) or not entry.is_dir():
+            continue
+        try:
+            if entry.stat().st_mtime > cutoff:
+                continue
+            shutil.rmtree(entry)
+            removed += 1
+        except OSError as e:
+            logger.warning(f"번들 정리 실패: {name}: {type(e).__name__}: {str(e)}")
+    return removed
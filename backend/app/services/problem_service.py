@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 from app.repositories.problem_repository import ProblemRepository
 from app.models.problem import Problem
 from app.schemas.problem import ProblemListResponse, ProblemDetailResponse, ProblemCreate
+from app.services.problem_bundle import build_problem_bundles
 
 
 class ProblemService:
@@ -19,8 +20,13 @@ class ProblemService:
     def create_problem(self, problem_in: ProblemCreate) -> ProblemDetailResponse:
         """
         Create a new problem and return its detail.
+
+        채점 대상 번들(JUDGE_BUNDLE_ENABLED)은 저장 후 이미 연결된 Mutant까지 함께 만듭니다.
         """
         problem = self.repository.create(problem_in)
+        build_problem_bundles(
+            problem.golden_code, [b.buggy_code for b in problem.buggy_implementations]
+        )
 
         return ProblemDetailResponse(
             id=problem.id,
@@ -0,0 +1,173 @@
+"""Redis accumulator for per-problem judge statistics.
+
+Golden 실행 시간(Problem.runtime_profile)과 테스트 특징별 kill 통계(Problem.test_kill_stats)는
+제출마다 바뀌지만, 제출마다 problems 행의 JSONB를 읽고-수정하고-쓰면 인기 문제에서
+동시 채점끼리 갱신을 덮어쓰고 행 잠금 경합이 생깁니다.
+
+채점 워커는 Redis에 표본과 카운터만 원자적으로 추가하고(RPUSH / HINCRBY),
+유지보수 큐의 주기 태스크(flush_problem_stats)가 문제별로 모아 행 잠금 아래 한 번에 반영합니다.
+
+키 형식:
+    problem_stats:dirty             (set: 반영할 데이터가 있는 문제 ID)
+    problem_stats:runtime:<id>      (list: Golden 실행 시간, 초)
+    problem_stats:kills:<id>        (hash: "<mutant_id>\\x1f<특징>\\x1fk" -> kill 수,
+                                           "<mutant_id>\\x1f<특징>\\x1fr" -> 실행 수)
+"""
+
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import redis
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.repositories.problem_repository import ProblemRepository
+from app.services.judge_cache import get_judge_cache_redis_url
+from app.services.mutant_test_order import merge_test_kills
+from app.services.runtime_profile import merge_golden_runtimes
+
+logger = logging.getLogger(__name__)
+
+# kill 통계 hash 필드 구분자 (특징 문자열에 나오지 않는 제어 문자)
+FIELD_SEP = "\x1f"
+KILLS_SUFFIX = "k"
+RUNS_SUFFIX = "r"
+
+# 데이터를 꺼내면서 지우는 스크립트 (꺼낸 뒤 들어온 표본이 함께 지워지지 않도록 원자적으로 실행)
+# KEYS: [runtime 키, kills 키]
+# 반환: [runtime 표본 목록, kills hash 평탄화 목록]
+DRAIN_SCRIPT = """
+local samples = redis.call('LRANGE', KEYS[1], 0, -1)
+local kills = redis.call('HGETALL', KEYS[2])
+redis.call('DEL', KEYS[1], KEYS[2])
+return {samples, kills}
+"""
+
+
+class ProblemStatsAccumulator:
+    """문제별 채점 통계를 Redis에 누적하고 DB에 일괄 반영합니다."""
+
+    KEY_PREFIX = "problem_stats:"
+
+    def __init__(self, redis_url: str):
+        """
+        ProblemStatsAccumulator 초기화.
+
+        Args:
+            redis_url: 통계를 누적할 Redis URL
+        """
+        self.redis_client = redis.from_url(redis_url)
+        self._drain = self.redis_client.register_script(DRAIN_SCRIPT)
+
+    @property
+    def dirty_key(self) -> str:
+        return f"{self.KEY_PREFIX}dirty"
+
+    def runtime_key(self, problem_id: int) -> str:
+        return f"{self.KEY_PREFIX}runtime:{problem_id}"
+
+    def kills_key(self, problem_id: int) -> str:
+        return f"{self.KEY_PREFIX}kills:{problem_id}"
+
+    def add_golden_runtime(self, problem_id: int, execution_time: float) -> None:
+        """통과한 Golden 실행 시간 표본을 추가합니다 (반영 전 최근 window 개만 유지)."""
+        key = self.runtime_key(problem_id)
+        pipe = self.redis_client.pipeline()
+        pipe.rpush(key, round(execution_time, 3))
+        pipe.ltrim(key, -max(1, settings.JUDGE_ADAPTIVE_TIMEOUT_WINDOW), -1)
+        pipe.sadd(self.dirty_key, problem_id)
+        pipe.execute()
+
+    def add_test_kills(self, problem_id: int, counts: Dict[str, Dict[str, List[int]]]) -> None:
+        """
+        제출 하나의 특징별 kill 수를 더합니다.
+
+        Args:
+            problem_id: 문제 ID
+            counts: mutant_test_order.count_test_kills 결과
+        """
+        if not counts:
+            return
+        key = self.kills_key(problem_id)
+        pipe = self.redis_client.pipeline()
+        for mutant_key, mutant_counts in counts.items():
+            for feature, (kills, runs) in mutant_counts.items():
+                field = f"{mutant_key}{FIELD_SEP}{feature}{FIELD_SEP}"
+                if kills:
+                    pipe.hincrby(key, field + KILLS_SUFFIX, kills)
+                pipe.hincrby(key, field + RUNS_SUFFIX, runs)
+        pipe.sadd(self.dirty_key, problem_id)
+        pipe.execute()
+
+    def _drain_problem(
+        self, problem_id: int
+    ) -> Tuple[List[float], Dict[str, Dict[str, List[int]]]]:
+        """문제의 누적 데이터를 꺼내고 지웁니다."""
+        raw_samples, raw_kills = self._drain(
+            keys=[self.runtime_key(problem_id), self.kills_key(problem_id)]
+        )
+        samples = [float(value) for value in raw_samples]
+        counts: Dict[str, Dict[str, List[int]]] = {}
+        for field, value in zip(raw_kills[0::2], raw_kills[1::2]):
+            field = field.decode() if isinstance(field, bytes) else field
+            mutant_key, feature, suffix = field.split(FIELD_SEP)
+            entry = counts.setdefault(mutant_key, {}).setdefault(feature, [0, 0])
+            entry[0 if suffix == KILLS_SUFFIX else 1] += int(value)
+        return samples, counts
+
+    def flush(self, db: Session, max_problems: Optional[int] = None) -> int:
+        """
+        누적된 통계를 문제 행에 반영합니다.
+
+        문제마다 행을 잠그고(SELECT ... FOR UPDATE) 한 번만 쓰므로
+        동시에 실행된 flush끼리도 갱신을 덮어쓰지 않습니다.
+        반영에 실패한 데이터는 버립니다 (통계는 채점 결과에 영향을 주지 않음).
+
+        Args:
+            db: DB 세션
+            max_problems: 한 번에 반영할 최대 문제 수 (None이면 PROBLEM_STATS_FLUSH_BATCH_SIZE)
+
+        Returns:
+            반영한 문제 수
+        """
+        count = max_problems if max_problems is not None else settings.PROBLEM_STATS_FLUSH_BATCH_SIZE
+        problem_ids = self.redis_client.spop(self.dirty_key, count) or []
+        repo = ProblemRepository(db)
+        flushed = 0
+        for raw_id in problem_ids:
+            problem_id = int(raw_id)
+            samples, counts = self._drain_problem(problem_id)
+            if not samples and not counts:
+                continue
+            try:
+                problem = repo.get_by_id_for_update(problem_id)
+                if problem is None:
+                    db.rollback()
+                    continue
+                if samples:
+                    problem.runtime_profile = merge_golden_runtimes(problem.runtime_profile, samples)
+                if counts:
+                    problem.test_kill_stats = merge_test_kills(problem.test_kill_stats, counts)
+                db.commit()
+                flushed += 1
+            except Exception as e:
+                db.rollback()
+                logger.warning(
+                    f"[PROBLEM_STATS_FLUSH_ERROR] problem_id={problem_id} "
+                    f"error={type(e).__name__}: {str(e)}"
+                )
+        return flushed
+
+
+_accumulator: Optional[ProblemStatsAccumulator] = None
+_accumulator_lock = threading.Lock()
+
+
+def get_problem_stats_accumulator() -> ProblemStatsAccumulator:
+    """프로세스 전역 통계 누적기를 반환합니다 (최초 호출 시 생성)."""
+    global _accumulator
+    with _accumulator_lock:
+        if _accumulator is None:
+            _accumulator = ProblemStatsAccumulator(redis_url=get_judge_cache_redis_url())
+        return _accumulator
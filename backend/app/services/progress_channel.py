@@ -0,0 +1,176 @@
+"""Redis-backed submission progress channel.
+
+채점 중 진행률(Submission.progress)은 단계/Mutant마다 바뀌지만 채점이 끝나면 필요 없으므로,
+매번 Postgres에 커밋하는 대신 제출별 Redis hash에 TTL과 함께 기록합니다.
+API는 PENDING/RUNNING 제출의 진행률을 여기서 읽고, RUNNING 전환과 최종 상태처럼
+지속되어야 하는 변경만 Postgres에 저장합니다.
+
+진행률과 최종 상태는 제출별 pub/sub 채널에도 이벤트로 발행되어
+SSE 엔드포인트(GET /submissions/{id}/events)가 폴링 없이 클라이언트에 전달합니다.
+
+키 형식:
+    submission_progress:<submission id>  (hash: progress=JSON, updated_at=epoch 초)
+    submission_events:<submission id>    (pub/sub 채널)
+
+이벤트 형식 (JSON):
+    {"type": "progress", "progress": {...}}
+    {"type": "final", "status": "SUCCESS" | "FAILURE" | "ERROR"}
+    {"type": "feedback"}  (회원 제출의 AI 피드백 저장 완료, 피드백 큐 태스크가 발행)
+"""
+
+import json
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+from uuid import UUID
+
+import redis
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+from app.services.judge_cache import get_judge_cache_redis_url
+
+logger = logging.getLogger(__name__)
+
+
+class SubmissionProgressChannel:
+    """제출별 진행률을 Redis에 기록하고 조회합니다."""
+
+    REDIS_KEY_PREFIX = "submission_progress:"
+    EVENT_CHANNEL_PREFIX = "submission_events:"
+
+    def __init__(self, redis_url: str, ttl_seconds: int):
+        """
+        SubmissionProgressChannel 초기화.
+
+        Args:
+            redis_url: 진행률을 저장할 Redis URL
+            ttl_seconds: 진행률 키 TTL (초). 워커가 비정상 종료해도 이 시간 후 정리
+        """
+        self.redis_client = redis.from_url(redis_url)
+        self.ttl_seconds = ttl_seconds
+
+    def _key(self, submission_id: UUID) -> str:
+        return f"{self.REDIS_KEY_PREFIX}{submission_id}"
+
+    @classmethod
+    def event_channel(cls, submission_id: UUID) -> str:
+        """제출 이벤트 pub/sub 채널 이름."""
+        return f"{cls.EVENT_CHANNEL_PREFIX}{submission_id}"
+
+    def publish(self, submission_id: UUID, progress: Dict[str, Any]) -> bool:
+        """
+        진행률을 기록하고 progress 이벤트를 발행합니다.
+
+        Returns:
+            기록 성공 여부 (실패 시 호출 측에서 DB에 저장)
+        """
+        key = self._key(submission_id)
+        try:
+            pipe = self.redis_client.pipeline()
+            pipe.hset(
+                key,
+                mapping={
+                    "progress": json.dumps(progress, ensure_ascii=False),
+                    "updated_at": time.time(),
+                },
+            )
+            pipe.expire(key, self.ttl_seconds)
+            pipe.publish(
+                self.event_channel(submission_id),
+                json.dumps({"type": "progress", "progress": progress}, ensure_ascii=False),
+            )
+            pipe.execute()
+            return True
+        except (redis.RedisError, TypeError, ValueError) as e:
+            logger.warning(
+                f"진행률 기록 실패 (DB에 저장): submission_id={submission_id}, "
+                f"{type(e).__name__}: {str(e)}"
+            )
+            return False
+
+    def get(self, submission_id: UUID) -> Optional[Dict[str, Any]]:
+        """
+        기록된 진행률을 조회합니다.
+
+        Returns:
+            진행률 딕셔너리. 없거나 Redis 오류 시 None
+        """
+        try:
+            raw = self.redis_client.hget(self._key(submission_id), "progress")
+        except redis.RedisError as e:
+            logger.warning(f"진행률 조회 실패: submission_id={submission_id}, {type(e).__name__}: {str(e)}")
+            return None
+        if raw is None:
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
+
+    def finish(self, submission_id: UUID, status: str) -> None:
+        """
+        채점이 끝난 제출의 진행률을 삭제하고 final 이벤트를 발행합니다.
+
+        최종 상태가 DB에 저장된 뒤 호출해야 구독자가 최종 결과를 읽을 수 있습니다.
+        """
+        try:
+            pipe = self.redis_client.pipeline()
+            pipe.delete(self._key(submission_id))
+            pipe.publish(
+                self.event_channel(submission_id),
+                json.dumps({"type": "final", "status": status}),
+            )
+            pipe.execute()
+        except redis.RedisError as e:
+            # 진행률은 TTL 만료 시 정리되고, SSE 구독자는 주기적으로 DB 상태를 확인함
+            logger.warning(
+                f"최종 상태 이벤트 발행 실패: submission_id={submission_id}, "
+                f"{type(e).__name__}: {str(e)}"
+            )
+
+    def feedback_ready(self, submission_id: UUID) -> None:
+        """AI 피드백이 DB에 저장된 제출의 feedback 이벤트를 발행합니다."""
+        try:
+            self.redis_client.publish(self.event_channel(submission_id), json.dumps({"type": "feedback"}))
+        except redis.RedisError as e:
+            logger.warning(
+                f"피드백 이벤트 발행 실패: submission_id={submission_id}, "
+                f"{type(e).__name__}: {str(e)}"
+            )
+
+
+_channel: Optional[SubmissionProgressChannel] = None
+_channel_lock = threading.Lock()
+
+
+def get_progress_channel() -> SubmissionProgressChannel:
+    """프로세스 전역 진행률 채널을 반환합니다 (최초 호출 시 생성)."""
+    global _channel
+    with _channel_lock:
+        if _channel is None:
+            _channel = SubmissionProgressChannel(
+                redis_url=get_judge_cache_redis_url(),
+                ttl_seconds=settings.SUBMISSION_PROGRESS_TTL_SECONDS,
+            )
+        return _channel
+
+
+@asynccontextmanager
+async def subscribe_submission_events(submission_id: UUID) -> AsyncIterator[aioredis.client.PubSub]:
+    """
+    제출 이벤트 채널을 구독하는 비동기 컨텍스트 (SSE 엔드포인트용).
+
+    Yields:
+        구독된 PubSub. get_message()로 이벤트를 받습니다
+    """
+    client = aioredis.from_url(get_judge_cache_redis_url())
+    pubsub = client.pubsub()
+    try:
+        await pubsub.subscribe(SubmissionProgressChannel.event_channel(submission_id))
+        yield pubsub
+    finally:
+        await pubsub.reset()
+        await client.close()
@@ -0,0 +1,139 @@
+"""Golden runtime profile and adaptive per-problem judge timeouts.
+
+문제별로 통과한 Golden 실행 시간을 기록하고(Problem.runtime_profile),
+그 분포에서 Mutant 실행에 사용할 타임아웃을 계산합니다.
+무한 루프 Mutant가 기본 타임아웃(DEFAULT_TIMEOUT) 전체를 쓰지 않도록
+Golden이 빠르게 끝나는 문제일수록 타임아웃을 짧게 잡습니다.
+
+runtime_profile 형식:
+    {"samples": [최근 Golden 실행 시간(초), ...], "timeout": 계산된 타임아웃(초) | None}
+"""
+
+import math
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.services.docker_service import DEFAULT_TIMEOUT
+
+# 타임아웃 계산에 사용하는 Golden 실행 시간 분위수
+TIMEOUT_PERCENTILE = 0.99
+# Mutant 타임아웃 버킷의 가장 작은 값 (초). 버킷은 이 값의 2^k배와 1.5×2^k배
+TIMEOUT_BUCKET_BASE = 0.5
+
+
+def _round_up(seconds: float) -> float:
+    """0.1초 단위로 올림합니다 (캐시 키가 작은 변동에 흔들리지 않도록)."""
+    return math.ceil(round(seconds * 10, 6)) / 10
+
+
+def _bucket_up(seconds: float) -> float:
+    """
+    0.5, 0.75, 1, 1.5, 2, 3, 4, 6, ... 초 버킷 중 seconds 이상인 가장 작은 값으로 올림합니다.
+
+    타임아웃은 실행 결과 캐시 키에 포함되므로, 표본이 바뀔 때마다 값이 달라지면
+    같은 (Mutant, 테스트) 실행이 캐시를 공유하지 못합니다.
+    """
+    bucket = TIMEOUT_BUCKET_BASE
+    while True:
+        for step in (bucket, bucket * 1.5):
+            if step >= seconds:
+                return step
+        bucket *= 2
+
+
+def _percentile(samples: List[float], ratio: float) -> float:
+    """nearest-rank 방식 분위수."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(ratio * len(ordered)))
+    return ordered[rank - 1]
+
+
+def derive_timeout(samples: List[float]) -> Optional[float]:
+    """
+    Golden 실행 시간 표본에서 문제별 타임아웃을 계산합니다.
+
+    p99 × JUDGE_ADAPTIVE_TIMEOUT_MULTIPLIER를 JUDGE_ADAPTIVE_TIMEOUT_FLOOR 이상,
+    DEFAULT_TIMEOUT 이하로 제한합니다.
+
+    Args:
+        samples: Golden 실행 시간 목록 (초)
+
+    Returns:
+        타임아웃 (초). 표본이 JUDGE_ADAPTIVE_TIMEOUT_MIN_SAMPLES 미만이면 None
+    """
+    if len(samples) < settings.JUDGE_ADAPTIVE_TIMEOUT_MIN_SAMPLES:
+        return None
+    timeout = _percentile(samples, TIMEOUT_PERCENTILE) * settings.JUDGE_ADAPTIVE_TIMEOUT_MULTIPLIER
+    timeout = max(timeout, settings.JUDGE_ADAPTIVE_TIMEOUT_FLOOR)
+    return min(_round_up(timeout), float(DEFAULT_TIMEOUT))
+
+
+def record_golden_runtime(
+    profile: Optional[Dict[str, Any]],
+    execution_time: float,
+) -> Dict[str, Any]:
+    """
+    통과한 Golden 실행 시간을 프로파일에 추가합니다.
+
+    Args:
+        profile: 기존 Problem.runtime_profile (없으면 None)
+        execution_time: Golden 실행 시간 (초)
+
+    Returns:
+        갱신된 runtime_profile
+    """
+    return merge_golden_runtimes(profile, [execution_time])
+
+
+def merge_golden_runtimes(
+    profile: Optional[Dict[str, Any]],
+    execution_times: List[float],
+) -> Dict[str, Any]:
+    """
+    통과한 Golden 실행 시간들을 프로파일에 추가합니다 (problem_stats의 일괄 반영용).
+
+    최근 JUDGE_ADAPTIVE_TIMEOUT_WINDOW 개의 표본만 유지하며,
+    JSONB 컬럼 변경이 감지되도록 항상 새 딕셔너리를 반환합니다.
+
+    Args:
+        profile: 기존 Problem.runtime_profile (없으면 None)
+        execution_times: 기록 순서대로의 Golden 실행 시간 목록 (초)
+
+    Returns:
+        갱신된 runtime_profile
+    """
+    samples = list((profile or {}).get("samples", []))
+    samples.extend(round(execution_time, 3) for execution_time in execution_times)
+    samples = samples[-max(1, settings.JUDGE_ADAPTIVE_TIMEOUT_WINDOW):]
+    return {"samples": samples, "timeout": derive_timeout(samples)}
+
+
+def mutant_timeout(
+    profile: Optional[Dict[str, Any]],
+    golden_execution_time: float,
+) -> Optional[float]:
+    """
+    이번 제출의 Mutant 실행에 사용할 타임아웃을 계산합니다.
+
+    문제별 타임아웃과 이번 Golden 실행 시간 × 배수 중 큰 값을 사용하므로
+    사용자 테스트가 평소보다 느린 제출도 정상 Mutant 실행이 잘리지 않습니다.
+
+    Args:
+        profile: Problem.runtime_profile
+        golden_execution_time: 이번 제출의 Golden 실행 시간 (초)
+
+    Returns:
+        타임아웃 (초, 캐시 키가 공유되도록 버킷 단위로 올림).
+        비활성화되었거나 프로파일이 부족하면 None (기본 타임아웃 사용)
+    """
+    if not settings.JUDGE_ADAPTIVE_TIMEOUT_ENABLED:
+        return None
+    problem_timeout = (profile or {}).get("timeout")
+    if problem_timeout is None:
+        return None
+    timeout = max(
+        float(problem_timeout),
+        golden_execution_time * settings.JUDGE_ADAPTIVE_TIMEOUT_MULTIPLIER,
+    )
+    timeout = _bucket_up(timeout)
+    return timeout if timeout < DEFAULT_TIMEOUT else None
@@ -0,0 +1,350 @@
+"""Process-based judge backend using an nsjail sandbox.
+
+Docker 데몬을 거치지 않고 nsjail로 격리한 로컬 프로세스에서 pytest를 실행합니다.
+- 파일 시스템: 빈 루트(tmpfs)에 시스템 라이브러리와 인터프리터 경로, 작업 디렉토리만 읽기 전용으로 마운트
+  (/tmp만 쓰기 가능한 tmpfs)
+- 네임스페이스: user/mount/pid/net/ipc/uts/cgroup 격리 (네트워크 없음, jail 밖 프로세스 보이지 않음)
+- 권한: jail 내부 root(러너)와 대상 실행 uid를 호스트의 비특권 uid 범위로 매핑.
+  러너는 대상마다 권한을 낮춘 uid로 사용자 테스트를 실행합니다 (Docker 백엔드와 동일)
+- seccomp: ptrace, mount, 커널 모듈 등 사용자 테스트에 필요 없는 시스템 호출 거부
+- 리소스 제한: cgroup v2 메모리/CPU/프로세스 수 (Docker 백엔드의 mem_limit, 50% CPU quota와 동일)
+  및 rlimit (CPU 시간, 파일 크기, core dump)
+- 위험 모듈 임포트 차단: judge/conftest.py (Docker 백엔드와 동일)
+
+uid 매핑과 cgroup 제한을 위해 워커는 root로 nsjail을 실행해야 합니다.
+"""
+
+import json
+import logging
+import math
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import IO, Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.services.container_reaper import TEMP_DIR_PREFIX
+from app.services.docker_service import DEFAULT_TIMEOUT, WORKDIR
+from app.services.judge_backend import (
+    SINGLE_TARGET_NAME,
+    BoundedOutput,
+    JudgeBackend,
+    MultiTargetRun,
+    cancellable,
+    write_workdir,
+)
+from app.services.mutant_schema import MutantSchema
+
+logger = logging.getLogger(__name__)
+
+# Docker 백엔드의 mem_limit="128m"과 동일한 메모리 제한
+MEMORY_LIMIT_BYTES = 128 * 1024 * 1024
+# Docker 백엔드의 cpu_quota/cpu_period (50%)와 동일한 CPU 제한 (초당 CPU 밀리초)
+CPU_MS_PER_SEC = 500
+# jail 내부 최대 프로세스 수 (러너, zygote, 대상 실행 프로세스와 사용자 테스트의 자식 프로세스)
+PIDS_LIMIT = 64
+# 작업 디렉토리에 쓸 수 있는 최대 파일 크기 (MB, nsjail rlimit 단위)
+FILE_SIZE_LIMIT_MB = 1
+# 프로세스당 최대 파일 디스크립터 수
+OPEN_FILES_LIMIT = 256
+# 매핑할 대상 실행 uid 수 (JUDGE_RUN_UID_BASE부터, 배치 채점의 최대 대상 수보다 커야 함)
+RUN_UID_SPAN = 4096
+# 인터프리터와 함께 읽기 전용으로 마운트할 시스템 디렉토리
+SYSTEM_MOUNTS = ("/usr", "/lib", "/lib64", "/bin", "/etc/ld.so.cache", "/etc/localtime")
+# 쓰기 가능으로 마운트할 장치 파일 (러너가 대상 실행 프로세스의 표준 입출력을 /dev/null로 교체)
+DEVICE_MOUNTS = ("/dev/null", "/dev/urandom")
+# 사용자 테스트에 필요 없는 시스템 호출 거부 목록 (Kafel 정책, EPERM 반환)
+SECCOMP_POLICY = (
+    "ERRNO(1) {"
+    " ptrace, process_vm_readv, process_vm_writev,"
+    " mount, umount2, pivot_root, chroot, unshare, setns,"
+    " init_module, finit_module, delete_module, kexec_load,"
+    " bpf, perf_event_open, userfaultfd, keyctl, add_key, request_key,"
+    " open_by_handle_at, acct, swapon, swapoff, reboot, iopl, ioperm"
+    " } DEFAULT ALLOW"
+)
+# 인터프리터의 설치 경로와 모듈 검색 경로를 조회하는 스크립트
+INTERPRETER_PATHS_SCRIPT = (
+    "import json, os, sys; "
+    "print(json.dumps([os.path.realpath(sys.executable), sys.prefix, sys.base_prefix, "
+    "sys.exec_prefix, *[p for p in sys.path if p]]))"
+)
+
+
+class SandboxService(JudgeBackend):
+    """nsjail 기반 로컬 sandbox에서 pytest를 실행하는 백엔드."""
+
+    name = "sandbox"
+
+    def __init__(self):
+        """sandbox 실행 환경을 확인하고 초기화합니다."""
+        self.python = os.path.realpath(settings.JUDGE_SANDBOX_PYTHON or sys.executable)
+        self.workdir_root = Path(settings.JUDGE_SANDBOX_WORKDIR)
+        self.workdir_root.mkdir(parents=True, exist_ok=True)
+
+        self.nsjail = shutil.which(settings.JUDGE_SANDBOX_NSJAIL)
+        if self.nsjail is None:
+            raise RuntimeError(
+                f"sandbox 백엔드에는 nsjail이 필요합니다: {settings.JUDGE_SANDBOX_NSJAIL}"
+            )
+        if os.geteuid() != 0:
+            raise RuntimeError("sandbox 백엔드는 uid 매핑과 cgroup 제한을 위해 root로 실행해야 합니다.")
+
+        self.host_uid = settings.JUDGE_SANDBOX_HOST_UID_BASE
+        self.mounts = self._readonly_mounts()
+
+        logger.info(
+            f"Sandbox 백엔드 초기화: nsjail={self.nsjail}, python={self.python}, "
+            f"마운트={self.mounts}, workdir={self.workdir_root}"
+        )
+
+    def get_runtime_digest(self) -> str:
+        """인터프리터 경로와 버전을 실행 환경 식별자로 사용합니다."""
+        return f"{self.python}:{sys.version.split()[0]}"
+
+    def _readonly_mounts(self) -> List[str]:
+        """
+        jail에 읽기 전용으로 마운트할 경로 목록 (시스템 디렉토리와 인터프리터 경로).
+
+        다른 경로 아래에 있는 경로는 상위 경로의 마운트에 포함되므로 제외합니다.
+        """
+        output = subprocess.run(
+            [self.python, "-I", "-c", INTERPRETER_PATHS_SCRIPT],
+            capture_output=True, text=True, timeout=30, check=True,
+        ).stdout
+        interpreter_paths = json.loads(output)
+        # 실행 파일은 디렉토리를 마운트
+        interpreter_paths[0] = os.path.dirname(interpreter_paths[0])
+
+        # 시스템 디렉토리는 심볼릭 링크(/lib -> usr/lib 등)도 같은 경로로 보이도록 그대로 마운트
+        candidates = sorted(
+            {*SYSTEM_MOUNTS, *(os.path.realpath(path) for path in interpreter_paths)}
+        )
+        mounts: List[str] = []
+        for path in candidates:
+            if not os.path.exists(path):
+                continue
+            if any(path == mount or path.startswith(mount + os.sep) for mount in mounts):
+                continue
+            mounts.append(path)
+        return mounts
+
+    def _uid_mappings(self) -> List[str]:
+        """jail 내부 uid(gid) → 호스트 uid 매핑 (root와 대상 실행 uid 범위)."""
+        mappings = [f"0:{self.host_uid}:1"]
+        if settings.JUDGE_RUN_UID_BASE:
+            mappings.append(f"{settings.JUDGE_RUN_UID_BASE}:{self.host_uid + 1}:{RUN_UID_SPAN}")
+        return mappings
+
+    def _sandbox_command(self, command: List[str], workdir: Path, cpu_seconds: int) -> List[str]:
+        """nsjail 격리 및 리소스 제한을 붙인 실행 명령을 만듭니다."""
+        wrapped = [
+            self.nsjail,
+            "--mode", "o",
+            "--quiet",
+            "--hostname", "judge",
+            "--cwd", WORKDIR,
+            "--user", "0",
+            "--group", "0",
+        ]
+        for mapping in self._uid_mappings():
+            wrapped += ["--uid_mapping", mapping, "--gid_mapping", mapping]
+        for path in self.mounts:
+            wrapped += ["--bindmount_ro", path]
+        for path in DEVICE_MOUNTS:
+            wrapped += ["--bindmount", path]
+        wrapped += [
+            "--bindmount_ro", f"{workdir}:{WORKDIR}",
+            "--tmpfsmount", "/tmp",
+            "--env", f"PATH={os.path.dirname(self.python)}:/usr/bin:/bin",
+            "--env", "HOME=/tmp",
+            "--env", "PYTHONDONTWRITEBYTECODE=1",
+            "--time_limit", str(cpu_seconds + 1),
+            "--rlimit_cpu", str(cpu_seconds),
+            "--rlimit_fsize", str(FILE_SIZE_LIMIT_MB),
+            "--rlimit_nofile", str(OPEN_FILES_LIMIT),
+            "--rlimit_core", "0",
+            "--use_cgroupv2",
+            "--cgroup_mem_max", str(MEMORY_LIMIT_BYTES),
+            "--cgroup_cpu_ms_per_sec", str(CPU_MS_PER_SEC),
+            "--cgroup_pids_max", str(PIDS_LIMIT),
+            "--seccomp_string", SECCOMP_POLICY,
+            "--",
+            *command,
+        ]
+        return wrapped
+
+    def _run_in_sandbox(
+        self,
+        files: Dict[str, str],
+        command: List[str],
+        timeout: float,
+        max_log_bytes: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        임시 작업 디렉토리를 만들고 sandbox 프로세스로 명령을 실행합니다.
+
+        Args:
+            files: {작업 디렉토리 기준 상대 경로: 내용}
+            command: 실행할 명령 (작업 디렉토리 기준)
+            timeout: 전체 실행 타임아웃 (초)
+            max_log_bytes: 보관할 최대 출력 크기. None이면 JUDGE_LOG_MAX_BYTES 설정 사용
+
+        Returns:
+            DockerService.run_container와 같은 형식의 실행 결과 딕셔너리
+        """
+        temp_path = Path(tempfile.mkdtemp(prefix=TEMP_DIR_PREFIX, dir=self.workdir_root))
+        start_time = time.time()
+
+        try:
+            write_workdir(temp_path, files)
+            # 작업 디렉토리는 jail 내부 root(러너) 소유로 변경 (대상 실행 uid는 접근 불가)
+            for path in (temp_path, *temp_path.rglob("*")):
+                os.lchown(path, self.host_uid, self.host_uid)
+            process = subprocess.Popen(
+                self._sandbox_command(command, temp_path, cpu_seconds=math.ceil(timeout) + 1),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                env={"PATH": os.environ.get("PATH", "/usr/bin:/bin")},
+                start_new_session=True,
+            )
+            # 출력은 별도 스레드에서 스트리밍으로 읽어 상한까지만 보관
+            output = BoundedOutput(max_log_bytes)
+            reader = threading.Thread(
+                target=self._drain_output,
+                args=(process.stdout, output),
+                name="sandbox-output-reader",
+                daemon=True,
+            )
+            reader.start()
+            try:
+                with cancellable(lambda: os.killpg(process.pid, signal.SIGKILL)):
+                    exit_code = process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                logger.warning(
+                    f"Sandbox 실행 타임아웃: pid={process.pid}, 타임아웃={timeout}초"
+                )
+                # nsjail 종료 (jail 내부 프로세스는 pid 네임스페이스와 함께 종료)
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                process.wait()
+                exit_code = -1
+            reader.join(timeout=1.0)
+            process.stdout.close()
+
+            execution_time = time.time() - start_time
+            logs = output.getvalue()
+            if output.truncated:
+                logger.warning(
+                    f"Sandbox 출력 상한 초과: 전체={output.total_bytes}바이트, "
+                    f"상한={output.max_bytes}바이트"
+                )
+            # nsjail 시간 제한, RLIMIT_CPU 초과 등 시그널 종료는 타임아웃/시스템 오류로 처리
+            if exit_code is not None and (exit_code < 0 or exit_code > 128):
+                exit_code = -1
+
+            success = exit_code == 0
+            logger.info(f"Sandbox 실행 완료: 성공: {success}, 시간: {execution_time:.2f}초")
+            return {
+                "success": success,
+                "exit_code": exit_code,
+                "stdout": logs,
+                "stderr": "",
+                "execution_time": execution_time,
+                "logs": logs,
+            }
+
+        except Exception as e:
+            execution_time = time.time() - start_time
+            logger.error(
+                f"Sandbox 실행 중 예외 발생: 에러 타입={type(e).__name__}, "
+                f"에러 메시지={str(e)}, 실행 시간={execution_time:.2f}초",
+                exc_info=True,
+            )
+            return {
+                "success": False,
+                "exit_code": -1,
+                "stdout": "",
+                "stderr": f"sandbox 실행 실패: {type(e).__name__}: {str(e)}",
+                "execution_time": execution_time,
+                "logs": "",
+            }
+
+        finally:
+            shutil.rmtree(temp_path, ignore_errors=True)
+
+    @staticmethod
+    def _drain_output(stream: IO[bytes], output: BoundedOutput) -> None:
+        """프로세스 출력을 EOF까지 읽어 버퍼에 전달합니다."""
+        try:
+            for chunk in iter(lambda: stream.read1(65536), b""):
+                output.feed(chunk)
+        except (OSError, ValueError):
+            # 타임아웃 후 스트림이 닫힌 경우
+            pass
+
+    def run_pytest(
+        self,
+        target_code: str,
+        test_code: str,
+        timeout: float = DEFAULT_TIMEOUT,
+        test_order: Optional[List[str]] = None,
+        coverage: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        sandbox 프로세스에서 pytest를 실행합니다.
+
+        Args:
+            target_code: 테스트 대상 코드
+            test_code: 사용자가 작성한 테스트 코드
+            timeout: 실행 타임아웃 (초)
+            test_order: 먼저 실행할 테스트 이름 순서
+            coverage: target.py 줄 커버리지 수집 여부
+
+        Returns:
+            실행 결과 딕셔너리
+        """
+        run = MultiTargetRun(
+            {SINGLE_TARGET_NAME: target_code}, test_code, timeout,
+            test_order=test_order, coverage=coverage,
+        )
+        run_result = self._run_in_sandbox(
+            run.files(), run.command(self.python), run.run_timeout(), max_log_bytes=run.output_limit()
+        )
+        return run.parse_single(run_result)
+
+    def run_pytest_multi(
+        self,
+        targets: Dict[str, str],
+        test_code: str,
+        timeout: float = DEFAULT_TIMEOUT,
+        schema: Optional[MutantSchema] = None,
+        test_codes: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        하나의 sandbox 프로세스에서 여러 대상에 대해 pytest를 실행합니다.
+
+        Args:
+            targets: {대상 이름: 대상 코드}
+            test_code: 사용자가 작성한 테스트 코드
+            timeout: 대상별 실행 타임아웃 (초)
+            schema: mutant schema 모듈 (모든 대상을 포함하면 한 번의 수집으로 실행)
+            test_codes: {대상 이름: 테스트 코드} (배치 채점)
+
+        Returns:
+            {대상 이름: 실행 결과 딕셔너리}
+        """
+        run = MultiTargetRun(targets, test_code, timeout, schema, test_codes)
+        run_result = self._run_in_sandbox(
+            run.files(), run.command(self.python), run.run_timeout(), max_log_bytes=run.output_limit()
+        )
+        return run.parse(run_result)
@@ -0,0 +1,149 @@
+"""Micro-batching of concurrent submissions for the same problem.
+
+같은 문제의 제출이 짧은 시간에 몰리면(추천 문제 등) 워커마다 문제/Mutant를 따로 읽고
+컨테이너를 따로 띄웁니다. 이 모듈은 워커들이 Redis 대기열 하나를 공유하여
+짧은 창(JUDGE_BATCH_WINDOW_MS) 동안 들어온 같은 문제의 제출을 한 워커(리더)가 모아
+공유 judge 세션(SubmissionService.process_batch)에서 채점하도록 합니다.
+
+동작:
+    1. 각 태스크는 제출 ID를 문제별 대기열(list)에 추가합니다.
+    2. 리더 키를 먼저 확보한 태스크가 창 동안 기다린 뒤, 자신의 제출과 대기열 앞쪽의
+       제출을 최대 JUDGE_BATCH_MAX_SIZE 개까지 원자적으로 가져가 채점합니다.
+    3. 나머지 태스크는 자신의 제출이 대기열에서 빠지면(다른 리더가 가져감) 바로 종료하고,
+       리더가 창을 넘겨 멈춘 경우에는 직접 리더가 되거나 혼자 채점합니다.
+
+Redis 오류 시에는 배치 없이 단건 채점합니다.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from typing import List, Optional
+
+import redis
+
+from app.core.config import settings
+from app.services.judge_cache import get_judge_cache_redis_url
+
+logger = logging.getLogger(__name__)
+
+# 대기열 확인 간격 (초)
+POLL_INTERVAL = 0.02
+# 리더 임대 시간 = 창 + 여유 시간 (리더가 비정상 종료해도 이 시간 후 다른 태스크가 리더가 됨)
+LEADER_LEASE_MARGIN = 2.0
+# 대기열 키 TTL (초, 처리되지 않고 남은 ID 정리)
+PENDING_TTL_SECONDS = 600
+
+# 자신의 제출을 먼저 가져간 뒤 대기열 앞쪽에서 배치 크기만큼 가져오고, 자신의 리더 키를 해제
+# KEYS[1]=대기열, KEYS[2]=리더 키, ARGV=[자신의 제출 ID, 최대 배치 크기, 리더 토큰]
+CLAIM_SCRIPT = """
+local claimed = {}
+if redis.call('LREM', KEYS[1], 1, ARGV[1]) == 1 then
+    table.insert(claimed, ARGV[1])
+end
+local rest = tonumber(ARGV[2]) - #claimed
+if rest > 0 then
+    local ids = redis.call('LRANGE', KEYS[1], 0, rest - 1)
+    redis.call('LTRIM', KEYS[1], #ids, -1)
+    for _, id in ipairs(ids) do
+        table.insert(claimed, id)
+    end
+end
+if redis.call('GET', KEYS[2]) == ARGV[3] then
+    redis.call('DEL', KEYS[2])
+end
+return claimed
+"""
+
+
+class SubmissionBatcher:
+    """Redis 기반 문제별 제출 배치 수집기."""
+
+    REDIS_KEY_PREFIX = "judge_batch:"
+
+    def __init__(self, redis_url: str, window_seconds: float, max_size: int):
+        """
+        SubmissionBatcher 초기화.
+
+        Args:
+            redis_url: 대기열을 저장할 Redis URL
+            window_seconds: 리더가 같은 문제의 제출을 모으는 시간 (초)
+            max_size: 한 배치의 최대 제출 수
+        """
+        self.redis_client = redis.from_url(redis_url)
+        self.window_seconds = window_seconds
+        self.max_size = max(1, max_size)
+        self._claim = self.redis_client.register_script(CLAIM_SCRIPT)
+
+    def _pending_key(self, problem_id: int, lane: str) -> str:
+        return f"{self.REDIS_KEY_PREFIX}{problem_id}:{lane}:pending"
+
+    def _leader_key(self, problem_id: int, lane: str) -> str:
+        return f"{self.REDIS_KEY_PREFIX}{problem_id}:{lane}:leader"
+
+    def join(self, problem_id: int, submission_id: str, lane: str = "") -> List[str]:
+        """
+        제출을 문제별 배치에 참여시키고, 이 태스크가 채점할 제출 ID 목록을 반환합니다.
+
+        Args:
+            problem_id: 제출의 문제 ID
+            submission_id: 제출 ID
+            lane: 배치를 나누는 구분 (채점 큐 이름). 다른 큐의 제출과는 묶지 않습니다
+
+        Returns:
+            이 태스크가 채점할 제출 ID 목록 (리더이면 배치 전체, 다른 리더가 가져갔으면 빈 목록).
+            Redis 오류 시 [submission_id]
+        """
+        pending_key = self._pending_key(problem_id, lane)
+        leader_key = self._leader_key(problem_id, lane)
+        token = uuid.uuid4().hex
+        lease_ms = int((self.window_seconds + LEADER_LEASE_MARGIN) * 1000)
+        deadline = time.monotonic() + self.window_seconds + LEADER_LEASE_MARGIN * 2
+
+        try:
+            pipe = self.redis_client.pipeline()
+            pipe.rpush(pending_key, submission_id)
+            pipe.expire(pending_key, PENDING_TTL_SECONDS)
+            pipe.execute()
+
+            while True:
+                if self.redis_client.set(leader_key, token, nx=True, px=lease_ms):
+                    time.sleep(self.window_seconds)
+                    claimed = self._claim(
+                        keys=[pending_key, leader_key],
+                        args=[submission_id, self.max_size, token],
+                    )
+                    return [i.decode() if isinstance(i, bytes) else i for i in claimed]
+                if self.redis_client.lpos(pending_key, submission_id) is None:
+                    # 다른 리더가 가져감
+                    return []
+                if time.monotonic() >= deadline:
+                    # 리더가 멈춘 경우: 아직 대기열에 있으면 직접 채점
+                    if self.redis_client.lrem(pending_key, 1, submission_id):
+                        return [submission_id]
+                    return []
+                time.sleep(POLL_INTERVAL)
+        except redis.RedisError as e:
+            logger.warning(
+                f"제출 배치 참여 실패 (단건 채점): submission_id={submission_id}, "
+                f"{type(e).__name__}: {str(e)}"
+            )
+            return [submission_id]
+
+
+_batcher: Optional[SubmissionBatcher] = None
+_batcher_lock = threading.Lock()
+
+
+def get_submission_batcher() -> SubmissionBatcher:
+    """프로세스 전역 제출 배치 수집기를 반환합니다 (최초 호출 시 생성)."""
+    global _batcher
+    with _batcher_lock:
+        if _batcher is None:
+            _batcher = SubmissionBatcher(
+                redis_url=get_judge_cache_redis_url(),
+                window_seconds=settings.JUDGE_BATCH_WINDOW_MS / 1000,
+                max_size=settings.JUDGE_BATCH_MAX_SIZE,
+            )
+        return _batcher
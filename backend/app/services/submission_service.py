@@ -1,21 +1,49 @@
 """Submission service for processing submissions."""
 
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Set, Tuple
 import logging
 
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.models.submission import Submission
 from app.models.problem import Problem
+from app.models.buggy_implementation import BuggyImplementation
+from app.models.kill_matrix import SubmissionKillMatrix
 from app.repositories.submission_repository import SubmissionRepository
 from app.repositories.problem_repository import ProblemRepository
 from app.repositories.buggy_implementation_repository import BuggyImplementationRepository
-from app.services.judge_service import JudgeService
+from app.repositories.kill_matrix_repository import KillMatrixRepository
+from app.services.judge_backend import TEST_TIMEOUT_ERROR_TYPE, RunCancelScope, run_in_scope
+from app.services.judge_service import TIMEOUT_DETECTION_RATIO, JudgeService
+from app.services.kill_matrix import build_kill_matrix
+from app.services.mutant_coverage import is_reached, mutant_probe_lines
+from app.services.mutant_schema import get_mutant_schema, is_schema_safe_test_code
+from app.services.mutant_test_order import count_test_kills, mutant_test_orders
+from app.services.progress_channel import get_progress_channel
+from app.services.problem_stats import get_problem_stats_accumulator
+from app.services.runtime_profile import mutant_timeout
+from app.services.test_prescreen import prescreen_test_code
 from app.services.ai_feedback_engine import generate_feedback
 
 logger = logging.getLogger(__name__)
 
+# 점수 확정 후 AI 피드백 생성을 기다리는 회원 제출의 진행률 (DB 저장)
+FEEDBACK_PENDING_PROGRESS = {
+    "step": "generating_feedback",
+    "message": "AI 피드백 생성 중...",
+    "percent": 100,
+}
+# AI 피드백 생성이 끝난 제출의 진행률
+FEEDBACK_DONE_PROGRESS = {
+    "step": "completed",
+    "message": "채점 완료",
+    "percent": 100,
+}
+
 
 class SubmissionService:
     """Service for processing submissions."""
@@ -36,27 +64,69 @@ class SubmissionService:
         "expected an indented block",
     ]
 
+    # Golden Code 자체 오류를 나타내는 예외 타입들 (리포터 플러그인 결과 기반 판단)
+    GOLDEN_CODE_ERROR_TYPES = frozenset({
+        "ImportError",
+        "ModuleNotFoundError",
+        "SyntaxError",
+        "IndentationError",
+        "NameError",
+        "AttributeError",
+        "TypeError",
+    })
+
     def __init__(self, db: Session):
         """Initialize service with database session."""
         self.db = db
         self.submission_repo = SubmissionRepository(db)
         self.problem_repo = ProblemRepository(db)
         self.buggy_repo = BuggyImplementationRepository(db)
-        self.judge_service = JudgeService()
+        self.kill_matrix_repo = KillMatrixRepository(db)
+        self._judge_service: Optional[JudgeService] = None
+        self.progress_channel = (
+            get_progress_channel() if settings.SUBMISSION_PROGRESS_REDIS_ENABLED else None
+        )
+
+    @property
+    def judge_service(self) -> JudgeService:
+        """
+        채점 실행 서비스 (처음 사용할 때 생성).
 
-    def _is_golden_code_error(self, logs: str) -> bool:
+        JudgeService는 Docker 백엔드에 연결하므로, Docker 소켓이 없는 피드백 워커처럼
+        채점하지 않는 경로에서는 만들지 않습니다.
         """
-        로그에서 Golden Code 자체의 오류인지 판단합니다.
+        if self._judge_service is None:
+            self._judge_service = JudgeService()
+        return self._judge_service
+
+    def _is_golden_code_error(self, result: Dict[str, Any]) -> bool:
+        """
+        실행 결과에서 Golden Code 자체의 오류인지 판단합니다.
         
         Golden Code 오류: ImportError, SyntaxError 등 코드 자체가 실행 불가한 경우
         사용자 테스트 실패: AssertionError 등 테스트 로직 실패
         
+        리포터 플러그인 결과(first_failure)가 있으면 예외 타입과 발생 파일만 확인하고,
+        없으면(이전 judge 이미지 등) 로그 키워드 검사로 대체합니다.
+        
         Args:
-            logs: pytest 실행 로그
+            result: JudgeService.run_pytest 실행 결과
             
         Returns:
             Golden Code 자체 오류이면 True, 아니면 False
         """
+        if result.get("tests") is not None:
+            failure = result.get("first_failure")
+            if not failure or failure.get("error_type") not in self.GOLDEN_CODE_ERROR_TYPES:
+                return False
+            # target.py (Golden Code 파일)에서 발생했거나 target.py 임포트 실패인 경우
+            # test_user.py에서 발생한 것은 사용자 테스트 문제
+            if failure.get("file") == "target.py" or "target.py" in (failure.get("message") or ""):
+                logger.debug(f"Golden Code 오류 감지: {failure.get('error_type')}")
+                return True
+            return False
+
+        logs = result.get("logs", "") or result.get("stdout", "") or ""
         if not logs:
             return False
         
@@ -71,12 +141,505 @@ class SubmissionService:
         
         return False
 
-    def process_submission(self, submission_id: UUID) -> None:
+    @staticmethod
+    def _mutant_target_name(mutant: BuggyImplementation) -> str:
+        """다중 대상 채점에서 사용하는 Mutant 대상 이름."""
+        return f"mutant_{mutant.id}"
+
+    def _submit_mutants(
+        self,
+        executor: ThreadPoolExecutor,
+        mutants: List[BuggyImplementation],
+        user_test_code: str,
+        timeout: Optional[float] = None,
+        test_orders: Optional[Dict[int, List[str]]] = None,
+        scope: Optional[RunCancelScope] = None,
+    ) -> Dict[int, Future]:
+        """
+        Mutant 테스트를 executor에 제출합니다.
+
+        Args:
+            executor: Mutant 실행에 사용할 executor
+            mutants: Mutant 목록
+            user_test_code: 사용자가 작성한 테스트 코드
+            timeout: Mutant별 실행 타임아웃 (초). None이면 기본값 사용
+            test_orders: {mutant_id: 먼저 실행할 테스트 이름 순서}
+            scope: 실행 중인 Mutant를 중단할 수 있는 cancel scope (투기적 실행)
+
+        Returns:
+            {mutant_id: Future} 딕셔너리
+        """
+        return {
+            mutant.id: executor.submit(
+                run_in_scope,
+                scope,
+                self.judge_service.test_buggy_code,
+                buggy_code=mutant.buggy_code,
+                user_test_code=user_test_code,
+                timeout=timeout,
+                test_order=(test_orders or {}).get(mutant.id),
+            )
+            for mutant in mutants
+        }
+
+    def _unreached_mutants(
+        self,
+        golden_code: str,
+        mutants: List[BuggyImplementation],
+        golden_result: Dict[str, Any],
+    ) -> Set[int]:
+        """
+        Golden 실행 커버리지가 변경된 코드에 도달하지 않은 Mutant ID를 반환합니다.
+
+        커버리지가 없으면(리포터 미지원 이미지, 캐시된 이전 결과 등) 빈 집합을 반환합니다.
+        """
+        covered = golden_result.get("target_coverage")
+        if not settings.JUDGE_COVERAGE_SKIP_ENABLED or covered is None:
+            return set()
+        return {
+            mutant.id
+            for mutant in mutants
+            if not is_reached(mutant_probe_lines(golden_code, mutant.buggy_code), covered)
+        }
+
+    @staticmethod
+    def _not_reached_result() -> Dict[str, Any]:
+        """실행하지 않은 Mutant의 결과 (survived, not reached)."""
+        return {
+            "success": True,
+            "exit_code": 0,
+            "stdout": None,
+            "stderr": "",
+            "execution_time": 0.0,
+            "logs": "사용자 테스트가 이 버그 구현의 변경된 코드를 실행하지 않아 실행을 생략했습니다.",
+            "all_tests_passed": True,
+            "any_test_failed": False,
+            "tests": None,
+            "collection_errors": None,
+            "test_summary": None,
+            "first_failure": None,
+            "target_coverage": None,
+            "not_reached": True,
+        }
+
+    def _run_mutants(
+        self,
+        submission: Submission,
+        mutants: List[BuggyImplementation],
+        precomputed: Optional[Dict[str, Dict[str, Any]]] = None,
+        futures: Optional[Dict[int, Future]] = None,
+        unreached: Optional[Set[int]] = None,
+        timeout: Optional[float] = None,
+        test_orders: Optional[Dict[int, List[str]]] = None,
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        각 Mutant에 대해 사용자 테스트를 실행하고 kill된 가중치를 합산합니다.
+
+        Mutant는 JUDGE_MUTANT_CONCURRENCY 개까지 동시에 실행되며,
+        진행률은 Mutant가 완료될 때마다 갱신됩니다.
+        unreached에 포함된 Mutant는 실행하지 않고 survived로 처리합니다
+        (투기적 실행으로 이미 시작된 Mutant는 결과를 그대로 사용).
+
+        Args:
+            submission: 채점 중인 Submission
+            mutants: Mutant 목록
+            precomputed: 다중 대상 또는 배치 채점으로 이미 실행된 결과 ({대상 이름: 결과})
+            futures: 투기적 실행으로 이미 제출된 Mutant 실행 ({mutant_id: Future})
+            unreached: 사용자 테스트가 변경된 코드에 도달하지 않은 Mutant ID
+            timeout: 새로 제출하는 Mutant 실행의 타임아웃 (초). None이면 기본값 사용
+            test_orders: 새로 제출하는 Mutant 실행의 테스트 순서 ({mutant_id: 테스트 이름 목록})
+
+        Returns:
+            (kill된 Mutant 가중치 합, Mutant별 실행 로그 목록) 튜플
+        """
+        results: Dict[int, Dict[str, Any]] = {}
+        executor = None
+        unreached = set(unreached or ())
+
+        if precomputed is not None:
+            results = {m.id: precomputed[self._mutant_target_name(m)] for m in mutants}
+        elif futures is None:
+            executor = ThreadPoolExecutor(
+                max_workers=max(1, settings.JUDGE_MUTANT_CONCURRENCY),
+                thread_name_prefix="mutant-runner",
+            )
+            futures = self._submit_mutants(
+                executor,
+                [m for m in mutants if m.id not in unreached],
+                submission.code,
+                timeout,
+                test_orders,
+            )
+        else:
+            # 아직 시작하지 않은 투기적 실행만 취소 가능
+            unreached = {mutant_id for mutant_id in unreached if futures[mutant_id].cancel()}
+
+        if precomputed is None and unreached:
+            for mutant in mutants:
+                if mutant.id in unreached:
+                    results[mutant.id] = self._not_reached_result()
+            logger.info(
+                f"[MUTANT_NOT_REACHED] submission_id={submission.id} "
+                f"skipped={len(unreached)}/{len(mutants)}"
+            )
+            self._update_mutant_progress(submission, len(results), len(mutants))
+
+        try:
+            if futures is not None:
+                # 완료되는 순서대로 진행률 갱신 (DB 세션은 이 스레드에서만 사용)
+                mutant_by_future = {futures[m.id]: m for m in mutants if m.id not in unreached}
+                for future in as_completed(mutant_by_future):
+                    results[mutant_by_future[future].id] = future.result()
+                    self._update_mutant_progress(submission, len(results), len(mutants))
+            elif mutants:
+                self._update_mutant_progress(submission, len(mutants), len(mutants))
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        killed = 0
+        mutant_logs = []
+
+        for mutant in mutants:
+            mutant_result = results[mutant.id]
+            mutant_logs.append(
+                {
+                    "mutant_id": mutant.id,
+                    "bug_description": mutant.bug_description,
+                    "weight": mutant.weight,
+                    "result": mutant_result,
+                }
+            )
+
+            # 테스트가 실패하면 mutant를 kill한 것
+            if mutant_result.get("any_test_failed", False):
+                killed += mutant.weight
+                logger.debug(
+                    f"[MUTANT_KILLED] submission_id={submission.id} "
+                    f"mutant_id={mutant.id} weight={mutant.weight}"
+                )
+
+        return killed, mutant_logs
+
+    def _record_golden_runtime(self, problem: Problem, golden_result: Dict[str, Any]) -> None:
+        """
+        통과한 Golden 실행 시간을 문제의 runtime_profile 누적기에 기록합니다.
+
+        problems 행은 유지보수 태스크가 일괄 반영하므로 여기서는 Redis에만 추가합니다.
+        캐시된 결과는 실제 실행 시간이 아니므로 기록하지 않습니다.
+        기록 실패는 채점 결과에 영향을 주지 않습니다.
+        """
+        if not settings.JUDGE_RUNTIME_PROFILE_ENABLED or golden_result.get("cached"):
+            return
+        try:
+            get_problem_stats_accumulator().add_golden_runtime(
+                problem.id, golden_result.get("execution_time", 0.0)
+            )
+        except Exception as e:
+            logger.warning(
+                f"[RUNTIME_PROFILE_ERROR] problem_id={problem.id} "
+                f"error={type(e).__name__}: {str(e)}"
+            )
+
+    def _record_kill_matrix(
+        self,
+        submission: Submission,
+        matrix: Optional[Dict[str, Any]],
+    ) -> None:
+        """
+        제출의 테스트 × Mutant kill 행렬(build_kill_matrix 결과)을 저장합니다.
+
+        저장 실패는 채점 결과에 영향을 주지 않습니다.
+        """
+        if not settings.JUDGE_KILL_MATRIX_ENABLED or matrix is None:
+            return
+        try:
+            self.kill_matrix_repo.save(
+                SubmissionKillMatrix(
+                    submission_id=submission.id,
+                    problem_id=submission.problem_id,
+                    **matrix,
+                )
+            )
+        except Exception as e:
+            self.db.rollback()
+            logger.warning(
+                f"[KILL_MATRIX_ERROR] submission_id={submission.id} "
+                f"error={type(e).__name__}: {str(e)}"
+            )
+
+    def _record_test_kill_stats(
+        self,
+        problem: Problem,
+        test_code: str,
+        matrix: Optional[Dict[str, Any]],
+    ) -> None:
+        """
+        제출의 kill 행렬을 문제의 테스트 특징별 kill 통계 누적기에 더합니다.
+
+        problems 행은 유지보수 태스크가 일괄 반영하므로 여기서는 Redis 카운터만 올립니다.
+        누적 실패는 채점 결과에 영향을 주지 않습니다.
+        """
+        if not settings.JUDGE_TEST_KILL_STATS_ENABLED or matrix is None:
+            return
+        try:
+            get_problem_stats_accumulator().add_test_kills(
+                problem.id, count_test_kills(test_code, matrix)
+            )
+        except Exception as e:
+            logger.warning(
+                f"[TEST_KILL_STATS_ERROR] problem_id={problem.id} "
+                f"error={type(e).__name__}: {str(e)}"
+            )
+
+    def _update_progress(self, submission: Submission, progress: Dict[str, Any]) -> None:
+        """
+        채점 중 진행률을 저장합니다.
+
+        Redis 진행률 채널이 활성화되어 있으면 Redis에만 기록하고(DB 커밋 없음),
+        비활성화되었거나 기록에 실패하면 Submission.progress로 DB에 저장합니다.
+        """
+        if self.progress_channel is not None and self.progress_channel.publish(submission.id, progress):
+            return
+        submission.progress = progress
+        self.submission_repo.update(submission)
+
+    def _update_mutant_progress(self, submission: Submission, completed: int, total: int) -> None:
+        """Mutant 테스트 진행률을 저장합니다."""
+        self._update_progress(
+            submission,
+            {
+                "step": "testing_buggy",
+                "current": completed,
+                "total": total,
+                "message": f"버그 구현 {completed}/{total} 테스트 중...",
+                "percent": 20 + (70 * completed // total)
+            },
+        )
+
+    def _enqueue_feedback(self, submission: Submission) -> None:
+        """
+        점수가 확정된 회원 제출의 AI 피드백 생성을 피드백 큐에 등록합니다.
+
+        LLM 호출은 채점 워커 슬롯을 점유하지 않도록 별도 태스크(generate_feedback_task)에서 실행합니다.
+        등록에 실패하면 피드백 없이 완료 처리합니다.
+        """
+        # tasks 모듈이 이 모듈을 import하므로 호출 시점에 import
+        from app.workers.tasks import generate_feedback_task
+
+        try:
+            generate_feedback_task.delay(str(submission.id))
+            logger.info(f"[AI_FEEDBACK_QUEUED] submission_id={submission.id} user_id={submission.user_id}")
+        except Exception as e:
+            logger.error(
+                f"[AI_FEEDBACK_ERROR] submission_id={submission.id} "
+                f"reason=enqueue_failed error={type(e).__name__}: {str(e)}"
+            )
+            submission.progress = FEEDBACK_DONE_PROGRESS
+            self.submission_repo.update(submission)
+
+    def generate_submission_feedback(self, submission_id: UUID) -> None:
+        """
+        채점이 끝난 회원 제출의 AI 피드백을 생성하여 저장합니다 (피드백 큐 태스크).
+
+        저장된 채점 결과(score, execution_log)로 프롬프트를 만들고, 저장 후
+        progress_channel로 feedback 이벤트를 발행하여 SSE 구독자에게 알립니다.
+
+        Args:
+            submission_id: 피드백을 생성할 제출 ID
+        """
+        submission = self.submission_repo.get_by_id(submission_id)
+        if not submission or submission.status != "SUCCESS" or submission.user_id is None:
+            logger.warning(f"[AI_FEEDBACK_SKIP] submission_id={submission_id} reason=not_eligible")
+            return
+        if submission.feedback_json is not None:
+            logger.info(f"[AI_FEEDBACK_SKIP] submission_id={submission_id} reason=already_generated")
+            return
+        problem = self.problem_repo.get_by_id(submission.problem_id)
+        if not problem:
+            logger.error(f"[AI_FEEDBACK_ERROR] submission_id={submission_id} reason=problem_not_found")
+            return
+
+        total_weight = submission.total_mutants or 0
+        kill_ratio = submission.killed_mutants / total_weight if total_weight > 0 else 0.0
+        logger.info(f"[AI_FEEDBACK_START] submission_id={submission_id} user_id={submission.user_id}")
+        try:
+            feedback = generate_feedback(
+                problem_title=problem.title,
+                problem_description=problem.description_md,
+                problem_skills=problem.skills or [],
+                test_code=submission.code,
+                score=submission.score,
+                killed_mutants=submission.killed_mutants,
+                total_mutants=total_weight,
+                kill_ratio=kill_ratio,
+                execution_log=submission.execution_log or {},
+            )
+            logger.info(f"[AI_FEEDBACK_SUCCESS] submission_id={submission_id}")
+        except Exception as e:
+            logger.error(
+                f"[AI_FEEDBACK_ERROR] submission_id={submission_id} "
+                f"error={type(e).__name__}: {str(e)}",
+                exc_info=True
+            )
+            # 피드백 생성 실패해도 채점 결과는 유지
+            feedback = None
+
+        submission.feedback_json = feedback
+        self._finish_feedback(submission)
+
+    def _finish_feedback(self, submission: Submission) -> None:
+        """피드백 대기를 끝내고(completed) feedback 이벤트를 발행합니다."""
+        submission.progress = FEEDBACK_DONE_PROGRESS
+        self.submission_repo.update(submission)
+        if self.progress_channel is not None:
+            self.progress_channel.feedback_ready(submission.id)
+
+    def abandon_feedback(self, submission_id: UUID) -> None:
+        """
+        피드백 생성이 실패한 제출을 피드백 없이 완료 처리합니다.
+
+        진행률이 generating_feedback에 머물면 클라이언트가 계속 기다리므로,
+        피드백 태스크가 예외로 끝났을 때 호출합니다.
+        """
+        submission = self.submission_repo.get_by_id(submission_id)
+        if submission is None or not self._is_feedback_pending(submission):
+            return
+        logger.warning(f"[AI_FEEDBACK_ABANDONED] submission_id={submission_id}")
+        self._finish_feedback(submission)
+
+    @staticmethod
+    def _is_feedback_pending(submission: Submission) -> bool:
+        return (
+            submission.status == "SUCCESS"
+            and (submission.progress or {}).get("step") == FEEDBACK_PENDING_PROGRESS["step"]
+        )
+
+    def expire_stale_feedback(self, max_age_seconds: float) -> int:
+        """
+        오래 피드백을 기다리는 제출을 피드백 없이 완료 처리합니다 (유지보수 태스크).
+
+        피드백 태스크가 유실되거나(브로커/워커 장애) 강제 종료되어
+        abandon_feedback도 호출되지 않은 제출을 정리합니다.
+
+        Args:
+            max_age_seconds: 제출 생성 후 이 시간이 지난 피드백 대기 제출만 처리
+
+        Returns:
+            완료 처리한 제출 수
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=max_age_seconds)
+        stale = self.submission_repo.get_feedback_pending_before(
+            FEEDBACK_PENDING_PROGRESS["step"], cutoff
+        )
+        for submission in stale:
+            logger.warning(f"[AI_FEEDBACK_EXPIRED] submission_id={submission.id}")
+            self._finish_feedback(submission)
+        return len(stale)
+
+    @staticmethod
+    def _batch_run_name(target_name: str, submission: Submission) -> str:
+        """배치 채점에서 제출별 실행 이름 (예: "golden__<submission id>")."""
+        return f"{target_name}__{submission.id.hex}"
+
+    def process_batch(self, submission_ids: List[UUID]) -> None:
+        """
+        같은 문제의 제출들을 공유 judge 세션에서 채점합니다.
+
+        문제와 Mutant를 한 번만 읽고, 모든 제출의 Golden 실행을 컨테이너 하나에서,
+        Golden을 통과한 제출들의 Mutant 실행을 다시 컨테이너 하나에서 수행합니다
+        (실행마다 격리된 프로세스). 결과는 process_submission으로 제출마다 저장합니다.
+        배치 실행에 실패했거나 사전 검사에서 거부된 제출은 단건으로 채점합니다.
+
+        Args:
+            submission_ids: 채점할 제출 ID 목록 (같은 문제)
+        """
+        submissions = [
+            submission
+            for submission in (self.submission_repo.get_by_id(i) for i in submission_ids)
+            if submission is not None
+        ]
+        problem_ids = {submission.problem_id for submission in submissions}
+        problem = (
+            self.problem_repo.get_by_id(submissions[0].problem_id)
+            if len(problem_ids) == 1
+            else None
+        )
+        batch_results: Dict[UUID, Dict[str, Dict[str, Any]]] = {}
+
+        if problem is not None:
+            mutants = self.buggy_repo.get_by_problem_id(problem.id)
+            batched = [
+                submission
+                for submission in submissions
+                if not (
+                    settings.JUDGE_PRESCREEN_ENABLED
+                    and prescreen_test_code(submission.code) is not None
+                )
+            ]
+            for submission in batched:
+                submission.status = "RUNNING"
+                submission.progress = {
+                    "step": "testing_golden",
+                    "message": "정답 코드 테스트 중...",
+                    "percent": 20
+                }
+                self.submission_repo.update(submission)
+            logger.info(
+                f"[BATCH_GRADING_START] problem_id={problem.id} "
+                f"submissions={len(batched)}/{len(submission_ids)} mutants={len(mutants)}"
+            )
+            try:
+                golden_results = self.judge_service.run_pytest_batch({
+                    self._batch_run_name("golden", submission): (problem.golden_code, submission.code)
+                    for submission in batched
+                })
+                passed = [
+                    submission
+                    for submission in batched
+                    if golden_results[self._batch_run_name("golden", submission)].get(
+                        "all_tests_passed", False
+                    )
+                ]
+                mutant_results = self.judge_service.run_pytest_batch({
+                    self._batch_run_name(self._mutant_target_name(m), submission): (
+                        m.buggy_code,
+                        submission.code,
+                    )
+                    for submission in passed
+                    for m in mutants
+                }) if passed and mutants else {}
+                for submission in batched:
+                    results = {"golden": golden_results[self._batch_run_name("golden", submission)]}
+                    if submission in passed:
+                        for m in mutants:
+                            name = self._mutant_target_name(m)
+                            results[name] = mutant_results[self._batch_run_name(name, submission)]
+                    batch_results[submission.id] = results
+            except Exception as e:
+                logger.error(
+                    f"[BATCH_GRADING_ERROR] problem_id={problem.id} "
+                    f"error_type={type(e).__name__} error_message={str(e)}",
+                    exc_info=True
+                )
+                batch_results = {}
+
+        # 결과 저장 (배치 결과가 없는 제출은 단건 채점)
+        for submission_id in submission_ids:
+            self.process_submission(submission_id, precomputed=batch_results.get(submission_id))
+
+    def process_submission(
+        self,
+        submission_id: UUID,
+        precomputed: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> None:
         """
         Process a submission: run tests against golden code and mutants.
 
         Args:
             submission_id: Submission ID to process
+            precomputed: 배치 채점으로 이미 실행된 결과 ({"golden": ..., "mutant_<id>": ...}).
+                Golden이 통과하지 않은 제출은 "golden"만 포함합니다.
         """
         logger.info(f"[GRADING_START] submission_id={submission_id}")
 
@@ -96,6 +659,8 @@ class SubmissionService:
         self.submission_repo.update(submission)
         logger.info(f"[STATUS_CHANGE] submission_id={submission_id} status=PENDING->RUNNING")
 
+        speculative_executor = None
+        speculative_scope = None
         try:
             # 2. Problem 및 BuggyImplementations 조회
             problem = self.problem_repo.get_by_id(submission.problem_id)
@@ -113,33 +678,104 @@ class SubmissionService:
             mutants = self.buggy_repo.get_by_problem_id(problem.id)
 
             # 3. Golden Code로 pytest 실행
-            submission.progress = {
-                "step": "testing_golden",
-                "message": "정답 코드 테스트 중...",
-                "percent": 20
-            }
-            self.submission_repo.update(submission)
+            self._update_progress(
+                submission,
+                {
+                    "step": "testing_golden",
+                    "message": "정답 코드 테스트 중...",
+                    "percent": 20
+                },
+            )
             logger.info(
                 f"[GOLDEN_TEST_START] submission_id={submission_id} "
                 f"problem_id={problem.id} problem_title={problem.title}"
             )
-            golden_result = self.judge_service.test_golden_code(
-                golden_code=problem.golden_code,
-                user_test_code=submission.code,
+            speculative_futures = None
+            test_orders = mutant_test_orders(
+                submission.code, problem.test_kill_stats, [m.id for m in mutants]
+            )
+            prescreen_result = (
+                prescreen_test_code(submission.code)
+                if settings.JUDGE_PRESCREEN_ENABLED and precomputed is None
+                else None
             )
+            if precomputed is not None:
+                # 배치 채점(공유 judge 세션)에서 이미 실행된 결과
+                golden_result = precomputed["golden"]
+            elif prescreen_result is not None:
+                # 컨테이너 실행 없이 확실히 실패하는 제출 (Golden 실패와 같은 결과 형식)
+                logger.info(
+                    f"[PRESCREEN_REJECTED] submission_id={submission_id} "
+                    f"rule={prescreen_result['prescreen']}"
+                )
+                golden_result = prescreen_result
+            elif settings.JUDGE_MULTI_TARGET_ENABLED and mutants:
+                # 단일 컨테이너에서 Golden + 모든 Mutant 실행
+                mutant_targets = {self._mutant_target_name(m): m.buggy_code for m in mutants}
+                # 임포트 시점에 target을 호출하는 테스트는 변형별 결과가 달라지므로 대상별 실행
+                schema = (
+                    get_mutant_schema(problem.golden_code, mutant_targets)
+                    if settings.JUDGE_MUTANT_SCHEMA_ENABLED
+                    and is_schema_safe_test_code(submission.code)
+                    else None
+                )
+                precomputed = self.judge_service.run_pytest_multi(
+                    targets={"golden": problem.golden_code, **mutant_targets},
+                    user_test_code=submission.code,
+                    schema=schema,
+                )
+                golden_result = precomputed["golden"]
+            elif settings.JUDGE_SPECULATIVE_MUTANTS and mutants:
+                # 투기적 실행: Golden 결과를 기다리지 않고 Mutant 실행을 먼저 제출
+                speculative_executor = ThreadPoolExecutor(
+                    max_workers=max(1, settings.JUDGE_MUTANT_CONCURRENCY),
+                    thread_name_prefix="mutant-runner",
+                )
+                speculative_scope = RunCancelScope()
+                speculative_futures = self._submit_mutants(
+                    speculative_executor,
+                    mutants,
+                    submission.code,
+                    test_orders=test_orders,
+                    scope=speculative_scope,
+                )
+                golden_result = self.judge_service.test_golden_code(
+                    golden_code=problem.golden_code,
+                    user_test_code=submission.code,
+                )
+            else:
+                golden_result = self.judge_service.test_golden_code(
+                    golden_code=problem.golden_code,
+                    user_test_code=submission.code,
+                )
 
             # 4. 실패 시 처리 (ERROR vs FAILURE 구분)
             if not golden_result.get("all_tests_passed", False):
+                if speculative_executor is not None:
+                    # 아직 시작하지 않은 Mutant 실행 취소 후 실행 중인 컨테이너/프로세스 종료
+                    speculative_executor.shutdown(wait=False, cancel_futures=True)
+                    killed_runs = speculative_scope.cancel()
+                    logger.info(
+                        f"[MUTANT_TEST_CANCELLED] submission_id={submission_id} "
+                        f"reason=golden_test_not_passed killed_running={killed_runs}"
+                    )
                 exit_code = golden_result.get("exit_code", -1)
                 execution_time = golden_result.get("execution_time", 0)
-                logs = golden_result.get("logs", "") or golden_result.get("stdout", "") or ""
                 
+                applied_timeout = golden_result.get("timeout") or self.judge_service.timeout
+
+                first_failure = golden_result.get("first_failure") or {}
+
                 # ERROR 조건 판단:
-                # 1. 타임아웃 (exit_code == -1, execution_time >= 4.5초)
+                # 1. 타임아웃 (exit_code == -1, 실행 시간이 적용된 타임아웃의 90% 이상)
+                #    또는 테스트별 타임아웃으로 실패한 테스트
                 # 2. Golden Code 자체 실행 불가 (ImportError, SyntaxError 등)
                 # 3. Docker/시스템 오류 (exit_code == -1)
-                is_timeout = exit_code == -1 and execution_time >= 4.5
-                is_golden_code_error = self._is_golden_code_error(logs)
+                is_timeout = (
+                    exit_code == -1
+                    and execution_time >= applied_timeout * TIMEOUT_DETECTION_RATIO
+                ) or first_failure.get("error_type") == TEST_TIMEOUT_ERROR_TYPE
+                is_golden_code_error = self._is_golden_code_error(golden_result)
                 is_system_error = exit_code == -1 and not is_timeout
                 
                 if is_timeout or is_golden_code_error or is_system_error:
@@ -199,43 +835,26 @@ class SubmissionService:
                 return
 
             # 5. 성공 시 각 Mutant에 대해 pytest 실행
+            if precomputed is None:
+                self._record_golden_runtime(problem, golden_result)
+            timeout = (
+                mutant_timeout(problem.runtime_profile, golden_result.get("execution_time", 0.0))
+                if precomputed is None and speculative_futures is None
+                else None
+            )
             logger.info(
                 f"[MUTANT_TEST_START] submission_id={submission_id} "
-                f"total_mutants={len(mutants)}"
+                f"total_mutants={len(mutants)} timeout={timeout or self.judge_service.timeout} "
+                f"reordered={len(test_orders)}"
+            )
+            unreached = (
+                self._unreached_mutants(problem.golden_code, mutants, golden_result)
+                if precomputed is None
+                else set()
+            )
+            killed, mutant_logs = self._run_mutants(
+                submission, mutants, precomputed, speculative_futures, unreached, timeout, test_orders
             )
-            killed = 0
-            mutant_logs = []
-
-            for idx, mutant in enumerate(mutants):
-                submission.progress = {
-                    "step": "testing_buggy",
-                    "current": idx + 1,
-                    "total": len(mutants),
-                    "message": f"버그 구현 {idx+1}/{len(mutants)} 테스트 중...",
-                    "percent": 20 + (70 * (idx + 1) // len(mutants))
-                }
-                self.submission_repo.update(submission)
-
-                mutant_result = self.judge_service.test_buggy_code(
-                    buggy_code=mutant.buggy_code,
-                    user_test_code=submission.code,
-                )
-                mutant_logs.append(
-                    {
-                        "mutant_id": mutant.id,
-                        "bug_description": mutant.bug_description,
-                        "weight": mutant.weight,
-                        "result": mutant_result,
-                    }
-                )
-
-                # 테스트가 실패하면 mutant를 kill한 것
-                if mutant_result.get("any_test_failed", False):
-                    killed += mutant.weight
-                    logger.debug(
-                        f"[MUTANT_KILLED] submission_id={submission_id} "
-                        f"mutant_id={mutant.id} weight={mutant.weight}"
-                    )
 
             # 6. Kill ratio 계산
             total_weight = sum(m.weight for m in mutants) if mutants else 1
@@ -250,49 +869,8 @@ class SubmissionService:
                 f"killed={killed} total={total_weight} kill_ratio={kill_ratio:.2f} score={score}"
             )
 
-            # 8. AI 피드백 생성 - 회원에게만 제공
-            if submission.user_id is not None:
-                # 회원인 경우에만 AI 피드백 생성
-                submission.progress = {
-                    "step": "generating_feedback",
-                    "message": "AI 피드백 생성 중...",
-                    "percent": 95
-                }
-                self.submission_repo.update(submission)
-                logger.info(f"[AI_FEEDBACK_START] submission_id={submission_id} user_id={submission.user_id}")
-                try:
-                    feedback = generate_feedback(
-                        problem_title=problem.title,
-                        problem_description=problem.description_md,
-                        problem_skills=problem.skills or [],
-                        test_code=submission.code,
-                        score=score,
-                        killed_mutants=killed,
-                        total_mutants=total_weight,
-                        kill_ratio=kill_ratio,
-                        execution_log={
-                            "golden": golden_result,
-                            "mutants": mutant_logs,
-                        },
-                    )
-                    logger.info(f"[AI_FEEDBACK_SUCCESS] submission_id={submission_id}")
-                except Exception as e:
-                    logger.error(
-                        f"[AI_FEEDBACK_ERROR] submission_id={submission_id} "
-                        f"error={type(e).__name__}: {str(e)}",
-                        exc_info=True
-                    )
-                    # 피드백 생성 실패해도 채점은 완료된 것으로 처리
-                    feedback = None
-            else:
-                # 게스트인 경우 AI 피드백 스킵
-                logger.info(
-                    f"[AI_FEEDBACK_SKIP] submission_id={submission_id} "
-                    f"anonymous_id={submission.anonymous_id} reason=guest_user"
-                )
-                feedback = None
-
-            # 9. 결과 DB 저장
+            # 8. 결과 DB 저장 (AI 피드백은 회원에게만, 피드백 큐에서 비동기로 생성)
+            feedback_pending = submission.user_id is not None
             submission.status = "SUCCESS"
             submission.score = score
             submission.killed_mutants = killed
@@ -301,14 +879,26 @@ class SubmissionService:
                 "golden": golden_result,
                 "mutants": mutant_logs,
             }
-            submission.feedback_json = feedback
+            submission.feedback_json = None
+            if feedback_pending:
+                submission.progress = FEEDBACK_PENDING_PROGRESS
 
             self.submission_repo.update(submission)
+            kill_matrix = build_kill_matrix(golden_result, mutant_logs)
+            self._record_kill_matrix(submission, kill_matrix)
+            self._record_test_kill_stats(problem, submission.code, kill_matrix)
             logger.info(f"[STATUS_CHANGE] submission_id={submission_id} status=RUNNING->SUCCESS")
             logger.info(
                 f"[GRADING_COMPLETE] submission_id={submission_id} status=SUCCESS "
                 f"score={score} killed={killed}/{total_weight}"
             )
+            if feedback_pending:
+                self._enqueue_feedback(submission)
+            else:
+                logger.info(
+                    f"[AI_FEEDBACK_SKIP] submission_id={submission_id} "
+                    f"anonymous_id={submission.anonymous_id} reason=guest_user"
+                )
 
         except Exception as e:
             logger.error(
@@ -322,3 +912,12 @@ class SubmissionService:
             logger.info(f"[STATUS_CHANGE] submission_id={submission_id} status=RUNNING->ERROR")
             logger.info(f"[GRADING_COMPLETE] submission_id={submission_id} status=ERROR")
 
+        finally:
+            if speculative_executor is not None:
+                speculative_executor.shutdown(wait=False, cancel_futures=True)
+                # 예외로 중단된 경우에도 실행 중인 Mutant 종료 (모두 끝났으면 no-op)
+                speculative_scope.cancel()
+            if self.progress_channel is not None:
+                # 최종 상태는 DB에 저장되었으므로 진행률 삭제 후 SSE 구독자에게 알림
+                self.progress_channel.finish(submission_id, submission.status)
+
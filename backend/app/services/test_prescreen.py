@@ -0,0 +1,258 @@
+"""Static pre-screening of user test code before any judge run."""
+
+import ast
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
+import logging
+
+from app.services.judge_backend import read_support_files
+
+logger = logging.getLogger(__name__)
+
+TEST_FILE_NAME = "test_user.py"
+
+# judge/conftest.py를 읽을 수 없을 때 사용하는 차단 모듈 목록
+DEFAULT_BLOCKED_MODULES = frozenset(
+    {"os", "sys", "subprocess", "socket", "shutil", "multiprocessing", "threading", "ctypes", "imp"}
+)
+
+# pytest 종료 코드
+EXIT_TESTS_FAILED = 1
+EXIT_INTERRUPTED = 2  # 수집 오류
+EXIT_NO_TESTS_COLLECTED = 5
+
+# 이 이름이 코드에 있으면 테스트가 건너뛰어지거나 실패가 허용될 수 있음
+_NON_FAILING_NAMES = frozenset({"skip", "skipif", "xfail", "importorskip", "pytestmark"})
+
+
+@lru_cache(maxsize=1)
+def blocked_modules() -> FrozenSet[str]:
+    """
+    judge/conftest.py의 BLOCKED_MODULES를 반환합니다 (프로세스당 한 번 읽음).
+
+    conftest.py를 단일 기준으로 삼아 차단 목록이 어긋나지 않도록 합니다.
+    """
+    source = read_support_files().get("conftest.py")
+    if source:
+        try:
+            for node in ast.parse(source).body:
+                if (
+                    isinstance(node, ast.Assign)
+                    and any(isinstance(t, ast.Name) and t.id == "BLOCKED_MODULES" for t in node.targets)
+                ):
+                    return frozenset(ast.literal_eval(node.value))
+        except (SyntaxError, ValueError) as e:
+            logger.warning(f"conftest.py BLOCKED_MODULES 파싱 실패, 기본 목록 사용: {e}")
+    return DEFAULT_BLOCKED_MODULES
+
+
+def _names(nodes: Iterable[ast.AST]) -> List[str]:
+    """AST 노드에 등장하는 이름/속성 이름을 모두 반환합니다."""
+    names = []
+    for node in nodes:
+        for child in ast.walk(node):
+            if isinstance(child, ast.Name):
+                names.append(child.id)
+            elif isinstance(child, ast.Attribute):
+                names.append(child.attr)
+    return names
+
+
+def collected_test_functions(tree: ast.Module) -> Dict[str, ast.AST]:
+    """
+    pytest가 수집할 테스트 함수를 반환합니다 ({"test_x" 또는 "TestX::test_x": 함수 노드}).
+
+    모듈 수준 test_* 함수와 Test* 클래스(__init__ 없음)의 test_* 메서드만 대상이며,
+    같은 이름이 다시 정의되면 마지막 정의만 남습니다.
+    """
+    functions: Dict[str, ast.AST] = {}
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name.startswith("test"):
+            functions[node.name] = node
+        elif isinstance(node, ast.ClassDef) and node.name.startswith("Test"):
+            methods: Dict[str, ast.AST] = {}
+            for item in node.body:
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    methods[item.name] = item
+            if "__init__" in methods or "__new__" in methods:
+                # pytest는 생성자가 있는 테스트 클래스를 수집하지 않음
+                continue
+            for name, item in methods.items():
+                if name.startswith("test"):
+                    functions[f"{node.name}::{name}"] = item
+    return functions
+
+
+def _may_define_tests(tree: ast.Module) -> bool:
+    """
+    모듈이 테스트를 정의할 가능성이 있는지 보수적으로 판단합니다.
+
+    임포트나 대입으로 만들어진 test* 이름과 조건문/try 안에서 정의된 test* 함수도
+    pytest가 수집할 수 있으므로 포함합니다.
+    """
+    if collected_test_functions(tree):
+        return True
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name.startswith("test"):
+            return True
+        if isinstance(node, ast.ClassDef) and node.name.startswith("Test"):
+            return True
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            if any((alias.asname or alias.name).startswith(("test", "Test")) for alias in node.names):
+                return True
+            if isinstance(node, ast.ImportFrom) and any(alias.name == "*" for alias in node.names):
+                return True
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+            if node.id.startswith(("test", "Test")):
+                return True
+        if isinstance(node, ast.Call) and "setattr" in _names([node.func]):
+            return True
+    return False
+
+
+def _blocked_import(function: ast.AST, blocked: FrozenSet[str]) -> Optional[ast.AST]:
+    """
+    테스트 함수 본문에서 무조건 실행되는 차단 모듈 임포트를 찾습니다.
+
+    조건문/try 안의 임포트와 return 이후의 임포트는 실행 여부를 알 수 없으므로 검사하지 않습니다.
+    """
+    for statement in function.body:
+        if isinstance(statement, ast.Return):
+            return None
+        if isinstance(statement, ast.Import):
+            for alias in statement.names:
+                if alias.name.split(".")[0] in blocked:
+                    return statement
+        elif isinstance(statement, ast.ImportFrom) and statement.level == 0 and statement.module:
+            if statement.module.split(".")[0] in blocked:
+                return statement
+    return None
+
+
+def _imported_module(statement: ast.AST, blocked: FrozenSet[str]) -> str:
+    """임포트 구문에서 차단된 모듈 이름을 반환합니다."""
+    if isinstance(statement, ast.ImportFrom):
+        return statement.module
+    return next(a.name for a in statement.names if a.name.split(".")[0] in blocked)
+
+
+def _result(
+    exit_code: int,
+    logs: str,
+    tests: List[Dict[str, Any]],
+    collection_errors: List[Dict[str, Any]],
+    rule: str,
+) -> Dict[str, Any]:
+    """JudgeService.run_pytest와 같은 형식의 결과를 만듭니다."""
+    summary = {"passed": 0, "failed": 0, "error": 0, "skipped": 0}
+    for test in tests:
+        summary[test["outcome"]] = summary.get(test["outcome"], 0) + 1
+    first_failure = collection_errors[0] if collection_errors else (tests[0] if tests else None)
+    return {
+        "success": False,
+        "exit_code": exit_code,
+        "stdout": None,
+        "stderr": "",
+        "execution_time": 0.0,
+        "logs": logs,
+        "all_tests_passed": False,
+        "any_test_failed": True,
+        "tests": tests,
+        "collection_errors": collection_errors,
+        "test_summary": summary,
+        "first_failure": first_failure,
+        "target_coverage": None,
+        "prescreen": rule,
+    }
+
+
+def prescreen_test_code(test_code: str) -> Optional[Dict[str, Any]]:
+    """
+    컨테이너 실행 없이 사용자 테스트 코드가 Golden Code에서 확실히 실패하는지 검사합니다.
+
+    다음 경우 Golden 실행 결과와 같은 형식의 실패 결과를 반환합니다:
+    - 문법 오류 (pytest 수집 오류)
+    - 수집될 테스트가 하나도 없음 (pytest 종료 코드 5)
+    - 테스트 함수 본문에서 conftest.py가 차단하는 모듈을 무조건 임포트
+
+    Args:
+        test_code: 사용자가 작성한 테스트 코드
+
+    Returns:
+        실패가 확실하면 실행 결과 딕셔너리, 판단할 수 없으면 None (정상 채점 진행)
+    """
+    try:
+        tree = ast.parse(test_code, filename=TEST_FILE_NAME)
+    except SyntaxError as e:
+        error_type = type(e).__name__
+        message = f"{error_type}: {e.msg}"
+        logs = (
+            f"_ ERROR collecting {TEST_FILE_NAME} _\n"
+            f'  File "{TEST_FILE_NAME}", line {e.lineno}\n'
+            f"    {(e.text or '').strip()}\n"
+            f"E   {message}\n"
+            f"1 error in 0.00s\n"
+        )
+        return _result(
+            EXIT_INTERRUPTED,
+            logs,
+            tests=[],
+            collection_errors=[
+                {
+                    "nodeid": TEST_FILE_NAME,
+                    "error_type": error_type,
+                    "file": TEST_FILE_NAME,
+                    "message": message,
+                }
+            ],
+            rule="syntax_error",
+        )
+
+    if not _may_define_tests(tree):
+        return _result(
+            EXIT_NO_TESTS_COLLECTED,
+            "no tests ran in 0.00s\n",
+            tests=[],
+            collection_errors=[],
+            rule="no_tests",
+        )
+
+    if any(name in _NON_FAILING_NAMES for name in _names([tree])):
+        # skip/xfail 마커나 pytest.skip() 호출이 결과를 바꿀 수 있음
+        return None
+
+    blocked = blocked_modules()
+    for name, function in collected_test_functions(tree).items():
+        if isinstance(function, ast.AsyncFunctionDef):
+            # 플러그인 없이 async 테스트는 실행되지 않고 skip 처리됨
+            continue
+        statement = _blocked_import(function, blocked)
+        if statement is None:
+            continue
+        module = _imported_module(statement, blocked)
+        nodeid = f"{TEST_FILE_NAME}::{name}"
+        message = f"ImportError: Import of '{module}' is not allowed for security reasons"
+        logs = (
+            f"F\n_ {function.name} _\n"
+            f"E   {message}\n"
+            f"{TEST_FILE_NAME}:{statement.lineno}: ImportError\n"
+            f"1 failed in 0.00s\n"
+        )
+        return _result(
+            EXIT_TESTS_FAILED,
+            logs,
+            tests=[
+                {
+                    "nodeid": nodeid,
+                    "outcome": "failed",
+                    "duration": 0.0,
+                    "error_type": "ImportError",
+                    "file": TEST_FILE_NAME,
+                    "message": message,
+                }
+            ],
+            collection_errors=[],
+            rule="blocked_import",
+        )
+
+    return None
@@ -0,0 +1,94 @@
+"""Maintenance tasks for Celery Beat."""
+
+import logging
+
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.models.db import SessionLocal
+from app.repositories.problem_repository import ProblemRepository
+from app.services.problem_bundle import collect_bundle_garbage
+from app.services.problem_stats import get_problem_stats_accumulator
+from app.services.submission_service import SubmissionService
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(
+    name="app.workers.maintenance_tasks.flush_problem_stats",
+    bind=True,
+    max_retries=0,
+    ignore_result=True,
+)
+def flush_problem_stats(self):
+    """
+    Redis에 누적된 문제별 채점 통계를 problems 행에 반영합니다.
+
+    Celery Beat에 의해 주기적으로 실행됨.
+    """
+    if not (settings.JUDGE_RUNTIME_PROFILE_ENABLED or settings.JUDGE_TEST_KILL_STATS_ENABLED):
+        return {"status": "disabled"}
+
+    db = SessionLocal()
+    try:
+        flushed = get_problem_stats_accumulator().flush(db)
+        if flushed:
+            logger.info(f"[PROBLEM_STATS_FLUSHED] problems={flushed}")
+        return {"status": "ok", "problems": flushed}
+    except Exception as e:
+        logger.error(f"[PROBLEM_STATS_FLUSH_ERROR] {type(e).__name__}: {str(e)}")
+        return {"status": "error", "error": str(e)}
+    finally:
+        db.close()
+
+
+@celery_app.task(
+    name="app.workers.maintenance_tasks.expire_stale_feedback",
+    bind=True,
+    max_retries=0,
+    ignore_result=True,
+)
+def expire_stale_feedback(self):
+    """
+    AI 피드백 태스크가 유실되어 generating_feedback에 머문 제출을 완료 처리합니다.
+
+    Celery Beat에 의해 주기적으로 실행됨.
+    """
+    db = SessionLocal()
+    try:
+        expired = SubmissionService(db).expire_stale_feedback(settings.AI_FEEDBACK_STALE_SECONDS)
+        if expired:
+            logger.warning(f"[AI_FEEDBACK_EXPIRED] submissions={expired}")
+        return {"status": "ok", "expired": expired}
+    except Exception as e:
+        db.rollback()
+        logger.error(f"[AI_FEEDBACK_EXPIRE_ERROR] {type(e).__name__}: {str(e)}")
+        return {"status": "error", "error": str(e)}
+    finally:
+        db.close()
+
+
+@celery_app.task(
+    name="app.workers.maintenance_tasks.collect_judge_bundle_garbage",
+    bind=True,
+    max_retries=0,
+    ignore_result=True,
+)
+def collect_judge_bundle_garbage(self):
+    """
+    현재 문제/Mutant의 대상 코드에 해당하지 않는 채점 대상 번들을 삭제합니다.
+
+    Celery Beat에 의해 주기적으로 실행됨. JUDGE_BUNDLE_DIR을 마운트한 워커에서 처리해야 합니다.
+    """
+    if not settings.JUDGE_BUNDLE_ENABLED:
+        return {"status": "disabled"}
+
+    db = SessionLocal()
+    try:
+        target_codes = ProblemRepository(db).get_target_codes()
+    finally:
+        db.close()
+
+    removed = collect_bundle_garbage(target_codes, settings.JUDGE_BUNDLE_GC_GRACE_SECONDS)
+    if removed:
+        logger.info(f"[BUNDLE_GC] removed={removed}")
+    return {"status": "ok", "removed": removed}
@@ -1,13 +1,20 @@
 """Celery tasks for processing submissions."""
 
+from typing import Optional, Tuple
 from uuid import UUID
 import logging
 
+from celery.signals import worker_ready
 from sqlalchemy.orm import Session
 
-from app.core.celery_app import celery_app
+from app.core.celery_app import PRIORITY_RETRY, celery_app, grading_queue
+from app.core.config import settings
 from app.core.sentry import init_sentry, capture_exception_with_context
 from app.models.db import SessionLocal
+from app.repositories.submission_repository import SubmissionRepository
+from app.services.container_reaper import sweep_stale_judge_resources
+from app.services.fair_share import get_fair_share_scheduler
+from app.services.submission_batcher import get_submission_batcher
 from app.services.submission_service import SubmissionService
 
 logger = logging.getLogger(__name__)
@@ -16,6 +23,50 @@ logger = logging.getLogger(__name__)
 init_sentry()
 
 
+@worker_ready.connect
+def cleanup_stale_judge_resources(sender=None, **kwargs) -> None:
+    """워커 시작 시 이전 프로세스가 남긴 judge 컨테이너와 임시 디렉토리를 정리합니다."""
+    try:
+        sweep_stale_judge_resources()
+    except Exception as e:
+        logger.warning(f"Stale judge 리소스 정리 실패: {type(e).__name__}: {str(e)}")
+
+
+def _dispatch_pending_submission(
+    lane: str, submission_id: str, problem_id: Optional[int]
+) -> Optional[Tuple[str, Optional[int]]]:
+    """
+    공정 분배 대기열에서 아직 PENDING인 다음 제출을 꺼냅니다.
+
+    dispatch가 Redis 오류로 태스크 자신의 제출을 돌려주면 그 항목은 대기열에 남고,
+    나중에 다른 태스크가 다시 꺼냅니다. 이미 채점 중이거나 끝난 제출은 건너뛰고
+    다음 항목을 꺼냅니다. 같은 제출을 두 번 채점하지 않고 태스크 수와 대기 항목 수도 맞게 유지됩니다.
+
+    Returns:
+        (제출 ID, 문제 ID). 채점할 제출이 없으면 None
+    """
+    scheduler = get_fair_share_scheduler()
+    db: Session = SessionLocal()
+    try:
+        repo = SubmissionRepository(db)
+        while True:
+            dispatched = scheduler.dispatch(lane, submission_id, problem_id)
+            if dispatched is None:
+                return None
+            status = repo.get_status(UUID(dispatched[0]))
+            if status is not None and status[0] == "PENDING":
+                return dispatched
+            logger.info(
+                f"Skipping dispatched submission {dispatched[0]} "
+                f"(status={status[0] if status else None})"
+            )
+            if dispatched[0] == submission_id:
+                # 자신의 제출(Redis 오류 시 반환)이 이미 채점됨
+                return None
+    finally:
+        db.close()
+
+
 @celery_app.task(
     bind=True,
     max_retries=3,
@@ -24,13 +75,36 @@ init_sentry()
     retry_backoff_max=600,  # 최대 재시도 간격 (10분)
     retry_jitter=True,  # 재시도 시간 랜덤화 (thundering herd 문제 방지)
 )
-def process_submission_task(self, submission_id: str) -> None:
+def process_submission_task(
+    self,
+    submission_id: str,
+    problem_id: Optional[int] = None,
+    is_member: bool = True,
+    fair_share: bool = False,
+) -> None:
     """
     Celery task to process a submission.
 
+    fair_share이면 자신의 제출 대신 제출자별 대기열에서 DRR 순서로 다음 제출을 가져와 채점합니다
+    (app.services.fair_share). 대기열이 비었으면 이 제출은 이미 다른 태스크가 채점한 것입니다.
+    PENDING이 아닌 제출(Redis 오류로 다른 태스크가 먼저 채점한 항목)은 건너뜁니다.
+
+    JUDGE_BATCH_ENABLED이면 같은 문제의 동시 제출과 배치로 묶어 채점합니다.
+    다른 태스크(배치 리더)가 이 제출을 가져간 경우 채점 없이 종료합니다.
+
     Args:
         submission_id: Submission ID as string (UUID)
+        problem_id: 제출의 문제 ID (배치 채점용, 없으면 단건 채점)
+        is_member: 회원 제출 여부 (큐 라우팅용, app.core.celery_app.route_submission_task)
+        fair_share: 제출이 공정 분배 대기열에 추가되었는지 여부
     """
+    if fair_share and not self.request.retries:
+        dispatched = _dispatch_pending_submission(grading_queue(is_member), submission_id, problem_id)
+        if dispatched is None:
+            logger.info(f"Submission {submission_id} already dispatched to another task")
+            return
+        submission_id, problem_id = dispatched
+
     submission_uuid = UUID(submission_id)
     logger.info(f"Starting Celery task for submission: {submission_uuid}")
 
@@ -38,7 +112,21 @@ def process_submission_task(self, submission_id: str) -> None:
     db: Session = SessionLocal()
     try:
         service = SubmissionService(db)
-        service.process_submission(submission_uuid)
+        # 재시도는 배치 없이 단건 채점
+        if settings.JUDGE_BATCH_ENABLED and problem_id is not None and not self.request.retries:
+            batch_ids = get_submission_batcher().join(
+                problem_id, submission_id, lane=grading_queue(is_member)
+            )
+            batch = [UUID(i) for i in batch_ids]
+            if not batch:
+                logger.info(f"Submission {submission_uuid} graded in another worker's batch")
+            elif len(batch) == 1:
+                service.process_submission(batch[0])
+            else:
+                logger.info(f"Grading batch of {len(batch)} submissions for problem {problem_id}")
+                service.process_batch(batch)
+        else:
+            service.process_submission(submission_uuid)
         logger.info(f"Successfully processed submission: {submission_uuid}")
     except Exception as e:
         # Sentry에 에러 보고 (컨텍스트 포함)
@@ -72,7 +160,13 @@ def process_submission_task(self, submission_id: str) -> None:
                 f"Retrying task for submission {submission_uuid} "
                 f"(attempt {self.request.retries + 1}/{self.max_retries})"
             )
-            raise self.retry(exc=e)
+            # 재시도는 이 태스크가 채점하던 제출을 다시 채점 (공정 분배 대기열을 거치지 않음)
+            raise self.retry(
+                exc=e,
+                priority=PRIORITY_RETRY,
+                args=[submission_id, problem_id],
+                kwargs={"is_member": is_member},
+            )
         else:
             logger.error(
                 f"Max retries reached for submission {submission_uuid}. "
@@ -96,3 +190,50 @@ def process_submission_task(self, submission_id: str) -> None:
                 )
     finally:
         db.close()
+
+
+@celery_app.task(bind=True)
+def generate_feedback_task(self, submission_id: str) -> None:
+    """
+    Celery task to generate AI feedback for a graded member submission.
+
+    채점 태스크가 점수를 저장한 뒤 피드백 큐에 등록합니다. LLM 호출은 네트워크 대기가
+    대부분이므로 채점 워커와 분리된 워커(스레드 풀)에서 실행합니다.
+
+    Args:
+        submission_id: Submission ID as string (UUID)
+    """
+    submission_uuid = UUID(submission_id)
+    db: Session = SessionLocal()
+    try:
+        SubmissionService(db).generate_submission_feedback(submission_uuid)
+    except Exception as e:
+        capture_exception_with_context(
+            e,
+            context={
+                "celery_task": {
+                    "task_id": self.request.id,
+                    "task_name": self.name,
+                    "submission_id": str(submission_uuid),
+                }
+            },
+            tags={
+                "task_name": "generate_feedback_task",
+                "submission_id": str(submission_uuid),
+            }
+        )
+        logger.error(
+            f"Error generating feedback for submission {submission_uuid}: {e}",
+            exc_info=True,
+        )
+        # 피드백 대기 상태로 남지 않도록 피드백 없이 완료 처리
+        try:
+            db.rollback()
+            SubmissionService(db).abandon_feedback(submission_uuid)
+        except Exception as finish_error:
+            logger.error(
+                f"Failed to finish feedback for submission {submission_uuid}: {finish_error}",
+                exc_info=True,
+            )
+    finally:
+        db.close()
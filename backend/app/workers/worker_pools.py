@@ -0,0 +1,98 @@
+"""
+Celery worker pools.
+
+큐별 워커 풀(소비 큐, 동시 실행 수, 풀 종류)을 정의하고 워커를 실행합니다.
+회원 채점, 게스트 채점, AI 피드백, 유지보수를 별도 풀로 띄우면
+게스트 제출 폭주나 LLM 지연이 회원 채점과 헬스 체크를 막지 않습니다.
+
+Usage:
+    python -m app.workers.worker_pools <pool> [추가 celery worker 옵션...]
+
+여러 큐를 소비하는 풀은 나열한 순서대로 큐를 비웁니다 (broker queue_order_strategy=priority).
+유지보수 큐를 소비하는 풀은 Celery Beat를 함께 실행하므로 배포당 하나만 띄워야 합니다.
+"""
+
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from app.core.celery_app import celery_app
+from app.core.config import settings
+
+
+@dataclass
+class WorkerPool:
+    """워커 풀 설정."""
+
+    queues: List[str]
+    concurrency: int
+    pool: str = "prefork"
+    # 주기 유지보수 태스크 스케줄러(Celery Beat)를 워커에 포함
+    beat: bool = False
+
+
+def worker_pools() -> Dict[str, WorkerPool]:
+    """풀 이름별 워커 풀 설정 (동시 실행 수는 settings)."""
+    member = settings.CELERY_QUEUE_MEMBER_GRADING
+    guest = settings.CELERY_QUEUE_GUEST_GRADING
+    return {
+        "grading_member": WorkerPool(
+            queues=[member],
+            concurrency=settings.CELERY_MEMBER_GRADING_CONCURRENCY,
+        ),
+        "grading_guest": WorkerPool(
+            queues=[guest],
+            concurrency=settings.CELERY_GUEST_GRADING_CONCURRENCY,
+        ),
+        # 단일 채점 워커 구성 (개발 환경): 회원 큐를 먼저 비우고 게스트/유지보수 큐 처리
+        "grading": WorkerPool(
+            queues=[member, guest, settings.CELERY_QUEUE_MAINTENANCE],
+            concurrency=settings.CELERY_MEMBER_GRADING_CONCURRENCY + settings.CELERY_GUEST_GRADING_CONCURRENCY,
+            beat=True,
+        ),
+        # LLM 호출은 네트워크 대기 위주이므로 스레드 풀
+        "feedback": WorkerPool(
+            queues=[settings.AI_FEEDBACK_QUEUE],
+            concurrency=settings.CELERY_FEEDBACK_CONCURRENCY,
+            pool="threads",
+        ),
+        # 기본 큐(task_default_queue)이자 Beat 태스크 큐
+        "maintenance": WorkerPool(
+            queues=[settings.CELERY_QUEUE_MAINTENANCE],
+            concurrency=settings.CELERY_MAINTENANCE_CONCURRENCY,
+            beat=True,
+        ),
+    }
+
+
+def worker_argv(name: str, extra_args: Optional[List[str]] = None) -> List[str]:
+    """
+    워커 풀의 celery worker 인자를 만듭니다.
+
+    Raises:
+        KeyError: 알 수 없는 풀 이름
+    """
+    pool = worker_pools()[name]
+    return [
+        "worker",
+        "--loglevel=info",
+        f"--hostname={name}@%h",
+        f"--queues={','.join(pool.queues)}",
+        f"--pool={pool.pool}",
+        f"--concurrency={pool.concurrency}",
+        *(["--beat", f"--schedule={settings.CELERY_BEAT_SCHEDULE_FILE}"] if pool.beat else []),
+        *(extra_args or []),
+    ]
+
+
+def main() -> None:
+    """명령행에서 지정한 워커 풀을 실행합니다."""
+    pools = worker_pools()
+    if len(sys.argv) < 2 or sys.argv[1] not in pools:
+        print(f"Usage: python -m app.workers.worker_pools <{'|'.join(pools)}> [celery worker options]")
+        sys.exit(2)
+    celery_app.worker_main(worker_argv(sys.argv[1], sys.argv[2:]))
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,7 @@ from sqlalchemy.orm import Session
 from app.models.db import SessionLocal
 from app.models.problem import Problem
 from app.models.buggy_implementation import BuggyImplementation
+from app.services.problem_bundle import build_problem_bundles
 
 
 def extract_title_from_description(description_md: str, function_signature: str) -> str:
@@ -89,6 +90,11 @@ def load_problem_from_json(json_path: str, problem_id: str, db: Session):
         )
         db.add(buggy_impl)
     
+    # 채점 대상 번들 준비 (JUDGE_BUNDLE_ENABLED)
+    build_problem_bundles(
+        problem.golden_code, [b.get('buggy_code', '') for b in buggy_impls]
+    )
+    
     print(f"✅ {problem_id} ({slug}) - '{title}' 로드 완료 ({len(buggy_impls)}개 buggy 구현)")
     return True
 
@@ -0,0 +1,125 @@
+"""Tests for batch grading fan-out and fallback to single grading."""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.config import settings
+from app.services.submission_service import SubmissionService
+
+PASSING_TEST = "from target import add\n\ndef test_add():\n    assert add(1, 1) == 2\n"
+
+
+def _submission(problem_id=1, code=PASSING_TEST):
+    return SimpleNamespace(id=uuid.uuid4(), problem_id=problem_id, code=code, status="PENDING", progress=None)
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """DB와 judge 실행을 mock으로 대체한 SubmissionService."""
+    monkeypatch.setattr(settings, "JUDGE_PRESCREEN_ENABLED", True)
+    service = SubmissionService.__new__(SubmissionService)
+    service.submissions = {}
+    service.submission_repo = MagicMock()
+    service.submission_repo.get_by_id.side_effect = lambda i: service.submissions.get(i)
+    service.problem_repo = MagicMock()
+    service.problem_repo.get_by_id.return_value = SimpleNamespace(id=1, golden_code="golden")
+    service.buggy_repo = MagicMock()
+    service.buggy_repo.get_by_problem_id.return_value = [
+        SimpleNamespace(id=7, buggy_code="mutant 7"),
+        SimpleNamespace(id=8, buggy_code="mutant 8"),
+    ]
+    service._judge_service = MagicMock()
+    service.process_submission = MagicMock()
+    return service
+
+
+def _add(service, *submissions):
+    for submission in submissions:
+        service.submissions[submission.id] = submission
+    return [submission.id for submission in submissions]
+
+
+def _precomputed(service):
+    return {
+        call.args[0]: call.kwargs["precomputed"]
+        for call in service.process_submission.call_args_list
+    }
+
+
+def test_golden_then_mutants_fan_out(service):
+    """Golden을 통과한 제출만 Mutant 배치에 포함되고 결과가 제출별로 나뉩니다."""
+    passing, failing = _submission(), _submission()
+    ids = _add(service, passing, failing)
+    golden = {
+        f"golden__{passing.id.hex}": {"all_tests_passed": True},
+        f"golden__{failing.id.hex}": {"all_tests_passed": False},
+    }
+    mutants = {
+        f"mutant_{mutant_id}__{passing.id.hex}": {"exit_code": mutant_id}
+        for mutant_id in (7, 8)
+    }
+    service.judge_service.run_pytest_batch.side_effect = [golden, mutants]
+
+    service.process_batch(ids)
+
+    golden_runs, mutant_runs = (
+        call.args[0] for call in service.judge_service.run_pytest_batch.call_args_list
+    )
+    assert golden_runs == {
+        f"golden__{passing.id.hex}": ("golden", PASSING_TEST),
+        f"golden__{failing.id.hex}": ("golden", PASSING_TEST),
+    }
+    assert mutant_runs == {
+        f"mutant_7__{passing.id.hex}": ("mutant 7", PASSING_TEST),
+        f"mutant_8__{passing.id.hex}": ("mutant 8", PASSING_TEST),
+    }
+    assert _precomputed(service) == {
+        passing.id: {
+            "golden": {"all_tests_passed": True},
+            "mutant_7": {"exit_code": 7},
+            "mutant_8": {"exit_code": 8},
+        },
+        failing.id: {"golden": {"all_tests_passed": False}},
+    }
+    assert [call.args[0] for call in service.process_submission.call_args_list] == ids
+
+
+def test_batch_failure_falls_back_to_single_grading(service):
+    """배치 실행이 실패하면 모든 제출을 단건으로 채점합니다."""
+    ids = _add(service, _submission(), _submission())
+    service.judge_service.run_pytest_batch.side_effect = RuntimeError("container failed")
+
+    service.process_batch(ids)
+
+    assert _precomputed(service) == {submission_id: None for submission_id in ids}
+
+
+def test_prescreen_rejected_submission_is_graded_alone(service):
+    """사전 검사에서 거부된 제출은 배치에서 빠지고 단건으로 채점합니다."""
+    batched, rejected = _submission(), _submission(code="def helper():\n    pass\n")
+    ids = _add(service, batched, rejected)
+    service.judge_service.run_pytest_batch.side_effect = [
+        {f"golden__{batched.id.hex}": {"all_tests_passed": False}},
+    ]
+
+    service.process_batch(ids)
+
+    (golden_runs,), _ = service.judge_service.run_pytest_batch.call_args
+    assert list(golden_runs) == [f"golden__{batched.id.hex}"]
+    assert _precomputed(service) == {
+        batched.id: {"golden": {"all_tests_passed": False}},
+        rejected.id: None,
+    }
+
+
+def test_mixed_problems_are_not_batched(service):
+    """서로 다른 문제의 제출은 배치로 실행하지 않습니다."""
+    ids = _add(service, _submission(problem_id=1), _submission(problem_id=2))
+
+    service.process_batch(ids)
+
+    service.judge_service.run_pytest_batch.assert_not_called()
+    assert _precomputed(service) == {submission_id: None for submission_id in ids}
@@ -0,0 +1,48 @@
+"""Tests for bounded judge output buffering."""
+
+from app.services.judge_backend import TRUNCATION_MARKER, BoundedOutput
+
+
+def test_output_within_limit_is_kept():
+    """상한 이하의 출력은 그대로 보관합니다."""
+    output = BoundedOutput(max_bytes=16)
+    for chunk in (b"hello ", b"", b"world"):
+        output.feed(chunk)
+
+    assert output.truncated is False
+    assert output.total_bytes == 11
+    assert output.getvalue() == "hello world"
+
+
+def test_output_over_limit_keeps_head_and_tail():
+    """상한을 넘으면 앞부분과 뒷부분만 남기고 버린 크기를 표시합니다."""
+    output = BoundedOutput(max_bytes=10)
+    output.feed(b"HEAD-")
+    for _ in range(100):
+        output.feed(b"x" * 7)
+    output.feed(b"-TAIL")
+
+    value = output.getvalue()
+    assert output.truncated is True
+    assert output.total_bytes == 710
+    assert value == "HEAD-" + TRUNCATION_MARKER.format(omitted=700) + "-TAIL"
+
+
+def test_tail_buffer_stays_bounded():
+    """뒷부분 버퍼는 청크 수와 무관하게 상한의 두 배를 넘지 않습니다."""
+    output = BoundedOutput(max_bytes=8)
+    for _ in range(1000):
+        output.feed(b"y" * 3)
+
+    assert len(output._tail) <= 2 * output.tail_limit + 3
+    assert output.getvalue().endswith("yyyy")
+
+
+def test_multibyte_characters_split_across_chunks():
+    """청크 경계에서 나뉜 UTF-8 문자도 상한 이하이면 온전히 복원됩니다."""
+    encoded = "가나다".encode("utf-8")
+    output = BoundedOutput(max_bytes=64)
+    output.feed(encoded[:2])
+    output.feed(encoded[2:])
+
+    assert output.getvalue() == "가나다"
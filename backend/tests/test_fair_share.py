@@ -0,0 +1,82 @@
+"""Tests for per-submitter fair-share (DRR) dispatch order and cancellation."""
+
+import uuid
+
+import pytest
+import redis
+
+from app.services.fair_share import FairShareScheduler
+from app.services.judge_cache import get_judge_cache_redis_url
+
+
+@pytest.fixture
+def scheduler():
+    """테스트 전용 lane을 쓰는 스케줄러 (Redis가 없으면 건너뜀)."""
+    scheduler = FairShareScheduler(redis_url=get_judge_cache_redis_url(), quantum=1)
+    try:
+        scheduler.redis_client.ping()
+    except redis.RedisError:
+        pytest.skip("Redis를 사용할 수 없음")
+    scheduler.lane = f"test-{uuid.uuid4().hex}"
+    yield scheduler
+    keys = scheduler.redis_client.keys(f"{scheduler.REDIS_KEY_PREFIX}{scheduler.lane}:*")
+    if keys:
+        scheduler.redis_client.delete(*keys)
+
+
+def _drain(scheduler):
+    order = []
+    while True:
+        item = scheduler.dispatch(scheduler.lane, "self", None)
+        if item is None:
+            return order
+        order.append(item[0])
+
+
+def _active(scheduler):
+    return [key.decode() for key in scheduler.redis_client.lrange(scheduler._active_key(scheduler.lane), 0, -1)]
+
+
+def test_burst_submitter_does_not_block_others(scheduler):
+    """연속으로 제출한 제출자가 있어도 다른 제출자의 제출이 차례대로 끼어듭니다."""
+    for index in range(3):
+        scheduler.enqueue(scheduler.lane, "user:a", f"a{index}", 1)
+    scheduler.enqueue(scheduler.lane, "user:b", "b0", 1)
+
+    assert _drain(scheduler) == ["a0", "b0", "a1", "a2"]
+    assert _active(scheduler) == []
+
+
+def test_cost_is_charged_against_deficit(scheduler):
+    """비용이 큰 제출은 deficit이 쌓일 때까지 다른 제출자에게 차례를 넘깁니다."""
+    scheduler.enqueue(scheduler.lane, "user:a", "heavy", 1, cost=3)
+    for index in range(3):
+        scheduler.enqueue(scheduler.lane, "user:b", f"b{index}", 1)
+
+    assert _drain(scheduler) == ["b0", "b1", "heavy", "b2"]
+
+
+def test_cancel_removes_emptied_submitter_from_ring(scheduler):
+    """취소로 대기열이 빈 제출자는 순환 목록에서 빠져 다음 제출 때 한 번만 추가됩니다."""
+    scheduler.enqueue(scheduler.lane, "user:a", "a0", 1)
+    scheduler.cancel(scheduler.lane, "user:a", "a0", 1)
+    assert _active(scheduler) == []
+    assert scheduler.depths(scheduler.lane) == {}
+
+    scheduler.enqueue(scheduler.lane, "user:b", "b0", 1)
+    scheduler.enqueue(scheduler.lane, "user:a", "a1", 1)
+    scheduler.enqueue(scheduler.lane, "user:a", "a2", 1)
+    assert _active(scheduler) == ["user:b", "user:a"]
+    assert scheduler.depths(scheduler.lane) == {"user:b": 1, "user:a": 2}
+
+    assert _drain(scheduler) == ["b0", "a1", "a2"]
+
+
+def test_cancel_keeps_submitter_with_remaining_items(scheduler):
+    """대기 항목이 남은 제출자는 취소 후에도 순환 목록에 남습니다."""
+    scheduler.enqueue(scheduler.lane, "user:a", "a0", 1)
+    scheduler.enqueue(scheduler.lane, "user:a", "a1", 1)
+    scheduler.cancel(scheduler.lane, "user:a", "a0", 1)
+
+    assert _active(scheduler) == ["user:a"]
+    assert _drain(scheduler) == ["a1"]
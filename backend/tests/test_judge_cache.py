@@ -0,0 +1,79 @@
+"""Tests for judge result cache keys and cacheability."""
+
+import pytest
+
+from app.services.judge_cache import JudgeResultCache, is_cacheable
+
+BASE_KEY_ARGS = {
+    "target_code": "def add(a, b):\n    return a + b\n",
+    "test_code": "from target import add\n\ndef test_add():\n    assert add(1, 1) == 2\n",
+    "runtime_files": "conftest.py:...\0multi_runner.py:...",
+    "image_digest": "docker:sha256:abc",
+    "timeout": 5.0,
+}
+
+
+def test_same_inputs_make_same_key():
+    """같은 입력은 항상 같은 키를 만듭니다."""
+    assert JudgeResultCache.make_key(**BASE_KEY_ARGS) == JudgeResultCache.make_key(**BASE_KEY_ARGS)
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("target_code", "def add(a, b):\n    return a - b\n"),
+        ("test_code", "def test_nothing():\n    pass\n"),
+        ("runtime_files", "conftest.py:changed"),
+        ("image_digest", "sandbox:/usr/bin/python3:3.11.7"),
+        ("timeout", 10.0),
+    ],
+)
+def test_every_field_changes_key(field, value):
+    """키 구성 요소 중 하나만 달라도 다른 키가 됩니다."""
+    changed = {**BASE_KEY_ARGS, field: value}
+    assert JudgeResultCache.make_key(**changed) != JudgeResultCache.make_key(**BASE_KEY_ARGS)
+
+
+def test_field_boundaries_do_not_collide():
+    """필드 경계를 옮긴 입력은 이어 붙인 문자열이 같아도 다른 키가 됩니다."""
+    left = {**BASE_KEY_ARGS, "target_code": "ab", "test_code": "c"}
+    right = {**BASE_KEY_ARGS, "target_code": "a", "test_code": "bc"}
+    assert JudgeResultCache.make_key(**left) != JudgeResultCache.make_key(**right)
+
+
+def test_missing_runtime_files_equal_empty():
+    """런타임 파일이 없으면 빈 문자열과 같은 키를 사용합니다."""
+    assert JudgeResultCache.make_key(**{**BASE_KEY_ARGS, "runtime_files": None}) == (
+        JudgeResultCache.make_key(**{**BASE_KEY_ARGS, "runtime_files": ""})
+    )
+
+
+@pytest.mark.parametrize(
+    "result, expected",
+    [
+        ({"exit_code": 0}, True),
+        ({"exit_code": 1}, True),
+        ({"exit_code": 5}, True),
+        ({"exit_code": -1}, False),
+        ({}, False),
+    ],
+)
+def test_is_cacheable(result, expected):
+    """pytest 종료 코드만 캐시하고 타임아웃/시스템 오류(-1)는 캐시하지 않습니다."""
+    assert is_cacheable(result) is expected
+
+
+def test_local_cache_returns_copies_and_evicts_oldest():
+    """in-process 캐시는 복사본을 반환하고 최대 항목 수를 넘으면 오래된 항목을 버립니다."""
+    cache = JudgeResultCache(redis_url=None, local_max_entries=2)
+    cache.set("a", {"exit_code": 0, "tests": []})
+
+    hit = cache.get("a")
+    hit["tests"].append("mutated")
+    assert cache.get("a") == {"exit_code": 0, "tests": []}
+
+    cache.set("b", {"exit_code": 1})
+    cache.set("c", {"exit_code": 1})
+    assert cache.get("a") is None
+    assert cache.get("c") == {"exit_code": 1}
+    assert cache.stats()["local_entries"] == 2
@@ -0,0 +1,74 @@
+"""Tests for building and decoding test-by-mutant kill matrices."""
+
+from app.services.kill_matrix import (
+    KILLED,
+    NOT_RUN,
+    SURVIVED,
+    build_kill_matrix,
+    decode_kill_matrix,
+)
+
+
+def _tests(*outcomes):
+    return [
+        {"nodeid": f"test_user.py::{name}", "outcome": outcome}
+        for name, outcome in outcomes
+    ]
+
+
+GOLDEN = {"tests": _tests(("test_a", "passed"), ("test_b", "passed"), ("test_c", "passed"))}
+
+
+def test_round_trip_with_not_run_cells():
+    """killed/survived/not_run 셀이 비트셋을 거쳐 그대로 복원됩니다."""
+    mutant_logs = [
+        # --maxfail=1: test_a에서 kill 되어 나머지는 실행되지 않음
+        {"mutant_id": 11, "result": {"tests": _tests(("test_a", "failed"))}},
+        # 모든 테스트 통과
+        {"mutant_id": 12, "result": {"tests": _tests(
+            ("test_a", "passed"), ("test_b", "passed"), ("test_c", "passed"),
+        )}},
+        # 두 번째 테스트의 setup 오류
+        {"mutant_id": 13, "result": {"tests": _tests(("test_a", "passed"), ("test_b", "error"))}},
+        # 타임아웃 등으로 테스트별 결과 없음
+        {"mutant_id": 14, "result": {"exit_code": -1}},
+        # 실행하지 않고 survived 처리
+        {"mutant_id": 15, "result": {"not_reached": True}},
+    ]
+
+    matrix = build_kill_matrix(GOLDEN, mutant_logs)
+    decoded = decode_kill_matrix(
+        matrix["test_names"], matrix["mutant_ids"], matrix["killed"], matrix["executed"]
+    )
+
+    assert matrix["test_names"] == ["test_a", "test_b", "test_c"]
+    assert matrix["mutant_ids"] == [11, 12, 13, 14, 15]
+    assert len(matrix["killed"]) == len(matrix["executed"]) == 2
+    assert decoded == {
+        "test_a": {11: KILLED, 12: SURVIVED, 13: SURVIVED, 14: NOT_RUN, 15: SURVIVED},
+        "test_b": {11: NOT_RUN, 12: SURVIVED, 13: KILLED, 14: NOT_RUN, 15: SURVIVED},
+        "test_c": {11: NOT_RUN, 12: SURVIVED, 13: NOT_RUN, 14: NOT_RUN, 15: SURVIVED},
+    }
+
+
+def test_parametrized_rows_and_unknown_tests():
+    """parametrize 테스트는 행으로 구분하고 Golden에 없는 테스트 결과는 무시합니다."""
+    golden = {"tests": _tests(("test_p[1]", "passed"), ("test_p[2]", "passed"))}
+    mutant_logs = [
+        {"mutant_id": 1, "result": {"tests": _tests(
+            ("test_p[1]", "passed"), ("test_p[2]", "failed"), ("test_other", "failed"),
+        )}},
+    ]
+
+    matrix = build_kill_matrix(golden, mutant_logs)
+    decoded = decode_kill_matrix(
+        matrix["test_names"], matrix["mutant_ids"], matrix["killed"], matrix["executed"]
+    )
+
+    assert decoded == {"test_p[1]": {1: SURVIVED}, "test_p[2]": {1: KILLED}}
+
+
+def test_no_golden_tests_builds_nothing():
+    """Golden 테스트별 결과가 없으면 행렬을 만들지 않습니다."""
+    assert build_kill_matrix({"tests": []}, [{"mutant_id": 1, "result": {}}]) is None
+    assert build_kill_matrix({}, []) is None
@@ -0,0 +1,79 @@
+"""Tests for detecting test code that cannot share one import across schema variants."""
+
+import pytest
+
+from app.services.mutant_schema import is_schema_safe_test_code
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "from target import add\n\ndef test_add():\n    assert add(2, 2) == 4\n",
+        "import target\n\ndef test_add():\n    assert target.add(2, 2) == 4\n",
+        "import pytest\nfrom target import add\n\n"
+        "@pytest.mark.parametrize('a,b', [(1, 2), (3, 4)])\n"
+        "def test_add(a, b):\n    assert add(a, b) == a + b\n",
+        "from target import Stack\n\nclass TestStack:\n    def test_push(self):\n        assert Stack().push(1) is None\n",
+        "from target import add\n\nif True:\n    def test_add():\n        assert add(1, 1) == 2\n",
+        # 읽기만 하는 모듈 수준 케이스 목록과 테스트 안의 지역 객체
+        "import pytest\nfrom target import add\n\nCASES = [(1, 2, 3), (2, 2, 4)]\n\n"
+        "@pytest.mark.parametrize('a,b,expected', CASES)\n"
+        "def test_add(a, b, expected):\n    assert add(a, b) == expected\n",
+        "from target import Stack\n\ndef test_push():\n    s = Stack()\n    s.items = []\n"
+        "    seen = {}\n    seen['a'] = s.push(1)\n    assert s.items == [1]\n",
+    ],
+)
+def test_runtime_only_references_are_safe(code):
+    """target 호출이 테스트 본문 안에만 있으면 schema 모드를 사용할 수 있습니다."""
+    assert is_schema_safe_test_code(code) is True
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        # 모듈 상수
+        "from target import add\n\nEXPECTED = add(2, 2)\n\ndef test_add():\n    assert add(2, 2) == EXPECTED\n",
+        # parametrize 인자
+        "import pytest\nfrom target import add\n\n"
+        "@pytest.mark.parametrize('v', [add(1, 1)])\n"
+        "def test_add(v):\n    assert add(1, 1) == v\n",
+        # 모듈 별칭 / 기본 인자
+        "import target as t\n\ndef test_add(v=t.add(1, 1)):\n    assert v == 2\n",
+        # 클래스 본문
+        "from target import add\n\nclass TestAdd:\n    expected = add(1, 1)\n\n"
+        "    def test_add(self):\n        assert add(1, 1) == self.expected\n",
+        # 로컬 헬퍼를 통한 간접 호출
+        "import pytest\nfrom target import add\n\ndef cases():\n    return [add(1, 1)]\n\n"
+        "@pytest.mark.parametrize('v', cases())\ndef test_add(v):\n    assert v == 2\n",
+        # 판단할 수 없는 임포트와 수집 훅
+        "from target import *\n\ndef test_add():\n    assert add(1, 1) == 2\n",
+        "import importlib\n\ndef test_add():\n    assert importlib.import_module('target').add(1, 1) == 2\n",
+        "def pytest_collection_modifyitems(items):\n    pass\n\ndef test_a():\n    pass\n",
+        "def test_a(:\n    pass\n",
+        # 변형 사이에 target 결과를 남기는 캐시
+        "import functools\nfrom target import add\n\n@functools.lru_cache(maxsize=None)\n"
+        "def expected(a, b):\n    return add(a, b)\n\ndef test_add():\n    assert add(1, 1) == expected(1, 1)\n",
+        "from functools import cache\nfrom target import add\n\n@cache\n"
+        "def expected():\n    return add(1, 1)\n\ndef test_add():\n    assert add(1, 1) == expected()\n",
+        "from target import add\n\nSEEN = {}\n\ndef test_add():\n"
+        "    SEEN.setdefault('v', add(1, 1))\n    assert add(1, 1) == SEEN['v']\n",
+        "from target import add\n\nRESULTS = []\n\ndef test_add():\n"
+        "    RESULTS.append(add(1, 1))\n    assert RESULTS[0] == add(1, 1)\n",
+        "from target import add\n\ndef test_add(memo={}):\n"
+        "    memo.setdefault('v', add(1, 1))\n    assert memo['v'] == add(1, 1)\n",
+        "from target import add\n\nclass TestAdd:\n    seen = []\n\n"
+        "    def test_add(self):\n        self.seen.append(add(1, 1))\n        assert self.seen[0] == add(1, 1)\n",
+        "from target import add\n\nFIRST = None\n\ndef test_add():\n"
+        "    global FIRST\n    FIRST = FIRST or add(1, 1)\n    assert FIRST == add(1, 1)\n",
+        # 변형 선택이나 schema 모듈 내부를 들여다보는 코드
+        "import os\nfrom target import add\n\ndef test_add():\n"
+        "    assert os.environ.get('QA_ARENA_VARIANT', 'golden') == 'golden' or add(1, 1) == 2\n",
+        "import target\n\ndef test_add():\n    assert target.add.__wrapped__(1, 1) == 2\n",
+        "import target\n\ndef test_add():\n    assert getattr(target, 'add')(1, 1) == 2\n",
+        "import target\n\ndef test_add():\n    assert '_qa_add__0' not in dir(target)\n",
+        "def test_source():\n    assert 'golden' in open('target.py').read()\n",
+    ],
+)
+def test_import_time_references_fall_back(code):
+    """target 결과가 고정·공유되거나 변형을 구분할 수 있는 코드는 대상별 실행으로 돌아갑니다."""
+    assert is_schema_safe_test_code(code) is False
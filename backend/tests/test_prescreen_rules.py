@@ -0,0 +1,92 @@
+"""Tests for static pre-screening of user test code."""
+
+import pytest
+
+from app.services.test_prescreen import (
+    EXIT_INTERRUPTED,
+    EXIT_NO_TESTS_COLLECTED,
+    EXIT_TESTS_FAILED,
+    prescreen_test_code,
+)
+
+
+def test_syntax_error_is_rejected():
+    """문법 오류는 수집 오류로 처리됩니다."""
+    result = prescreen_test_code("def test_a(:\n    pass\n")
+
+    assert result["prescreen"] == "syntax_error"
+    assert result["exit_code"] == EXIT_INTERRUPTED
+    assert result["collection_errors"][0]["error_type"] == "SyntaxError"
+    assert result["all_tests_passed"] is False
+
+
+def test_no_tests_is_rejected():
+    """수집될 테스트가 없으면 종료 코드 5 결과를 반환합니다."""
+    result = prescreen_test_code("from target import add\n\ndef helper():\n    return add(1, 2)\n")
+
+    assert result["prescreen"] == "no_tests"
+    assert result["exit_code"] == EXIT_NO_TESTS_COLLECTED
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "def test_a():\n    assert True\n",
+        "async def test_a():\n    assert True\n",
+        "class TestAdd:\n    def test_a(self):\n        assert True\n",
+        "import sys\nif sys.version_info >= (3, 8):\n    def test_a():\n        assert True\n",
+        "try:\n    def test_a():\n        assert True\nexcept Exception:\n    pass\n",
+        "from helpers import test_shared\n",
+        "from helpers import *\n",
+        "def _make():\n    return lambda: None\ntest_generated = _make()\n",
+        "setattr(__import__(__name__), 'test_x', lambda: None)\n",
+    ],
+)
+def test_code_that_may_define_tests_is_not_rejected_as_no_tests(code):
+    """테스트를 정의할 가능성이 있는 코드는 no_tests로 거부하지 않습니다."""
+    result = prescreen_test_code(code)
+
+    assert result is None or result["prescreen"] != "no_tests"
+
+
+def test_unconditional_blocked_import_is_rejected():
+    """테스트 본문에서 무조건 실행되는 차단 모듈 임포트는 실패로 처리됩니다."""
+    result = prescreen_test_code("def test_a():\n    import os\n    assert os.getcwd()\n")
+
+    assert result["prescreen"] == "blocked_import"
+    assert result["exit_code"] == EXIT_TESTS_FAILED
+    assert result["tests"][0]["nodeid"] == "test_user.py::test_a"
+    assert result["tests"][0]["error_type"] == "ImportError"
+
+
+def test_blocked_from_import_in_test_method_is_rejected():
+    """Test 클래스 메서드의 from-import도 검사합니다."""
+    result = prescreen_test_code(
+        "class TestA:\n    def test_a(self):\n        from subprocess import run\n"
+    )
+
+    assert result["prescreen"] == "blocked_import"
+    assert result["tests"][0]["nodeid"] == "test_user.py::TestA::test_a"
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        # 조건문 안의 임포트는 실행 여부를 알 수 없음
+        "def test_a():\n    if False:\n        import os\n",
+        # return 이후의 임포트는 실행되지 않음
+        "def test_a():\n    return\n    import os\n",
+        # skip 마커가 있으면 결과가 바뀔 수 있음
+        "import pytest\n\n@pytest.mark.skip\ndef test_a():\n    import os\n",
+        # 생성자가 있는 클래스는 수집되지 않음
+        "class TestA:\n    def __init__(self):\n        pass\n    def test_a(self):\n        import os\n",
+    ],
+)
+def test_blocked_import_rule_is_conservative(code):
+    """실패가 확실하지 않은 코드는 정상 채점으로 넘깁니다."""
+    assert prescreen_test_code(code) is None
+
+
+def test_valid_test_code_passes_through():
+    """정상적인 테스트 코드는 None을 반환합니다."""
+    assert prescreen_test_code("from target import add\n\ndef test_add():\n    assert add(1, 2) == 3\n") is None
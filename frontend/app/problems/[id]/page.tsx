@@ -6,7 +6,12 @@ import { useEffect, useState, useRef, useCallback } from "react";
 import { useParams } from "next/navigation";
 import { Code2, FileText, Info, Bot } from "lucide-react";
 import { getProblem } from "@/lib/api/problems";
-import { createSubmission, getSubmission } from "@/lib/api/submissions";
+import {
+  createSubmission,
+  getSubmission,
+  isSubmissionInProgress,
+  subscribeSubmissionEvents,
+} from "@/lib/api/submissions";
 import { ApiError } from "@/lib/api";
 import { useSubmit } from "@/hooks/useSubmit";
 import type { Problem, Submission } from "@/types/problem";
@@ -28,6 +33,11 @@ import AICoachMobileDrawer from "@/components/AICoachMobileDrawer";
 import TagChips from "@/components/TagChips";
 import Link from "next/link";
 
+// 채점 결과를 기다리는 최대 시간 (5분)
+const SUBMISSION_MAX_WAIT = 5 * 60 * 1000;
+const SUBMISSION_DELAYED_MESSAGE =
+  "채점이 5분 이상 지연되고 있습니다. 서버에 문제가 있을 수 있습니다. 잠시 후 다시 시도해주세요.";
+
 export default function ProblemDetailPage() {
   const params = useParams();
   const problemId = parseInt(params.id as string);
@@ -38,6 +48,8 @@ export default function ProblemDetailPage() {
   const [code, setCode] = useState("");
   const [submission, setSubmission] = useState<Submission | null>(null);
   const [submissionError, setSubmissionError] = useState<string | null>(null);
+  // 이벤트 스트림(SSE)을 쓸 수 없으면 폴링으로 결과 확인
+  const [eventStreamUnavailable, setEventStreamUnavailable] = useState(false);
   const [isScoringDrawerOpen, setIsScoringDrawerOpen] = useState(false);
   const [isMobileDrawerOpen, setIsMobileDrawerOpen] = useState(false);
   const [isEditorVisible, setIsEditorVisible] = useState(false);
@@ -107,10 +119,39 @@ from target import ${functionName}
     fetchProblem();
   }, [problemId]);
 
-  // Polling for submission result with exponential backoff
+  // 채점 중이거나 AI 피드백을 기다리는 제출 ID (이벤트 스트림 구독 대상)
+  const activeSubmissionId =
+    submission && isSubmissionInProgress(submission) ? submission.id : null;
+
+  // Server-sent events for submission progress and result
+  useEffect(() => {
+    if (!activeSubmissionId || eventStreamUnavailable) {
+      return;
+    }
+
+    const unsubscribe = subscribeSubmissionEvents(activeSubmissionId, {
+      onProgress: (progress) =>
+        setSubmission((prev) =>
+          prev && prev.id === activeSubmissionId ? { ...prev, progress } : prev
+        ),
+      onSubmission: (updated) => setSubmission(updated),
+      onUnavailable: () => setEventStreamUnavailable(true),
+    });
+    const maxWaitTimeout = setTimeout(() => {
+      unsubscribe();
+      setSubmissionError(SUBMISSION_DELAYED_MESSAGE);
+    }, SUBMISSION_MAX_WAIT);
+
+    return () => {
+      clearTimeout(maxWaitTimeout);
+      unsubscribe();
+    };
+  }, [activeSubmissionId, eventStreamUnavailable]);
+
+  // Polling fallback (event stream unavailable) with exponential backoff
   useEffect(() => {
     // 폴링이 필요 없는 상태면 정리
-    if (!submission || (submission.status !== "PENDING" && submission.status !== "RUNNING")) {
+    if (!submission || !isSubmissionInProgress(submission) || !eventStreamUnavailable) {
       if (pollingTimeoutRef.current) {
         clearTimeout(pollingTimeoutRef.current);
         pollingTimeoutRef.current = null;
@@ -131,17 +172,14 @@ from target import ${functionName}
     }
 
     // 최대 타임아웃 설정 (5분)
-    const POLLING_MAX_TIMEOUT = 5 * 60 * 1000; // 5분
     pollingMaxTimeoutRef.current = setTimeout(() => {
       if (pollingTimeoutRef.current) {
         clearTimeout(pollingTimeoutRef.current);
         pollingTimeoutRef.current = null;
       }
-      setSubmissionError(
-        "채점이 5분 이상 지연되고 있습니다. 서버에 문제가 있을 수 있습니다. 잠시 후 다시 시도해주세요."
-      );
+      setSubmissionError(SUBMISSION_DELAYED_MESSAGE);
       pollingStartTimeRef.current = null;
-    }, POLLING_MAX_TIMEOUT);
+    }, SUBMISSION_MAX_WAIT);
 
     // 지수 백오프 간격 계산: 2초 → 4초 → 8초 → 16초 → 32초
     const getBackoffInterval = (errorCount: number) => {
@@ -159,7 +197,7 @@ from target import ${functionName}
           pollingErrorCountRef.current = 0;
 
           // 아직 폴링이 필요하면 다음 폴링 예약 (기본 간격으로)
-          if (updatedSubmission.status === "PENDING" || updatedSubmission.status === "RUNNING") {
+          if (isSubmissionInProgress(updatedSubmission)) {
             scheduleNextPoll(BASE_POLL_INTERVAL);
           }
         } catch (err) {
@@ -202,7 +240,7 @@ from target import ${functionName}
         pollingMaxTimeoutRef.current = null;
       }
     };
-  }, [submission]);
+  }, [submission, eventStreamUnavailable]);
 
   // Submission function wrapped in useCallback for useSubmit
   const doSubmit = useCallback(async (): Promise<Submission> => {
@@ -8,7 +8,7 @@ export default function ErrorLogDisplay({ executionLog }: ErrorLogDisplayProps)
   const errorType = executionLog?.error_type || "unknown";
   const exitCode = executionLog?.golden?.exit_code;
   const stderr = executionLog?.golden?.stderr || "";
-  const stdout = executionLog?.golden?.stdout || "";
+  const stdout = executionLog?.golden?.stdout || executionLog?.golden?.logs || "";
   const errorMessage = executionLog?.error_message || executionLog?.error || "";
 
   return (
@@ -24,7 +24,7 @@ export default function SubmissionResult({ submission }: SubmissionResultProps)
 
     return {
       exitCode: golden.exit_code,
-      stdout: golden.stdout || "",
+      stdout: golden.stdout || golden.logs || "",
       stderr: golden.stderr || "",
       logs: golden.logs || "",
     };
@@ -35,7 +35,7 @@ export default function SubmissionResult({ submission }: SubmissionResultProps)
   // Parse pytest output for FAILURE status
   const parsedGolden = submission.status === "FAILURE" && submission.execution_log
     ? parsePytestOutput(
-        ((submission.execution_log as any)?.golden?.stdout || ""),
+        ((submission.execution_log as any)?.golden?.stdout || (submission.execution_log as any)?.golden?.logs || ""),
         ((submission.execution_log as any)?.golden?.stderr || "")
       )
     : null;
@@ -26,6 +26,13 @@ export class ApiError extends Error {
   }
 }
 
+/**
+ * Full URL of an API endpoint (for clients that do not go through fetch, e.g. EventSource)
+ */
+export function apiUrl(endpoint: string): string {
+  return `${API_BASE_URL}${endpoint}`;
+}
+
 /**
  * Generic API request function with Sentry integration
  */
@@ -33,7 +40,7 @@ async function apiRequest<T>(
   endpoint: string,
   options?: RequestInit
 ): Promise<T> {
-  const url = `${API_BASE_URL}${endpoint}`;
+  const url = apiUrl(endpoint);
   const method = options?.method || "GET";
 
   try {
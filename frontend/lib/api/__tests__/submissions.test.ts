@@ -0,0 +1,133 @@
+/** Submissions API client tests */
+
+import { subscribeSubmissionEvents, isSubmissionInProgress } from '../submissions';
+import { apiUrl } from '@/lib/api';
+import type { Submission } from '@/types/problem';
+
+jest.mock('../../api');
+
+type Listener = (event: MessageEvent) => void;
+
+class MockEventSource {
+  static CONNECTING = 0;
+  static OPEN = 1;
+  static CLOSED = 2;
+  static instances: MockEventSource[] = [];
+
+  readyState = MockEventSource.OPEN;
+  onerror: (() => void) | null = null;
+  listeners: Record<string, Listener[]> = {};
+
+  constructor(public url: string, public init?: EventSourceInit) {
+    MockEventSource.instances.push(this);
+  }
+
+  addEventListener(type: string, listener: Listener) {
+    (this.listeners[type] ||= []).push(listener);
+  }
+
+  close() {
+    this.readyState = MockEventSource.CLOSED;
+  }
+
+  emit(type: string, data: unknown) {
+    (this.listeners[type] || []).forEach((listener) =>
+      listener({ data: JSON.stringify(data) } as MessageEvent)
+    );
+  }
+}
+
+const baseSubmission: Submission = {
+  id: 'sub-1',
+  user_id: 'user-1',
+  anonymous_id: null,
+  problem_id: 1,
+  code: 'def test_a(): pass',
+  status: 'SUCCESS',
+  score: 100,
+  killed_mutants: 1,
+  total_mutants: 1,
+  created_at: '2026-01-01T00:00:00Z',
+};
+
+describe('Submissions API', () => {
+  const mockApiUrl = apiUrl as jest.MockedFunction<typeof apiUrl>;
+
+  beforeEach(() => {
+    jest.clearAllMocks();
+    MockEventSource.instances = [];
+    mockApiUrl.mockImplementation((endpoint: string) => `/api${endpoint}`);
+    (global as unknown as { EventSource: unknown }).EventSource = MockEventSource;
+  });
+
+  describe('isSubmissionInProgress', () => {
+    it('should treat submissions waiting for AI feedback as in progress', () => {
+      expect(isSubmissionInProgress({ ...baseSubmission, status: 'RUNNING' })).toBe(true);
+      expect(
+        isSubmissionInProgress({
+          ...baseSubmission,
+          progress: { step: 'generating_feedback', message: '', percent: 100 },
+        })
+      ).toBe(true);
+      expect(isSubmissionInProgress(baseSubmission)).toBe(false);
+    });
+  });
+
+  describe('subscribeSubmissionEvents', () => {
+    const handlers = () => ({
+      onProgress: jest.fn(),
+      onSubmission: jest.fn(),
+      onUnavailable: jest.fn(),
+    });
+
+    it('should forward progress and close after the final result', () => {
+      const h = handlers();
+      subscribeSubmissionEvents('sub-1', h);
+      const source = MockEventSource.instances[0];
+
+      expect(source.url).toBe('/api/v1/submissions/sub-1/events');
+      expect(source.init).toEqual({ withCredentials: true });
+
+      source.emit('progress', { step: 'testing_buggy', message: '', percent: 50 });
+      expect(h.onProgress).toHaveBeenCalledWith({ step: 'testing_buggy', message: '', percent: 50 });
+
+      source.emit('result', baseSubmission);
+      expect(h.onSubmission).toHaveBeenCalledWith(baseSubmission);
+      expect(source.readyState).toBe(MockEventSource.CLOSED);
+    });
+
+    it('should keep the stream open until feedback arrives', () => {
+      const h = handlers();
+      subscribeSubmissionEvents('sub-1', h);
+      const source = MockEventSource.instances[0];
+
+      source.emit('result', {
+        ...baseSubmission,
+        progress: { step: 'generating_feedback', message: '', percent: 100 },
+      });
+      expect(source.readyState).toBe(MockEventSource.OPEN);
+
+      source.emit('feedback', baseSubmission);
+      expect(h.onSubmission).toHaveBeenCalledTimes(2);
+      expect(source.readyState).toBe(MockEventSource.CLOSED);
+    });
+
+    it('should report the stream as unavailable when the server rejects it', () => {
+      const h = handlers();
+      subscribeSubmissionEvents('sub-1', h);
+      const source = MockEventSource.instances[0];
+
+      source.readyState = MockEventSource.CLOSED;
+      source.onerror?.();
+
+      expect(h.onUnavailable).toHaveBeenCalledTimes(1);
+    });
+
+    it('should close the stream on unsubscribe', () => {
+      const unsubscribe = subscribeSubmissionEvents('sub-1', handlers());
+      unsubscribe();
+
+      expect(MockEventSource.instances[0].readyState).toBe(MockEventSource.CLOSED);
+    });
+  });
+});
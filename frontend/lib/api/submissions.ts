@@ -1,10 +1,30 @@
 /** Submissions API client */
 
-import { post, get } from "@/lib/api";
-import type { Submission, SubmissionCreate } from "@/types/problem";
+import { post, get, apiUrl } from "@/lib/api";
+import type { Submission, SubmissionCreate, SubmissionProgress } from "@/types/problem";
 
 const SUBMISSIONS_ENDPOINT = "/v1/submissions";
 
+// 연결 오류가 이만큼 연속되면 이벤트 스트림을 포기 (호출 측에서 폴링으로 전환)
+const MAX_EVENT_STREAM_ERRORS = 5;
+
+/**
+ * 채점 중이거나, 점수 확정 후 AI 피드백을 기다리는 제출인지 여부
+ */
+export const isSubmissionInProgress = (submission: Submission): boolean =>
+  submission.status === "PENDING" ||
+  submission.status === "RUNNING" ||
+  (submission.status === "SUCCESS" && submission.progress?.step === "generating_feedback");
+
+export interface SubmissionEventHandlers {
+  /** 채점 진행률 */
+  onProgress: (progress: SubmissionProgress) => void;
+  /** 최종 결과 또는 AI 피드백이 저장된 제출 */
+  onSubmission: (submission: Submission) => void;
+  /** 이벤트 스트림을 사용할 수 없음 (비활성화, 연결 실패 등) */
+  onUnavailable: () => void;
+}
+
 /**
  * Create a new submission
  */
@@ -21,3 +41,52 @@ export async function getSubmission(id: string): Promise<Submission> {
   return get<Submission>(`${SUBMISSIONS_ENDPOINT}/${id}`);
 }
 
+/**
+ * Subscribe to submission progress/result server-sent events
+ * (GET /submissions/{id}/events).
+ *
+ * 최종 결과를 받으면(피드백 대기 중이면 feedback 이벤트까지) 스트림을 닫습니다.
+ *
+ * @returns 구독 해제 함수
+ */
+export function subscribeSubmissionEvents(
+  id: string,
+  handlers: SubmissionEventHandlers
+): () => void {
+  if (typeof EventSource === "undefined") {
+    handlers.onUnavailable();
+    return () => {};
+  }
+
+  const source = new EventSource(apiUrl(`${SUBMISSIONS_ENDPOINT}/${id}/events`), {
+    withCredentials: true,
+  });
+  let errorCount = 0;
+
+  const handleSubmission = (event: MessageEvent) => {
+    errorCount = 0;
+    const submission = JSON.parse(event.data) as Submission;
+    if (!isSubmissionInProgress(submission)) {
+      // 서버도 스트림을 닫으므로 자동 재연결되지 않도록 먼저 닫음
+      source.close();
+    }
+    handlers.onSubmission(submission);
+  };
+
+  source.addEventListener("progress", (event) => {
+    errorCount = 0;
+    handlers.onProgress(JSON.parse((event as MessageEvent).data) as SubmissionProgress);
+  });
+  source.addEventListener("result", (event) => handleSubmission(event as MessageEvent));
+  source.addEventListener("feedback", (event) => handleSubmission(event as MessageEvent));
+  source.onerror = () => {
+    errorCount += 1;
+    // CLOSED: 404(이벤트 비활성화) 등으로 브라우저가 재연결하지 않는 경우
+    if (source.readyState === EventSource.CLOSED || errorCount >= MAX_EVENT_STREAM_ERRORS) {
+      source.close();
+      handlers.onUnavailable();
+    }
+  };
+
+  return () => source.close();
+}
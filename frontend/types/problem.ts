@@ -51,7 +51,7 @@ export interface BookmarkStatusResponse {
 }
 
 export interface SubmissionProgress {
-  step: "initializing" | "testing_golden" | "testing_buggy" | "generating_feedback";
+  step: "initializing" | "testing_golden" | "testing_buggy" | "generating_feedback" | "completed";
   message: string;
   percent: number;
   current?: number;
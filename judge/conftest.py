@@ -4,9 +4,21 @@
 pytest 자체의 동작에는 영향을 주지 않습니다.
 """
 
+# 보안 제한 적용 전(conftest 로드 시점)에 필요한 모듈을 임포트
+import json
+import re
+import signal
+import threading
+import time
+
+import pytest
+
 # target.py를 테스트 수집에서 제외 (test_로 시작하는 함수가 있어도 테스트로 인식하지 않음)
 collect_ignore = ["target.py"]
 
+# 테스트별 결과를 JSON 한 줄로 출력하는 리포터 (qa_arena_reporter.py)
+pytest_plugins = ["qa_arena_reporter"]
+
 # 보안 제한은 pytest_collection_modifyitems hook을 통해 적용됩니다.
 # 이렇게 하면 pytest 자체의 내부 모듈 임포트는 허용하면서
 # 사용자 테스트 코드의 위험한 임포트만 차단할 수 있습니다.
@@ -23,9 +35,119 @@ BLOCKED_MODULES = [
     'imp',
 ]
 
+# 테스트별 타임아웃 ini 옵션 (초, 0이면 사용 안 함). 채점 백엔드가 -o로 전달합니다.
+TEST_TIMEOUT_INI = 'qa_arena_test_timeout'
+# 타임아웃으로 실패한 테스트에 남기는 user_properties 키 (qa_arena_reporter.py와 동일)
+TEST_TIMEOUT_PROPERTY = 'qa_arena_timeout'
+TIME_BUDGET_PLUGIN = 'qa_arena_time_budget'
+# 테스트 실행 순서 ini 옵션 (JSON 테스트 이름 목록, 먼저 실행할 순서). 채점 백엔드가 -o로 전달합니다.
+TEST_ORDER_INI = 'qa_arena_test_order'
+
+
+def pytest_addoption(parser):
+    """테스트별 타임아웃 ini 옵션을 등록합니다."""
+    parser.addini(TEST_TIMEOUT_INI, 'per-test time budget in seconds (0 disables)', default='0')
+    parser.addini(TEST_ORDER_INI, 'JSON list of test names to run first, in order', default='')
+
+
+def _apply_test_order(config, items):
+    """
+    qa_arena_test_order에 나열된 테스트를 그 순서대로 먼저 실행하도록 정렬합니다.
+
+    이름은 "test_x" 또는 "TestX::test_x" 형식이며 parametrize된 테스트는 함수 이름으로 찾습니다.
+    나열되지 않은 테스트는 원래 순서대로 뒤에 실행됩니다.
+    """
+    try:
+        order = json.loads(config.getini(TEST_ORDER_INI) or '[]')
+    except ValueError:
+        return
+    if not isinstance(order, list) or not order:
+        return
+    rank = {name: index for index, name in enumerate(order) if isinstance(name, str)}
+
+    def _rank(item):
+        name = item.nodeid.split('::', 1)[-1]
+        return rank.get(name, rank.get(re.sub(r'\[.*\]$', '', name), len(rank)))
+
+    items.sort(key=_rank)
+
+
+def _test_timeout(item):
+    """테스트별 타임아웃 (초). 설정되지 않았거나 잘못된 값이면 0."""
+    try:
+        return max(float(item.config.getini(TEST_TIMEOUT_INI) or 0), 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _run_with_time_budget(item):
+    """
+    테스트 단계(setup/call/teardown) 하나를 시간 제한 안에서 실행하는 hookwrapper 본문.
+
+    SIGALRM으로 제한 시간을 넘긴 단계를 pytest.fail()로 실패시키므로,
+    멈춘 테스트 하나 때문에 바깥 실행 타임아웃까지 기다리지 않고
+    그때까지의 테스트별 결과를 보고할 수 있습니다.
+    바깥 타이머(multi_runner.py의 대상별 타임아웃)가 먼저 만료되면 그 타이머를 그대로 둡니다.
+    """
+    budget = _test_timeout(item)
+    if not budget or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    outer_remaining = signal.getitimer(signal.ITIMER_REAL)[0]
+    if outer_remaining and outer_remaining <= budget:
+        yield
+        return
+
+    finished = False
+
+    def _on_timeout(signum, frame):
+        if finished:
+            return
+        item.user_properties.append((TEST_TIMEOUT_PROPERTY, budget))
+        pytest.fail(f'Timeout: test exceeded {budget}s', pytrace=False)
+
+    outer_handler = signal.signal(signal.SIGALRM, _on_timeout)
+    start_time = time.monotonic()
+    signal.setitimer(signal.ITIMER_REAL, budget)
+    try:
+        yield
+    finally:
+        finished = True
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, outer_handler)
+        if outer_remaining:
+            # 바깥 타이머 복원 (이미 지났으면 곧바로 만료)
+            elapsed = time.monotonic() - start_time
+            signal.setitimer(signal.ITIMER_REAL, max(outer_remaining - elapsed, 1e-6))
+
+
+class _TimeBudgetPlugin:
+    """테스트 단계별(setup/call/teardown) 타임아웃을 적용하는 플러그인."""
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item):
+        yield from _run_with_time_budget(item)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        yield from _run_with_time_budget(item)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item):
+        yield from _run_with_time_budget(item)
+
+
+def pytest_configure(config):
+    """테스트별 타임아웃 플러그인을 등록합니다 (같은 세션에서 한 번만)."""
+    if not config.pluginmanager.has_plugin(TIME_BUDGET_PLUGIN):
+        config.pluginmanager.register(_TimeBudgetPlugin(), TIME_BUDGET_PLUGIN)
+
 
 def pytest_collection_modifyitems(config, items):
-    """테스트 수집 후 각 테스트 항목을 검사하여 위험한 모듈 임포트를 차단합니다."""
+    """테스트 수집 후 각 테스트 항목을 검사하여 위험한 모듈 임포트를 차단하고, 실행 순서를 정합니다."""
+    _apply_test_order(config, items)
+
     import builtins
     import importlib.util
     
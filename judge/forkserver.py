@@ -0,0 +1,168 @@
+"""Forkserver entrypoint for warm judge containers.
+
+pytest와 리포터 플러그인, multi_runner.py를 미리 임포트한 상태로 Unix 소켓에서 대기하다가,
+채점 작업마다 fork()한 자식 프로세스에서 multi_runner.py의 실행 명세를 실행합니다.
+자식 프로세스가 러너(부모) 역할을 하며 사용자 테스트는 러너가 fork한 프로세스에서 실행되므로,
+결과 줄은 cold 컨테이너와 같이 러너만 출력합니다.
+작업마다 인터프리터 기동과 pytest 임포트 비용이 발생하지 않습니다.
+
+프로토콜 (한 연결당 작업 하나):
+    client -> server: {"workdir": str, "timeout": float, "spec": {...}}\\n
+    server -> client: 러너 출력 (RESULT_MARKER 줄) ... EXIT_MARKER<exit_code>\\n
+"""
+
+import json
+import os
+import resource
+import signal
+import socket
+import sys
+import time
+
+# 무거운 pytest 모듈을 부모 프로세스에서 미리 임포트
+import pytest  # noqa: F401
+import _pytest.assertion.rewrite  # noqa: F401
+import _pytest.python  # noqa: F401
+import _pytest.terminal  # noqa: F401
+
+# conftest.py의 pytest_plugins로 로드되는 리포터와 다중 대상 러너 (이 파일과 같은 디렉토리)
+import multi_runner
+import qa_arena_reporter  # noqa: F401
+
+SOCKET_PATH = os.environ.get("QA_ARENA_FORKSERVER_SOCKET", "/tmp/qa_arena_forkserver.sock")
+EXIT_MARKER = "__QA_ARENA_EXIT__="
+# 타임아웃으로 강제 종료된 작업의 종료 코드 (coreutils timeout과 동일)
+TIMEOUT_EXIT_CODE = 124
+# 작업을 신뢰할 수 없을 때의 종료 코드 (forkserver_client.py의 CONNECT_FAILED_EXIT_CODE와 동일,
+# pool이 컨테이너를 재생성하고 cold 컨테이너로 다시 실행)
+FORKSERVER_FAILED_EXIT_CODE = 97
+# 작업 중 forkserver에 도착하면 해당 작업 후 종료하는 시그널
+# (컨테이너 PID 1은 핸들러가 없는 시그널을 무시하므로, 받은 시그널을 기록하기 위해 핸들러를 둠)
+WATCHED_SIGNALS = (
+    signal.SIGTERM, signal.SIGINT, signal.SIGHUP, signal.SIGQUIT,
+    signal.SIGUSR1, signal.SIGUSR2, signal.SIGALRM,
+)
+# 자식 프로세스 리소스 제한
+FILE_SIZE_LIMIT_BYTES = 1024 * 1024
+
+
+class _SignalWatch:
+    """작업 중 forkserver가 받은 시그널을 기록합니다."""
+
+    def __init__(self):
+        self.in_job = False
+        self.received = None
+
+    def install(self) -> None:
+        for signum in WATCHED_SIGNALS:
+            signal.signal(signum, self._on_signal)
+
+    def _on_signal(self, signum, frame):
+        self.received = signum
+        if not self.in_job:
+            # 대기 중 종료 요청 (docker stop 등)
+            sys.exit(0)
+
+
+def _run_child(conn: socket.socket, job: dict) -> None:
+    """fork된 자식 프로세스에서 작업을 실행합니다. 반환하지 않습니다."""
+    try:
+        for signum in WATCHED_SIGNALS:
+            signal.signal(signum, signal.SIG_DFL)
+        os.setsid()
+        cpu_seconds = int(job["timeout"]) + 1
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds))
+        resource.setrlimit(resource.RLIMIT_FSIZE, (FILE_SIZE_LIMIT_BYTES, FILE_SIZE_LIMIT_BYTES))
+        resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+
+        # 출력은 클라이언트 소켓으로 직접 전달
+        os.dup2(conn.fileno(), 1)
+        os.dup2(conn.fileno(), 2)
+        sys.stdout = os.fdopen(1, "w", buffering=1, closefd=False)
+        sys.stderr = os.fdopen(2, "w", buffering=1, closefd=False)
+
+        os.chdir(job["workdir"])
+        results = multi_runner.run_spec(job["spec"])
+        sys.stdout.write(multi_runner.RESULT_MARKER + json.dumps(results, ensure_ascii=False) + "\n")
+        sys.stdout.flush()
+        sys.stderr.flush()
+        exit_code = 0
+    except BaseException as e:  # noqa: BLE001 - 자식은 어떤 경우에도 부모로 돌아가면 안 됨
+        try:
+            sys.stderr.write(f"forkserver child error: {type(e).__name__}: {e}\n")
+            sys.stderr.flush()
+        except Exception:
+            pass
+        exit_code = FORKSERVER_FAILED_EXIT_CODE
+    os._exit(exit_code)
+
+
+def _wait_child(pid: int, timeout: float) -> int:
+    """자식 프로세스 종료를 기다리고 종료 코드를 반환합니다. 타임아웃 시 강제 종료합니다."""
+    deadline = time.monotonic() + timeout
+    while True:
+        waited_pid, status = os.waitpid(pid, os.WNOHANG)
+        if waited_pid == pid:
+            if os.WIFEXITED(status):
+                return os.WEXITSTATUS(status)
+            return 128 + os.WTERMSIG(status)
+        if time.monotonic() >= deadline:
+            try:
+                os.killpg(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            os.waitpid(pid, 0)
+            return TIMEOUT_EXIT_CODE
+        time.sleep(0.005)
+
+
+def _handle(conn: socket.socket, watch: _SignalWatch) -> None:
+    """
+    연결 하나(작업 하나)를 처리합니다.
+
+    작업 중 forkserver가 시그널을 받았으면 작업이 forkserver에 영향을 주었을 수 있으므로
+    결과 대신 FORKSERVER_FAILED_EXIT_CODE를 보냅니다.
+    """
+    with conn, conn.makefile("rb") as reader:
+        job = json.loads(reader.readline())
+        watch.in_job = True
+        try:
+            pid = os.fork()
+            if pid == 0:
+                _run_child(conn, job)
+            exit_code = _wait_child(pid, float(job["timeout"]))
+        finally:
+            watch.in_job = False
+        if watch.received is not None:
+            exit_code = FORKSERVER_FAILED_EXIT_CODE
+        conn.sendall(f"\n{EXIT_MARKER}{exit_code}\n".encode("utf-8"))
+
+
+def main() -> None:
+    """
+    Unix 소켓에서 작업을 순서대로 받아 처리합니다.
+
+    작업 중 시그널을 받으면 그 작업을 끝으로 소켓을 닫고 종료하여 이후 연결을 거부합니다.
+    """
+    if os.path.exists(SOCKET_PATH):
+        os.unlink(SOCKET_PATH)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(SOCKET_PATH)
+    server.listen(1)
+    watch = _SignalWatch()
+    watch.install()
+
+    while watch.received is None:
+        conn, _ = server.accept()
+        try:
+            _handle(conn, watch)
+        except Exception as e:
+            sys.stderr.write(f"forkserver error: {type(e).__name__}: {e}\n")
+
+    sys.stderr.write(f"forkserver received signal {watch.received} during a job, exiting\n")
+    server.close()
+    os.unlink(SOCKET_PATH)
+
+
+if __name__ == "__main__":
+    main()
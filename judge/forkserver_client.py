@@ -0,0 +1,70 @@
+"""Thin client that submits one grading job to the forkserver.
+
+`python -I -S forkserver_client.py <workdir> <timeout> <multi_runner 실행 명세 JSON>`
+
+pytest를 임포트하지 않으므로 기동 비용이 거의 없습니다.
+러너 출력을 stdout으로 그대로 전달하고, 작업의 종료 코드로 종료합니다.
+"""
+
+import json
+import os
+import socket
+import sys
+import time
+
+SOCKET_PATH = os.environ.get("QA_ARENA_FORKSERVER_SOCKET", "/tmp/qa_arena_forkserver.sock")
+EXIT_MARKER = b"__QA_ARENA_EXIT__="
+# forkserver가 기동(pytest 임포트)을 마칠 때까지 기다리는 최대 시간 (초)
+CONNECT_TIMEOUT = 10.0
+# forkserver 연결 실패/작업 실패 시 종료 코드 (pytest 종료 코드 0-5와 겹치지 않는 값,
+# forkserver.py의 FORKSERVER_FAILED_EXIT_CODE와 동일)
+CONNECT_FAILED_EXIT_CODE = 97
+
+
+def _connect() -> socket.socket:
+    """forkserver 소켓에 연결합니다. 기동 중이면 잠시 재시도합니다."""
+    deadline = time.monotonic() + CONNECT_TIMEOUT
+    while True:
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            client.connect(SOCKET_PATH)
+            return client
+        except OSError:
+            client.close()
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.02)
+
+
+def main() -> int:
+    """작업을 전송하고 결과를 출력합니다."""
+    workdir, timeout, spec = sys.argv[1], float(sys.argv[2]), json.loads(sys.argv[3])
+    try:
+        client = _connect()
+    except OSError as e:
+        sys.stdout.write(f"forkserver connection failed: {e}\n")
+        return CONNECT_FAILED_EXIT_CODE
+
+    with client:
+        job = {"workdir": workdir, "timeout": timeout, "spec": spec}
+        client.sendall(json.dumps(job).encode("utf-8") + b"\n")
+        chunks = []
+        while True:
+            chunk = client.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+
+    output = b"".join(chunks)
+    marker_at = output.rfind(b"\n" + EXIT_MARKER)
+    if marker_at < 0:
+        sys.stdout.buffer.write(output)
+        return CONNECT_FAILED_EXIT_CODE
+
+    sys.stdout.buffer.write(output[:marker_at])
+    sys.stdout.flush()
+    return int(output[marker_at + 1 + len(EXIT_MARKER):].strip() or CONNECT_FAILED_EXIT_CODE)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,701 @@
+"""Multi-target runner for a single judge container.
+
+Golden Code와 모든 Mutant를 하나의 컨테이너에서 채점합니다.
+실행 디렉토리의 targets/<name>/ 마다 target.py, test_user.py, conftest.py,
+qa_arena_reporter.py가 있습니다 (번들 레이아웃이면 test_user.py는 run/ 아래). 러너는 pytest를 한 번만 임포트하고 대상마다 fork한
+자식 프로세스에서 pytest.main()을 실행하므로, 인터프리터와 pytest 기동 비용은 제출당
+한 번만 발생하고 대상 사이에 모듈/전역 상태가 공유되지 않습니다.
+
+사용자 테스트는 자식 프로세스에서만 실행됩니다. 자식은 표준 입출력이 /dev/null로 바뀌고
+결과 파일 외의 파일 디스크립터가 닫힌 상태로 실행되며, 러너(부모)는 dump 불가로 설정되어
+자식이 /proc/<pid>/fd로 러너의 stdout에 접근할 수 없습니다. 결과 줄은 러너만 출력하므로
+사용자 테스트는 자신이 실행된 대상의 결과 외에는 바꿀 수 없습니다.
+대상 이름은 채점 백엔드가 실행마다 만든 임의의 이름입니다.
+
+러너가 root이고 실행 명세에 uid_base가 있으면 (서로 다른 제출을 함께 채점하는 배치 등)
+각 자식은 자신의 대상 디렉토리를 전용 디렉토리로 복사한 뒤 대상 전용 uid로 권한을 낮추고,
+러너는 실행이 끝난 대상의 파일과 그 uid로 남은 프로세스를 정리합니다.
+자식은 결과를 모으기 전에 만든 zygote 프로세스에서 fork되므로 다른 대상의 결과를 메모리에 갖지 않습니다.
+
+targets/__schema__/가 있으면 (mutant schema 모드) 그 안의 target.py는 모든 변형을
+담은 schema 모듈입니다. 이 경우 자식 프로세스 하나에서 schema 모듈과 사용자 테스트를
+한 번만 임포트/수집하고, 환경 변수 QA_ARENA_VARIANT를 바꿔가며 수집된 테스트를
+변형마다 다시 실행합니다.
+
+실행 명세는 첫 번째 인자로 JSON을 전달합니다:
+    {"timeout": float, "targets": [str], "schema_variants": [str],
+     "max_log_chars": int, "pytest_args": [str], "uid_base": int}
+
+결과는 마지막 줄에 RESULT_MARKER 뒤에 JSON으로 출력됩니다:
+    [{"target": str, "exit_code": int, "execution_time": float, "logs": str, "report": dict}, ...]
+report는 qa_arena_reporter.py의 결과로, 사용자 테스트의 출력과 분리된 결과 파일로 전달됩니다.
+"""
+
+import contextlib
+import functools
+import io
+import json
+import os
+import select
+import shutil
+import signal
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+RESULT_MARKER = "QA_ARENA_RESULTS="
+# 대상 디렉토리 (실행 디렉토리 기준, 러너는 judge 이미지의 /opt/qa_arena에서 실행될 수 있음)
+TARGETS_DIR_NAME = "targets"
+# 번들 레이아웃에서 test_user.py가 위치한 디렉토리 (backend problem_bundle.py와 동일)
+RUN_DIR_NAME = "run"
+PYTEST_ARGS = ["-q", "--disable-warnings", "--maxfail=1", "--capture=sys", "-p", "no:cacheprovider"]
+# mutant schema 모드: 디렉토리 이름, 활성 변형 환경 변수, pytest 인자 (출력은 러너가 직접 구성)
+SCHEMA_DIR_NAME = "__schema__"
+VARIANT_ENV = "QA_ARENA_VARIANT"
+SCHEMA_PYTEST_ARGS = ["-p", "no:terminal", "--capture=sys", "-p", "no:cacheprovider"]
+# pytest 종료 코드
+EXIT_OK = 0
+EXIT_TESTS_FAILED = 1
+EXIT_INTERRUPTED = 2
+EXIT_NO_TESTS_COLLECTED = 5
+# 대상별로 보관할 최대 로그 크기 (문자 수, 초과 시 앞/뒤만 유지)
+DEFAULT_MAX_LOG_CHARS = 65536
+TRUNCATION_MARKER = "\n[... truncated {omitted} characters of output ...]\n"
+# 자식 프로세스의 결과를 기다리는 여유 시간 (초, 대상별 타임아웃에 더함)
+CHILD_GRACE_SECONDS = 2.0
+# prctl(2) 옵션 번호 (linux/prctl.h)
+PR_SET_DUMPABLE = 4
+PR_SET_NO_NEW_PRIVS = 38
+MAX_FD = os.sysconf("SC_OPEN_MAX")
+
+
+class BoundedWriter(io.TextIOBase):
+    """최대 크기까지만 출력을 보관하는 텍스트 스트림 (앞부분과 뒷부분 유지)."""
+
+    def __init__(self, max_chars: int):
+        self.head_limit = max_chars // 2
+        self.tail_limit = max_chars - self.head_limit
+        self.total = 0
+        self._head = []
+        self._head_size = 0
+        self._tail = []
+        self._tail_size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        written = len(text)
+        self.total += written
+        room = self.head_limit - self._head_size
+        if room > 0:
+            self._head.append(text[:room])
+            self._head_size += len(text[:room])
+            text = text[room:]
+        if text:
+            self._tail.append(text)
+            self._tail_size += len(text)
+            if self._tail_size > 2 * self.tail_limit:
+                joined = "".join(self._tail)[-self.tail_limit:]
+                self._tail = [joined]
+                self._tail_size = len(joined)
+        return written
+
+    def getvalue(self) -> str:
+        head = "".join(self._head)
+        tail = "".join(self._tail)
+        if self.total <= self._head_size + self._tail_size:
+            return head + tail
+        tail = tail[-self.tail_limit:] if self.tail_limit else ""
+        omitted = self.total - len(head) - len(tail)
+        return head + TRUNCATION_MARKER.format(omitted=omitted) + tail
+
+
+class TargetTimeout(BaseException):
+    """대상별 실행 시간 초과."""
+
+
+def _on_alarm(signum, frame):
+    raise TargetTimeout()
+
+
+def _prctl(option: int, value: int) -> None:
+    """prctl(2)을 호출합니다."""
+    import ctypes
+
+    libc = ctypes.CDLL(None, use_errno=True)
+    if libc.prctl(option, value, 0, 0, 0) != 0:
+        raise OSError(ctypes.get_errno(), f"prctl({option}) failed")
+
+
+def _protect_runner() -> None:
+    """
+    러너를 dump 불가 프로세스로 설정합니다.
+
+    같은 uid의 자식 프로세스(사용자 테스트)가 /proc/<pid>/fd, /proc/<pid>/mem으로
+    러너의 stdout에 쓰거나 메모리를 읽지 못하게 합니다 (CAP_SYS_PTRACE가 없는 judge 환경).
+    """
+    try:
+        _prctl(PR_SET_DUMPABLE, 0)
+    except (OSError, AttributeError) as e:
+        sys.stderr.write(f"runner protection unavailable: {e}\n")
+
+
+def _isolate_child(result_fd: int) -> None:
+    """
+    사용자 테스트를 실행하기 전에 자식 프로세스의 입출력을 격리합니다.
+
+    표준 입출력을 /dev/null로 바꾸고 결과 파일 외의 상속된 파일 디스크립터를 닫아,
+    사용자 코드가 러너의 stdout(결과 줄)이나 zygote 명령 파이프에 쓰지 못하게 합니다.
+    """
+    os.setsid()
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+    os.closerange(3, result_fd)
+    os.closerange(result_fd + 1, MAX_FD)
+
+
+def _private_workdir(target_dir: Path, workdir: Path, uid: int) -> Path:
+    """
+    대상 파일을 자식 전용 디렉토리로 복사하고, uid가 주어지면 그 uid로 권한을 낮춥니다.
+
+    대상 디렉토리(targets/)는 root 전용이므로 권한을 낮춘 자식은 자신의 복사본만 읽고 쓸 수 있습니다.
+    """
+    workdir.mkdir(mode=0o700)
+    shutil.copytree(target_dir, workdir, dirs_exist_ok=True)
+    with contextlib.suppress(OSError, AttributeError):
+        _prctl(PR_SET_NO_NEW_PRIVS, 1)
+    if uid:
+        for path in (workdir, *workdir.rglob("*")):
+            os.lchown(path, uid, uid)
+        os.setgroups([])
+        os.setgid(uid)
+        os.setuid(uid)
+    os.umask(0o077)
+    os.chdir(workdir)
+    os.environ["HOME"] = os.environ["TMPDIR"] = str(workdir)
+    tempfile.tempdir = None
+    return workdir
+
+
+def _sweep_uid(uid: int) -> None:
+    """
+    대상 전용 uid로 남은 프로세스를 모두 종료합니다.
+
+    setsid로 세션을 벗어나 killpg에 걸리지 않은 프로세스가 다음 대상 실행 중에 남지 않도록 합니다.
+    """
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.setgroups([])
+            os.setgid(uid)
+            os.setuid(uid)
+            os.kill(-1, signal.SIGKILL)
+        except BaseException:  # noqa: BLE001 - 남은 프로세스가 없으면 ESRCH
+            pass
+        os._exit(0)
+    os.waitpid(pid, 0)
+
+
+class TargetLauncher:
+    """
+    대상 실행 프로세스를 fork하는 zygote 프로세스.
+
+    러너가 대상 결과를 모으기 전에 만들어지므로, zygote에서 fork된 대상 실행 프로세스의
+    메모리에는 다른 대상의 파일이나 결과(다른 제출의 테스트 로그 등)가 없습니다.
+    대상 실행 프로세스는 root 전용 디렉토리의 결과 파일에 JSON 결과를 씁니다.
+
+    Args:
+        jobs: [(대상 디렉토리, 실행 함수(작업 디렉토리) -> 결과, 전용 uid 또는 0)]
+        run_root: 러너 전용 임시 디렉토리 (결과 파일과 대상별 작업 디렉토리)
+    """
+
+    def __init__(self, jobs, run_root: Path):
+        self.jobs = jobs
+        self.run_root = run_root
+        self.results_dir = run_root / "results"
+        self.results_dir.mkdir(mode=0o700)
+        self._buffer = b""
+        command_read, self._command_write = os.pipe()
+        self._event_read, event_write = os.pipe()
+        self.pid = os.fork()
+        if self.pid == 0:
+            status = 0
+            try:
+                os.close(self._command_write)
+                os.close(self._event_read)
+                self._serve(command_read, event_write)
+            except BaseException:  # noqa: BLE001 - zygote는 러너 코드로 돌아가면 안 됨
+                status = 1
+            os._exit(status)
+        os.close(command_read)
+        os.close(event_write)
+
+    def _serve(self, command_read: int, event_write: int) -> None:
+        """러너가 보낸 대상 번호마다 실행 프로세스를 만들고 종료를 기다립니다 (zygote)."""
+        with os.fdopen(command_read, "rb") as commands:
+            for line in commands:
+                pid = self._spawn(int(line))
+                os.write(event_write, f"{pid}\n".encode())
+                _, status = os.waitpid(pid, 0)
+                with contextlib.suppress(ProcessLookupError, PermissionError):
+                    os.killpg(pid, signal.SIGKILL)
+                os.write(event_write, f"{status}\n".encode())
+
+    def _spawn(self, index: int) -> int:
+        """대상 실행 프로세스를 fork합니다 (zygote)."""
+        target_dir, run, uid = self.jobs[index]
+        pid = os.fork()
+        if pid == 0:
+            status = 0
+            try:
+                result_fd = os.open(
+                    self.results_dir / f"{index}.json", os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600
+                )
+                _isolate_child(result_fd)
+                workdir = _private_workdir(target_dir, self.run_root / f"w{index}", uid)
+                payload = json.dumps(run(workdir), ensure_ascii=False).encode("utf-8")
+                with os.fdopen(result_fd, "wb") as out:
+                    out.write(payload)
+            except BaseException:  # noqa: BLE001 - 자식은 어떤 경우에도 zygote 코드로 돌아가면 안 됨
+                status = 1
+            os._exit(status)
+        return pid
+
+    def _read_event(self, deadline=None):
+        """zygote가 보낸 한 줄을 읽습니다. 마감 시간까지 없으면 None."""
+        while b"\n" not in self._buffer:
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not select.select([self._event_read], [], [], remaining)[0]:
+                    return None
+            chunk = os.read(self._event_read, 64)
+            if not chunk:
+                raise RuntimeError("target launcher exited")
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return line.decode()
+
+    def run(self, index: int, budget: float, max_bytes: int):
+        """
+        대상 하나를 실행하고 결과를 받습니다.
+
+        마감 시간을 넘기면 실행 프로세스를 세션(프로세스 그룹) 단위로 강제 종료하고,
+        종료 후에는 전용 uid의 남은 프로세스와 작업 디렉토리, 원본 대상 디렉토리를 정리합니다.
+
+        Returns:
+            (실행 함수의 반환값, None) 또는 결과가 없을 때 (None, 실패 사유)
+        """
+        target_dir, _, uid = self.jobs[index]
+        try:
+            os.write(self._command_write, f"{index}\n".encode())
+            pid = int(self._read_event())
+            expired = self._read_event(time.monotonic() + budget) is None
+            if expired:
+                with contextlib.suppress(ProcessLookupError, PermissionError):
+                    os.killpg(pid, signal.SIGKILL)
+                self._read_event()
+        except (OSError, RuntimeError, ValueError) as e:
+            return None, f"target launcher failed: {e}"
+        finally:
+            if uid:
+                _sweep_uid(uid)
+            shutil.rmtree(self.run_root / f"w{index}", ignore_errors=True)
+            # 실행이 끝난 대상 파일은 이후 대상에서 접근할 수 없도록 삭제 (읽기 전용 마운트는 유지)
+            shutil.rmtree(target_dir, ignore_errors=True)
+
+        if expired:
+            return None, f"Timeout: isolated run exceeded {budget}s"
+        result_path = self.results_dir / f"{index}.json"
+        try:
+            with open(result_path, "rb") as result_file:
+                payload = result_file.read(max_bytes + 1)
+            result_path.unlink()
+        except FileNotFoundError:
+            payload = b""
+        if len(payload) > max_bytes:
+            return None, f"isolated run output exceeded {max_bytes} bytes"
+        try:
+            return json.loads(payload), None
+        except ValueError:
+            # 실행 프로세스가 결과를 쓰기 전에 종료됨 (시그널, os._exit 등)
+            return None, "isolated run exited without result"
+
+    def close(self) -> None:
+        """zygote를 종료합니다."""
+        os.close(self._command_write)
+        os.close(self._event_read)
+        os.waitpid(self.pid, 0)
+
+
+def _result_limit(max_log_chars: int) -> int:
+    """대상 하나의 결과 JSON 최대 크기 (로그의 JSON 이스케이프 여유와 리포터 결과 포함)."""
+    return max_log_chars * 8 + 262144
+
+
+def _checked_result(name: str, result, start_time: float, error) -> dict:
+    """
+    자식 프로세스가 보낸 대상 결과를 검증합니다.
+
+    자식은 사용자 코드를 실행하므로 결과의 형식을 신뢰하지 않고 필요한 필드만 다시 만들며,
+    대상 이름은 러너가 실행한 대상으로 고정합니다.
+    """
+    if error is None:
+        try:
+            report = result.get("report")
+            return {
+                "target": name,
+                "exit_code": int(result["exit_code"]),
+                "execution_time": float(result["execution_time"]),
+                "logs": str(result["logs"]),
+                "report": report if isinstance(report, dict) else None,
+            }
+        except (AttributeError, TypeError, KeyError, ValueError):
+            error = "isolated run returned malformed result"
+    return {
+        "target": name,
+        "exit_code": -1,
+        "execution_time": time.time() - start_time,
+        "logs": f"{error}\n",
+        "report": None,
+    }
+
+
+def run_target(
+    target_dir: Path,
+    timeout: float,
+    max_log_chars: int = DEFAULT_MAX_LOG_CHARS,
+    pytest_args: list = (),
+) -> dict:
+    """하나의 대상 디렉토리에 대해 pytest를 실행합니다 (자식 프로세스에서 호출)."""
+    sys.path.insert(0, str(target_dir))
+    # 번들 레이아웃에서는 test_user.py가 run/ 디렉토리에 있음
+    test_path = target_dir / RUN_DIR_NAME / "test_user.py"
+    if not test_path.exists():
+        test_path = target_dir / "test_user.py"
+    output = BoundedWriter(max_log_chars)
+    timed_out = False
+    start_time = time.time()
+
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            exit_code = int(
+                pytest.main(
+                    [
+                        *PYTEST_ARGS,
+                        *pytest_args,
+                        f"--rootdir={target_dir}",
+                        f"--confcutdir={target_dir}",
+                        str(test_path),
+                    ]
+                )
+            )
+    except TargetTimeout:
+        timed_out = True
+        exit_code = -1
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        sys.path.remove(str(target_dir))
+
+    # pytest 내부에서 잡힌 타임아웃도 타임아웃으로 처리
+    if time.time() - start_time >= timeout:
+        timed_out = True
+        exit_code = -1
+
+    logs = output.getvalue()
+    report = None
+    if timed_out:
+        logs += f"\nTimeout: target exceeded {timeout}s\n"
+    else:
+        report = getattr(sys.modules.get("qa_arena_reporter"), "last_report", None)
+
+    return {
+        "target": target_dir.name,
+        "exit_code": exit_code,
+        "execution_time": time.time() - start_time,
+        "logs": logs,
+        "report": report,
+    }
+
+
+def run_target_isolated(
+    launcher: TargetLauncher,
+    index: int,
+    name: str,
+    timeout: float,
+    max_log_chars: int = DEFAULT_MAX_LOG_CHARS,
+) -> dict:
+    """zygote에서 fork한 프로세스에서 run_target을 실행합니다."""
+    start_time = time.time()
+    result, error = launcher.run(
+        index, budget=timeout + CHILD_GRACE_SECONDS, max_bytes=_result_limit(max_log_chars)
+    )
+    return _checked_result(name, result, start_time, error)
+
+
+class SchemaVariantLoop:
+    """
+    수집된 테스트를 schema 변형마다 다시 실행하는 pytest 플러그인.
+
+    기본 pytest_runtestloop 대신 실행되며, 변형마다 --maxfail=1과 같은 규칙으로
+    테스트를 실행하고 대상별 결과(run_target과 같은 형식)를 results에 기록합니다.
+    """
+
+    def __init__(self, variants, timeout: float, max_log_chars: int):
+        self.variants = variants
+        self.timeout = timeout
+        self.max_log_chars = max_log_chars
+        self.results = []
+        self._collection_failures = []
+        self._output = None
+        self._failed = 0
+        self._passed = 0
+
+    def pytest_collectreport(self, report):
+        if report.failed:
+            self._collection_failures.append(report)
+
+    def pytest_runtest_logreport(self, report):
+        if self._output is None:
+            return
+        if report.failed:
+            self._failed += 1
+            self._output.write(f"_ {report.nodeid} [{report.when}] _\n{report.longreprtext}\n")
+            for title, content in report.sections:
+                self._output.write(f"- {title} -\n{content}\n")
+        elif report.when == "call" and report.passed:
+            self._passed += 1
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtestloop(self, session):
+        reporter = sys.modules.get("qa_arena_reporter")
+        if reporter is not None:
+            # schema 모듈의 줄 번호는 원본 target.py와 다르므로 커버리지를 보고하지 않음
+            reporter.disable_coverage()
+        for variant in self.variants:
+            os.environ[VARIANT_ENV] = variant
+            if self._collection_failures:
+                self.results.append(self._collection_error_result(variant, reporter))
+            else:
+                self.results.append(self._run_variant(session, variant, reporter))
+        os.environ.pop(VARIANT_ENV, None)
+        return True
+
+    def _collection_error_result(self, variant: str, reporter) -> dict:
+        """수집 오류는 모든 변형에 같은 결과로 기록합니다."""
+        output = BoundedWriter(self.max_log_chars)
+        for report in self._collection_failures:
+            output.write(f"_ ERROR collecting {report.nodeid} _\n{report.longreprtext}\n")
+        output.write(f"{len(self._collection_failures)} error during collection\n")
+        return {
+            "target": variant,
+            "exit_code": EXIT_INTERRUPTED,
+            "execution_time": 0.0,
+            "logs": output.getvalue(),
+            "report": reporter.build_report(EXIT_INTERRUPTED) if reporter is not None else None,
+        }
+
+    def _run_variant(self, session, variant: str, reporter) -> dict:
+        """하나의 변형에 대해 수집된 테스트를 실행합니다."""
+        items = session.items
+        if reporter is not None:
+            reporter.reset()
+        self._output = BoundedWriter(self.max_log_chars)
+        self._failed = 0
+        self._passed = 0
+        session.testsfailed = 0
+        session.shouldfail = False
+        session.shouldstop = False
+        timed_out = False
+        start_time = time.time()
+
+        signal.setitimer(signal.ITIMER_REAL, self.timeout)
+        try:
+            for index, item in enumerate(items):
+                next_item = items[index + 1] if index + 1 < len(items) else None
+                # 이전 변형에서 캡처된 출력과 기록된 속성(타임아웃 표시 등)이 누적되지 않도록 초기화
+                item._report_sections = []
+                item.user_properties = []
+                item.config.hook.pytest_runtest_protocol(item=item, nextitem=next_item)
+                if self._failed or time.time() - start_time >= self.timeout:
+                    break
+        except TargetTimeout:
+            timed_out = True
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            # 중간에 멈춘 경우 남은 fixture 정리 (다음 변형이 새로 setup하도록)
+            with contextlib.suppress(BaseException):
+                session._setupstate.teardown_exact(None)
+
+        execution_time = time.time() - start_time
+        if timed_out or execution_time >= self.timeout:
+            exit_code = -1
+        elif not items:
+            exit_code = EXIT_NO_TESTS_COLLECTED
+        elif self._failed:
+            exit_code = EXIT_TESTS_FAILED
+        else:
+            exit_code = EXIT_OK
+
+        output = self._output
+        self._output = None
+        if exit_code == EXIT_NO_TESTS_COLLECTED:
+            output.write("no tests ran\n")
+        elif exit_code != -1:
+            output.write(f"{self._failed} failed, {self._passed} passed in {execution_time:.2f}s\n")
+        report = None
+        if reporter is not None and exit_code != -1:
+            report = reporter.build_report(exit_code)
+        logs = output.getvalue()
+        if exit_code == -1:
+            logs += f"\nTimeout: target exceeded {self.timeout}s\n"
+
+        return {
+            "target": variant,
+            "exit_code": exit_code,
+            "execution_time": execution_time,
+            "logs": logs,
+            "report": report,
+        }
+
+
+def run_schema(
+    schema_dir: Path,
+    variants,
+    timeout: float,
+    max_log_chars: int = DEFAULT_MAX_LOG_CHARS,
+    pytest_args: list = (),
+) -> list:
+    """schema 모듈을 한 번 수집하고 변형마다 테스트를 실행합니다 (자식 프로세스에서 호출)."""
+    sys.path.insert(0, str(schema_dir))
+    loop = SchemaVariantLoop(variants, timeout, max_log_chars)
+    # 수집 단계 출력(경고 등)은 결과에 포함하지 않음
+    discarded = BoundedWriter(max_log_chars)
+    try:
+        with contextlib.redirect_stdout(discarded), contextlib.redirect_stderr(discarded):
+            pytest.main(
+                [
+                    *SCHEMA_PYTEST_ARGS,
+                    *pytest_args,
+                    f"--rootdir={schema_dir}",
+                    str(schema_dir / "test_user.py"),
+                ],
+                plugins=[loop],
+            )
+    finally:
+        sys.path.remove(str(schema_dir))
+
+    # pytest가 중단되어 결과가 없는 변형은 러너가 시스템 오류로 처리
+    return loop.results
+
+
+def run_schema_isolated(
+    launcher: TargetLauncher,
+    index: int,
+    variants,
+    timeout: float,
+    max_log_chars: int = DEFAULT_MAX_LOG_CHARS,
+) -> list:
+    """zygote에서 fork한 프로세스에서 run_schema를 실행합니다. 결과가 없는 변형은 시스템 오류로 채웁니다."""
+    start_time = time.time()
+    results, error = launcher.run(
+        index,
+        budget=timeout * len(variants) + CHILD_GRACE_SECONDS,
+        max_bytes=_result_limit(max_log_chars) * len(variants),
+    )
+    reported = {}
+    if error is None and isinstance(results, list):
+        reported = {entry.get("target"): entry for entry in results if isinstance(entry, dict)}
+    return [
+        _checked_result(
+            variant,
+            reported.get(variant),
+            start_time,
+            error or ("schema run returned no result" if variant not in reported else None),
+        )
+        for variant in variants
+    ]
+
+
+def run_spec(spec: dict) -> list:
+    """
+    실행 명세의 모든 대상을 순서대로 실행합니다 (실행 디렉토리의 targets/ 기준).
+
+    Returns:
+        대상별 결과 목록 (RESULT_MARKER 줄의 JSON과 같은 형식)
+    """
+    targets_dir = Path.cwd() / TARGETS_DIR_NAME
+    timeout = float(spec.get("timeout", 5.0))
+    order = spec.get("targets")
+    if order is None:
+        order = sorted(p.name for p in targets_dir.iterdir() if p.is_dir() and p.name != SCHEMA_DIR_NAME)
+    max_log_chars = int(spec.get("max_log_chars", DEFAULT_MAX_LOG_CHARS))
+    # schema 모듈로 실행할 대상 (나머지는 대상별 디렉토리에서 실행)
+    schema_variants = list(spec.get("schema_variants") or [])
+    # 테스트별 타임아웃 등 추가 pytest 인자
+    pytest_args = list(spec.get("pytest_args") or [])
+    # 대상 실행 프로세스 전용 uid 시작 번호 (러너가 root일 때만 사용, 0이면 사용 안 함)
+    uid_base = int(spec.get("uid_base") or 0) if os.geteuid() == 0 else 0
+
+    _protect_runner()
+    signal.signal(signal.SIGALRM, _on_alarm)
+
+    jobs = []
+    if schema_variants:
+        run = functools.partial(
+            run_schema,
+            variants=schema_variants,
+            timeout=timeout,
+            max_log_chars=max_log_chars,
+            pytest_args=pytest_args,
+        )
+        jobs.append((targets_dir / SCHEMA_DIR_NAME, run))
+    names = [name for name in order if name not in schema_variants]
+    run = functools.partial(
+        run_target, timeout=timeout, max_log_chars=max_log_chars, pytest_args=pytest_args
+    )
+    jobs.extend((targets_dir / name, run) for name in names)
+    jobs = [
+        (target_dir, run, uid_base + index if uid_base else 0)
+        for index, (target_dir, run) in enumerate(jobs)
+    ]
+
+    if uid_base:
+        # 권한을 낮춘 대상 실행 프로세스가 다른 대상의 파일을 읽거나 바꾸지 못하도록 root 전용으로 설정
+        with contextlib.suppress(OSError):
+            targets_dir.chmod(0o700)
+    run_root = Path(tempfile.mkdtemp(prefix="qa_arena_runner_"))
+    run_root.chmod(0o711)
+
+    results = []
+    launcher = TargetLauncher(jobs, run_root)
+    try:
+        if schema_variants:
+            results.extend(run_schema_isolated(launcher, 0, schema_variants, timeout, max_log_chars))
+        offset = len(jobs) - len(names)
+        results.extend(
+            run_target_isolated(launcher, offset + index, name, timeout, max_log_chars)
+            for index, name in enumerate(names)
+        )
+    finally:
+        launcher.close()
+        shutil.rmtree(run_root, ignore_errors=True)
+    return results
+
+
+def main() -> int:
+    """첫 번째 인자의 실행 명세를 실행하고 결과를 JSON으로 출력합니다."""
+    spec = json.loads(sys.argv[1]) if len(sys.argv) > 1 else {}
+    results = run_spec(spec)
+    sys.stdout.write(RESULT_MARKER + json.dumps(results, ensure_ascii=False) + "\n")
+    sys.stdout.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
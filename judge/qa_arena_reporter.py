@@ -0,0 +1,194 @@
+"""Machine-readable result reporter for judge runs.
+
+conftest.py에서 pytest_plugins로 로드되는 pytest 플러그인입니다.
+pytest 세션이 끝나면 결과를 last_report에 다음 형식으로 보관하고,
+multi_runner.py가 이를 pytest 출력과 분리된 결과 채널로 전달합니다
+(사용자 테스트가 출력한 내용은 결과로 해석되지 않음):
+    {"tests": [...], "collection_errors": [...], "summary": {...}, "exit_status": int, "coverage": ...}
+
+- tests: [{"nodeid", "outcome", "duration", "error_type", "file"}]
+- collection_errors: [{"nodeid", "error_type", "file", "message"}]
+- file: 예외가 발생한 파일 이름 (예: "target.py", "test_user.py")
+- error_type "Timeout": conftest.py의 테스트별 타임아웃으로 실패한 테스트
+- coverage: 테스트 실행(setup/call/teardown) 중 실행된 target.py 줄 번호 목록
+  (줄 단위 추적은 실행을 크게 느리게 하므로 ini 옵션 qa_arena_coverage로 요청한 실행에서만
+  수집하며, 요청하지 않으면 null)
+"""
+
+import os
+import re
+import sys
+import threading
+
+import pytest
+
+# 오류 메시지는 분류에 필요한 만큼만 보관
+MAX_MESSAGE_LENGTH = 300
+
+_ERROR_LINE = re.compile(r"^E\s+(\w+(?:Error|Exception|Exit|Interrupt))\b:?\s*(.*)$", re.MULTILINE)
+_FILE_REF = re.compile(r"([\w./\\-]+\.py)(?::\d+|\", line \d+)")
+
+# 테스트별 타임아웃으로 실패한 테스트의 user_properties 키 (conftest.py와 동일)
+TIMEOUT_PROPERTY = "qa_arena_timeout"
+TIMEOUT_ERROR_TYPE = "Timeout"
+
+# 줄 커버리지를 수집할 대상 파일 이름
+COVERAGE_FILE_NAME = "target.py"
+# 줄 커버리지 수집을 요청하는 ini 옵션 (backend judge_backend.py와 동일)
+COVERAGE_INI = "qa_arena_coverage"
+
+_tests = []
+_collection_errors = []
+_covered_lines = set()
+_coverage_enabled = False
+# 마지막으로 끝난 pytest 세션의 결과 (multi_runner.py가 읽음)
+last_report = None
+
+
+def _error_type(message: str) -> str:
+    """오류 메시지에서 예외 타입 이름을 추출합니다."""
+    if message.startswith("assert ") or message.startswith("AssertionError"):
+        return "AssertionError"
+    head = message.split(":", 1)[0].strip()
+    return head if re.fullmatch(r"[A-Za-z_][\w.]*", head) else "Error"
+
+
+def _crash_info(report):
+    """실패한 리포트에서 (예외 타입, 발생 파일, 메시지)를 추출합니다."""
+    longrepr = report.longrepr
+    crash = getattr(longrepr, "reprcrash", None)
+    if crash is not None:
+        message = crash.message or ""
+        return _error_type(message), os.path.basename(str(crash.path)), message
+
+    # 수집 오류 등 문자열 리포트: 마지막 "E   XxxError" 줄과 마지막 파일 참조 사용
+    text = str(longrepr or "")
+    errors = _ERROR_LINE.findall(text)
+    files = _FILE_REF.findall(text)
+    error_type, message = errors[-1] if errors else ("Error", text.strip().splitlines()[-1:] or [""])
+    if isinstance(message, list):
+        message = message[0] if message else ""
+    file_name = os.path.basename(files[-1]) if files else None
+    return error_type, file_name, f"{error_type}: {message}" if errors else message
+
+
+def _trace_lines(frame, event, arg):
+    """target.py 프레임의 실행된 줄을 기록합니다."""
+    if event == "line":
+        _covered_lines.add(frame.f_lineno)
+    return _trace_lines
+
+
+def _trace_calls(frame, event, arg):
+    """target.py 프레임에만 줄 단위 추적을 켭니다 (다른 프레임은 호출 이벤트만 발생)."""
+    if event == "call" and os.path.basename(frame.f_code.co_filename) == COVERAGE_FILE_NAME:
+        _covered_lines.add(frame.f_lineno)
+        return _trace_lines
+    return None
+
+
+def pytest_addoption(parser):
+    """줄 커버리지 수집 여부 ini 옵션을 등록합니다."""
+    parser.addini(COVERAGE_INI, "collect target.py line coverage (slow)", type="bool", default=False)
+
+
+def pytest_configure(config):
+    """요청된 실행에서만 줄 커버리지 수집을 켭니다."""
+    global _coverage_enabled
+    _coverage_enabled = bool(config.getini(COVERAGE_INI))
+
+
+def disable_coverage() -> None:
+    """줄 커버리지 수집을 끕니다 (target.py가 원본 코드가 아닌 실행 모드에서 사용)."""
+    global _coverage_enabled
+    _coverage_enabled = False
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """테스트 하나(setup/call/teardown)를 실행하는 동안 target.py 줄 커버리지를 수집합니다."""
+    if not _coverage_enabled or sys.gettrace() is not None:
+        # 디버거 등 다른 추적기가 있으면 방해하지 않음
+        yield
+        return
+    sys.settrace(_trace_calls)
+    threading.settrace(_trace_calls)
+    try:
+        yield
+    finally:
+        sys.settrace(None)
+        threading.settrace(None)
+
+
+def pytest_collectreport(report):
+    """수집 오류를 기록합니다."""
+    if report.failed:
+        error_type, file_name, message = _crash_info(report)
+        _collection_errors.append(
+            {
+                "nodeid": report.nodeid,
+                "error_type": error_type,
+                "file": file_name,
+                "message": message[:MAX_MESSAGE_LENGTH],
+            }
+        )
+
+
+def pytest_runtest_logreport(report):
+    """테스트별 결과와 실행 시간을 기록합니다."""
+    if report.when == "call" or report.failed or report.skipped:
+        if report.when != "call" and report.passed:
+            return
+        outcome = report.outcome
+        if report.failed and report.when != "call":
+            outcome = "error"
+        entry = {
+            "nodeid": report.nodeid,
+            "outcome": outcome,
+            "duration": round(report.duration, 6),
+            "error_type": None,
+            "file": None,
+        }
+        if report.failed:
+            error_type, file_name, message = _crash_info(report)
+            if any(name == TIMEOUT_PROPERTY for name, _ in report.user_properties):
+                error_type, file_name = TIMEOUT_ERROR_TYPE, None
+            entry.update(
+                {
+                    "error_type": error_type,
+                    "file": file_name,
+                    "message": message[:MAX_MESSAGE_LENGTH],
+                }
+            )
+        # 같은 테스트의 setup/teardown 오류는 마지막 결과로 덮어씀
+        _tests[:] = [t for t in _tests if t["nodeid"] != report.nodeid]
+        _tests.append(entry)
+
+
+def build_report(exitstatus: int) -> dict:
+    """지금까지 기록된 결과로 결과 딕셔너리를 만듭니다."""
+    summary = {"passed": 0, "failed": 0, "error": 0, "skipped": 0}
+    for test in _tests:
+        summary[test["outcome"]] = summary.get(test["outcome"], 0) + 1
+    payload = {
+        "tests": list(_tests),
+        "collection_errors": list(_collection_errors),
+        "summary": summary,
+        "exit_status": int(exitstatus),
+        "coverage": sorted(_covered_lines) if _coverage_enabled else None,
+    }
+    return payload
+
+
+def reset() -> None:
+    """기록된 결과를 비웁니다."""
+    _tests.clear()
+    _collection_errors.clear()
+    _covered_lines.clear()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """세션이 끝나면 결과를 last_report에 보관합니다."""
+    global last_report
+    last_report = build_report(exitstatus)
+    reset()